@@ -9,6 +9,10 @@ Security:
 - TLS/SSL for all IMAP and SMTP connections
 - Audit logging of all sent emails
 
+IMAP traffic goes over one persistent, logged-in connection owned by an
+ImapSession worker thread (see imap_session.py) instead of a new TLS
+handshake + LOGIN per call. Fetches are batched into a single UID FETCH.
+
 Setup:
     1. Enable 2-step verification on your Google Account
     2. Create an App Password: Google Account → Security → App Passwords
@@ -19,6 +23,7 @@ Usage:
     messages = await gmail.fetch_unread(max_results=10)
     await gmail.send_reply(thread_id, message_id, to, subject, body)
     await gmail.mark_as_read(message_id)
+    gmail.on_new_mail(callback)  # IMAP IDLE push
 """
 
 from __future__ import annotations
@@ -26,17 +31,21 @@ from __future__ import annotations
 import asyncio
 import imaplib
 import logging
+import re
 import smtplib
 import time
+from collections.abc import Awaitable, Callable
 from datetime import UTC, datetime, timedelta, timezone
 from email import message, policy
 from email.header import decode_header as _decode_header
 from email.mime.text import MIMEText
 from email.parser import BytesParser
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from pydantic import BaseModel, Field
 
+from overblick.capabilities.communication.imap_session import ImapSession
+
 if TYPE_CHECKING:
     from overblick.core.plugin_base import PluginContext
 
@@ -54,6 +63,11 @@ MAX_RETRIES = 3
 INITIAL_RETRY_DELAY = 1.0  # seconds
 RETRY_BACKOFF_FACTOR = 2.0
 
+# Newest unread messages checked per fetch when a skip filter is given
+HEADER_SCAN_LIMIT = 50
+
+_FETCH_UID = re.compile(rb"\bUID (\d+)")
+
 
 class GmailMessage(BaseModel):
     """Parsed email message from Gmail."""
@@ -76,7 +90,8 @@ class GmailCapability:
     Gmail integration via IMAP (read) and SMTP (send).
 
     Uses Google App Password — no OAuth2, no Google Cloud Console.
-    All I/O is run in thread pool via asyncio.to_thread() to avoid blocking.
+    IMAP work runs on the ImapSession thread, SMTP via asyncio.to_thread(),
+    so neither blocks the event loop.
 
     Requires secrets (per-identity):
     - gmail_address: Gmail email address
@@ -84,8 +99,8 @@ class GmailCapability:
 
     This is a capability (not a plugin) because:
     - Reusable across multiple plugins (email_agent, notifications)
-    - No external state/polling (operates on demand)
-    - Simple API: fetch, send, mark-as-read
+    - No polling of its own (fetches on demand; IDLE push is opt-in)
+    - Simple API: fetch, send, mark-as-read, on_new_mail
     """
 
     # Hard kill switch for email sending. Must be explicitly set to True in
@@ -102,6 +117,9 @@ class GmailCapability:
         self._password: str | None = None
         self._send_as: str | None = None  # Optional From address (Gmail alias)
         self._uid_map: dict[str, bytes] = {}  # RFC Message-ID → IMAP UID
+        self._session: ImapSession | None = None
+        self._seen_pending: list[bytes] = []
+        self._seen_flush: asyncio.Future[None] | None = None
 
     async def setup(self) -> None:
         """Load Gmail credentials from secrets."""
@@ -142,19 +160,68 @@ class GmailCapability:
 
     # ── Read (IMAP) ──────────────────────────────────────────────────────
 
+    def _get_session(self) -> ImapSession:
+        """The persistent IMAP session (created on first use)."""
+        if self._session is None:
+            self._session = ImapSession(self._imap_connect, name=self.ctx.identity_name or "gmail")
+        return self._session
+
+    def _imap_connect(self) -> imaplib.IMAP4_SSL:
+        """Open, log in and select INBOX (runs on the session thread)."""
+        assert self._email is not None and self._password is not None, "Gmail credentials missing"
+        imap = imaplib.IMAP4_SSL(GMAIL_IMAP_HOST, GMAIL_IMAP_PORT, timeout=IMAP_TIMEOUT)
+        try:
+            imap.login(self._email, self._password)
+            imap.select("INBOX")
+        except Exception:
+            try:
+                imap.shutdown()
+            except Exception:
+                pass
+            raise
+        return imap
+
+    def on_new_mail(self, callback: Callable[[], Any] | None) -> bool:
+        """
+        Register a push callback for new mail (IMAP IDLE), or None to stop.
+
+        The callback runs on the calling event loop, so this must be called
+        from a coroutine. It only signals that the inbox changed — fetch
+        with fetch_unread() as usual.
+
+        Returns:
+            True if push is enabled.
+        """
+        if not self.configured:
+            return False
+        session = self._get_session()
+        if callback is None:
+            session.set_push_handler(None)
+            return False
+        loop = asyncio.get_running_loop()
+        session.set_push_handler(lambda: loop.call_soon_threadsafe(callback))
+        return True
+
     async def fetch_unread(
         self,
         max_results: int = 10,
         since_days: int | None = None,
+        skip: Callable[[list[str]], Awaitable[set[str]]] | None = None,
     ) -> list[GmailMessage]:
         """
         Fetch unread messages from Gmail inbox via IMAP.
 
+        Bodies of all selected messages come back in one batched
+        ``UID FETCH``. With ``skip``, a cheap Message-ID header pass runs
+        first so bodies of already-handled messages are never downloaded.
+
         Args:
             max_results: Maximum number of messages to return.
             since_days: Only fetch messages from the last N days (IMAP SINCE
                 filter). When set, old messages are excluded at the server
                 level — they are never transferred over the network.
+            skip: Optional async callable taking Message-IDs and returning
+                the subset to leave out (e.g. already processed).
 
         Returns:
             List of GmailMessage objects, newest first.
@@ -165,11 +232,7 @@ class GmailCapability:
 
         for attempt in range(MAX_RETRIES):
             try:
-                return await asyncio.to_thread(
-                    self._imap_fetch_unread,
-                    max_results,
-                    since_days,
-                )
+                return await self._fetch_unread_once(max_results, since_days, skip)
             except Exception as e:
                 if attempt == MAX_RETRIES - 1:
                     logger.error(
@@ -191,63 +254,87 @@ class GmailCapability:
         # Should never reach here, but return empty list if all retries fail
         return []
 
-    def _imap_fetch_unread(
+    async def _fetch_unread_once(
         self,
         max_results: int,
-        since_days: int | None = None,
+        since_days: int | None,
+        skip: Callable[[list[str]], Awaitable[set[str]]] | None,
     ) -> list[GmailMessage]:
-        """Fetch unread messages via IMAP (blocking, run in thread pool)."""
-        assert self._email is not None and self._password is not None, "Gmail credentials missing"
-        results = []
+        """Search, optionally filter by Message-ID, then fetch bodies in one batch."""
+        session = self._get_session()
+        scan_limit = max_results if skip is None else max(max_results, HEADER_SCAN_LIMIT)
+        uids = await session.run(
+            lambda imap: self._imap_search_unread(imap, scan_limit, since_days)
+        )
+        if not uids:
+            return []
 
-        with imaplib.IMAP4_SSL(
-            GMAIL_IMAP_HOST,
-            GMAIL_IMAP_PORT,
-            timeout=IMAP_TIMEOUT,
-        ) as imap:
-            imap.login(self._email, self._password)
-            imap.select("INBOX")
+        if skip is not None:
+            message_ids = await session.run(lambda imap: self._imap_fetch_message_ids(imap, uids))
+            skipped = await skip([mid for mid in message_ids.values() if mid])
+            if skipped:
+                uids = [uid for uid in uids if message_ids.get(uid) not in skipped]
+                logger.debug("GmailCapability: skipped %d known message(s)", len(skipped))
 
-            # Build search criteria — optionally restrict to recent messages
-            # at the server level to avoid fetching ancient unread emails.
-            search_criteria = "UNSEEN"
-            if since_days is not None:
-                cutoff = datetime.now(UTC) - timedelta(days=since_days)
-                imap_date = cutoff.strftime("%d-%b-%Y")  # e.g. "14-Feb-2026"
-                search_criteria = f"(UNSEEN SINCE {imap_date})"
-                logger.debug(
-                    "GmailCapability: fetching unread since %s (last %d day(s))",
-                    imap_date,
-                    since_days,
-                )
+        uids = uids[:max_results]
+        if not uids:
+            return []
+        return await session.run(lambda imap: self._imap_fetch_messages(imap, uids))
 
-            status, data = imap.uid("search", search_criteria)
-            if status != "OK" or not data or not data[0]:
-                return []
+    def _imap_search_unread(
+        self,
+        imap: imaplib.IMAP4,
+        limit: int,
+        since_days: int | None = None,
+    ) -> list[bytes]:
+        """UIDs of the newest unread messages, newest first (session thread)."""
+        # Build search criteria — optionally restrict to recent messages
+        # at the server level to avoid fetching ancient unread emails.
+        search_criteria = "UNSEEN"
+        if since_days is not None:
+            cutoff = datetime.now(UTC) - timedelta(days=since_days)
+            imap_date = cutoff.strftime("%d-%b-%Y")  # e.g. "14-Feb-2026"
+            search_criteria = f"(UNSEEN SINCE {imap_date})"
+            logger.debug(
+                "GmailCapability: fetching unread since %s (last %d day(s))",
+                imap_date,
+                since_days,
+            )
 
-            uids = data[0].split()
+        status, data = imap.uid("search", search_criteria)
+        if status != "OK" or not data or not data[0]:
+            return []
 
-            # Newest first, limited to max_results
-            for uid in reversed(uids[-max_results:]):
-                msg = self._imap_fetch_message(imap, uid)
-                if msg:
-                    results.append(msg)
+        uids = data[0].split()
+        return list(reversed(uids[-limit:]))
 
-        return results
+    def _imap_fetch_message_ids(self, imap: imaplib.IMAP4, uids: list[bytes]) -> dict[bytes, str]:
+        """Message-ID header per UID, in one batched fetch (session thread)."""
+        status, data = imap.uid("fetch", _uid_set(uids), "(BODY.PEEK[HEADER.FIELDS (MESSAGE-ID)])")
+        if status != "OK" or not data:
+            return {}
+        parser = BytesParser(policy=policy.default)
+        return {
+            uid: str(parser.parsebytes(raw, headersonly=True).get("Message-ID", "")).strip()
+            for uid, raw in _fetched_parts(data)
+        }
 
-    def _imap_fetch_message(
-        self,
-        imap: imaplib.IMAP4_SSL,
-        uid: bytes,
-    ) -> GmailMessage | None:
-        """Fetch and parse a single message by IMAP UID."""
-        uid_str = uid.decode()
+    def _imap_fetch_messages(self, imap: imaplib.IMAP4, uids: list[bytes]) -> list[GmailMessage]:
+        """Full messages for ``uids`` in one batched fetch, in ``uids`` order."""
         # BODY.PEEK[] fetches without marking as read (vs RFC822 which marks as seen)
-        status, data = imap.uid("fetch", uid_str, "(BODY.PEEK[])")
-        if status != "OK" or not data or not data[0]:
-            return None
+        status, data = imap.uid("fetch", _uid_set(uids), "(BODY.PEEK[])")
+        if status != "OK" or not data:
+            return []
+        raw_by_uid = dict(_fetched_parts(data))
+        results = []
+        for uid in uids:
+            raw = raw_by_uid.get(uid)
+            if raw:
+                results.append(self._parse_message(uid, raw))
+        return results
 
-        raw_bytes = data[0][1]
+    def _parse_message(self, uid: bytes, raw_bytes: bytes) -> GmailMessage:
+        """Parse a raw RFC 822 message fetched under ``uid``."""
         parser = BytesParser(policy=policy.default)
         msg = parser.parsebytes(raw_bytes)
 
@@ -434,73 +521,95 @@ class GmailCapability:
                 return False
 
         try:
-            await asyncio.to_thread(self._imap_mark_read, uid)
+            await self._store_seen(uid)
             logger.debug("Gmail message marked as read: %s", message_id)
             return True
         except Exception as e:
             logger.error("Gmail mark_as_read failed: %s", e, exc_info=True)
             return False
 
+    async def _store_seen(self, uid: bytes) -> None:
+        """Queue a UID for \\Seen; concurrent callers share one UID STORE."""
+        self._seen_pending.append(uid)
+        if self._seen_flush is None:
+            self._seen_flush = asyncio.ensure_future(self._flush_seen())
+        # Shielded: one cancelled caller must not abort the shared STORE
+        await asyncio.shield(self._seen_flush)
+
+    async def _flush_seen(self) -> None:
+        # Let mark_as_read calls scheduled in the same loop pass join the batch
+        await asyncio.sleep(0)
+        uids, self._seen_pending = list(dict.fromkeys(self._seen_pending)), []
+        self._seen_flush = None
+        await self._get_session().run(lambda imap: self._imap_mark_read(imap, uids))
+
     async def _find_uid_by_message_id(self, message_id: str) -> bytes | None:
         """Search for a message by its Message-ID header and return its UID."""
         if not self.configured:
             return None
 
         try:
-            return await asyncio.to_thread(self._imap_find_uid_by_message_id, message_id)
+            return await self._get_session().run(
+                lambda imap: self._imap_find_uid_by_message_id(imap, message_id)
+            )
         except Exception as e:
             logger.error("Gmail UID search failed: %s", e, exc_info=True)
             return None
 
-    def _imap_find_uid_by_message_id(self, message_id: str) -> bytes | None:
-        """Search for message by Message-ID header (blocking)."""
-        assert self._email is not None and self._password is not None, "Gmail credentials missing"
+    def _imap_find_uid_by_message_id(self, imap: imaplib.IMAP4, message_id: str) -> bytes | None:
+        """Search for message by Message-ID header (session thread)."""
+        # Search for messages with this Message-ID header
+        # Note: Message-ID includes angle brackets in headers
+        search_msg_id = message_id.strip()
+        if not search_msg_id.startswith("<"):
+            search_msg_id = f"<{search_msg_id}>"
+        if not search_msg_id.endswith(">"):
+            search_msg_id = f"{search_msg_id}>"
+
+        status, data = imap.uid("search", "", f'HEADER Message-ID "{search_msg_id}"')
+        if status != "OK" or not data or not data[0]:
+            return None
 
-        with imaplib.IMAP4_SSL(
-            GMAIL_IMAP_HOST,
-            GMAIL_IMAP_PORT,
-            timeout=IMAP_TIMEOUT,
-        ) as imap:
-            imap.login(self._email, self._password)
-            imap.select("INBOX")
+        uids = data[0].split()
+        if not uids:
+            return None
 
-            # Search for messages with this Message-ID header
-            # Note: Message-ID includes angle brackets in headers
-            search_msg_id = message_id.strip()
-            if not search_msg_id.startswith("<"):
-                search_msg_id = f"<{search_msg_id}>"
-            if not search_msg_id.endswith(">"):
-                search_msg_id = f"{search_msg_id}>"
-
-            status, data = imap.uid("search", "", f'HEADER Message-ID "{search_msg_id}"')
-            if status != "OK" or not data or not data[0]:
-                return None
-
-            uids = data[0].split()
-            if not uids:
-                return None
-
-            # Return the first (should be only) matching UID
-            uid = uids[0]
-            # Cache it for future use
-            self._uid_map[message_id] = uid
-            return uid  # type: ignore[no-any-return]
+        # Return the first (should be only) matching UID
+        uid = uids[0]
+        # Cache it for future use
+        self._uid_map[message_id] = uid
+        return uid  # type: ignore[no-any-return]
 
-    def _imap_mark_read(self, uid: bytes) -> None:
-        """Set \\Seen flag on a message via IMAP (blocking, run in thread pool)."""
-        assert self._email is not None and self._password is not None, "Gmail credentials missing"
-        uid_str = uid.decode()
-        with imaplib.IMAP4_SSL(
-            GMAIL_IMAP_HOST,
-            GMAIL_IMAP_PORT,
-            timeout=IMAP_TIMEOUT,
-        ) as imap:
-            imap.login(self._email, self._password)
-            imap.select("INBOX")
-            imap.uid("store", uid_str, "+FLAGS", "\\Seen")
+    def _imap_mark_read(self, imap: imaplib.IMAP4, uids: list[bytes]) -> None:
+        """Set \\Seen on all ``uids`` with a single UID STORE (session thread)."""
+        status, data = imap.uid("store", _uid_set(uids), "+FLAGS", "\\Seen")
+        if status != "OK":
+            raise imaplib.IMAP4.error(f"UID STORE failed: {data!r}")
 
     # ── Lifecycle ────────────────────────────────────────────────────────
 
     async def teardown(self) -> None:
-        """Cleanup internal state."""
+        """Close the IMAP session and clear internal state."""
         self._uid_map.clear()
+        if self._session is not None:
+            session, self._session = self._session, None
+            session.set_push_handler(None)
+            await asyncio.to_thread(session.close)
+
+
+def _uid_set(uids: list[bytes]) -> str:
+    """IMAP sequence set for a UID FETCH/STORE: ``"3,7,12"``."""
+    return b",".join(uids).decode()
+
+
+def _fetched_parts(data: list[Any]) -> list[tuple[bytes, bytes]]:
+    """(UID, literal) pairs from a ``UID FETCH`` response."""
+    parts = []
+    for item in data:
+        # Literals come back as (b'1 (UID 55 BODY[] {1234}', payload);
+        # the closing b')' items carry nothing we need.
+        if isinstance(item, tuple) and len(item) == 2:
+            match = _FETCH_UID.search(item[0])
+            if match:
+                parts.append((match.group(1), item[1]))
+    return parts
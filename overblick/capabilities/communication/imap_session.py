@@ -0,0 +1,345 @@
+"""
+Persistent IMAP session on a dedicated worker thread.
+
+GmailCapability used to open a fresh IMAP4_SSL connection (TLS handshake,
+LOGIN, SELECT) for every fetch, every mark-as-read and every UID lookup.
+ImapSession keeps one authenticated connection alive on its own thread
+and runs callers' blocking IMAP work there:
+
+- ``await session.run(fn)`` queues ``fn(imap)`` and resolves with its
+  result. Jobs run one at a time, in submission order, on the single
+  connection (imaplib is not thread-safe).
+- A dropped connection (``IMAP4.abort`` / socket errors) is reconnected
+  once and the job retried; other errors go straight back to the caller.
+- With a push handler set, the thread sits in IMAP IDLE (RFC 2177)
+  between jobs and calls the handler when the server announces new mail
+  (``* n EXISTS``). A queued job interrupts the IDLE with DONE, runs, and
+  the thread goes back to idling. IDLE is re-issued every
+  ``idle_timeout`` seconds, well under the 29 minutes servers allow.
+- Without a push handler the connection is dropped after ``linger``
+  seconds without work and the thread exits; the next job starts both
+  again.
+
+The connection factory must return a logged-in IMAP4 object with the
+mailbox selected, so tests can hand in a plain-TCP ``imaplib.IMAP4`` to a
+local stand-in server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import imaplib
+import logging
+import queue
+import re
+import select
+import socket
+import threading
+import time
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Re-issue IDLE before servers drop it (RFC 2177 allows 29 min; Gmail ~10 min)
+IDLE_TIMEOUT = 9 * 60  # seconds
+# Without push, close an unused connection after this long
+LINGER = 10 * 60  # seconds
+# Back-off between reconnect attempts while idling
+RECONNECT_DELAY = 5.0
+MAX_RECONNECT_DELAY = 300.0
+
+_IDLE_TAG = b"OVIDLE"
+_NEW_MAIL = re.compile(rb"^\* \d+ (EXISTS|RECENT)\b", re.IGNORECASE)
+
+_DROPPED = (imaplib.IMAP4.abort, OSError, EOFError)
+
+
+class ImapSession:
+    """
+    One long-lived IMAP connection, owned by a worker thread.
+
+    Thread-safe to submit to; all IMAP I/O happens on the worker thread.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], imaplib.IMAP4],
+        name: str = "imap",
+        idle_timeout: float = IDLE_TIMEOUT,
+        linger: float = LINGER,
+    ):
+        """
+        Args:
+            connect: Returns a logged-in connection with the mailbox selected
+            name: Thread name suffix, for logs
+            idle_timeout: Seconds per IDLE cycle before it is renewed
+            linger: Seconds an unused connection stays open without push
+        """
+        self._connect = connect
+        self._name = name
+        self._idle_timeout = idle_timeout
+        self._linger = linger
+        self._jobs: queue.SimpleQueue[tuple[Callable[[Any], Any], concurrent.futures.Future]] = (
+            queue.SimpleQueue()
+        )
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._imap: imaplib.IMAP4 | None = None
+        self._push_handler: Callable[[], None] | None = None
+        self._idle_supported = True
+        self._closed = False
+        # Wakes the worker out of select() when a job arrives mid-IDLE
+        self._wake_r, self._wake_w = socket.socketpair()
+        self._wake_r.setblocking(False)
+        self._wake_w.setblocking(False)
+        self.connects = 0
+        self.idle_events = 0
+
+    # ── Caller side ──────────────────────────────────────────────────────
+
+    async def run(self, fn: Callable[[Any], T]) -> T:
+        """Run ``fn(imap)`` on the session thread and await its result."""
+        return await asyncio.wrap_future(self.submit(fn))
+
+    def submit(self, fn: Callable[[Any], T]) -> concurrent.futures.Future[T]:
+        """Queue ``fn(imap)``; returns a concurrent future for its result."""
+        future: concurrent.futures.Future[T] = concurrent.futures.Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("IMAP session is closed")
+            self._jobs.put((fn, future))
+            self._ensure_thread()
+        self._wake()
+        return future
+
+    def set_push_handler(self, handler: Callable[[], None] | None) -> None:
+        """
+        Enable IDLE push with ``handler`` (called on the session thread), or
+        disable it with None. Handlers must be quick and thread-safe —
+        typically ``loop.call_soon_threadsafe(...)``.
+        """
+        with self._lock:
+            self._push_handler = handler
+            if handler is not None and not self._closed:
+                self._ensure_thread()
+        self._wake()
+
+    @property
+    def connected(self) -> bool:
+        return self._imap is not None
+
+    @property
+    def idling(self) -> bool:
+        """Whether the worker is (or will be) waiting in IDLE between jobs."""
+        return self._push_handler is not None and self._idle_supported
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the worker thread and log out. Pending jobs fail."""
+        with self._lock:
+            self._closed = True
+            thread = self._thread
+        self._wake()
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+        self._fail_pending(RuntimeError("IMAP session is closed"))
+        self._wake_r.close()
+        self._wake_w.close()
+
+    def _ensure_thread(self) -> None:
+        """Start the worker if it is not running. Caller holds _lock."""
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._worker, name=f"imap-session-{self._name}", daemon=True
+            )
+            self._thread.start()
+
+    def _wake(self) -> None:
+        try:
+            self._wake_w.send(b"\0")
+        except (BlockingIOError, OSError):
+            pass  # Buffer full (already signalled) or closed
+
+    # ── Worker thread ────────────────────────────────────────────────────
+
+    def _worker(self) -> None:
+        reconnect_delay = RECONNECT_DELAY
+        try:
+            while not self._closed:
+                job = self._next_job()
+                if job is not None:
+                    self._execute(*job)
+                    continue
+                if self._closed:
+                    break
+                if self.idling:
+                    try:
+                        self._idle_cycle()
+                        reconnect_delay = RECONNECT_DELAY
+                    except Exception as e:
+                        # Dropped connection or failed (re)login
+                        logger.warning("IMAP IDLE failed (%s) — reconnecting", e)
+                        self._disconnect()
+                        self._wait_for_wake(reconnect_delay)
+                        reconnect_delay = min(reconnect_delay * 2, MAX_RECONNECT_DELAY)
+                    continue
+                # No push: keep the connection for a while, then let go
+                if self._wait_for_wake(self._linger):
+                    continue
+                self._logout()
+                with self._lock:
+                    if self._jobs.empty() and not self.idling:
+                        self._thread = None
+                        return
+        finally:
+            if self._closed:
+                self._logout()
+
+    def _next_job(self) -> tuple[Callable[[Any], Any], concurrent.futures.Future] | None:
+        try:
+            return self._jobs.get_nowait()
+        except queue.Empty:
+            return None
+
+    def _execute(self, fn: Callable[[Any], Any], future: concurrent.futures.Future) -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = self._call(fn)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
+    def _call(self, fn: Callable[[Any], Any]) -> Any:
+        """Run fn on the connection, reconnecting once if it was dropped."""
+        for attempt in (1, 2):
+            imap = self._ensure_connected()
+            try:
+                return fn(imap)
+            except _DROPPED as e:
+                self._disconnect()
+                if attempt == 2:
+                    raise
+                logger.debug("IMAP session dropped (%s) — reconnecting", e)
+        raise AssertionError("unreachable")
+
+    def _ensure_connected(self) -> imaplib.IMAP4:
+        if self._imap is None:
+            self._imap = self._connect()
+            self.connects += 1
+            capabilities = getattr(self._imap, "capabilities", ())
+            self._idle_supported = "IDLE" in capabilities if capabilities else True
+            logger.debug("IMAP session %s connected", self._name)
+        return self._imap
+
+    def _disconnect(self) -> None:
+        imap, self._imap = self._imap, None
+        if imap is not None:
+            try:
+                imap.shutdown()
+            except Exception:
+                pass
+
+    def _logout(self) -> None:
+        imap, self._imap = self._imap, None
+        if imap is not None:
+            try:
+                imap.logout()
+            except Exception:
+                pass
+
+    def _wait_for_wake(self, timeout: float) -> bool:
+        """Block until woken or timeout. Returns True if woken."""
+        if not self._jobs.empty() or self._closed:
+            return True
+        try:
+            ready, _, _ = select.select([self._wake_r], [], [], max(timeout, 0))
+        except (OSError, ValueError):
+            return True
+        if ready:
+            self._drain_wake()
+        return bool(ready)
+
+    def _drain_wake(self) -> None:
+        try:
+            while self._wake_r.recv(4096):
+                pass
+        except (BlockingIOError, OSError):
+            pass
+
+    def _idle_cycle(self) -> None:
+        """One IDLE ... DONE round; calls the push handler on new mail."""
+        imap = self._ensure_connected()
+        if not self._idle_supported:
+            logger.warning("IMAP server does not support IDLE — push disabled")
+            return
+        new_mail = False
+        self._drain_wake()
+
+        imap.send(_IDLE_TAG + b" IDLE\r\n")
+        while True:
+            line = self._readline(imap)
+            if line.startswith(b"+"):
+                break
+            if line.startswith(_IDLE_TAG + b" "):
+                # Tagged NO/BAD: server refused IDLE
+                logger.warning("IMAP IDLE rejected (%r) — push disabled", line.strip())
+                self._idle_supported = False
+                return
+            new_mail |= bool(_NEW_MAIL.match(line))
+
+        if not new_mail:
+            # Untagged data arriving on the socket ends the wait, as does a
+            # wake-up (new job or close). A notification that arrived in the
+            # same packet as the continuation is already in imaplib's buffer,
+            # invisible to select(); it is only seen when this cycle ends.
+            deadline = time.monotonic() + self._idle_timeout
+            while not self._closed and self._jobs.empty():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                pending = getattr(imap.sock, "pending", None)
+                if pending is not None and pending():
+                    break
+                ready, _, _ = select.select([imap.sock, self._wake_r], [], [], remaining)
+                if self._wake_r in ready:
+                    self._drain_wake()
+                    break
+                if ready:
+                    break
+
+        imap.send(b"DONE\r\n")
+        while True:
+            line = self._readline(imap)
+            if line.startswith(_IDLE_TAG + b" "):
+                break
+            new_mail |= bool(_NEW_MAIL.match(line))
+
+        if new_mail:
+            self.idle_events += 1
+            handler = self._push_handler
+            if handler is not None:
+                try:
+                    handler()
+                except Exception as e:
+                    logger.warning("IMAP push handler failed: %s", e)
+
+    @staticmethod
+    def _readline(imap: imaplib.IMAP4) -> bytes:
+        line = imap.readline()
+        if not line:
+            raise imaplib.IMAP4.abort("connection closed during IDLE")
+        return line  # type: ignore[no-any-return]
+
+    def _fail_pending(self, error: Exception) -> None:
+        while True:
+            job = self._next_job()
+            if job is None:
+                return
+            _, future = job
+            if future.set_running_or_notify_cancel():
+                future.set_exception(error)
@@ -8,10 +8,12 @@ loaded from the identity configuration.
 
 import logging
 import re
-from typing import Optional
+from collections.abc import Sequence
+from typing import Any, Optional
 
 from pydantic import BaseModel, Field
-from rapidfuzz import fuzz
+
+from overblick.capabilities.engagement.keyword_matcher import KeywordMatch, KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
@@ -63,6 +65,7 @@ class DecisionEngine:
         self._keywords = [k.lower() for k in (interest_keywords or [])]
         self._threshold = engagement_threshold
         self._fuzzy_threshold = fuzzy_threshold
+        self._matcher = KeywordMatcher(self._keywords, fuzzy_threshold=fuzzy_threshold)
         self._self_name = self_agent_name.lower()
         self._relevant_submolts = (
             {s.lower() for s in relevant_submolts} if relevant_submolts else set()
@@ -74,32 +77,66 @@ class DecisionEngine:
         content: str,
         agent_name: str,
         submolt: str = "",
+        post_id: str = "",
     ) -> EngagementDecision:
-        """Evaluate whether to engage with a post."""
+        """
+        Evaluate whether to engage with a post.
+
+        Keyword matches are cached under ``post_id`` when given, so a post
+        re-evaluated on a later tick is not re-scored.
+        """
         # Never engage with own posts
         if agent_name.lower() == self._self_name:
-            return EngagementDecision(
-                should_engage=False,
-                score=0.0,
-                action="skip",
-                reason="own post",
+            return self._own_post()
+        match = self._matcher.match(f"{title} {content}".lower(), key=post_id)
+        return self._score_post(match, content, submolt)
+
+    def evaluate_posts(self, posts: Sequence[Any]) -> list[EngagementDecision]:
+        """
+        Evaluate a batch of posts (objects with title, content, agent_name,
+        and optionally submolt and id).
+
+        Equivalent to calling evaluate_post() per post, but fuzzy keyword
+        scoring runs once over the whole batch's vocabulary.
+        """
+        decisions: list[EngagementDecision | None] = [None] * len(posts)
+        pending: list[int] = []
+        for i, post in enumerate(posts):
+            if (getattr(post, "agent_name", "") or "").lower() == self._self_name:
+                decisions[i] = self._own_post()
+            else:
+                pending.append(i)
+
+        matches = self._matcher.match_many(
+            [f"{posts[i].title} {posts[i].content}".lower() for i in pending],
+            [getattr(posts[i], "id", "") or "" for i in pending],
+        )
+        for i, match in zip(pending, matches):
+            decisions[i] = self._score_post(
+                match, posts[i].content, getattr(posts[i], "submolt", "") or ""
             )
+        return decisions  # type: ignore[return-value]
+
+    @staticmethod
+    def _own_post() -> EngagementDecision:
+        return EngagementDecision(
+            should_engage=False,
+            score=0.0,
+            action="skip",
+            reason="own post",
+        )
 
-        text = f"{title} {content}".lower()
-        words = text.split()
+    def _score_post(self, match: KeywordMatch, content: str, submolt: str) -> EngagementDecision:
+        """Turn keyword hits plus post features into a decision."""
         score = 0.0
         matched = []
 
-        # Keyword matching: exact substring first, fuzzy only for non-matches.
-        # Pre-filter words by minimum length (3 chars) to skip noise tokens.
-        long_words = [w for w in words if len(w) >= 3]
+        # Keyword matching: exact substring first, fuzzy only for non-matches
         for keyword in self._keywords:
-            if keyword in text:
+            if keyword in match.exact:
                 score += 20.0
                 matched.append(keyword)
-            elif any(
-                fuzz.partial_ratio(keyword, word) >= self._fuzzy_threshold for word in long_words
-            ):
+            elif keyword in match.fuzzy:
                 score += 10.0
                 matched.append(f"~{keyword}")
 
@@ -165,10 +202,10 @@ class DecisionEngine:
             score += 10.0
 
         # Mentions of identity keywords
-        text_lower = comment_content.lower()
+        found = self._matcher.exact(comment_content.lower())
         matched = []
         for keyword in self._keywords:
-            if keyword in text_lower:
+            if keyword in found:
                 score += 15.0
                 matched.append(keyword)
 
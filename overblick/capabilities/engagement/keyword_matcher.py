@@ -0,0 +1,189 @@
+"""
+Precompiled interest-keyword matcher for engagement scoring.
+
+DecisionEngine used to call ``fuzz.partial_ratio(keyword, word)`` for
+every keyword against every word of every post — tens of thousands of
+Python-level calls per feed page for identities with 50+ keywords.
+KeywordMatcher splits the work in two passes:
+
+- Exact: every keyword occurring as a substring of the text. With
+  pyahocorasick installed this is one Aho-Corasick scan over the text;
+  otherwise one C-level ``in`` check per keyword.
+- Fuzzy: keywords with no exact hit are scored in one batch against the
+  deduplicated token set of all texts — ``rapidfuzz.process.cdist`` when
+  NumPy is available, ``process.extract`` per keyword otherwise. Both
+  loop in C.
+
+Results are cached per post id, so a post seen again on a later feed
+page (or by a second evaluation) is not re-scored.
+"""
+
+import hashlib
+import logging
+from collections import OrderedDict
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from rapidfuzz import fuzz, process
+
+# pyahocorasick is optional — the exact pass falls back to substring checks
+try:
+    import ahocorasick
+
+    HAS_AHOCORASICK = True
+except ImportError:
+    ahocorasick = None
+    HAS_AHOCORASICK = False
+
+# cdist returns a NumPy matrix; without NumPy the fuzzy pass uses extract()
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+logger = logging.getLogger(__name__)
+
+# Words shorter than this are noise for fuzzy matching
+MIN_FUZZY_WORD_LENGTH = 3
+
+
+@dataclass(frozen=True)
+class KeywordMatch:
+    """Keywords found in one text (each keyword at most once per set)."""
+
+    exact: frozenset[str] = field(default_factory=frozenset)
+    fuzzy: frozenset[str] = field(default_factory=frozenset)
+
+
+class KeywordMatcher:
+    """
+    Exact + fuzzy matching of a fixed keyword list against lowercased text.
+
+    Keywords are lowercased and deduplicated at construction; callers
+    lowercase the text they pass in.
+    """
+
+    def __init__(
+        self,
+        keywords: Sequence[str],
+        fuzzy_threshold: int = 75,
+        cache_size: int = 1024,
+    ):
+        self.keywords: tuple[str, ...] = tuple(dict.fromkeys(k.lower() for k in keywords if k))
+        self.fuzzy_threshold = fuzzy_threshold
+        self._cache_size = max(0, cache_size)
+        # post id -> (text digest, match)
+        self._cache: OrderedDict[str, tuple[str, KeywordMatch]] = OrderedDict()
+        self._automaton = None
+        if HAS_AHOCORASICK and self.keywords:
+            automaton = ahocorasick.Automaton()
+            for keyword in self.keywords:
+                automaton.add_word(keyword, keyword)
+            automaton.make_automaton()
+            self._automaton = automaton
+
+    def __bool__(self) -> bool:
+        return bool(self.keywords)
+
+    def exact(self, text: str) -> frozenset[str]:
+        """Keywords occurring as substrings of ``text``."""
+        if not self.keywords:
+            return frozenset()
+        if self._automaton is not None:
+            return frozenset(keyword for _, keyword in self._automaton.iter(text))
+        return frozenset(k for k in self.keywords if k in text)
+
+    def match(self, text: str, key: str = "") -> KeywordMatch:
+        """Exact and fuzzy keyword hits for one text (cached under ``key``)."""
+        return self.match_many([text], [key])[0]
+
+    def match_many(
+        self, texts: Sequence[str], keys: Sequence[str] | None = None
+    ) -> list[KeywordMatch]:
+        """
+        Match several texts at once.
+
+        The fuzzy pass runs once over the union of all texts' tokens, so a
+        feed page costs a single batched scoring call.
+
+        Args:
+            texts: Lowercased texts
+            keys: Optional cache key (post id) per text; empty keys are not cached
+        """
+        keys = list(keys) if keys is not None else [""] * len(texts)
+        results: list[KeywordMatch | None] = [None] * len(texts)
+        digests: list[str] = [""] * len(texts)
+        pending: list[int] = []
+
+        for i, (text, key) in enumerate(zip(texts, keys)):
+            if key:
+                digests[i] = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+                cached = self._cache.get(key)
+                if cached is not None and cached[0] == digests[i]:
+                    self._cache.move_to_end(key)
+                    results[i] = cached[1]
+                    continue
+            pending.append(i)
+
+        if pending:
+            exact_hits = {i: self.exact(texts[i]) for i in pending}
+            words = {
+                i: {w for w in texts[i].split() if len(w) >= MIN_FUZZY_WORD_LENGTH} for i in pending
+            }
+            # Only keywords that missed exactly somewhere need fuzzy scoring
+            candidates = [k for k in self.keywords if any(k not in exact_hits[i] for i in pending)]
+            vocabulary = sorted(set().union(*words.values()))
+            similar = self._similar_words(candidates, vocabulary)
+
+            for i in pending:
+                fuzzy = frozenset(
+                    k
+                    for k in candidates
+                    if k not in exact_hits[i] and not similar[k].isdisjoint(words[i])
+                )
+                results[i] = KeywordMatch(exact=exact_hits[i], fuzzy=fuzzy)
+                if keys[i]:
+                    self._remember(keys[i], digests[i], results[i])
+
+        return results  # type: ignore[return-value]
+
+    def _similar_words(self, keywords: list[str], vocabulary: list[str]) -> dict[str, set[str]]:
+        """For each keyword, the vocabulary words within the fuzzy threshold."""
+        if not keywords or not vocabulary:
+            return {k: set() for k in keywords}
+        if HAS_NUMPY:
+            scores = process.cdist(
+                keywords,
+                vocabulary,
+                scorer=fuzz.partial_ratio,
+                score_cutoff=self.fuzzy_threshold,
+            )
+            hits = scores >= self.fuzzy_threshold
+            return {
+                k: {vocabulary[j] for j in np.flatnonzero(hits[row])}
+                for row, k in enumerate(keywords)
+            }
+        return {
+            k: {
+                word
+                for word, _, _ in process.extract(
+                    k,
+                    vocabulary,
+                    scorer=fuzz.partial_ratio,
+                    score_cutoff=self.fuzzy_threshold,
+                    limit=None,
+                )
+            }
+            for k in keywords
+        }
+
+    def _remember(self, key: str, digest: str, match: KeywordMatch) -> None:
+        if not self._cache_size:
+            return
+        self._cache[key] = (digest, match)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
@@ -29,6 +29,7 @@ logger = logging.getLogger(__name__)
 #
 # v900-v903: Core agentic tables (IF NOT EXISTS for idempotency)
 # v904: Add missing columns to existing tables (for GitHub upgrade path)
+# v905: tick_log.planner_skipped (ticks answered from the no-op plan cache)
 # ---------------------------------------------------------------------------
 
 AGENTIC_MIGRATIONS = [
@@ -108,6 +109,13 @@ AGENTIC_MIGRATIONS = [
         """,
         down_sql="DROP TABLE IF EXISTS tick_log;",
     ),
+    Migration(
+        version=905,
+        name="agentic_tick_log_planner_skipped",
+        up_sql="""
+            ALTER TABLE tick_log ADD COLUMN planner_skipped INTEGER DEFAULT 0;
+        """,
+    ),
 ]
 
 
@@ -168,29 +176,46 @@ class AgenticDB:
 
     # ── Action log ────────────────────────────────────────────────────────
 
+    _ACTION_LOG_INSERT = (
+        "INSERT INTO action_log "
+        "(tick_number, action_type, target, target_number, repo, "
+        "priority, reasoning, success, result, error, duration_ms) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"
+    )
+
     async def log_action(self, tick_number: int, outcome: ActionOutcome) -> int:
         """Record an executed action."""
         row_id = await self._db.execute_returning_id(
-            "INSERT INTO action_log "
-            "(tick_number, action_type, target, target_number, repo, "
-            "priority, reasoning, success, result, error, duration_ms) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
-            (
-                tick_number,
-                outcome.action.action_type,
-                outcome.action.target,
-                outcome.action.target_number,
-                outcome.action.repo,
-                outcome.action.priority,
-                outcome.action.reasoning,
-                1 if outcome.success else 0,
-                outcome.result,
-                outcome.error,
-                outcome.duration_ms,
-            ),
+            self._ACTION_LOG_INSERT,
+            self._action_log_params(tick_number, outcome),
         )
         return row_id or 0
 
+    async def log_actions(self, tick_number: int, outcomes: list[ActionOutcome]) -> None:
+        """Record all actions executed in a tick with one batch insert, in order."""
+        if not outcomes:
+            return
+        await self._db.execute_many(
+            self._ACTION_LOG_INSERT,
+            [self._action_log_params(tick_number, outcome) for outcome in outcomes],
+        )
+
+    @staticmethod
+    def _action_log_params(tick_number: int, outcome: ActionOutcome) -> tuple:
+        return (
+            tick_number,
+            outcome.action.action_type,
+            outcome.action.target,
+            outcome.action.target_number,
+            outcome.action.repo,
+            outcome.action.priority,
+            outcome.action.reasoning,
+            1 if outcome.success else 0,
+            outcome.result,
+            outcome.error,
+            outcome.duration_ms,
+        )
+
     async def get_recent_actions(self, limit: int = 20) -> list[dict]:
         """Get recent action log entries."""
         return await self._db.fetch_all(
@@ -233,8 +258,8 @@ class AgenticDB:
             "INSERT INTO tick_log "
             "(tick_number, started_at, completed_at, observations_count, "
             "actions_planned, actions_executed, actions_succeeded, "
-            "reasoning_summary, duration_ms) "
-            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            "reasoning_summary, duration_ms, planner_skipped) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
             (
                 tick.tick_number,
                 tick.started_at,
@@ -245,6 +270,7 @@ class AgenticDB:
                 tick.actions_succeeded,
                 tick.reasoning_summary,
                 tick.duration_ms,
+                1 if tick.planner_skipped else 0,
             ),
         )
         return row_id or 0
@@ -254,6 +280,13 @@ class AgenticDB:
         count = await self._db.fetch_scalar("SELECT COUNT(*) FROM tick_log")
         return count or 0
 
+    async def get_planner_skip_count(self) -> int:
+        """Get the number of ticks that reused a cached no-op plan (LLM calls saved)."""
+        count = await self._db.fetch_scalar(
+            "SELECT COUNT(*) FROM tick_log WHERE planner_skipped = 1"
+        )
+        return count or 0
+
     # ── Internal helpers ──────────────────────────────────────────────────
 
     @staticmethod
@@ -3,10 +3,18 @@ ActionExecutor — dispatches planned actions to registered handlers.
 
 Domain-agnostic: looks up handlers by action_type string key.
 Provides timing, error handling, and max-actions enforcement.
+
+Independent actions run concurrently. Actions that share a plugin-
+supplied key (else a target), or that share the planner's ``group``
+hint, end up in the same group; each group runs in plan order while up
+to ``max_concurrent`` groups run side by side. The planner's hint can
+only join groups, never split one the plugin or target requires.
 """
 
+import asyncio
 import logging
 import time
+from collections.abc import Callable
 from typing import Any
 
 from overblick.core.agentic.models import ActionOutcome, ActionPlan, PlannedAction
@@ -21,15 +29,30 @@ class ActionExecutor:
 
     Plugins register handlers by string key. The executor looks up
     the handler for each action_type and delegates execution.
+
+    With max_concurrent=1 (the default) every action runs one after
+    another, exactly in plan order.
     """
 
     def __init__(
         self,
         handlers: dict[str, ActionHandler],
         max_actions_per_tick: int = 5,
+        max_concurrent: int = 1,
+        group_key: Callable[[PlannedAction], str | None] | None = None,
     ):
+        """
+        Args:
+            handlers: action_type -> handler
+            max_actions_per_tick: Actions beyond this are dropped
+            max_concurrent: Maximum action groups running at once
+            group_key: Plugin hook naming the group an action belongs to
+                (None = fall back to grouping by target)
+        """
         self._handlers = handlers
         self._max_actions = max_actions_per_tick
+        self._max_concurrent = max(1, max_concurrent)
+        self._group_key = group_key
 
     async def execute(
         self,
@@ -46,42 +69,108 @@ class ActionExecutor:
         Returns:
             List of action outcomes
         """
-        outcomes: list[ActionOutcome] = []
-
-        for i, action in enumerate(plan.actions):
-            if i >= self._max_actions:
-                logger.info(
-                    "Agent executor: max actions per tick reached (%d)",
-                    self._max_actions,
-                )
-                break
-
-            start_time = time.monotonic()
-            outcome = await self._execute_action(action, observation)
-            elapsed_ms = (time.monotonic() - start_time) * 1000
-            outcome.duration_ms = elapsed_ms
-
-            outcomes.append(outcome)
-
-            if outcome.success:
-                logger.info(
-                    "Agent executor: %s on %s — %s (%.0fms)",
-                    action.action_type,
-                    action.target,
-                    outcome.result[:100],
-                    elapsed_ms,
-                )
-            else:
-                logger.warning(
-                    "Agent executor: %s on %s FAILED — %s (%.0fms)",
-                    action.action_type,
-                    action.target,
-                    outcome.error[:100],
-                    elapsed_ms,
-                )
+        actions = plan.actions
+        if len(actions) > self._max_actions:
+            logger.info(
+                "Agent executor: max actions per tick reached (%d)",
+                self._max_actions,
+            )
+            actions = actions[: self._max_actions]
+
+        groups = self._group(actions) if self._max_concurrent > 1 else []
+
+        if len(groups) <= 1:
+            return [await self._run_timed(action, observation) for action in actions]
+
+        outcomes: list[ActionOutcome | None] = [None] * len(actions)
+        semaphore = asyncio.Semaphore(self._max_concurrent)
+
+        async def run_group(indices: list[int]) -> None:
+            async with semaphore:
+                for i in indices:
+                    outcomes[i] = await self._run_timed(actions[i], observation)
+
+        logger.debug(
+            "Agent executor: %d actions in %d groups (max %d concurrent)",
+            len(actions),
+            len(groups),
+            self._max_concurrent,
+        )
+        await asyncio.gather(*(run_group(indices) for indices in groups))
 
         return outcomes
 
+    def _group(self, actions: list[PlannedAction]) -> list[list[int]]:
+        """
+        Partition action indices into groups that must run in order.
+
+        Two actions share a group when they share group_for(), or the
+        same planner hint, directly or through other actions.
+        """
+        parent = list(range(len(actions)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        first_with: dict[str, int] = {}
+        for i, action in enumerate(actions):
+            keys = [self.group_for(action)]
+            if action.group:
+                keys.append(f"hint:{action.group}")
+            for key in keys:
+                j = first_with.setdefault(key, i)
+                parent[find(i)] = find(j)
+
+        groups: dict[int, list[int]] = {}
+        for i in range(len(actions)):
+            groups.setdefault(find(i), []).append(i)
+        return list(groups.values())
+
+    def group_for(self, action: PlannedAction) -> str:
+        """
+        Name the group an action must run in, regardless of planner hints.
+
+        The plugin's group_key wins, then the target: actions on the same
+        repo/number (or the same target text) run in order. Actions with
+        no target at all share one group.
+        """
+        if self._group_key:
+            key = self._group_key(action)
+            if key is not None:
+                return f"plugin:{key}"
+        if action.target_number:
+            return f"target:{action.repo}#{action.target_number}"
+        return f"target:{action.repo}:{action.target.strip().lower()}"
+
+    async def _run_timed(self, action: PlannedAction, observation: Any) -> ActionOutcome:
+        """Execute one action, record its duration and log the result."""
+        start_time = time.monotonic()
+        outcome = await self._execute_action(action, observation)
+        elapsed_ms = (time.monotonic() - start_time) * 1000
+        outcome.duration_ms = elapsed_ms
+
+        if outcome.success:
+            logger.info(
+                "Agent executor: %s on %s — %s (%.0fms)",
+                action.action_type,
+                action.target,
+                outcome.result[:100],
+                elapsed_ms,
+            )
+        else:
+            logger.warning(
+                "Agent executor: %s on %s FAILED — %s (%.0fms)",
+                action.action_type,
+                action.target,
+                outcome.error[:100],
+                elapsed_ms,
+            )
+
+        return outcome
+
     async def _execute_action(
         self,
         action: PlannedAction,
@@ -7,6 +7,8 @@ Domain-agnostic: all domain-specific behavior is injected via
 protocols and handlers.
 """
 
+import asyncio
+import hashlib
 import logging
 import time
 from datetime import UTC, datetime, timezone
@@ -15,7 +17,7 @@ from typing import Any, Optional
 from overblick.core.agentic.database import AgenticDB
 from overblick.core.agentic.executor import ActionExecutor
 from overblick.core.agentic.goal_tracker import GoalTracker
-from overblick.core.agentic.models import TickLog
+from overblick.core.agentic.models import ActionOutcome, TickLog
 from overblick.core.agentic.planner import ActionPlanner
 from overblick.core.agentic.protocols import Observer
 from overblick.core.agentic.reflection import ReflectionPipeline
@@ -33,6 +35,17 @@ class AgentLoop:
     3. PLAN   — LLM produces prioritized action list
     4. ACT    — execute top-priority actions
     5. REFLECT — record outcomes, extract learnings
+
+    Reflection runs as a background task so the next tick does not wait
+    for it; call wait_for_reflections() before shutting down.
+
+    With plan_staleness_seconds > 0, an empty plan is cached against a
+    fingerprint of the planner input (observation, goals, recent actions,
+    learnings, extra context). While the fingerprint is unchanged and the
+    plan younger than the window, PLAN is skipped and the tick is logged
+    with planner_skipped=True. Observers may define fingerprint(observation)
+    -> str to leave volatile fields (timestamps, ages) out of the comparison;
+    otherwise the formatted observation text is used.
     """
 
     def __init__(
@@ -46,6 +59,7 @@ class AgentLoop:
         max_actions_per_tick: int = 5,
         get_extra_context: Any | None = None,
         learning_store=None,
+        plan_staleness_seconds: float = 0.0,
     ):
         self._observer = observer
         self._goals = goal_tracker
@@ -57,6 +71,10 @@ class AgentLoop:
         self._get_extra_context = get_extra_context
         self._learning_store = learning_store
         self._tick_count = 0
+        self._reflection_tasks: set[asyncio.Task] = set()
+        self._plan_staleness = plan_staleness_seconds
+        # (fingerprint, monotonic time of the LLM call, reasoning) of the last no-op plan
+        self._noop_plan: tuple[str, float, str] | None = None
 
     async def setup(self) -> None:
         """Initialize the agent loop (get tick count)."""
@@ -93,31 +111,37 @@ class AgentLoop:
         # -- 2. THINK -- format state for planner ----------------------
         goals_text = self._goals.format_for_planner()
 
-        recent_actions_rows = await self._db.get_recent_actions(limit=10)
+        # Independent reads — run them together
+        recent_actions_rows, learnings_text = await asyncio.gather(
+            self._db.get_recent_actions(limit=10),
+            self._read_learnings(observations_text),
+        )
         recent_actions_text = self._format_recent_actions(recent_actions_rows)
 
-        # Read learnings from LearningStore (semantic) or AgenticDB (legacy)
-        if self._learning_store:
-            store_learnings = await self._learning_store.get_relevant(
-                context=observations_text,
-                limit=10,
-            )
-            learnings_text = (
-                "\n".join(f"- [{l.category}] {l.content}" for l in store_learnings)
-                if store_learnings
-                else ""
-            )
-        else:
-            learnings = await self._db.get_learnings(limit=10)
-            learnings_text = (
-                "\n".join(f"- [{l.category}] {l.insight}" for l in learnings) if learnings else ""
-            )
-
         extra_context = ""
         if self._get_extra_context:
             extra_context = self._get_extra_context()
 
         # -- 3. PLAN ---------------------------------------------------
+        fingerprint = ""
+        if self._plan_staleness > 0:
+            fingerprint = self._fingerprint(
+                observation,
+                observations_text,
+                goals_text,
+                recent_actions_text,
+                learnings_text,
+                extra_context,
+            )
+            reasoning = self._cached_noop_reasoning(fingerprint)
+            if reasoning is not None:
+                logger.info(
+                    "Agent tick #%d: world state unchanged, reusing no-op plan", tick_number
+                )
+                return await self._log_idle_tick(
+                    tick_number, started_at, start_time, obs_count, reasoning, skipped=True
+                )
+
         plan = await self._planner.plan(
             observations=observations_text,
             goals=goals_text,
@@ -129,20 +153,14 @@ class AgentLoop:
 
         if not plan.actions:
             logger.info("Agent tick #%d: planner produced no actions", tick_number)
-            elapsed_ms = (time.monotonic() - start_time) * 1000
-            tick_log = TickLog(
-                tick_number=tick_number,
-                started_at=started_at,
-                completed_at=datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
-                observations_count=obs_count,
-                actions_planned=0,
-                actions_executed=0,
-                actions_succeeded=0,
-                reasoning_summary=plan.reasoning[:500] if plan.reasoning else "No actions needed",
-                duration_ms=elapsed_ms,
+            # An empty plan without reasoning is a planner failure — don't cache it
+            if fingerprint and plan.reasoning:
+                self._noop_plan = (fingerprint, time.monotonic(), plan.reasoning)
+            return await self._log_idle_tick(
+                tick_number, started_at, start_time, obs_count, plan.reasoning
             )
-            await self._db.log_tick(tick_log)
-            return tick_log
+
+        self._noop_plan = None
 
         logger.info(
             "Agent tick #%d: plan has %d actions (reasoning: %s)",
@@ -155,13 +173,12 @@ class AgentLoop:
         outcomes = await self._executor.execute(plan, observation)
 
         # Log outcomes to DB
-        for outcome in outcomes:
-            await self._db.log_action(tick_number, outcome)
+        await self._db.log_actions(tick_number, outcomes)
 
         succeeded = sum(1 for o in outcomes if o.success)
 
-        # -- 5. REFLECT ------------------------------------------------
-        await self._reflection.reflect(tick_number, plan.reasoning, outcomes)
+        # -- 5. REFLECT (background) -----------------------------------
+        self._start_reflection(tick_number, plan.reasoning, outcomes)
 
         # -- Record tick -----------------------------------------------
         elapsed_ms = (time.monotonic() - start_time) * 1000
@@ -188,6 +205,94 @@ class AgentLoop:
 
         return tick_log
 
+    async def _log_idle_tick(
+        self,
+        tick_number: int,
+        started_at: str,
+        start_time: float,
+        obs_count: int,
+        reasoning: str,
+        skipped: bool = False,
+    ) -> TickLog:
+        """Record a tick that executed no actions."""
+        elapsed_ms = (time.monotonic() - start_time) * 1000
+        tick_log = TickLog(
+            tick_number=tick_number,
+            started_at=started_at,
+            completed_at=datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            observations_count=obs_count,
+            actions_planned=0,
+            actions_executed=0,
+            actions_succeeded=0,
+            reasoning_summary=reasoning[:500] if reasoning else "No actions needed",
+            duration_ms=elapsed_ms,
+            planner_skipped=skipped,
+        )
+        await self._db.log_tick(tick_log)
+        return tick_log
+
+    def _fingerprint(self, observation: Any, observations_text: str, *context: str) -> str:
+        """Hash the planner input; equal fingerprints mean the plan would be the same."""
+        observer_fingerprint = getattr(self._observer, "fingerprint", None)
+        observed = observer_fingerprint(observation) if observer_fingerprint else observations_text
+        digest = hashlib.sha256(observed.encode())
+        for part in context:
+            digest.update(b"\0")
+            digest.update(part.encode())
+        return digest.hexdigest()
+
+    def _cached_noop_reasoning(self, fingerprint: str) -> str | None:
+        """Reasoning of the cached no-op plan if it still applies, else None."""
+        if self._noop_plan is None:
+            return None
+        cached_fingerprint, cached_at, reasoning = self._noop_plan
+        if cached_fingerprint != fingerprint:
+            return None
+        if time.monotonic() - cached_at >= self._plan_staleness:
+            self._noop_plan = None
+            return None
+        return reasoning
+
+    async def wait_for_reflections(self) -> None:
+        """Wait for reflections still running from earlier ticks."""
+        if self._reflection_tasks:
+            await asyncio.gather(*self._reflection_tasks, return_exceptions=True)
+
+    def _start_reflection(
+        self, tick_number: int, reasoning: str, outcomes: list[ActionOutcome]
+    ) -> None:
+        """Run reflection for a tick without blocking the caller."""
+        task = asyncio.create_task(
+            self._reflect(tick_number, reasoning, outcomes),
+            name=f"agent-reflection-{tick_number}",
+        )
+        self._reflection_tasks.add(task)
+        task.add_done_callback(self._reflection_tasks.discard)
+
+    async def _reflect(
+        self, tick_number: int, reasoning: str, outcomes: list[ActionOutcome]
+    ) -> None:
+        try:
+            await self._reflection.reflect(tick_number, reasoning, outcomes)
+        except Exception as e:
+            logger.warning("Agent tick #%d: reflection failed: %s", tick_number, e)
+
+    async def _read_learnings(self, observations_text: str) -> str:
+        """Read learnings from LearningStore (semantic) or AgenticDB (legacy)."""
+        if self._learning_store:
+            store_learnings = await self._learning_store.get_relevant(
+                context=observations_text,
+                limit=10,
+            )
+            return (
+                "\n".join(f"- [{l.category}] {l.content}" for l in store_learnings)
+                if store_learnings
+                else ""
+            )
+
+        learnings = await self._db.get_learnings(limit=10)
+        return "\n".join(f"- [{l.category}] {l.insight}" for l in learnings) if learnings else ""
+
     async def _observe(self) -> Any:
         """Run the observer and handle errors."""
         try:
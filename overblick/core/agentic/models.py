@@ -47,6 +47,10 @@ class PlannedAction(BaseModel):
     priority: int = 50
     reasoning: str = ""
     params: dict[str, Any] = Field(default_factory=dict)
+    # Dependency hint: actions sharing a group run in order, one at a time.
+    # Adds to the executor's own grouping by plugin key/target, never
+    # replaces it (see ActionExecutor).
+    group: str = ""
 
 
 class ActionPlan(BaseModel):
@@ -80,6 +84,7 @@ class TickLog(BaseModel):
     actions_succeeded: int = 0
     reasoning_summary: str = ""
     duration_ms: float = 0.0
+    planner_skipped: bool = False  # Unchanged world state: cached no-op plan reused
 
 
 class AgentLearning(BaseModel):
@@ -129,6 +129,7 @@ class ActionPlanner:
                     priority=int(raw_action.get("priority", 50)),
                     reasoning=raw_action.get("reasoning", ""),
                     params=raw_action.get("params", {}),
+                    group=str(raw_action.get("group") or ""),
                 )
                 actions.append(action)
             except (ValueError, TypeError) as e:
@@ -10,6 +10,7 @@ implement domain-specific methods:
 Optional overrides:
 - get_default_goals() -> list[AgentGoal]
 - get_extra_planning_context() -> str
+- get_action_group(action) -> str | None
 """
 
 import logging
@@ -20,7 +21,7 @@ from overblick.core.agentic.database import AGENTIC_MIGRATIONS, AgenticDB
 from overblick.core.agentic.executor import ActionExecutor
 from overblick.core.agentic.goal_tracker import GoalTracker
 from overblick.core.agentic.loop import AgentLoop
-from overblick.core.agentic.models import AgentGoal, TickLog
+from overblick.core.agentic.models import AgentGoal, PlannedAction, TickLog
 from overblick.core.agentic.planner import ActionPlanner
 from overblick.core.agentic.protocols import ActionHandler, Observer, PlanningPromptConfig
 from overblick.core.agentic.reflection import ReflectionPipeline
@@ -84,6 +85,16 @@ class AgenticPluginBase(PluginBase):
         """Return domain-specific learning categories for reflection. Override in subclass."""
         return "general"
 
+    def get_action_group(self, action: PlannedAction) -> str | None:
+        """
+        Name the group an action must run in, serialized with the rest of it.
+
+        None = group by target. Override for actions that share state
+        beyond their target. The planner's group hint cannot split a
+        group named here; it can only join it with other actions.
+        """
+        return None
+
     def get_valid_action_types(self) -> set[str] | None:
         """Return set of valid action type strings. None = accept all."""
         return set(self.get_action_handlers().keys())
@@ -124,12 +135,20 @@ class AgenticPluginBase(PluginBase):
         max_actions_per_tick: int = 5,
         audit_action_prefix: str = "agent",
         complexity: str = "high",
+        max_concurrent_actions: int = 1,
+        plan_staleness_seconds: float = 0.0,
     ) -> AgentLoop:
         """
         Wire and return the complete agentic loop.
 
         Must be called after setup_agentic_db() and after the plugin
         has created its domain-specific components.
+
+        Args:
+            max_concurrent_actions: Independent action groups run in
+                parallel per tick, at most this many at once (1 = serial)
+            plan_staleness_seconds: Reuse a no-op plan for this long while the
+                observed world state is unchanged (0 = always call the planner)
         """
         if not self._agentic_db:
             raise RuntimeError("Call setup_agentic_db() before setup_agentic_loop()")
@@ -158,6 +177,8 @@ class AgenticPluginBase(PluginBase):
         executor = ActionExecutor(
             handlers=self.get_action_handlers(),
             max_actions_per_tick=max_actions_per_tick,
+            max_concurrent=max_concurrent_actions,
+            group_key=self.get_action_group,
         )
 
         # Reflection — routes through LearningStore if available
@@ -182,6 +203,7 @@ class AgenticPluginBase(PluginBase):
             max_actions_per_tick=max_actions_per_tick,
             get_extra_context=self.get_extra_planning_context,
             learning_store=learning_store,
+            plan_staleness_seconds=plan_staleness_seconds,
         )
         await self._agent_loop.setup()
 
@@ -200,6 +222,11 @@ class AgenticPluginBase(PluginBase):
 
         return await self._agent_loop.tick()
 
+    async def wait_for_agentic_loop(self) -> None:
+        """Wait for background reflection to finish. Call from teardown()."""
+        if self._agent_loop:
+            await self._agent_loop.wait_for_reflections()
+
     @property
     def goal_tracker(self) -> GoalTracker | None:
         """Access the goal tracker (available after setup_agentic_loop)."""
@@ -43,7 +43,9 @@ def planning_prompt(
         system += f"SAFETY RULES:\n{config.safety_rules}\n\n"
 
     system += (
-        f"Plan at most {max_actions} actions, ordered by priority (highest first).\n\n"
+        f"Plan at most {max_actions} actions, ordered by priority (highest first).\n"
+        "Actions on different targets may run in parallel. Give actions that must run "
+        'in order (e.g. one needs the result of another) the same "group".\n\n'
         "Respond with ONLY a JSON object:\n"
         "{\n"
         '  "reasoning": "Your overall analysis of the current state",\n'
@@ -54,6 +56,7 @@ def planning_prompt(
         '      "target_number": 0,\n'
         '      "repo": "owner/repo",\n'
         '      "priority": 90,\n'
+        '      "group": "",\n'
         '      "reasoning": "Why this action is needed"\n'
         "    }\n"
         "  ]\n"
@@ -20,6 +20,10 @@ class Observer(Protocol):
 
     The returned observation is opaque to the core loop — only the
     plugin's observer and action handlers understand its structure.
+
+    Optionally, an observer may also define fingerprint(observation) -> str,
+    a stable digest of the world state that ignores volatile fields such as
+    timestamps. The loop uses it to skip planning when nothing changed.
     """
 
     async def observe(self) -> Any:
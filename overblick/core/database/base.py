@@ -30,6 +30,20 @@ class DatabaseConfig(BaseModel):
 
     # SQLite settings
     sqlite_path: str = "data/{identity}/overblick.db"
+    # Read pool: one long-lived read-only connection per reader thread
+    sqlite_read_pool_size: int = 3
+    sqlite_cache_size_kib: int = 8192  # page cache per read connection
+    sqlite_mmap_size: int = 64 * 1024 * 1024  # bytes of the file to memory-map
+    sqlite_statement_cache: int = 128  # prepared statements kept per connection
+    # Durability: PRAGMA synchronous level for writes (OFF/NORMAL/FULL/EXTRA).
+    # Per-table overrides let caches run at NORMAL while audit-style tables
+    # stay FULL; a transaction uses the strongest level of any table it writes.
+    sqlite_synchronous: str = "FULL"
+    sqlite_table_durability: dict[str, str] = {}
+    # Group commit (opt-in): writes queued within the window share one transaction
+    sqlite_group_commit: bool = False
+    sqlite_group_commit_window_ms: float = 2.0
+    sqlite_group_commit_max_batch: int = 256
 
     # PostgreSQL settings
     pg_host: str = "localhost"
@@ -55,6 +69,19 @@ class DatabaseConfig(BaseModel):
         sqlite = data.get("sqlite", {})
         if "path" in sqlite:
             flat["sqlite_path"] = sqlite["path"]
+        for key in (
+            "read_pool_size",
+            "cache_size_kib",
+            "mmap_size",
+            "statement_cache",
+            "synchronous",
+            "table_durability",
+            "group_commit",
+            "group_commit_window_ms",
+            "group_commit_max_batch",
+        ):
+            if key in sqlite:
+                flat[f"sqlite_{key}"] = sqlite[key]
 
         pg = data.get("postgresql", {})
         for key in ("host", "port", "database", "user", "password", "schema"):
@@ -179,7 +206,10 @@ class MigrationManager:
     """
     Simple migration manager for schema versioning.
 
-    Tracks applied migrations in a _migrations table.
+    Tracks applied migrations in a _migrations table. A migration is
+    pending until its own version is recorded, so one numbered below the
+    current version (e.g. a plugin migration added after shared v900+
+    ones were applied) still runs.
     """
 
     def __init__(self, db: DatabaseBackend):
@@ -209,11 +239,12 @@ class MigrationManager:
         Returns the number of migrations applied.
         """
         await self.setup()
-        current = await self.current_version()
+        rows = await self._db.fetch_all("SELECT version FROM _migrations")
+        done = {row["version"] for row in rows}
         applied = 0
 
         for migration in sorted(migrations, key=lambda m: m.version):
-            if migration.version <= current:
+            if migration.version in done:
                 continue
 
             logger.info("Applying migration %d: %s", migration.version, migration.name)
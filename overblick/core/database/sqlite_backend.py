@@ -4,13 +4,20 @@ SQLite database backend.
 Default backend — no external dependencies required.
 Uses synchronous sqlite3 offloaded to a single-thread executor
 to avoid blocking the async event loop.
+
+With group commit enabled, writes queued within a short window are
+applied in one transaction (one fsync) and each caller's result is
+delivered once that transaction commits.
 """
 
 import asyncio
 import logging
+import re
 import sqlite3
+import threading
 from collections.abc import Callable, Sequence
 from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional, TypeVar
 
@@ -20,6 +27,36 @@ T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
 
+# PRAGMA synchronous levels, weakest first
+_SYNCHRONOUS_LEVELS = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+# Target table of a write statement (for per-table durability)
+_WRITE_TARGET = re.compile(
+    r"^\s*(?:INSERT(?:\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|UPDATE(?:\s+OR\s+\w+)?|DELETE\s+FROM)"
+    r"\s+[\"`\[]?(\w+)",
+    re.IGNORECASE,
+)
+
+
+def _synchronous_level(name: str) -> int:
+    """Index of a PRAGMA synchronous level name in _SYNCHRONOUS_LEVELS."""
+    level = name.strip().upper()
+    if level not in _SYNCHRONOUS_LEVELS:
+        raise ValueError(
+            f"Invalid SQLite synchronous level {name!r} (expected one of {_SYNCHRONOUS_LEVELS})"
+        )
+    return _SYNCHRONOUS_LEVELS.index(level)
+
+
+@dataclass
+class _PendingWrite:
+    """A write waiting for the next group commit."""
+
+    sql: str
+    params: Any  # Sequence for single statements, list of Sequences for "many"
+    mode: str  # "rowcount", "lastrowid" or "many"
+    future: asyncio.Future[Any]
+
 
 class SQLiteBackend(DatabaseBackend):
     """
@@ -30,8 +67,14 @@ class SQLiteBackend(DatabaseBackend):
 
     Thread safety model:
     - Writes go through a single-thread executor sharing self._conn
-    - Reads open per-call connections (WAL mode supports concurrent readers)
-    - This avoids sharing sqlite3.Connection across threads which is unsafe
+    - Each read executor thread owns one long-lived read-only connection
+      (WAL mode supports concurrent readers)
+    - No sqlite3.Connection is ever used from two threads at once
+
+    Durability: writes run under PRAGMA synchronous=sqlite_synchronous,
+    raised or lowered per table via sqlite_table_durability. With
+    sqlite_group_commit, each queued write runs inside its own savepoint
+    of a shared transaction, so a failing statement only fails its caller.
     """
 
     def __init__(self, config: DatabaseConfig, identity: str = ""):
@@ -45,12 +88,28 @@ class SQLiteBackend(DatabaseBackend):
             max_workers=1,
             thread_name_prefix="sqlite-write",
         )
-        # Read executor uses per-call connections (not shared _conn)
-        # so concurrent reads are safe under WAL mode.
+        # Read executor threads each keep their own connection (not the
+        # shared _conn) so concurrent reads are safe under WAL mode.
         self._read_executor = ThreadPoolExecutor(
-            max_workers=3,
+            max_workers=max(1, config.sqlite_read_pool_size),
             thread_name_prefix="sqlite-read",
         )
+        self._read_local = threading.local()
+        self._read_conns: list[sqlite3.Connection] = []
+        self._read_conns_lock = threading.Lock()
+
+        self._default_sync = _synchronous_level(config.sqlite_synchronous)
+        self._table_sync = {
+            table.lower(): _synchronous_level(level)
+            for table, level in config.sqlite_table_durability.items()
+        }
+        self._current_sync: int | None = None
+        self._group_commit = config.sqlite_group_commit
+        self._group_window = max(0.0, config.sqlite_group_commit_window_ms) / 1000
+        self._group_max_batch = max(1, config.sqlite_group_commit_max_batch)
+        self._pending_writes: list[_PendingWrite] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
 
     @property
     def db_path(self) -> Path:
@@ -70,6 +129,8 @@ class SQLiteBackend(DatabaseBackend):
         self._conn.execute("PRAGMA journal_mode=WAL")
         # Enable foreign keys
         self._conn.execute("PRAGMA foreign_keys=ON")
+        self._current_sync = None
+        self._set_synchronous_sync(self._default_sync)
 
         self._connected = True
         logger.info("SQLite connected: %s", self._db_path)
@@ -77,6 +138,10 @@ class SQLiteBackend(DatabaseBackend):
     async def close(self) -> None:
         """Close SQLite connection and executor."""
         if self._conn:
+            # Commit anything still queued for a group commit
+            await self._flush_writes()
+            if self._flush_tasks:
+                await asyncio.gather(*self._flush_tasks, return_exceptions=True)
             try:
                 self._conn.close()
             except Exception as e:
@@ -85,6 +150,14 @@ class SQLiteBackend(DatabaseBackend):
                 self._conn = None
         self._executor.shutdown(wait=True)
         self._read_executor.shutdown(wait=True)
+        # Reader threads are gone, so their connections can be closed here
+        with self._read_conns_lock:
+            for conn in self._read_conns:
+                try:
+                    conn.close()
+                except Exception as e:
+                    logger.warning("Error closing SQLite read connection: %s", e)
+            self._read_conns.clear()
         self._connected = False
 
     def _check_connected(self) -> None:
@@ -97,92 +170,215 @@ class SQLiteBackend(DatabaseBackend):
         return await loop.run_in_executor(self._executor, fn, *args)
 
     async def _run_in_read_executor(self, fn: Callable[..., T], *args: Any) -> T:
-        """Run a read operation in the read thread pool (up to 3 concurrent)."""
+        """Run a read operation in the read thread pool (sqlite_read_pool_size)."""
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(self._read_executor, fn, *args)
 
     def _open_read_connection(self) -> sqlite3.Connection:
-        """Open a read-only connection for thread-safe concurrent reads."""
-        conn = sqlite3.connect(str(self._db_path), check_same_thread=True)
+        """Open a tuned read-only connection for one reader thread."""
+        config = self._config
+        # check_same_thread=False only so close() can reap it after the
+        # reader thread has exited; it is never shared between live threads.
+        conn = sqlite3.connect(
+            str(self._db_path),
+            check_same_thread=False,
+            cached_statements=config.sqlite_statement_cache,
+        )
         conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys=ON")
+        conn.execute("PRAGMA query_only=ON")
+        conn.execute(f"PRAGMA cache_size=-{int(config.sqlite_cache_size_kib)}")
+        conn.execute(f"PRAGMA mmap_size={int(config.sqlite_mmap_size)}")
+        return conn
+
+    def _read_connection(self) -> sqlite3.Connection:
+        """Get the calling reader thread's connection, opening it on first use."""
+        conn = getattr(self._read_local, "conn", None)
+        if conn is None:
+            conn = self._open_read_connection()
+            self._read_local.conn = conn
+            with self._read_conns_lock:
+                self._read_conns.append(conn)
         return conn
 
     # --- Write operations (use shared _conn via single-thread executor) ---
 
+    def _durability_for(self, sql: str) -> int:
+        """Synchronous level required by the table a statement writes."""
+        if self._table_sync:
+            match = _WRITE_TARGET.match(sql)
+            if match:
+                return self._table_sync.get(match.group(1).lower(), self._default_sync)
+        return self._default_sync
+
+    def _set_synchronous_sync(self, level: int) -> None:
+        """Switch PRAGMA synchronous (only takes effect outside a transaction)."""
+        assert self._conn is not None
+        if level != self._current_sync:
+            self._conn.execute(f"PRAGMA synchronous={_SYNCHRONOUS_LEVELS[level]}")
+            self._current_sync = level
+
     def _execute_sync(self, sql: str, params: Sequence[Any]) -> int:
         assert self._conn is not None
+        self._set_synchronous_sync(self._durability_for(sql))
         with self._conn:
             cursor = self._conn.execute(sql, params)
             return cursor.rowcount
 
     def _execute_returning_id_sync(self, sql: str, params: Sequence[Any]) -> int | None:
         assert self._conn is not None
+        self._set_synchronous_sync(self._durability_for(sql))
         with self._conn:
             cursor = self._conn.execute(sql, params)
             return cursor.lastrowid
 
-    # --- Read operations (per-call connections for thread safety) ---
+    # --- Group commit ---
+
+    @staticmethod
+    def _apply_write(conn: sqlite3.Connection, write: _PendingWrite) -> Any:
+        if write.mode == "many":
+            conn.executemany(write.sql, write.params)
+            return len(write.params)
+        cursor = conn.execute(write.sql, write.params)
+        return cursor.lastrowid if write.mode == "lastrowid" else cursor.rowcount
+
+    def _commit_batch_sync(self, batch: list[_PendingWrite]) -> list[Any]:
+        """
+        Apply queued writes in one transaction.
+
+        Each write gets its own savepoint: a failing statement is rolled
+        back and its exception returned in place of a result, without
+        disturbing the rest of the batch.
+        """
+        assert self._conn is not None
+        conn = self._conn
+        self._set_synchronous_sync(max(self._durability_for(w.sql) for w in batch))
+        outcomes: list[Any] = []
+        conn.execute("BEGIN")
+        try:
+            for write in batch:
+                conn.execute("SAVEPOINT group_write")
+                try:
+                    outcome = self._apply_write(conn, write)
+                except Exception as e:
+                    conn.execute("ROLLBACK TO group_write")
+                    outcome = e
+                conn.execute("RELEASE group_write")
+                outcomes.append(outcome)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        return outcomes
+
+    async def _queue_write(self, sql: str, params: Any, mode: str) -> Any:
+        """Queue a write for the next group commit and wait for its result."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        self._pending_writes.append(_PendingWrite(sql, params, mode, future))
+        if len(self._pending_writes) >= self._group_max_batch:
+            self._start_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._group_window, self._start_flush)
+        return await future
+
+    def _start_flush(self) -> None:
+        """Commit the pending batch in the background."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        task = asyncio.get_running_loop().create_task(self._flush_writes())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush_writes(self) -> None:
+        """Commit every pending write and resolve the callers' futures."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending_writes = self._pending_writes, []
+        if not batch:
+            return
+        try:
+            outcomes = await self._run_in_executor(self._commit_batch_sync, batch)
+        except asyncio.CancelledError:
+            for write in batch:
+                write.future.cancel()
+            raise
+        except Exception as e:
+            logger.warning("SQLite group commit of %d write(s) failed: %s", len(batch), e)
+            for write in batch:
+                if not write.future.done():
+                    write.future.set_exception(e)
+            return
+        for write, outcome in zip(batch, outcomes):
+            if write.future.done():
+                continue
+            if isinstance(outcome, Exception):
+                write.future.set_exception(outcome)
+            else:
+                write.future.set_result(outcome)
+
+    # --- Read operations (per-thread pooled connections) ---
 
     def _fetch_one_sync(self, sql: str, params: Sequence[Any]) -> DatabaseRow | None:
-        conn = self._open_read_connection()
+        cursor = self._read_connection().execute(sql, params)
         try:
-            cursor = conn.execute(sql, params)
             row = cursor.fetchone()
             if row is None:
                 return None
             return dict(row)
         finally:
-            conn.close()
+            # Release the read snapshot even if rows remain unread
+            cursor.close()
 
     def _fetch_all_sync(self, sql: str, params: Sequence[Any]) -> list[DatabaseRow]:
-        conn = self._open_read_connection()
-        try:
-            cursor = conn.execute(sql, params)
-            return [dict(row) for row in cursor.fetchall()]
-        finally:
-            conn.close()
+        cursor = self._read_connection().execute(sql, params)
+        return [dict(row) for row in cursor.fetchall()]
 
     def _fetch_scalar_sync(self, sql: str, params: Sequence[Any]) -> Any:
-        conn = self._open_read_connection()
+        cursor = self._read_connection().execute(sql, params)
         try:
-            cursor = conn.execute(sql, params)
             row = cursor.fetchone()
             if row is None:
                 return None
             return row[0]
         finally:
-            conn.close()
+            cursor.close()
 
     # --- Async interface ---
 
     async def execute(self, sql: str, params: Sequence[Any] = ()) -> int:
         """Execute SQL and return affected row count."""
         self._check_connected()
+        if self._group_commit:
+            return int(await self._queue_write(sql, params, "rowcount"))
         return await self._run_in_executor(self._execute_sync, sql, params)
 
     async def execute_returning_id(self, sql: str, params: Sequence[Any] = ()) -> int | None:
         """Execute INSERT and return the new row ID."""
         self._check_connected()
+        if self._group_commit:
+            return await self._queue_write(sql, params, "lastrowid")  # type: ignore[no-any-return]
         return await self._run_in_executor(self._execute_returning_id_sync, sql, params)
 
     async def fetch_one(self, sql: str, params: Sequence[Any] = ()) -> DatabaseRow | None:
-        """Fetch a single row as a dict (uses per-call read connection)."""
+        """Fetch a single row as a dict (uses the pooled read connection)."""
         self._check_connected()
         return await self._run_in_read_executor(self._fetch_one_sync, sql, params)
 
     async def fetch_all(self, sql: str, params: Sequence[Any] = ()) -> list[DatabaseRow]:
-        """Fetch all matching rows as dicts (uses per-call read connection)."""
+        """Fetch all matching rows as dicts (uses the pooled read connection)."""
         self._check_connected()
         return await self._run_in_read_executor(self._fetch_all_sync, sql, params)
 
     async def fetch_scalar(self, sql: str, params: Sequence[Any] = ()) -> Any:
-        """Fetch a single scalar value (uses per-call read connection)."""
+        """Fetch a single scalar value (uses the pooled read connection)."""
         self._check_connected()
         return await self._run_in_read_executor(self._fetch_scalar_sync, sql, params)
 
     def _execute_many_sync(self, sql: str, params_list: list[Sequence[Any]]) -> int:
         assert self._conn is not None
+        self._set_synchronous_sync(self._durability_for(sql))
         with self._conn:
             self._conn.executemany(sql, params_list)
             return len(params_list)
@@ -192,6 +388,8 @@ class SQLiteBackend(DatabaseBackend):
         self._check_connected()
         if not params_list:
             return 0
+        if self._group_commit:
+            return int(await self._queue_write(sql, list(params_list), "many"))
         return await self._run_in_executor(self._execute_many_sync, sql, params_list)
 
     def _execute_script_sync(self, sql: str) -> None:
@@ -202,6 +400,8 @@ class SQLiteBackend(DatabaseBackend):
     async def execute_script(self, sql: str) -> None:
         """Execute a multi-statement SQL script."""
         self._check_connected()
+        # executescript() commits first; keep queued writes ahead of it
+        await self._flush_writes()
         await self._run_in_executor(self._execute_script_sync, sql)
 
     async def table_exists(self, table_name: str) -> bool:
@@ -21,6 +21,9 @@ class EngagementDB:
 
     _DEFAULT_RETENTION_DAYS = 90
     _CLEANUP_INTERVAL_SECONDS = 3600  # 1 hour
+    # Ids per filter_unprocessed query (each appears twice; SQLite's
+    # default variable limit is 999 on older builds)
+    _FILTER_CHUNK_SIZE = 400
 
     def __init__(self, db: DatabaseBackend, identity: str = ""):
         self._db = db
@@ -303,6 +306,33 @@ class EngagementDB:
         )
         return row is not None
 
+    async def filter_unprocessed(self, comment_ids: list[str]) -> list[str]:
+        """
+        Return the comment ids that are neither processed nor queued.
+
+        Bulk form of is_reply_processed(): one IN query per chunk of ids
+        instead of two queries per comment. Input order is preserved and
+        duplicates are dropped.
+        """
+        ids = list(dict.fromkeys(cid for cid in comment_ids if cid))
+        if not ids:
+            return []
+
+        ph = self._db.ph
+        seen: set[str] = set()
+        for start in range(0, len(ids), self._FILTER_CHUNK_SIZE):
+            chunk = ids[start : start + self._FILTER_CHUNK_SIZE]
+            n = len(chunk)
+            first = ", ".join(ph(i + 1) for i in range(n))
+            second = ", ".join(ph(n + i + 1) for i in range(n))
+            rows = await self._db.fetch_all(
+                f"SELECT comment_id FROM processed_replies WHERE comment_id IN ({first}) "
+                f"UNION SELECT comment_id FROM reply_action_queue WHERE comment_id IN ({second})",
+                tuple(chunk) * 2,
+            )
+            seen.update(r["comment_id"] for r in rows)
+        return [cid for cid in ids if cid not in seen]
+
     async def mark_reply_processed(
         self,
         comment_id: str,
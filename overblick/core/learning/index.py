@@ -0,0 +1,187 @@
+"""
+In-memory embedding index for LearningStore similarity search.
+
+Holds every approved learning's embedding, normalized, in insertion
+(recency) order. A query is one matrix-vector product over the whole
+set plus argpartition for the top k, with the recency boost applied as a
+vector. The index is loaded from SQLite once and then kept current by
+LearningStore._insert, so get_relevant() no longer re-reads and unpacks
+embedding BLOBs on every call.
+
+NumPy is optional (``pip install overblick[learning]``). Without it the
+same index runs in pure Python over pre-normalized tuples — still no
+per-query database load, just slower scoring.
+"""
+
+import heapq
+import logging
+import math
+import time
+from collections.abc import Sequence
+from typing import Any
+
+# numpy is optional — the index falls back to pure Python without it
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+logger = logging.getLogger(__name__)
+
+# The newest learning gets this boost, decaying linearly to 0 over
+# RECENCY_WINDOW rows (older rows compete on similarity alone)
+RECENCY_BOOST = 0.1
+RECENCY_WINDOW = 1000
+
+_INITIAL_CAPACITY = 64
+
+
+class EmbeddingIndex:
+    """
+    Normalized float32 embeddings of approved learnings, oldest first.
+
+    Only embeddings of the first dimension seen are indexed; a model
+    change that alters the dimension leaves older rows out (logged).
+    """
+
+    def __init__(self, use_numpy: bool = HAS_NUMPY):
+        self._use_numpy = use_numpy and HAS_NUMPY
+        self._dim: int | None = None
+        self._ids: list[int] = []
+        # numpy: (capacity x dim) float32 matrix, first len(_ids) rows used
+        self._matrix: Any = None
+        # pure Python: one normalized tuple per row
+        self._rows: list[tuple[float, ...]] = []
+        self._skipped = 0
+        self._queries = 0
+        self._last_query_ms = 0.0
+        self._total_query_ms = 0.0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    @property
+    def dim(self) -> int | None:
+        return self._dim
+
+    def add(self, learning_id: int, embedding: Sequence[float]) -> bool:
+        """Append a (newest) learning's embedding. Returns False if not indexed."""
+        if self._dim is None and len(embedding):
+            self._dim = len(embedding)
+        if not len(embedding) or len(embedding) != self._dim:
+            self._skipped += 1
+            logger.debug(
+                "Learning %s embedding has %d dims, index has %s — not indexed",
+                learning_id,
+                len(embedding),
+                self._dim,
+            )
+            return False
+
+        if self._use_numpy:
+            vector = np.asarray(embedding, dtype=np.float32)
+            norm = float(np.linalg.norm(vector))
+            row = len(self._ids)
+            self._reserve(row + 1)
+            self._matrix[row] = vector / norm if norm else vector
+        else:
+            norm = math.sqrt(sum(v * v for v in embedding))
+            self._rows.append(tuple(v / norm for v in embedding) if norm else tuple(embedding))
+        self._ids.append(learning_id)
+        return True
+
+    def _reserve(self, rows: int) -> None:
+        """Grow the matrix geometrically so appends are amortized O(dim)."""
+        capacity = 0 if self._matrix is None else self._matrix.shape[0]
+        if rows <= capacity:
+            return
+        new_capacity = max(_INITIAL_CAPACITY, capacity * 2, rows)
+        matrix = np.zeros((new_capacity, self._dim), dtype=np.float32)
+        if capacity:
+            matrix[:capacity] = self._matrix
+        self._matrix = matrix
+
+    def search(self, query: Sequence[float], limit: int) -> list[tuple[int, float]]:
+        """
+        Top learnings by cosine similarity plus recency boost.
+
+        Returns:
+            (learning_id, score) pairs, best first.
+
+        Raises:
+            ValueError: If the query's dimension does not match the index.
+        """
+        count = len(self._ids)
+        if not count or limit <= 0:
+            return []
+        if len(query) != self._dim:
+            raise ValueError(f"Query has {len(query)} dims, index has {self._dim}")
+
+        start = time.perf_counter()
+        if self._use_numpy:
+            results = self._search_numpy(query, limit, count)
+        else:
+            results = self._search_python(query, limit, count)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._queries += 1
+        self._last_query_ms = elapsed_ms
+        self._total_query_ms += elapsed_ms
+        return results
+
+    def _search_numpy(
+        self, query: Sequence[float], limit: int, count: int
+    ) -> list[tuple[int, float]]:
+        q = np.asarray(query, dtype=np.float32)
+        norm = float(np.linalg.norm(q))
+        if norm:
+            q = q / norm
+        scores = self._matrix[:count] @ q
+        # Row j is the (count - 1 - j)-th newest
+        age = np.arange(count - 1, -1, -1, dtype=np.float32)
+        scores += np.clip(RECENCY_WINDOW - age, 0, None) * (RECENCY_BOOST / RECENCY_WINDOW)
+
+        if limit < count:
+            top = np.argpartition(scores, count - limit)[count - limit :]
+        else:
+            top = np.arange(count)
+        # Best first; ties go to the newer row
+        order = top[np.lexsort((-top, -scores[top]))]
+        return [(self._ids[j], float(scores[j])) for j in order]
+
+    def _search_python(
+        self, query: Sequence[float], limit: int, count: int
+    ) -> list[tuple[int, float]]:
+        norm = math.sqrt(sum(v * v for v in query))
+        q = [v / norm for v in query] if norm else list(query)
+        scale = RECENCY_BOOST / RECENCY_WINDOW
+
+        def scored():
+            for j, row in enumerate(self._rows):
+                boost = max(RECENCY_WINDOW - (count - 1 - j), 0) * scale
+                yield sum(a * b for a, b in zip(q, row)) + boost, j
+
+        best = heapq.nlargest(limit, scored())
+        return [(self._ids[j], score) for score, j in best]
+
+    def stats(self) -> dict[str, Any]:
+        """Size, memory and query-latency figures for monitoring."""
+        if self._use_numpy:
+            memory = 0 if self._matrix is None else int(self._matrix.nbytes)
+        else:
+            # float objects (24 B) plus tuple slots (8 B) per value
+            memory = sum(32 * len(row) + 56 for row in self._rows)
+        return {
+            "backend": "numpy" if self._use_numpy else "python",
+            "entries": len(self._ids),
+            "dim": self._dim,
+            "skipped": self._skipped,
+            "memory_bytes": memory,
+            "queries": self._queries,
+            "last_query_ms": round(self._last_query_ms, 3),
+            "avg_query_ms": (
+                round(self._total_query_ms / self._queries, 3) if self._queries else 0.0
+            ),
+        }
@@ -61,6 +61,8 @@ class EthosReviewer:
                     {"role": "user", "content": prompt},
                 ],
                 audit_action="ethos_review",
+                # Deterministic verdicts; also makes repeated reviews cacheable
+                temperature=0.0,
                 skip_preflight=True,
                 priority="low",
             )
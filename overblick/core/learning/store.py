@@ -3,10 +3,11 @@ LearningStore — per-identity learning persistence with embedding retrieval.
 
 Provides SQLite-backed storage for learnings with:
 - Immediate ethos review at propose time
-- Embedding-based semantic retrieval
+- Embedding-based semantic retrieval over an in-memory index
 - Graceful fallback when embeddings are unavailable
 """
 
+import asyncio
 import logging
 import struct
 from collections.abc import Callable
@@ -18,6 +19,7 @@ import aiosqlite
 
 from overblick.core.llm.pipeline import SafeLLMPipeline
 
+from .index import EmbeddingIndex
 from .migrations import run_migrations
 from .models import Learning, LearningStatus
 from .reviewer import EthosReviewer
@@ -68,6 +70,9 @@ class LearningStore:
         self._reviewer = EthosReviewer(llm_pipeline, ethos_text)  # type: ignore[arg-type]
         self._embed_fn = embed_fn
         self._embedding_cache: dict[str, list[float]] = {}
+        # Loaded on first similarity search, then kept current by _insert
+        self._index: EmbeddingIndex | None = None
+        self._index_lock = asyncio.Lock()
 
     async def setup(self) -> None:
         """Run migrations and ensure the database is ready."""
@@ -212,53 +217,64 @@ class LearningStore:
             await conn.commit()
             learning.id = cursor.lastrowid
 
-    # Maximum number of embeddings to load for in-memory similarity search.
-    # Keeps memory bounded while still returning good results.
-    _MAX_SIMILARITY_CANDIDATES = 1000
+        if (
+            self._index is not None
+            and learning.id is not None
+            and learning.status == LearningStatus.APPROVED
+            and learning.embedding
+        ):
+            self._index.add(learning.id, learning.embedding)
+
+    async def _get_index(self) -> EmbeddingIndex:
+        """Return the embedding index, loading it from SQLite on first use."""
+        if self._index is not None:
+            return self._index
+        async with self._index_lock:
+            if self._index is None:
+                index = EmbeddingIndex()
+                async with aiosqlite.connect(str(self._db_path)) as conn:
+                    cursor = await conn.execute(
+                        "SELECT id, embedding FROM identity_learnings "
+                        "WHERE status = ? AND embedding IS NOT NULL "
+                        "ORDER BY created_at ASC, id ASC",
+                        (LearningStatus.APPROVED.value,),
+                    )
+                    async for learning_id, blob in cursor:
+                        index.add(learning_id, _unpack_embedding(blob))
+                self._index = index
+                logger.info("Learning embedding index loaded: %s", index.stats())
+        return self._index
+
+    def index_stats(self) -> dict[str, Any] | None:
+        """Embedding index size, memory and query latency (None until loaded)."""
+        return self._index.stats() if self._index is not None else None
 
     async def _search_by_similarity(
         self,
         query_embedding: list[float],
         limit: int,
     ) -> list[Learning]:
-        """Search approved learnings by cosine similarity to query embedding.
+        """Search all approved learnings by cosine similarity to query embedding.
 
-        Loads at most _MAX_SIMILARITY_CANDIDATES recent embeddings.
-        Applies a recency bias to ensure fresh knowledge is prioritized
-        when similarity scores are close.
+        Scores come from the in-memory EmbeddingIndex, which adds a
+        recency boost so fresh knowledge wins when similarity is close.
+        Only the top `limit` rows are then read from SQLite.
         """
+        index = await self._get_index()
+        hits = index.search(query_embedding, limit)
+        if not hits:
+            return []
+
+        ids = [learning_id for learning_id, _ in hits]
         async with aiosqlite.connect(str(self._db_path)) as conn:
             conn.row_factory = aiosqlite.Row
             cursor = await conn.execute(
-                "SELECT * FROM identity_learnings "
-                "WHERE status = ? AND embedding IS NOT NULL "
-                "ORDER BY created_at DESC LIMIT ?",
-                (LearningStatus.APPROVED.value, self._MAX_SIMILARITY_CANDIDATES),
-            )
-            rows = await cursor.fetchall()
-
-        if not rows:
-            return []
-
-        # Score and rank by similarity + recency decay
-        scored = []
-
-        for i, row in enumerate(rows):
-            embedding = _unpack_embedding(row["embedding"])
-            similarity = _cosine_similarity(query_embedding, embedding)
-
-            # Simple recency factor: newer rows (lower index i) get a small boost.
-            # Max boost is 0.1 for the very newest, decaying to 0.0 for the 1000th.
-            # This ensures that if two learnings have similar content, the newer wins.
-            recency_boost = (
-                (self._MAX_SIMILARITY_CANDIDATES - i) / self._MAX_SIMILARITY_CANDIDATES * 0.1
+                f"SELECT * FROM identity_learnings WHERE id IN ({','.join('?' * len(ids))})",
+                ids,
             )
-            final_score = similarity + recency_boost
-
-            scored.append((final_score, row))
+            rows = {row["id"]: row for row in await cursor.fetchall()}
 
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return [self._row_to_learning(row) for _, row in scored[:limit]]
+        return [self._row_to_learning(rows[i]) for i in ids if i in rows]
 
     @staticmethod
     def _row_to_learning(row: aiosqlite.Row) -> Learning:
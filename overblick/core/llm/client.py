@@ -13,12 +13,76 @@ Reasoning policy:
 
 import re
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 from contextlib import contextmanager
 from typing import Optional
 
 from overblick.core.exceptions import SecurityError
 
 _THINK_RE = re.compile(r"<think>.*?</think>", re.DOTALL)
+_THINK_OPEN = "<think>"
+_THINK_CLOSE = "</think>"
+
+
+def _partial_tag_len(text: str, tag: str) -> int:
+    """Length of the longest suffix of text that is a proper prefix of tag."""
+    for k in range(min(len(tag) - 1, len(text)), 0, -1):
+        if text.endswith(tag[:k]):
+            return k
+    return 0
+
+
+class ThinkTokenStreamFilter:
+    """
+    Incremental counterpart of LLMClient.strip_think_tokens for streams.
+
+    Tags may be split across deltas, so a possible partial tag at the end
+    of the buffer is held back until the next feed(). Leading whitespace
+    is dropped like strip() does; an unterminated think block is dropped.
+    """
+
+    def __init__(self) -> None:
+        self._buf = ""
+        self._in_think = False
+        self._started = False
+
+    def feed(self, text: str) -> str:
+        """Add a streamed delta and return the text that is safe to emit."""
+        self._buf += text
+        out: list[str] = []
+        while True:
+            if self._in_think:
+                idx = self._buf.find(_THINK_CLOSE)
+                if idx < 0:
+                    keep = _partial_tag_len(self._buf, _THINK_CLOSE)
+                    self._buf = self._buf[len(self._buf) - keep :]
+                    break
+                self._buf = self._buf[idx + len(_THINK_CLOSE) :]
+                self._in_think = False
+            else:
+                idx = self._buf.find(_THINK_OPEN)
+                if idx < 0:
+                    keep = _partial_tag_len(self._buf, _THINK_OPEN)
+                    out.append(self._buf[: len(self._buf) - keep])
+                    self._buf = self._buf[len(self._buf) - keep :]
+                    break
+                out.append(self._buf[:idx])
+                self._buf = self._buf[idx + len(_THINK_OPEN) :]
+                self._in_think = True
+        return self._emit("".join(out))
+
+    def flush(self) -> str:
+        """Return any held-back text once the stream has ended."""
+        rest = "" if self._in_think else self._buf
+        self._buf = ""
+        self._in_think = False
+        return self._emit(rest)
+
+    def _emit(self, text: str) -> str:
+        if not self._started:
+            text = text.lstrip()
+            self._started = bool(text)
+        return text
 
 
 class LLMClient(ABC):
@@ -86,6 +150,7 @@ class LLMClient(ABC):
         top_p: float | None = None,
         priority: str = "low",
         complexity: str | None = None,
+        cache: str | None = None,
     ) -> dict | None:
         """
         Send a chat completion request.
@@ -99,11 +164,41 @@ class LLMClient(ABC):
                       for queue ordering. OllamaClient ignores this parameter.
             complexity: Request complexity ("high" or "low"). Used by GatewayClient
                         for backend routing. Other clients ignore this parameter.
+            cache: Gateway response cache mode ("auto", "force" or "off").
+                   Used by GatewayClient. Other clients ignore this parameter.
 
         Returns:
             Dict with 'content' key containing the response, or None on error
         """
 
+    async def chat_stream(
+        self,
+        messages: list[dict],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        top_p: float | None = None,
+        priority: str = "low",
+        complexity: str | None = None,
+    ) -> AsyncIterator[str]:
+        """
+        Stream a chat completion as text deltas (think tokens stripped).
+
+        The default implementation has no real streaming: it awaits chat()
+        and yields the whole response once. Clients whose backend can
+        stream (GatewayClient) override this.
+        """
+        result = await self.chat(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            top_p=top_p,
+            priority=priority,
+            complexity=complexity,
+        )
+        content = self.strip_think_tokens((result or {}).get("content") or "")
+        if content:
+            yield content
+
     @abstractmethod
     async def health_check(self) -> bool:
         """
@@ -14,14 +14,16 @@ Reasoning policy:
 """
 
 import asyncio
+import json
 import logging
 import time
+from collections.abc import AsyncIterator
 from typing import Optional
 
 import aiohttp
 
 from overblick.core.exceptions import LLMConnectionError, LLMTimeoutError
-from overblick.core.llm.client import LLMClient
+from overblick.core.llm.client import LLMClient, ThinkTokenStreamFilter
 
 logger = logging.getLogger(__name__)
 
@@ -80,6 +82,7 @@ class GatewayClient(LLMClient):
         top_p: float | None = None,
         priority: str = "",
         complexity: str | None = None,
+        cache: str | None = None,
     ) -> dict | None:
         """Send chat completion through the gateway with per-request priority."""
         await self._ensure_session()
@@ -89,6 +92,8 @@ class GatewayClient(LLMClient):
         url = f"{self.base_url}/v1/chat/completions?priority={prio}"
         if complexity:
             url += f"&complexity={complexity}"
+        if cache:
+            url += f"&cache={cache}"
         payload = {
             "model": self.model,
             "messages": messages,
@@ -160,6 +165,105 @@ class GatewayClient(LLMClient):
             logger.error("Gateway: Unexpected error: %s", e, exc_info=True)
             raise LLMConnectionError(f"Gateway unexpected error: {e}") from e
 
+    async def chat_stream(
+        self,
+        messages: list[dict],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        top_p: float | None = None,
+        priority: str = "",
+        complexity: str | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream a chat completion through the gateway as text deltas.
+
+        Uses the gateway's SSE mode. Think tokens are stripped on the fly;
+        DeepSeek reasoning deltas are not forwarded. The timeout applies to
+        the gap between chunks rather than the whole generation.
+        """
+        await self._ensure_session()
+        assert self._session is not None
+
+        prio = priority if priority else self.default_priority
+        url = f"{self.base_url}/v1/chat/completions?priority={prio}"
+        if complexity:
+            url += f"&complexity={complexity}"
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "temperature": temperature if temperature is not None else self.temperature,
+            "max_tokens": max_tokens if max_tokens is not None else self.max_tokens,
+            "top_p": top_p if top_p is not None else self.top_p,
+            "stream": True,
+        }
+
+        start_time = time.monotonic()
+        first_token_at: float | None = None
+        chars = 0
+        think_filter = ThinkTokenStreamFilter()
+
+        try:
+            async with self._session.post(
+                url,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=None, sock_read=self.timeout_seconds),
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.warning("Gateway: API error %d: %s", response.status, error_text)
+                    raise LLMConnectionError(
+                        f"Gateway API error {response.status}: {error_text[:200]}"
+                    )
+
+                async for raw_line in response.content:
+                    line = raw_line.decode("utf-8", errors="replace").strip()
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    try:
+                        chunk = json.loads(data)
+                    except json.JSONDecodeError:
+                        continue
+                    if "error" in chunk:
+                        message = chunk["error"].get("message", "unknown error")
+                        raise LLMConnectionError(f"Gateway stream error: {message}")
+
+                    for choice in chunk.get("choices") or []:
+                        delta = (choice.get("delta") or {}).get("content")
+                        text = think_filter.feed(delta) if delta else ""
+                        if text:
+                            if first_token_at is None:
+                                first_token_at = time.monotonic()
+                            chars += len(text)
+                            yield text
+
+            tail = think_filter.flush()
+            if tail:
+                chars += len(tail)
+                yield tail
+
+            elapsed = time.monotonic() - start_time
+            ttft = (first_token_at - start_time) if first_token_at else elapsed
+            logger.info(
+                "Gateway: Streamed response in %.1fs (first token %.2fs, %d chars)",
+                elapsed,
+                ttft,
+                chars,
+            )
+
+        except TimeoutError:
+            logger.error("Gateway: Stream stalled (%ds)", self.timeout_seconds, exc_info=True)
+            raise LLMTimeoutError(f"Gateway stream timeout ({self.timeout_seconds}s)")
+        except aiohttp.ClientError as e:
+            logger.error("Gateway: Connection error: %s", e, exc_info=True)
+            raise LLMConnectionError(f"Gateway connection error: {e}") from e
+        except (LLMTimeoutError, LLMConnectionError):
+            raise
+        except Exception as e:
+            logger.error("Gateway: Unexpected error: %s", e, exc_info=True)
+            raise LLMConnectionError(f"Gateway unexpected error: {e}") from e
+
     async def health_check(self) -> bool:
         """Check if the gateway is available."""
         await self._ensure_session()
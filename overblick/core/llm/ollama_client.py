@@ -77,8 +77,9 @@ class OllamaClient(LLMClient):
         top_p: float | None = None,
         priority: str = "low",
         complexity: str | None = None,
+        cache: str | None = None,
     ) -> dict | None:
-        """Send a chat completion request to Ollama. Priority and complexity are ignored (no queue)."""
+        """Send a chat completion request to Ollama. Priority, complexity and cache are ignored (no gateway)."""
         await self._ensure_session()
 
         temp = temperature if temperature is not None else self.temperature
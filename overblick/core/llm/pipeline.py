@@ -7,11 +7,17 @@ Consolidates the full security chain into one pipeline:
 Plugins should use this instead of calling llm_client.chat() directly.
 This guarantees that every LLM interaction passes through all security layers,
 eliminating the risk of skipped checks.
+
+chat_stream() runs the same chain but yields text while the model is still
+generating. Output safety then runs on a sliding window: the newest
+_STREAM_HOLDBACK_CHARS are withheld until enough text follows them to rule
+out a blocked pattern starting there.
 """
 
 import asyncio
 import logging
 import time
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
@@ -151,6 +157,29 @@ class PipelineResult(BaseModel):
     reasoning_content: str | None = None
 
 
+class PipelineStreamChunk(BaseModel):
+    """
+    One event from SafeLLMPipeline.chat_stream().
+
+    Intermediate events carry a safe ``delta`` to display. The last event
+    has ``done=True`` and the full PipelineResult. If that result is
+    blocked, text already shown should be replaced with its deflection.
+    """
+
+    delta: str = ""
+    done: bool = False
+    result: PipelineResult | None = None
+
+
+# Streamed output safety: text is released only once this many newer
+# characters follow it, so any blocked pattern up to this length is seen
+# in full before its first character leaves the pipeline.
+_STREAM_HOLDBACK_CHARS = 160
+# Already-released context re-scanned with each check, for patterns that
+# straddle the release boundary.
+_STREAM_WINDOW_CHARS = 240
+
+
 class SafeLLMPipeline:
     """
     Single secure interface for all LLM interactions.
@@ -227,6 +256,7 @@ class SafeLLMPipeline:
         audit_details: dict[str, Any] | None = None,
         priority: str = "low",
         complexity: str | None = None,
+        cache: str | None = None,
     ) -> PipelineResult:
         """
         Send a chat request through the full security pipeline.
@@ -245,6 +275,8 @@ class SafeLLMPipeline:
             audit_details: Extra audit details
             priority: Request priority ("high" or "low")
             complexity: Request complexity ("high" or "low")
+            cache: Gateway response cache mode ("auto", "force" or "off");
+                None leaves it to the gateway default (temperature 0 only)
 
         Returns:
             PipelineResult with safe content or block information
@@ -262,6 +294,7 @@ class SafeLLMPipeline:
             audit_details=audit_details,
             priority=priority,
             complexity=complexity,
+            cache=cache,
         )
 
     async def _chat_with_overrides(
@@ -278,6 +311,7 @@ class SafeLLMPipeline:
         audit_details: dict[str, Any] | None = None,
         priority: str = "low",
         complexity: str | None = None,
+        cache: str | None = None,
     ) -> PipelineResult:
         """
         Internal chat implementation with security overrides.
@@ -358,6 +392,7 @@ class SafeLLMPipeline:
                 top_p=top_p,
                 priority=priority,
                 complexity=complexity,
+                cache=cache,
             )
 
             # Record success on circuit breaker
@@ -451,6 +486,245 @@ class SafeLLMPipeline:
 
         return result
 
+    async def chat_stream(
+        self,
+        messages: list[dict[str, str]],
+        user_id: str = "system",
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        top_p: float | None = None,
+        sanitize_messages: bool = True,
+        audit_action: str = "llm_chat",
+        audit_details: dict[str, Any] | None = None,
+        priority: str = "high",
+        complexity: str | None = None,
+    ) -> AsyncIterator[PipelineStreamChunk]:
+        """
+        Streaming variant of chat() with the same security chain.
+
+        Input sanitize, preflight and rate limit run before the first token.
+        While tokens arrive, output safety checks a sliding window and text
+        is released with a short holdback; at the end the full text is
+        checked once more and ``result.content`` holds the authoritative
+        safe text. Priority defaults to "high" since streaming is meant for
+        interactive replies.
+
+        Yields:
+            PipelineStreamChunk events; exactly one final event has done=True
+        """
+        start = time.monotonic()
+        stages: list[PipelineStage] = []
+        stage_timings: dict[str, float] = {}
+
+        t0 = time.monotonic()
+        if sanitize_messages:
+            messages = self._sanitize_messages(messages)
+        stage_timings["input_sanitize"] = (time.monotonic() - t0) * 1000
+        stages.append(PipelineStage.INPUT_SANITIZE)
+
+        t0 = time.monotonic()
+        blocked = await self._run_preflight(messages, user_id)
+        stage_timings["preflight"] = (time.monotonic() - t0) * 1000
+        if blocked:
+            blocked.duration_ms = (time.monotonic() - start) * 1000
+            blocked.stages_passed = stages
+            blocked.stage_timings = stage_timings
+            self._audit_blocked(blocked, audit_action, audit_details)
+            yield PipelineStreamChunk(done=True, result=blocked)
+            return
+        stages.append(PipelineStage.PREFLIGHT)
+
+        t0 = time.monotonic()
+        if self._rate_limiter:
+            rate_key = f"{self._rate_limit_key}:{user_id}"
+            if not self._rate_limiter.allow(rate_key):
+                wait = self._rate_limiter.retry_after(rate_key)
+                stage_timings["rate_limit"] = (time.monotonic() - t0) * 1000
+                blocked = PipelineResult(
+                    blocked=True,
+                    block_reason=f"Rate limited, retry after {wait:.1f}s",
+                    block_stage=PipelineStage.RATE_LIMIT,
+                    duration_ms=(time.monotonic() - start) * 1000,
+                    stages_passed=stages,
+                    stage_timings=stage_timings,
+                )
+                self._audit_blocked(blocked, audit_action, audit_details)
+                yield PipelineStreamChunk(done=True, result=blocked)
+                return
+        else:
+            self._warn_missing("rate_limiter")
+        stage_timings["rate_limit"] = (time.monotonic() - t0) * 1000
+        stages.append(PipelineStage.RATE_LIMIT)
+
+        if self._circuit_breaker and not self._circuit_breaker.allow_request():
+            blocked = PipelineResult(
+                blocked=True,
+                block_reason="LLM backend temporarily unavailable (circuit breaker open)",
+                block_stage=PipelineStage.LLM_CALL,
+                duration_ms=(time.monotonic() - start) * 1000,
+                stages_passed=stages,
+            )
+            self._audit_error(blocked, audit_action, audit_details, "Circuit breaker OPEN")
+            yield PipelineStreamChunk(done=True, result=blocked)
+            return
+
+        # Stream the LLM call, releasing text through the safety window
+        t0 = time.monotonic()
+        text = ""
+        released = 0
+        stream = self._llm.chat_stream(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            top_p=top_p,
+            priority=priority,
+            complexity=complexity,
+        )
+        try:
+            async for delta in stream:
+                text += delta
+                release_to = self._stream_release_point(text, released)
+                if release_to <= released:
+                    continue
+                window_start = max(0, released - _STREAM_WINDOW_CHARS)
+                check = self._run_output_safety(text[window_start:])
+                if check is not None and check[0]:
+                    blocked = self._stream_blocked(check, text, start, stages, stage_timings)
+                    self._audit_blocked(blocked, audit_action, audit_details)
+                    yield PipelineStreamChunk(done=True, result=blocked)
+                    return
+                segment = text[released:release_to]
+                if check is not None:
+                    segment = self._stream_safe_segment(segment)
+                released = release_to
+                if segment:
+                    yield PipelineStreamChunk(delta=segment)
+
+            if self._circuit_breaker:
+                self._circuit_breaker.on_success()
+
+        except Exception as e:
+            if self._circuit_breaker:
+                self._circuit_breaker.on_failure()
+            logger.error("LLM stream failed: %s", e, exc_info=True)
+            failed = PipelineResult(
+                blocked=True,
+                block_reason="LLM call failed",
+                block_stage=PipelineStage.LLM_CALL,
+                duration_ms=(time.monotonic() - start) * 1000,
+                stages_passed=stages,
+            )
+            self._audit_error(failed, audit_action, audit_details, str(e))
+            yield PipelineStreamChunk(done=True, result=failed)
+            return
+        finally:
+            aclose = getattr(stream, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+        if not text:
+            failed = PipelineResult(
+                blocked=True,
+                block_reason="LLM returned empty response",
+                block_stage=PipelineStage.LLM_CALL,
+                duration_ms=(time.monotonic() - start) * 1000,
+                stages_passed=stages,
+            )
+            self._audit_error(failed, audit_action, audit_details, "empty_response")
+            yield PipelineStreamChunk(done=True, result=failed)
+            return
+
+        stage_timings["llm_call"] = (time.monotonic() - t0) * 1000
+        stages.append(PipelineStage.LLM_CALL)
+
+        # Final authoritative check over the complete text
+        t0 = time.monotonic()
+        content = text
+        check = self._run_output_safety(text)
+        if check is not None:
+            if check[0]:
+                blocked = self._stream_blocked(check, text, start, stages, stage_timings)
+                self._audit_blocked(blocked, audit_action, audit_details)
+                yield PipelineStreamChunk(done=True, result=blocked)
+                return
+            content = check[1]
+        tail = text[released:]
+        if check is not None:
+            tail = self._stream_safe_segment(tail)
+        if tail:
+            yield PipelineStreamChunk(delta=tail)
+        stage_timings["output_safety"] = (time.monotonic() - t0) * 1000
+        stages.append(PipelineStage.OUTPUT_SAFETY)
+        stages.append(PipelineStage.COMPLETE)
+
+        duration = (time.monotonic() - start) * 1000
+        result = PipelineResult(
+            content=content,
+            raw_response={"content": text},
+            duration_ms=duration,
+            stages_passed=stages,
+            stage_timings=stage_timings,
+        )
+
+        if self._audit:
+            d = {**(audit_details or {})}
+            d["duration_ms"] = duration
+            d["content_length"] = len(content)
+            d["streamed"] = True
+            if hasattr(self._llm, "model"):
+                d["model"] = self._llm.model
+            self._audit.log(
+                action=audit_action,
+                category="llm",
+                details=d,
+                success=True,
+                duration_ms=duration,
+            )
+
+        yield PipelineStreamChunk(done=True, result=result)
+
+    @staticmethod
+    def _stream_release_point(text: str, released: int) -> int:
+        """Index up to which streamed text may be released (a word boundary)."""
+        limit = len(text) - _STREAM_HOLDBACK_CHARS
+        if limit <= released:
+            return released
+        # Break after whitespace so word-boundary slang replacements still apply
+        cut = max(text.rfind(" ", released, limit), text.rfind("\n", released, limit))
+        if cut >= released:
+            return cut + 1
+        # No whitespace at all (e.g. CJK text): don't hold the whole reply back
+        if limit - released >= _STREAM_HOLDBACK_CHARS * 4:
+            return limit
+        return released
+
+    def _stream_safe_segment(self, segment: str) -> str:
+        """Apply output-safety replacements to a released stream segment."""
+        check = self._run_output_safety(segment)
+        if check is None or check[0]:
+            return segment
+        return check[1]
+
+    @staticmethod
+    def _stream_blocked(
+        check: tuple[bool, str, str | None],
+        text: str,
+        start: float,
+        stages: list[PipelineStage],
+        stage_timings: dict[str, float],
+    ) -> PipelineResult:
+        """Build the blocked result for a stream stopped by output safety."""
+        return PipelineResult(
+            blocked=True,
+            block_reason=check[2],
+            block_stage=PipelineStage.OUTPUT_SAFETY,
+            deflection=check[1],
+            raw_response={"content": text},
+            duration_ms=(time.monotonic() - start) * 1000,
+            stages_passed=stages,
+            stage_timings=stage_timings,
+        )
+
     def _sanitize_messages(self, messages: list[dict[str, str]]) -> list[dict[str, str]]:
         """Sanitize all message content."""
         sanitized = []
@@ -382,6 +382,9 @@ class Orchestrator:
         # 11. Create IPC client (if running under supervisor)
         if self._ipc_client is None:
             self._ipc_client = self._create_ipc_client()  # type: ignore[assignment]
+        if isinstance(self._ipc_client, IPCClient):
+            # Open the session up front so routed messages are pushed, not polled
+            await self._ipc_client.connect()
 
         # Use plugins from identity if specified, otherwise fall back to constructor arg
         plugin_names = (
@@ -574,6 +577,10 @@ class Orchestrator:
             except Exception as e:
                 logger.error(f"Error closing LLM client: {e}", exc_info=True)
 
+        # Close the supervisor IPC session
+        if isinstance(self._ipc_client, IPCClient):
+            await self._ipc_client.close()
+
         # Close engagement DB backend
         if self._engagement_db_backend:
             try:
@@ -824,6 +831,8 @@ class Orchestrator:
                 target="supervisor",
                 socket_dir=socket_dir,
                 auth_token=auth_token,
+                identity=self._identity_name,
+                persistent=True,
             )
             logger.info("IPC client created — supervisor communication enabled")
             return client
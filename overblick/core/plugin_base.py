@@ -304,6 +304,10 @@ class PluginContext(BaseModel):
         """
         Collect pending messages from other agents via the Supervisor.
 
+        With a persistent IPC session the supervisor pushes messages as
+        they are routed, so this returns the locally buffered ones
+        without a round trip.
+
         Returns:
             List of message dicts with "message_id", "source_agent",
             "message_type", "payload", "created_at"
@@ -311,7 +315,13 @@ class PluginContext(BaseModel):
         if not self.ipc_client:
             return []
 
-        from overblick.supervisor.ipc import IPCMessage
+        from overblick.supervisor.ipc import IPCClient, IPCMessage
+
+        pushed: list[dict] = []
+        if isinstance(self.ipc_client, IPCClient):
+            pushed = self.ipc_client.take_routed_messages()
+            if self.ipc_client.receives_pushes:
+                return pushed
 
         msg = IPCMessage(
             msg_type="collect_messages",
@@ -321,8 +331,8 @@ class PluginContext(BaseModel):
 
         response = await self.ipc_client.send(msg, timeout=timeout)
         if response and response.payload:
-            return response.payload.get("messages", [])
-        return []
+            return pushed + response.payload.get("messages", [])
+        return pushed
 
     def model_post_init(self, __context) -> None:
         # Ensure directories exist
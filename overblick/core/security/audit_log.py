@@ -6,6 +6,16 @@ is logged to an append-only SQLite database per identity.
 
 Thread-safety: all writes go through a dedicated single-thread executor
 so the async event loop is never blocked by SQLite disk I/O.
+
+Durability: the log always runs with PRAGMA synchronous=FULL. With group
+commit enabled, entries logged within a few milliseconds are chained and
+committed together, so a busy tick pays one fsync instead of one per entry.
+
+Hash chain: each row stores the hash of the row before it. The chain tip
+(hash of the newest row) is read once at open and then advanced in the
+write thread, so logging never re-reads the previous row. verify_chain()
+records a checkpoint (last verified id and hash); incremental runs only
+check rows written since.
 """
 
 import asyncio
@@ -13,6 +23,7 @@ import hashlib
 import json
 import logging
 import sqlite3
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
@@ -38,8 +49,17 @@ CREATE TABLE IF NOT EXISTS audit_log (
 CREATE INDEX IF NOT EXISTS idx_audit_timestamp ON audit_log(timestamp);
 CREATE INDEX IF NOT EXISTS idx_audit_action ON audit_log(action);
 CREATE INDEX IF NOT EXISTS idx_audit_category ON audit_log(category);
+
+CREATE TABLE IF NOT EXISTS audit_chain_checkpoint (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    last_id INTEGER NOT NULL,
+    last_hash TEXT NOT NULL,
+    verified_at REAL NOT NULL
+);
 """
 
+_ENTRY_COLUMNS = "timestamp, action, category, identity, plugin, details, success, duration_ms, error, previous_hash"
+
 
 class AuditLog:
     """
@@ -54,6 +74,9 @@ class AuditLog:
     Usage:
         audit = AuditLog(Path("data/anomal/audit.db"), identity="anomal")
         audit.log("api_call", category="moltbook", details={"endpoint": "/posts"})
+
+    Pass group_commit_window_ms > 0 to batch async writes: entries become
+    visible to query() once their batch commits (after at most the window).
     """
 
     _DEFAULT_RETENTION_DAYS = 90
@@ -64,17 +87,27 @@ class AuditLog:
         db_path: Path,
         identity: str,
         retention_days: int = _DEFAULT_RETENTION_DAYS,
+        group_commit_window_ms: float = 0.0,
     ):
         self._db_path = db_path
         self._identity = identity
         self._retention_days = retention_days
+        self._group_window = max(0.0, group_commit_window_ms) / 1000
+        # Entries waiting for the next group commit (guarded by _pending_lock)
+        self._pending: list[tuple[Any, ...]] = []
+        self._pending_lock = threading.Lock()
+        self._flush_handle: asyncio.TimerHandle | None = None
         self._cleanup_task: asyncio.Task | None = None
         self._conn: sqlite3.Connection | None = None
         db_path.parent.mkdir(parents=True, exist_ok=True)
         self._conn = sqlite3.connect(str(db_path), timeout=10, check_same_thread=False)
         self._conn.execute("PRAGMA journal_mode=WAL")
+        # Audit entries are evidence: never trade durability for speed here
+        self._conn.execute("PRAGMA synchronous=FULL")
         self._conn.executescript(_SCHEMA)
         self._conn.commit()
+        # Hash of the newest entry; only the write thread advances it
+        self._chain_tip = self._get_last_hash()
         # Single-thread executor for non-blocking writes
         self._write_executor = ThreadPoolExecutor(
             max_workers=1,
@@ -97,9 +130,6 @@ class AuditLog:
 
         Hash includes all entry fields plus the previous hash to create a chain.
         """
-        import hashlib
-        import json
-
         # Create deterministic string representation
         data_str = f"{timestamp}|{action}|{category}|{self._identity}|{plugin}|"
         if details_json:
@@ -116,19 +146,22 @@ class AuditLog:
         return hashlib.sha256(data_str.encode("utf-8")).hexdigest()
 
     def _get_last_hash(self) -> str:
-        """Get the hash of the most recent audit log entry.
+        """Get the hash of the most recent audit log entry from disk.
 
-        Returns "genesis" if no entries exist.
+        Returns "genesis" if no entries exist. Only used to seed the
+        in-memory chain tip; the write path uses _chain_tip.
         """
         assert self._conn is not None
         cursor = self._conn.execute(
-            "SELECT timestamp, action, category, identity, plugin, details, success, duration_ms, error, previous_hash FROM audit_log ORDER BY id DESC LIMIT 1"
+            f"SELECT {_ENTRY_COLUMNS} FROM audit_log ORDER BY id DESC LIMIT 1"
         )
         row = cursor.fetchone()
         if row is None:
             return "genesis"
+        return self._hash_row(row)
 
-        # Unpack row
+    def _hash_row(self, row: tuple[Any, ...]) -> str:
+        """Hash a row selected as _ENTRY_COLUMNS."""
         (
             timestamp,
             action,
@@ -141,8 +174,6 @@ class AuditLog:
             error,
             previous_hash,
         ) = row
-
-        # Compute hash of the last entry
         return self._compute_entry_hash(
             timestamp,
             action,
@@ -169,8 +200,8 @@ class AuditLog:
         assert self._conn is not None
         conn = self._conn
 
-        # Get hash of previous entry
-        previous_hash = self._get_last_hash()
+        # Hash of the previous entry (in-memory chain tip)
+        previous_hash = self._chain_tip
 
         # Compute hash for this entry
         timestamp = time.time()
@@ -206,18 +237,100 @@ class AuditLog:
             ),
         )
         conn.commit()
-
-        # Verify the chain integrity (entry_hash should match what next entry will use as previous_hash)
-        # This is a sanity check
-        last_hash = self._get_last_hash()
-        if last_hash != entry_hash:
-            logger.error(
-                "Audit log hash chain mismatch! Expected %s, got %s", entry_hash, last_hash
-            )
+        # Advance the tip only once the entry is durable
+        self._chain_tip = entry_hash
 
         assert cursor.lastrowid is not None
         return cursor.lastrowid
 
+    def _flush_pending_sync(self) -> int:
+        """
+        Write every pending entry in one transaction (runs in executor thread).
+
+        Entries are chained in the order they were logged. Returns the
+        number of entries written.
+        """
+        with self._pending_lock:
+            batch, self._pending = self._pending, []
+        if not batch or self._conn is None:
+            return 0
+        conn = self._conn
+
+        previous_hash = self._chain_tip
+        rows = []
+        for (
+            timestamp,
+            action,
+            category,
+            plugin,
+            details_json,
+            success,
+            duration_ms,
+            error,
+        ) in batch:
+            rows.append(
+                (
+                    timestamp,
+                    action,
+                    category,
+                    self._identity,
+                    plugin,
+                    details_json,
+                    1 if success else 0,
+                    duration_ms,
+                    error,
+                    previous_hash,
+                )
+            )
+            previous_hash = self._compute_entry_hash(
+                timestamp,
+                action,
+                category,
+                plugin,
+                details_json,
+                success,
+                duration_ms,
+                error,
+                previous_hash,
+            )
+
+        try:
+            with conn:
+                conn.executemany(
+                    """
+                    INSERT INTO audit_log
+                        (timestamp, action, category, identity, plugin, details, success, duration_ms, error, previous_hash)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+        except sqlite3.Error as e:
+            logger.error("Audit log group commit of %d entries failed: %s", len(batch), e)
+            return 0
+
+        self._chain_tip = previous_hash
+        return len(batch)
+
+    def _submit_flush(self) -> None:
+        """Hand the pending batch to the write thread (event loop callback)."""
+        self._flush_handle = None
+        if self._conn is None:
+            return
+        asyncio.get_running_loop().run_in_executor(self._write_executor, self._flush_pending_sync)
+
+    def flush(self) -> int:
+        """
+        Write pending group-commit entries now (blocking).
+
+        Waits for any batch already handed to the write thread, so entries
+        logged before this call are queryable afterwards. Returns the
+        number of entries written by this call.
+        """
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        return self._write_executor.submit(self._flush_pending_sync).result()
+
     def log(
         self,
         action: str,
@@ -252,6 +365,22 @@ class AuditLog:
         # Try to offload to executor if an event loop is running
         try:
             loop = asyncio.get_running_loop()
+            if self._group_window:
+                entry = (
+                    time.time(),
+                    action,
+                    category,
+                    plugin,
+                    details_json,
+                    success,
+                    duration_ms,
+                    error,
+                )
+                with self._pending_lock:
+                    self._pending.append(entry)
+                if self._flush_handle is None:
+                    self._flush_handle = loop.call_later(self._group_window, self._submit_flush)
+                return 0  # ID not available for async writes
             loop.run_in_executor(
                 self._write_executor,
                 self._log_sync,
@@ -265,7 +394,10 @@ class AuditLog:
             )
             return 0  # ID not available for async writes
         except RuntimeError:
-            # No event loop running — write synchronously (setup/teardown)
+            # No event loop running — write synchronously (setup/teardown),
+            # after any entries still waiting for a group commit
+            if self._pending:
+                self.flush()
             return self._log_sync(
                 action,
                 category,
@@ -487,35 +619,65 @@ class AuditLog:
         except asyncio.CancelledError:
             pass
 
-    def verify_chain(self) -> tuple[bool, list[int]]:
+    def _save_checkpoint_sync(self, last_id: int, last_hash: str) -> None:
+        """Persist the newest verified entry (runs in executor thread)."""
+        assert self._conn is not None
+        with self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO audit_chain_checkpoint (id, last_id, last_hash, verified_at)
+                VALUES (1, ?, ?, ?)
+                ON CONFLICT(id) DO UPDATE SET
+                    last_id = excluded.last_id,
+                    last_hash = excluded.last_hash,
+                    verified_at = excluded.verified_at
+                """,
+                (last_id, last_hash, time.time()),
+            )
+
+    def verify_chain(self, incremental: bool = False) -> tuple[bool, list[int]]:
         """Verify the integrity of the audit log hash chain.
 
+        A fully valid run records a checkpoint (id and hash of the newest
+        row). With incremental=True, verification resumes from that
+        checkpoint instead of genesis: only the checkpointed row and the
+        rows after it are re-read.
+
+        Args:
+            incremental: Trust rows up to the last checkpoint
+
         Returns:
             Tuple of (is_valid, list_of_tampered_entry_ids)
         """
         assert self._conn is not None
-        cursor = self._conn.execute(
-            "SELECT id, timestamp, action, category, identity, plugin, details, success, duration_ms, error, previous_hash FROM audit_log ORDER BY id ASC"
-        )
-        rows = cursor.fetchall()
-
-        tampered_ids = []
+        conn = self._conn
+        tampered_ids: list[int] = []
         previous_hash = "genesis"
+        after_id = 0
+
+        checkpoint = None
+        if incremental:
+            checkpoint = conn.execute(
+                "SELECT last_id, last_hash FROM audit_chain_checkpoint WHERE id = 1"
+            ).fetchone()
+        if checkpoint is not None:
+            after_id, previous_hash = checkpoint
+            # The checkpointed row itself must still hash to the saved value
+            # (it may legitimately be gone after retention trimming)
+            row = conn.execute(
+                f"SELECT {_ENTRY_COLUMNS} FROM audit_log WHERE id = ?", (after_id,)
+            ).fetchone()
+            if row is not None and self._hash_row(row) != previous_hash:
+                tampered_ids.append(after_id)
 
-        for row in rows:
-            (
-                entry_id,
-                timestamp,
-                action,
-                category,
-                identity,
-                plugin,
-                details_json,
-                success,
-                duration_ms,
-                error,
-                stored_previous_hash,
-            ) = row
+        cursor = conn.execute(
+            f"SELECT id, {_ENTRY_COLUMNS} FROM audit_log WHERE id > ? ORDER BY id ASC",
+            (after_id,),
+        )
+        last_id = after_id
+        for entry_id, *entry in cursor:
+            stored_previous_hash = entry[-1]
+            last_id = entry_id
 
             # Check that stored previous_hash matches computed previous hash
             if stored_previous_hash != previous_hash:
@@ -524,26 +686,21 @@ class AuditLog:
                 previous_hash = stored_previous_hash
                 continue
 
-            # Compute hash for this entry
-            entry_hash = self._compute_entry_hash(
-                timestamp,
-                action,
-                category,
-                plugin,
-                details_json,
-                bool(success),
-                duration_ms,
-                error,
-                previous_hash,
-            )
-            previous_hash = entry_hash
+            previous_hash = self._hash_row(tuple(entry))
+
+        if not tampered_ids and last_id:
+            # Through the write thread so it never lands inside a log transaction
+            self._write_executor.submit(self._save_checkpoint_sync, last_id, previous_hash).result()
 
         return (len(tampered_ids) == 0, tampered_ids)
 
     def close(self) -> None:
         """Close the database connection and stop background tasks."""
         self.stop_background_cleanup()
-        # Wait for pending writes to complete
+        # Commit entries still waiting for a group commit, then wait for
+        # pending writes to complete
+        if self._conn:
+            self.flush()
         self._write_executor.shutdown(wait=True)
         if self._conn:
             self._conn.close()
@@ -12,6 +12,8 @@ from typing import ClassVar, Optional
 
 from pydantic import BaseModel
 
+from overblick.core.security.pattern_set import PatternSet
+
 logger = logging.getLogger(__name__)
 
 
@@ -80,9 +82,9 @@ class OutputSafety:
         """
         self._identity_name = identity_name
 
-        # Compile patterns
-        self._ai_compiled = [re.compile(p, re.IGNORECASE) for p in self._AI_LANGUAGE_PATTERNS]
-        self._block_compiled = [re.compile(p, re.IGNORECASE) for p in self._BLOCK_PATTERNS]
+        # Compile each layer into a single-pass PatternSet
+        self._ai_compiled = PatternSet(self._AI_LANGUAGE_PATTERNS, re.IGNORECASE)
+        self._block_compiled = PatternSet(self._BLOCK_PATTERNS, re.IGNORECASE)
 
         # Identity-specific persona break patterns
         default_persona = [
@@ -92,13 +94,15 @@ class OutputSafety:
         ]
         extra_persona = persona_break_patterns or []
         all_persona = [p for p in default_persona + extra_persona if p]
-        self._persona_compiled = [re.compile(p, re.IGNORECASE) for p in all_persona]
+        self._persona_compiled = PatternSet(all_persona, re.IGNORECASE)
 
         # Identity-specific banned slang
-        self._banned_slang_compiled = [
-            re.compile(p, re.IGNORECASE) for p in (banned_slang_patterns or [])
-        ]
+        self._banned_slang_compiled = PatternSet(banned_slang_patterns or [], re.IGNORECASE)
         self._slang_replacements = slang_replacements or {}
+        self._slang_replacement_compiled = [
+            (re.compile(rf"\b{slang}\b", re.IGNORECASE), replacement)
+            for slang, replacement in self._slang_replacements.items()
+        ]
 
         # Deflections
         self._deflections = deflections or [
@@ -115,41 +119,40 @@ class OutputSafety:
         replaced = False
 
         # Layer 1: AI language
-        for pattern in self._ai_compiled:
-            if pattern.search(filtered):
-                logger.warning(f"OUTPUT SAFETY: AI language detected: {pattern.pattern}")
-                return OutputSafetyResult(
-                    text=random.choice(self._deflections),
-                    blocked=True,
-                    reason=f"ai_language:{pattern.pattern}",
-                )
+        pattern = self._ai_compiled.first(filtered)
+        if pattern:
+            logger.warning(f"OUTPUT SAFETY: AI language detected: {pattern.pattern}")
+            return OutputSafetyResult(
+                text=random.choice(self._deflections),
+                blocked=True,
+                reason=f"ai_language:{pattern.pattern}",
+            )
 
         # Layer 2: Persona break
-        for pattern in self._persona_compiled:
-            if pattern.search(filtered):
-                logger.warning("OUTPUT SAFETY: Persona break detected")
-                return OutputSafetyResult(
-                    text=f"Right, I'm not sure where that came from. I'm {self._identity_name}, same as always.",
-                    blocked=True,
-                    reason=f"persona_break:{pattern.pattern}",
-                )
+        pattern = self._persona_compiled.first(filtered)
+        if pattern:
+            logger.warning("OUTPUT SAFETY: Persona break detected")
+            return OutputSafetyResult(
+                text=f"Right, I'm not sure where that came from. I'm {self._identity_name}, same as always.",
+                blocked=True,
+                reason=f"persona_break:{pattern.pattern}",
+            )
 
         # Layer 3: Banned slang replacement
-        for pattern in self._banned_slang_compiled:
-            if pattern.search(filtered):
-                for slang, replacement in self._slang_replacements.items():
-                    filtered = re.sub(rf"\b{slang}\b", replacement, filtered, flags=re.IGNORECASE)
-                replaced = True
+        if self._banned_slang_compiled.any(filtered):
+            for slang_pattern, replacement in self._slang_replacement_compiled:
+                filtered = slang_pattern.sub(replacement, filtered)
+            replaced = True
 
         # Layer 4: Blocked content
-        for pattern in self._block_compiled:
-            if pattern.search(filtered):
-                logger.warning("OUTPUT SAFETY: Blocked content detected")
-                return OutputSafetyResult(
-                    text=random.choice(self._deflections),
-                    blocked=True,
-                    reason=f"blocked_content:{pattern.pattern}",
-                )
+        pattern = self._block_compiled.first(filtered)
+        if pattern:
+            logger.warning("OUTPUT SAFETY: Blocked content detected")
+            return OutputSafetyResult(
+                text=random.choice(self._deflections),
+                blocked=True,
+                reason=f"blocked_content:{pattern.pattern}",
+            )
 
         return OutputSafetyResult(text=filtered, blocked=False, replaced=replaced)
 
@@ -0,0 +1,161 @@
+"""
+Keyword-prefiltered regex matching for security pattern lists.
+
+PreflightChecker and OutputSafety each hold lists of regexes that run on
+every LLM call, and searching them one by one costs O(patterns x text).
+CPython's re cannot do better with one big alternation: case-insensitive
+alternations lose the literal-prefix scan, so a combined regex is slower
+than the loop it replaces.
+
+PatternSet instead extracts, from each pattern's parse tree, literal
+keywords of which at least one must appear in any match (``prompt`` for
+``(show|reveal)\\s+...prompt``, ``admin``/``root`` for
+``(admin|root)\\s+...``). A match is only possible if a keyword occurs in
+the case-folded text, which ``str.__contains__`` checks at C speed. The
+regexes whose keywords are present are then confirmed in list order, so
+callers still learn exactly which pattern matched. Patterns with no
+extractable keyword are always confirmed.
+
+The parse tree comes from CPython's private regex parser (re._parser, or
+the older sre_parse). On an interpreter without either, or if parsing
+fails, no keywords are extracted and every pattern is always confirmed.
+"""
+
+import re
+import warnings
+from collections.abc import Iterable
+
+try:
+    from re import _constants as _sre  # type: ignore[attr-defined]
+    from re import _parser as _sre_parse  # type: ignore[attr-defined]
+except ImportError:
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            import sre_constants as _sre  # type: ignore[no-redef]
+            import sre_parse as _sre_parse  # type: ignore[no-redef]
+    except ImportError:
+        _sre = _sre_parse = None
+
+# Characters that re.IGNORECASE treats as an ASCII letter but whose
+# str.lower() is not that letter. Folded before lower() so a keyword
+# prefilter never rejects text the regex itself would match.
+_IGNORECASE_FIXES = str.maketrans({"İ": "i", "ı": "i", "ſ": "s", "K": "k"})
+
+_REPEATS = tuple(
+    getattr(_sre, name)
+    for name in ("MAX_REPEAT", "MIN_REPEAT", "POSSESSIVE_REPEAT")
+    if hasattr(_sre, name)
+)
+
+
+def fold_case(text: str) -> str:
+    """Lowercase text the way re.IGNORECASE compares ASCII letters."""
+    return text.translate(_IGNORECASE_FIXES).lower()
+
+
+def _best(candidates: list[frozenset[str]]) -> frozenset[str] | None:
+    """Pick the most selective keyword set (longest shortest keyword)."""
+    if not candidates:
+        return None
+    return max(candidates, key=lambda kws: (min(map(len, kws)), -len(kws)))
+
+
+def _required_keywords(items: Iterable) -> frozenset[str] | None:
+    """
+    Keywords of which at least one occurs in every match of a parsed sequence.
+
+    Only ASCII literals are used (see _IGNORECASE_FIXES); anything the
+    walker does not understand simply contributes no keyword.
+    """
+    candidates: list[frozenset[str]] = []
+    run: list[str] = []
+
+    def flush() -> None:
+        if run:
+            candidates.append(frozenset({"".join(run)}))
+            run.clear()
+
+    for op, av in items:
+        if op is _sre.LITERAL and av < 128:
+            run.append(chr(av))
+            continue
+        flush()
+        found: frozenset[str] | None = None
+        if op is _sre.SUBPATTERN:
+            # A scoped (?i:...) would need folding the pattern doesn't get
+            if not av[1] & re.IGNORECASE:
+                found = _required_keywords(av[-1])
+        elif op is _sre.BRANCH:
+            alternatives = [_required_keywords(alt) for alt in av[1]]
+            if alternatives and all(alternatives):
+                found = frozenset().union(*alternatives)  # type: ignore[arg-type]
+        elif op in _REPEATS and av[0] >= 1:
+            found = _required_keywords(av[2])
+        if found:
+            candidates.append(found)
+    flush()
+    return _best(candidates)
+
+
+def _keywords_for(pattern: re.Pattern[str]) -> frozenset[str] | None:
+    """Prefilter keywords for a compiled pattern (None = always confirm)."""
+    if _sre_parse is None:
+        return None
+    try:
+        keywords = _required_keywords(_sre_parse.parse(pattern.pattern, pattern.flags))
+    except Exception:
+        return None
+    if not keywords:
+        return None
+    if pattern.flags & re.IGNORECASE:
+        keywords = frozenset(fold_case(k) for k in keywords)
+    return keywords
+
+
+class PatternSet:
+    """An ordered list of regexes searched behind a keyword prefilter."""
+
+    def __init__(self, patterns: Iterable[str], flags: int = 0):
+        self.patterns: tuple[re.Pattern[str], ...] = tuple(re.compile(p, flags) for p in patterns)
+        # (pattern, keywords, keywords are case-folded)
+        self._entries = [
+            (p, _keywords_for(p), bool(p.flags & re.IGNORECASE)) for p in self.patterns
+        ]
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def __bool__(self) -> bool:
+        return bool(self.patterns)
+
+    def _candidates(self, texts: tuple[str, ...]) -> Iterable[re.Pattern[str]]:
+        """Patterns that could match, in list order."""
+        folded: list[str] | None = None
+        for pattern, keywords, fold in self._entries:
+            if keywords is None:
+                yield pattern
+                continue
+            if fold:
+                if folded is None:
+                    folded = [fold_case(t) for t in texts]
+                haystacks: Iterable[str] = folded
+            else:
+                haystacks = texts
+            if any(k in h for h in haystacks for k in keywords):
+                yield pattern
+
+    def first(self, *texts: str) -> re.Pattern[str] | None:
+        """The first pattern (in list order) matching any of the texts."""
+        for pattern in self._candidates(texts):
+            if any(pattern.search(t) for t in texts):
+                return pattern
+        return None
+
+    def any(self, *texts: str) -> bool:
+        """Whether any pattern matches any of the texts."""
+        return self.first(*texts) is not None
+
+    def matching(self, *texts: str) -> list[re.Pattern[str]]:
+        """All patterns matching any of the texts, in list order."""
+        return [p for p in self._candidates(texts) if any(p.search(t) for t in texts)]
@@ -21,6 +21,8 @@ from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
+from overblick.core.security.pattern_set import PatternSet
+
 logger = logging.getLogger(__name__)
 
 
@@ -44,13 +46,37 @@ _UNICODE_LOOKALIKES = {
 }
 
 
+_STRIPPED_CATEGORIES = frozenset({"Mn", "Mc", "Me", "Sk"})
+
+
+class _PatternCharMap(dict):
+    """
+    str.translate() table: lookalikes -> ASCII, combining marks -> removed.
+
+    Filled lazily per code point (the full table would span all of Unicode),
+    so each character is classified once and every later call is a plain
+    C-level translate.
+    """
+
+    def __missing__(self, codepoint: int) -> str | int | None:
+        char = chr(codepoint)
+        value: str | int | None
+        if char in _UNICODE_LOOKALIKES:
+            value = _UNICODE_LOOKALIKES[char]
+        elif unicodedata.category(char) in _STRIPPED_CATEGORIES:
+            value = None
+        else:
+            value = codepoint
+        self[codepoint] = value
+        return value
+
+
+_PATTERN_CHAR_MAP = _PatternCharMap()
+
+
 def _normalize_for_patterns(text: str) -> str:
     """Light unicode normalization preserving word structure for regex."""
-    normalized = unicodedata.normalize("NFKD", text)
-    for lookalike, replacement in _UNICODE_LOOKALIKES.items():
-        normalized = normalized.replace(lookalike, replacement)
-    result = [c for c in normalized if unicodedata.category(c) not in ("Mn", "Mc", "Me", "Sk")]
-    return "".join(result)
+    return unicodedata.normalize("NFKD", text).translate(_PATTERN_CHAR_MAP)
 
 
 class ThreatLevel(Enum):
@@ -129,8 +155,10 @@ SUSPICION_PATTERNS = [
     r"imagine\s+you\s+(have\s+)?no\s+(rules|restrictions)",
 ]
 
-_instant_block_compiled = [re.compile(p, re.IGNORECASE) for p in INSTANT_BLOCK_PATTERNS]
-_suspicion_compiled = [re.compile(p, re.IGNORECASE) for p in SUSPICION_PATTERNS]
+_instant_block_compiled = PatternSet(INSTANT_BLOCK_PATTERNS, re.IGNORECASE)
+_suspicion_compiled = PatternSet(SUSPICION_PATTERNS, re.IGNORECASE)
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
 
 _COMPACT_BLOCK_TERMS: list[tuple[str, ThreatType]] = [
     ("ignorepreviousinstructions", ThreatType.JAILBREAK),
@@ -241,8 +269,10 @@ class PreflightChecker:
     def _check_patterns(self, message: str) -> PreflightResult:
         """Fast pattern-based check."""
         normalized = _normalize_for_patterns(message)
-        compact = re.sub(r"[^a-z0-9]+", "", message.lower())
-        compact_normalized = re.sub(r"[^a-z0-9]+", "", normalized.lower())
+        compact = _NON_ALNUM.sub("", message.lower())
+        compact_normalized = _NON_ALNUM.sub("", normalized.lower())
+        # Plain ASCII text normalizes to itself; don't scan it twice
+        texts = (message,) if normalized == message else (message, normalized)
 
         for term, threat_type in _COMPACT_BLOCK_TERMS:
             if term in compact or term in compact_normalized:
@@ -254,17 +284,16 @@ class PreflightChecker:
                     reason=f"Blocked term: {term}",
                 )
 
-        for pattern in _instant_block_compiled:
-            if pattern.search(message) or pattern.search(normalized):
-                return PreflightResult(
-                    allowed=False,
-                    threat_level=ThreatLevel.BLOCKED,
-                    threat_type=ThreatType.JAILBREAK,
-                    threat_score=0.95,
-                    reason="Block pattern matched",
-                )
+        if _instant_block_compiled.any(*texts):
+            return PreflightResult(
+                allowed=False,
+                threat_level=ThreatLevel.BLOCKED,
+                threat_type=ThreatType.JAILBREAK,
+                threat_score=0.95,
+                reason="Block pattern matched",
+            )
 
-        matched = [p for p in _suspicion_compiled if p.search(message) or p.search(normalized)]
+        matched = _suspicion_compiled.matching(*texts)
         if matched:
             return PreflightResult(
                 allowed=True,
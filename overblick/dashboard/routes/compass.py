@@ -9,6 +9,8 @@ import logging
 from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
 
+from overblick.plugins.compass.journal import JOURNAL_FILE, STATE_FILE, load_state
+
 logger = logging.getLogger(__name__)
 
 # Severity classification multipliers for drift score thresholds
@@ -81,9 +83,6 @@ def _load_compass_data(request: Request) -> tuple:
     Each alert gets a 'severity' field. identity_status maps identity name to
     latest drift score and severity.
     """
-    import json
-    from pathlib import Path
-
     baselines = {}
     alerts = []
     drift_history = []
@@ -96,15 +95,16 @@ def _load_compass_data(request: Request) -> tuple:
         return baselines, alerts, drift_history, drift_threshold, {}
 
     for identity_dir in data_root.iterdir():
-        state_file = identity_dir / "compass" / "compass_state.json"
-        if state_file.exists():
+        state_dir = identity_dir / "compass"
+        # Snapshot plus the journal of records appended since it was written
+        if (state_dir / STATE_FILE).exists() or (state_dir / JOURNAL_FILE).exists():
             try:
-                data = json.loads(state_file.read_text())
-                baselines.update(data.get("baselines", {}))
-                alerts.extend(data.get("alerts", []))
-                drift_history.extend(data.get("drift_history", []))
+                data = load_state(state_dir)
+                baselines.update(data["baselines"])
+                alerts.extend(data["alerts"])
+                drift_history.extend(data["drift_history"])
             except Exception as e:
-                logger.warning("Failed to load compass state from %s: %s", state_file, e)
+                logger.warning("Failed to load compass state from %s: %s", state_dir, e)
 
     # Add severity to each alert
     for alert in alerts:
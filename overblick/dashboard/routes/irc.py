@@ -4,7 +4,8 @@ IRC route — identity-to-identity conversation viewer.
 Displays IRC-style conversations between agent identities on curated topics.
 Uses htmx partial updates for live-polling the current conversation feed.
 
-Data is read via IRCService (JSON files), not from live plugin instances.
+Data is read via IRCService (the plugin's conversation journal), not from live
+plugin instances.
 """
 
 import logging
@@ -66,8 +67,9 @@ async def irc_page(request: Request):
         selected = current
         selected_id = current.get("id", "")
     elif conversations:
-        selected = conversations[0]
-        selected_id = selected.get("id", "")
+        # The list holds headers only — fetch the turns for display
+        selected_id = conversations[0].get("id", "")
+        selected = irc_service.get_conversation(selected_id) or conversations[0]
 
     # Build color map for participants
     color_map: dict[str, str] = {}
@@ -1,44 +1,64 @@
 """
-IRC service — read-only access to IRC conversation data via JSON files.
+IRC service — read-only access to IRC conversation data on disk.
 
-The IRC plugin writes conversations to data/<identity>/conversations.json.
-This service reads those files for dashboard display without requiring
-a live plugin instance.
+The IRC plugin journals conversations under data/<identity>/irc/journal/
+(an index of conversation headers plus one append-only turn file per
+conversation). This service reads those journals for dashboard display
+without requiring a live plugin instance. Journal readers are kept per
+identity, so each request only parses what was appended since the last
+one. Identities still on the old single-file format
+(data/<identity>/irc/conversations.json) are read from that file.
 """
 
 import json
 import logging
 from pathlib import Path
 
+from overblick.plugins.irc.journal import ConversationJournal
+
 logger = logging.getLogger(__name__)
 
 
 class IRCService:
-    """Read-only access to IRC conversation data via JSON files."""
+    """Read-only access to IRC conversation data via the plugin's files."""
 
     def __init__(self, base_dir: Path):
         self._base_dir = base_dir
+        self._journals: dict[Path, ConversationJournal] = {}
 
-    def _find_conversations_files(self) -> list[Path]:
-        """Find all IRC conversations.json files across identity data dirs.
-
-        Plugin data is stored at data/<identity>/irc/conversations.json
-        (the orchestrator sets data_dir = data/<identity>/<plugin_name>).
-        """
+    def _irc_dirs(self) -> list[Path]:
+        """IRC plugin data dirs (data/<identity>/irc) across identities."""
         data_dir = self._base_dir / "data"
         if not data_dir.exists():
             return []
-        files = []
-        for identity_dir in sorted(data_dir.iterdir()):
-            if not identity_dir.is_dir():
-                continue
-            f = identity_dir / "irc" / "conversations.json"
-            if f.exists():
-                files.append(f)
-        return files
-
-    def get_conversations(self, limit: int = 20) -> list[dict]:
-        """Get recent conversations from all identity data dirs, sorted by updated_at."""
+        return [d / "irc" for d in sorted(data_dir.iterdir()) if (d / "irc").is_dir()]
+
+    def _find_journals(self) -> list[ConversationJournal]:
+        journals = []
+        for irc_dir in self._irc_dirs():
+            directory = irc_dir / "journal"
+            journal = self._journals.get(directory)
+            if journal is None:
+                if not (directory / "index.jsonl").exists():
+                    continue
+                journal = self._journals[directory] = ConversationJournal(directory)
+            journals.append(journal)
+        return journals
+
+    def _find_conversations_files(self) -> list[Path]:
+        """Find legacy conversations.json files for identities without a journal.
+
+        Plugin data is stored at data/<identity>/irc/ (the orchestrator
+        sets data_dir = data/<identity>/<plugin_name>).
+        """
+        return [
+            irc_dir / "conversations.json"
+            for irc_dir in self._irc_dirs()
+            if (irc_dir / "conversations.json").exists()
+            and not (irc_dir / "journal" / "index.jsonl").exists()
+        ]
+
+    def _legacy_conversations(self) -> list[dict]:
         all_convs: list[dict] = []
         for f in self._find_conversations_files():
             try:
@@ -47,25 +67,44 @@ class IRCService:
                     all_convs.extend(data)
             except Exception as e:
                 logger.warning("Failed to read IRC conversations from %s: %s", f, e)
+        return all_convs
+
+    def get_conversations(self, limit: int = 20, offset: int = 0) -> list[dict]:
+        """Get a page of conversations across identities, most recently updated first.
+
+        Journaled conversations are returned as headers (no ``turns``);
+        use get_conversation() for a conversation's turns.
+        """
+        all_convs = self._legacy_conversations()
+        for journal in self._find_journals():
+            all_convs.extend(journal.conversations(limit=offset + limit))
         all_convs.sort(key=lambda c: c.get("updated_at", 0), reverse=True)
-        return all_convs[:limit]
+        return all_convs[offset : offset + limit]
 
-    def get_conversation(self, conversation_id: str) -> dict | None:
-        """Get a specific conversation by ID."""
-        for conv in self.get_conversations(limit=100):
+    def get_conversation(self, conversation_id: str, tail: int | None = None) -> dict | None:
+        """Get a specific conversation by ID, optionally only its last ``tail`` turns."""
+        for journal in self._find_journals():
+            conv = journal.conversation(conversation_id, tail=tail)
+            if conv is not None:
+                return conv
+        for conv in self._legacy_conversations():
             if conv.get("id") == conversation_id:
+                if tail is not None:
+                    conv = {**conv, "turns": conv.get("turns", [])[-tail:] if tail > 0 else []}
                 return conv
         return None
 
-    def get_current_conversation(self) -> dict | None:
-        """Get the most recent active conversation."""
-        for conv in self.get_conversations():
-            if conv.get("state") == "active":
-                return conv
+    def get_current_conversation(self, tail: int | None = None) -> dict | None:
+        """Get the most recent active conversation (with turns)."""
+        convs = self.get_conversations()
+        current = next((c for c in convs if c.get("state") == "active"), None)
         # Fallback to most recent conversation
-        convs = self.get_conversations(limit=1)
-        return convs[0] if convs else None
+        if current is None and convs:
+            current = convs[0]
+        if current is None:
+            return None
+        return self.get_conversation(current["id"], tail=tail) or current
 
     def has_data(self) -> bool:
         """Check if any IRC conversation data exists."""
-        return len(self._find_conversations_files()) > 0
+        return bool(self._find_journals() or self._find_conversations_files())
@@ -2,7 +2,7 @@
 FastAPI application for the LLM Gateway.
 
 Provides REST endpoints for:
-- Chat completions (with priority queuing)
+- Chat completions (with priority queuing, optionally streamed as SSE)
 - Health checks
 - Queue statistics
 - Model listing
@@ -16,16 +16,17 @@ from contextlib import asynccontextmanager
 from typing import Optional
 
 from fastapi import Depends, FastAPI, HTTPException, Query, Security
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.security import APIKeyHeader
 
 from .backend_registry import BackendRegistry
 from .config import get_config
 from .deepseek_client import DeepseekConnectionError, DeepseekError, DeepseekTimeoutError
-from .models import ChatRequest, ChatResponse, GatewayStats, Priority
+from .models import CacheMode, ChatRequest, ChatResponse, GatewayStats, Priority
 from .ollama_client import OllamaConnectionError, OllamaError, OllamaTimeoutError
 from .queue_manager import QueueManager
 from .router import RequestRouter
+from .sse import SSE_DONE, format_sse
 
 logging.basicConfig(
     level=logging.INFO,
@@ -206,7 +207,7 @@ async def health_check() -> dict:
         "max_queue_size": config.max_queue_size,
         "gpu_starvation_risk": starvation_risk,
         "avg_response_time_ms": stats.avg_response_time_ms,
-        "active_requests": 1 if stats.is_processing else 0,
+        "active_requests": stats.active_requests,
     }
 
 
@@ -265,6 +266,9 @@ async def chat_completion(
     complexity: str | None = Query(
         default=None, description="Complexity: ultra, high, or low (for backend routing)"
     ),
+    cache: str = Query(
+        default="auto", description="Response cache: auto (temperature 0 only), force, or off"
+    ),
 ) -> ChatResponse:
     """
     OpenAI-compatible chat completion endpoint with priority queuing.
@@ -284,6 +288,17 @@ async def chat_completion(
     Backend selection:
     - Defaults to intelligent routing based on complexity/priority
     - Can be overridden per-request via ?backend=local or ?backend=cloud
+
+    Streaming:
+    - With "stream": true in the body, the response is text/event-stream
+      carrying OpenAI-style chat.completion.chunk events and a final
+      "data: [DONE]". Queueing, routing and fallback work as for buffered
+      requests.
+
+    Response cache (buffered requests only):
+    - auto: reuse responses for temperature-0 requests
+    - force: reuse responses whatever the temperature
+    - off: always run inference
     """
     qm = get_queue_manager()
 
@@ -292,6 +307,11 @@ async def chat_completion(
     except (ValueError, AttributeError):
         prio = Priority.LOW
 
+    try:
+        cache_mode = CacheMode(cache.lower())
+    except (ValueError, AttributeError):
+        cache_mode = CacheMode.AUTO
+
     # Use router to resolve backend if not explicitly specified
     resolved_backend = backend
     if _router and not backend:
@@ -331,7 +351,9 @@ async def chat_completion(
     try:
         # Inner try: catch connection errors for fallback retry
         try:
-            response = await qm.submit(request, prio, backend=resolved_backend)
+            if request.stream:
+                return await _start_stream(qm, request, prio, resolved_backend)
+            response = await qm.submit(request, prio, backend=resolved_backend, cache=cache_mode)
             return response
 
         except (OllamaConnectionError, DeepseekConnectionError) as e:
@@ -354,7 +376,11 @@ async def chat_completion(
                         fb_backend = (
                             None if fallback == _backend_registry.default_backend else fallback
                         )
-                        response = await qm.submit(request, prio, backend=fb_backend)
+                        if request.stream:
+                            return await _start_stream(qm, request, prio, fb_backend)
+                        response = await qm.submit(
+                            request, prio, backend=fb_backend, cache=cache_mode
+                        )
                         return response
                     except Exception as retry_err:
                         logger.warning(
@@ -404,6 +430,57 @@ async def chat_completion(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+async def _start_stream(
+    qm: QueueManager,
+    request: ChatRequest,
+    prio: Priority,
+    backend: str | None,
+) -> StreamingResponse:
+    """
+    Start a streamed completion and wrap it in an SSE response.
+
+    The first chunk is awaited before returning, so queue-full, routing and
+    backend connection errors still surface as HTTP errors (and trigger
+    fallback). Once the 200 has been sent, failures are reported in-band
+    as an error event followed by [DONE].
+    """
+    stream = qm.submit_stream(request, prio, backend=backend)
+    try:
+        first = await anext(stream)
+    except StopAsyncIteration:
+        first = None
+    except BaseException:
+        await stream.aclose()
+        raise
+
+    async def _events():
+        try:
+            if first is not None:
+                yield format_sse(first)
+                async for chunk in stream:
+                    yield format_sse(chunk)
+            yield format_sse(SSE_DONE)
+        except Exception as e:
+            logger.error("Stream failed mid-response: %s", e, exc_info=True)
+            yield format_sse(
+                {
+                    "error": {
+                        "message": "LLM stream interrupted. Check gateway logs for details.",
+                        "type": "server_error",
+                    }
+                }
+            )
+            yield format_sse(SSE_DONE)
+        finally:
+            await stream.aclose()
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.post("/v1/embeddings", dependencies=[Depends(verify_api_key)])
 async def create_embedding(
     text: str = Query(description="Text to embed"),
@@ -9,6 +9,11 @@ Supported backend types:
 - ollama / lmstudio → OllamaClient (OpenAI-compatible local inference)
 - deepseek → DeepseekClient (OpenAI-compatible cloud API with Bearer auth)
 - openai → logged as "coming soon", skipped
+
+Each backend also carries a worker concurrency (``concurrency:`` in YAML).
+Local GPU backends default to the gateway's max_concurrent_requests
+(normally 1, raise it to match OLLAMA_NUM_PARALLEL); cloud backends have
+no GPU to protect and default to DEFAULT_REMOTE_CONCURRENCY.
 """
 
 import logging
@@ -21,6 +26,9 @@ from .ollama_client import OllamaClient
 
 logger = logging.getLogger(__name__)
 
+# Parallel in-flight requests for cloud backends unless configured
+DEFAULT_REMOTE_CONCURRENCY = 4
+
 
 class BackendConfig:
     """Runtime config for a single backend."""
@@ -35,6 +43,7 @@ class BackendConfig:
         model: str = "",
         api_url: str = "",
         api_key: str = "",
+        concurrency: int = 1,
     ):
         self.name = name
         self.enabled = enabled
@@ -44,6 +53,7 @@ class BackendConfig:
         self.model = model
         self.api_url = api_url
         self.api_key = api_key
+        self.concurrency = concurrency
 
     @property
     def base_url(self) -> str:
@@ -59,6 +69,7 @@ class BackendRegistry:
         self._clients: dict[str, Any] = {}
         self._backend_configs: dict[str, BackendConfig] = {}
         self._default = config.default_backend
+        self._default_concurrency = config.max_concurrent_requests
 
         for name, bcfg in config.backends.items():
             if not bcfg.get("enabled", False):
@@ -99,6 +110,7 @@ class BackendRegistry:
             host=bcfg.get("host", config.ollama_host),
             port=bcfg.get("port", config.ollama_port),
             model=bcfg.get("model", config.default_model),
+            concurrency=int(bcfg.get("concurrency", config.max_concurrent_requests)),
         )
         self._backend_configs[name] = bc
 
@@ -110,10 +122,11 @@ class BackendRegistry:
         )
         self._clients[name] = OllamaClient(client_config)
         logger.info(
-            "Registered backend '%s': %s (model: %s)",
+            "Registered backend '%s': %s (model: %s, concurrency: %d)",
             name,
             bc.base_url,
             bc.model,
+            bc.concurrency,
         )
 
     def _register_deepseek_backend(
@@ -151,6 +164,7 @@ class BackendRegistry:
             model=model,
             api_url=api_url,
             api_key=api_key,
+            concurrency=int(bcfg.get("concurrency", DEFAULT_REMOTE_CONCURRENCY)),
         )
         self._backend_configs[name] = bc
 
@@ -161,11 +175,12 @@ class BackendRegistry:
             timeout_seconds=config.request_timeout_seconds,
         )
         logger.info(
-            "Registered backend '%s': %s (model: %s, key: %s)",
+            "Registered backend '%s': %s (model: %s, key: %s, concurrency: %d)",
             name,
             api_url,
             model,
             "configured" if api_key else "MISSING",
+            bc.concurrency,
         )
 
     def get_client(self, backend: str | None = None) -> Any:
@@ -183,6 +198,14 @@ class BackendRegistry:
             return bcfg.model
         return "qwen3:8b"
 
+    def get_concurrency(self, backend: str | None = None) -> int:
+        """Get the worker pool size for a backend (at least 1)."""
+        name = backend or self._default
+        bcfg = self._backend_configs.get(name)
+        if bcfg:
+            return max(1, bcfg.concurrency)
+        return max(1, self._default_concurrency)
+
     @property
     def default_backend(self) -> str:
         return self._default
@@ -26,6 +26,11 @@ def _get_env_int(key: str, default: int) -> int:
     return int(_get_env(key, str(default)))
 
 
+def _get_env_bool(key: str, default: bool) -> bool:
+    """Get boolean environment variable with OVERBLICK_GW_ prefix."""
+    return _get_env(key, str(default)).strip().lower() in ("1", "true", "yes", "on")
+
+
 def _get_env_float(key: str, default: float) -> float:
     """Get float environment variable with OVERBLICK_GW_ prefix."""
     return float(_get_env(key, str(default)))
@@ -48,6 +53,15 @@ class GatewayConfig(BaseModel):
     # Worker settings
     max_concurrent_requests: int = 1
 
+    # Response cache (temperature-0 requests unless the caller forces it)
+    cache_enabled: bool = True
+    cache_max_entries: int = 1000
+    cache_ttl_seconds: float = 600.0
+    # Embedding-similarity tier (off by default; costs one embed call per miss)
+    cache_semantic_enabled: bool = False
+    cache_semantic_threshold: float = 0.97
+    cache_embedding_model: str = "nomic-embed-text"
+
     # API settings
     api_host: str = "127.0.0.1"
     api_port: int = 8200
@@ -87,6 +101,12 @@ class GatewayConfig(BaseModel):
             max_queue_size=_get_env_int("MAX_QUEUE_SIZE", 100),
             request_timeout_seconds=_get_env_float("REQUEST_TIMEOUT", 300.0),
             max_concurrent_requests=_get_env_int("MAX_CONCURRENT", 1),
+            cache_enabled=_get_env_bool("CACHE_ENABLED", True),
+            cache_max_entries=_get_env_int("CACHE_MAX_ENTRIES", 1000),
+            cache_ttl_seconds=_get_env_float("CACHE_TTL", 600.0),
+            cache_semantic_enabled=_get_env_bool("CACHE_SEMANTIC", False),
+            cache_semantic_threshold=_get_env_float("CACHE_SEMANTIC_THRESHOLD", 0.97),
+            cache_embedding_model=_get_env("CACHE_EMBEDDING_MODEL", "nomic-embed-text"),
             api_key=_get_env("API_KEY", os.getenv("OVERBLICK_GATEWAY_KEY", "")),
             api_host=_get_env("API_HOST", "127.0.0.1"),
             api_port=_get_env_int("API_PORT", 8200),
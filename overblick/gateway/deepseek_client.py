@@ -7,7 +7,8 @@ Deepseek cloud API at https://api.deepseek.com/v1.
 """
 
 import logging
-from typing import Optional
+from collections.abc import AsyncIterator
+from typing import Any, Optional
 
 import httpx
 
@@ -20,6 +21,8 @@ from .models import (
 )
 from overblick.core.exceptions import LLMError, LLMConnectionError, LLMTimeoutError
 
+from .sse import SSE_DONE, parse_sse_line
+
 logger = logging.getLogger(__name__)
 
 
@@ -114,6 +117,21 @@ class DeepseekClient:
             logger.error("Failed to list Deepseek models: %s", e, exc_info=True)
             return []
 
+    @staticmethod
+    def _build_payload(request: ChatRequest, model: str, stream: bool) -> dict[str, Any]:
+        """Build the OpenAI-compatible request body for Deepseek."""
+        payload: dict[str, Any] = {
+            "model": model,
+            "messages": [{"role": m.role, "content": m.content} for m in request.messages],
+            "max_tokens": request.max_tokens,
+            "temperature": request.temperature,
+            "top_p": request.top_p,
+            "stream": stream,
+        }
+        if stream:
+            payload["stream_options"] = {"include_usage": True}
+        return payload
+
     async def chat_completion(self, request: ChatRequest) -> ChatResponse:
         """
         Send a chat completion request to the Deepseek API.
@@ -138,14 +156,7 @@ class DeepseekClient:
             selected_model = request.model or self.model
             is_reasoner = selected_model == "deepseek-reasoner"
 
-            payload = {
-                "model": selected_model,
-                "messages": [{"role": m.role, "content": m.content} for m in request.messages],
-                "max_tokens": request.max_tokens,
-                "temperature": request.temperature,
-                "top_p": request.top_p,
-                "stream": False,
-            }
+            payload = self._build_payload(request, selected_model, stream=False)
 
             if is_reasoner:
                 logger.info(
@@ -241,3 +252,57 @@ class DeepseekClient:
         except Exception as e:
             logger.error("Unexpected error calling Deepseek: %s", e, exc_info=True)
             raise DeepseekError(f"Failed to call Deepseek: {e}") from e
+
+    async def chat_completion_stream(self, request: ChatRequest) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream a chat completion from the Deepseek API as OpenAI-style chunks.
+
+        deepseek-reasoner streams its thinking as ``delta.reasoning_content``
+        before the answer; those deltas are passed through unchanged.
+
+        Raises:
+            DeepseekConnectionError: If API is unreachable
+            DeepseekTimeoutError: If the stream stalls past the read timeout
+            DeepseekError: For other errors
+        """
+        selected_model = request.model or self.model
+        payload = self._build_payload(request, selected_model, stream=True)
+        logger.debug(
+            "Streaming request to Deepseek: model=%s, messages=%d",
+            selected_model,
+            len(request.messages),
+        )
+
+        try:
+            client = await self._get_client()
+            async with client.stream("POST", "/chat/completions", json=payload) as response:
+                if response.status_code >= 400:
+                    # Body intentionally not included — may echo API details
+                    await response.aread()
+                    logger.error("Deepseek HTTP error on stream: %s", response.status_code)
+                    raise DeepseekError(f"Deepseek returned error {response.status_code}")
+
+                async for line in response.aiter_lines():
+                    chunk = parse_sse_line(line)
+                    if chunk is None:
+                        continue
+                    if chunk == SSE_DONE:
+                        break
+                    yield chunk  # type: ignore[misc]
+
+        except DeepseekError:
+            raise
+
+        except httpx.ConnectError as e:
+            logger.error("Connection to Deepseek API failed: %s", e, exc_info=True)
+            raise DeepseekConnectionError(
+                f"Cannot connect to Deepseek API at {self.api_url}: {e}"
+            ) from e
+
+        except httpx.TimeoutException as e:
+            logger.error("Deepseek stream timed out: %s", e, exc_info=True)
+            raise DeepseekTimeoutError(f"Stream stalled for {self.timeout_seconds}s: {e}") from e
+
+        except Exception as e:
+            logger.error("Unexpected error streaming from Deepseek: %s", e, exc_info=True)
+            raise DeepseekError(f"Failed to stream from Deepseek: {e}") from e
@@ -3,13 +3,26 @@ API key management for the Internet Gateway.
 
 Stores API keys in SQLite with bcrypt hashing. Provides create, verify,
 revoke, rotate, and list operations with timing-safe verification.
+
+bcrypt is deliberately slow (tens of ms of CPU), so the gateway verifies
+keys via averify_key(), which runs bcrypt in a worker thread. Keys that
+verified recently are remembered for a short TTL under an HMAC of the raw
+key, so a client's repeat requests skip bcrypt entirely. Unknown keys are
+never cached and still pay the dummy bcrypt compare.
+
+Usage counters are accumulated in memory by update_usage() and written in
+one transaction by flush_usage(), which the gateway calls periodically.
 """
 
+import asyncio
+import hashlib
+import hmac
 import logging
 import secrets
 import sqlite3
 import threading
 import time
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
@@ -50,6 +63,15 @@ CREATE INDEX IF NOT EXISTS idx_api_keys_prefix ON api_keys(key_prefix);
 """
 
 
+@dataclass
+class _PendingUsage:
+    """Usage accumulated for one key since the last flush."""
+
+    requests: int = 0
+    tokens: int = 0
+    ip: str = ""
+
+
 class APIKeyManager:
     """Manages API keys for the Internet Gateway.
 
@@ -57,13 +79,32 @@ class APIKeyManager:
     returned once at creation time and cannot be retrieved afterward.
     """
 
-    def __init__(self, db_path: Path):
+    def __init__(self, db_path: Path, verify_cache_ttl: float = 30.0):
+        """
+        Args:
+            db_path: SQLite database path
+            verify_cache_ttl: Seconds a successfully verified key skips
+                bcrypt (0 disables the cache). Bounds how long a key revoked
+                by another process keeps working here.
+        """
         db_path.parent.mkdir(parents=True, exist_ok=True)
         self._db_path = db_path
         self._local = threading.local()
         self._connections = []
         self._lock = threading.Lock()
 
+        # Verified-key cache and pending usage, guarded by _state_lock.
+        # Cached records reflect flushed usage; pending usage is overlaid
+        # on every record handed out.
+        self._state_lock = threading.Lock()
+        self._verify_cache_ttl = verify_cache_ttl
+        self._cache_secret = secrets.token_bytes(32)
+        self._verified: dict[bytes, tuple[APIKeyRecord, float]] = {}
+        self._pending_usage: dict[str, _PendingUsage] = {}
+        self._flush_generation = 0
+        # Bumped on revoke/rotate so a verify racing one never caches the key
+        self._revoke_generation = 0
+
         # Initialize schema in a thread-safe manner
         with self._lock:
             conn = sqlite3.connect(str(db_path), timeout=10, check_same_thread=True)
@@ -154,7 +195,10 @@ class APIKeyManager:
 
         Timing-safe: always performs at least one bcrypt comparison
         even if the key prefix is not found, preventing key enumeration
-        via timing side-channels.
+        via timing side-channels. Keys verified within the cache TTL are
+        answered from memory.
+
+        Blocking (bcrypt + SQLite); use averify_key() from async code.
 
         Returns:
             APIKeyRecord if valid, None if invalid/expired/revoked.
@@ -166,19 +210,26 @@ class APIKeyManager:
             bcrypt.checkpw(raw_key.encode() if raw_key else b"", _DUMMY_HASH.encode())
             return None
 
+        cached = self._cached_record(raw_key)
+        if cached is not None:
+            return cached
+
         prefix = raw_key[:_DISPLAY_PREFIX_LENGTH]
 
-        cursor = self._get_conn().execute(
-            """
-            SELECT key_id, name, key_hash, key_prefix, created_at, expires_at,
-                   revoked, allowed_models, allowed_backends, max_tokens_cap,
-                   requests_per_minute, total_requests, total_tokens_used, last_used_ip
-            FROM api_keys
-            WHERE key_prefix = ? AND revoked = 0
-            """,
-            (prefix,),
-        )
-        rows = cursor.fetchall()
+        conn = self._get_conn()
+        with self._state_lock:
+            cursor = conn.execute(
+                """
+                SELECT key_id, name, key_hash, key_prefix, created_at, expires_at,
+                       revoked, allowed_models, allowed_backends, max_tokens_cap,
+                       requests_per_minute, total_requests, total_tokens_used, last_used_ip
+                FROM api_keys
+                WHERE key_prefix = ? AND revoked = 0
+                """,
+                (prefix,),
+            )
+            rows = cursor.fetchall()
+            generation = (self._flush_generation, self._revoke_generation)
 
         if not rows:
             # No matching prefix — run dummy bcrypt for timing safety
@@ -204,7 +255,7 @@ class APIKeyManager:
                 except (json.JSONDecodeError, TypeError):
                     allowed_backends = []
 
-                return APIKeyRecord(
+                record = APIKeyRecord(
                     key_id=row[0],
                     name=row[1],
                     key_hash=row[2],
@@ -220,9 +271,74 @@ class APIKeyManager:
                     total_tokens_used=row[12],
                     last_used_ip=row[13],
                 )
+                with self._state_lock:
+                    # A flush since the SELECT would make the row's totals
+                    # stale; a revoke since then means the row no longer holds
+                    if self._verify_cache_ttl > 0 and generation == (
+                        self._flush_generation,
+                        self._revoke_generation,
+                    ):
+                        self._verified[self._cache_key(raw_key)] = (
+                            record,
+                            time.monotonic() + self._verify_cache_ttl,
+                        )
+                    return self._with_pending(record)
 
         return None
 
+    async def averify_key(self, raw_key: str) -> APIKeyRecord | None:
+        """Verify an API key without blocking the event loop.
+
+        Cache hits return immediately; everything else (including the
+        timing-safe dummy compare) runs bcrypt in a worker thread.
+        """
+        if raw_key and raw_key.startswith(_KEY_PREFIX):
+            cached = self._cached_record(raw_key)
+            if cached is not None:
+                return cached
+        return await asyncio.to_thread(self.verify_key, raw_key)
+
+    def _cache_key(self, raw_key: str) -> bytes:
+        """HMAC of the raw key — the key itself is never held in memory."""
+        return hmac.new(self._cache_secret, raw_key.encode(), hashlib.sha256).digest()
+
+    def _cached_record(self, raw_key: str) -> APIKeyRecord | None:
+        """Return a recently verified record, or None on miss/expiry."""
+        if self._verify_cache_ttl <= 0:
+            return None
+        cache_key = self._cache_key(raw_key)
+        with self._state_lock:
+            entry = self._verified.get(cache_key)
+            if entry is None:
+                return None
+            record, valid_until = entry
+            if time.monotonic() >= valid_until or (
+                record.expires_at is not None and time.time() > record.expires_at
+            ):
+                del self._verified[cache_key]
+                return None
+            return self._with_pending(record)
+
+    def _with_pending(self, record: APIKeyRecord) -> APIKeyRecord:
+        """Copy a record with unflushed usage added. Caller holds _state_lock."""
+        pending = self._pending_usage.get(record.key_id)
+        if pending is None:
+            return record.model_copy()
+        return record.model_copy(
+            update={
+                "total_requests": record.total_requests + pending.requests,
+                "total_tokens_used": record.total_tokens_used + pending.tokens,
+                "last_used_ip": pending.ip or record.last_used_ip,
+            }
+        )
+
+    def _invalidate(self, key_id: str) -> None:
+        """Drop cached verifications for a key and fence in-flight ones."""
+        with self._state_lock:
+            self._revoke_generation += 1
+            for cache_key in [k for k, (r, _) in self._verified.items() if r.key_id == key_id]:
+                del self._verified[cache_key]
+
     def revoke_key(self, key_id: str) -> bool:
         """Revoke an API key by ID.
 
@@ -234,6 +350,7 @@ class APIKeyManager:
             (key_id,),
         )
         self._get_conn().commit()
+        self._invalidate(key_id)
 
         if cursor.rowcount > 0:
             logger.info("Revoked API key: %s", key_id)
@@ -312,6 +429,7 @@ class APIKeyManager:
         except Exception:
             self._get_conn().execute("ROLLBACK")
             raise
+        self._invalidate(key_id)
 
         record = APIKeyRecord(
             key_id=new_key_id,
@@ -342,6 +460,8 @@ class APIKeyManager:
         """
         import json
 
+        self.flush_usage()
+
         cursor = self._get_conn().execute(
             """
             SELECT key_id, name, key_hash, key_prefix, created_at, expires_at,
@@ -385,21 +505,68 @@ class APIKeyManager:
         return results
 
     def update_usage(self, key_id: str, tokens: int = 0, ip: str = "") -> None:
-        """Update usage statistics for a key."""
-        self._get_conn().execute(
-            """
-            UPDATE api_keys
-            SET total_requests = total_requests + 1,
-                total_tokens_used = total_tokens_used + ?,
-                last_used_ip = ?
-            WHERE key_id = ?
-            """,
-            (tokens, ip, key_id),
-        )
-        self._get_conn().commit()
+        """Record one request's usage. Buffered in memory until flush_usage()."""
+        with self._state_lock:
+            pending = self._pending_usage.setdefault(key_id, _PendingUsage())
+            pending.requests += 1
+            pending.tokens += tokens
+            if ip:
+                pending.ip = ip
+
+    def flush_usage(self) -> int:
+        """Write buffered usage to SQLite in one transaction.
+
+        Returns:
+            Number of keys updated.
+        """
+        conn = self._get_conn()
+        with self._state_lock:
+            if not self._pending_usage:
+                return 0
+            pending, self._pending_usage = self._pending_usage, {}
+            try:
+                conn.executemany(
+                    """
+                    UPDATE api_keys
+                    SET total_requests = total_requests + ?,
+                        total_tokens_used = total_tokens_used + ?,
+                        last_used_ip = CASE WHEN ? != '' THEN ? ELSE last_used_ip END
+                    WHERE key_id = ?
+                    """,
+                    [(u.requests, u.tokens, u.ip, u.ip, kid) for kid, u in pending.items()],
+                )
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                # Keep the counts for the next attempt
+                for kid, u in pending.items():
+                    merged = self._pending_usage.setdefault(kid, _PendingUsage())
+                    merged.requests += u.requests
+                    merged.tokens += u.tokens
+                    merged.ip = merged.ip or u.ip
+                raise
+
+            self._flush_generation += 1
+            # Cached records now lag the table by exactly the flushed amounts
+            for cache_key, (record, valid_until) in self._verified.items():
+                u = pending.get(record.key_id)
+                if u is not None:
+                    updated = record.model_copy(
+                        update={
+                            "total_requests": record.total_requests + u.requests,
+                            "total_tokens_used": record.total_tokens_used + u.tokens,
+                            "last_used_ip": u.ip or record.last_used_ip,
+                        }
+                    )
+                    self._verified[cache_key] = (updated, valid_until)
+            return len(pending)
 
     def close(self) -> None:
-        """Close all thread-local database connections."""
+        """Flush buffered usage and close all thread-local database connections."""
+        try:
+            self.flush_usage()
+        except Exception as e:
+            logger.warning("Failed to flush API key usage on close: %s", e)
         with self._lock:
             for conn in self._connections:
                 try:
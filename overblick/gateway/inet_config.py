@@ -77,6 +77,10 @@ class InternetGatewayConfig(BaseModel):
     auto_ban_window: int = 300  # seconds to track violations (5 min)
     auto_ban_duration: int = 3600  # ban duration in seconds (1 hour)
 
+    # API key verification
+    key_cache_ttl: float = 30.0  # seconds a verified key skips bcrypt (0 = off)
+    usage_flush_interval: float = 5.0  # seconds between usage counter flushes
+
     # Data directory
     data_dir: str = ""
 
@@ -139,6 +143,8 @@ class InternetGatewayConfig(BaseModel):
             auto_ban_threshold=_get_env_int("AUTO_BAN_THRESHOLD", 10),
             auto_ban_window=_get_env_int("AUTO_BAN_WINDOW", 300),
             auto_ban_duration=_get_env_int("AUTO_BAN_DURATION", 3600),
+            key_cache_ttl=_get_env_float("KEY_CACHE_TTL", 30.0),
+            usage_flush_interval=_get_env_float("USAGE_FLUSH_INTERVAL", 5.0),
             data_dir=_get_env("DATA_DIR", ""),
         )
 
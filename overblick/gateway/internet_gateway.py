@@ -10,6 +10,7 @@ Usage:
     python -m overblick internet-gateway --no-tls  # dev mode, localhost only
 """
 
+import asyncio
 import ipaddress
 import logging
 import time
@@ -19,7 +20,7 @@ from typing import Optional
 import httpx
 import pydantic
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field, field_validator
 
 from overblick.core.security.rate_limiter import RateLimiter
@@ -36,6 +37,7 @@ from .inet_middleware import (
 )
 from .inet_models import APIKeyRecord
 from .inet_violation_db import SQLiteBanStore
+from .sse import parse_sse_line
 
 logging.basicConfig(
     level=logging.INFO,
@@ -51,6 +53,7 @@ _http_client: httpx.AsyncClient | None = None
 _violation_tracker: ViolationTracker | None = None
 _per_key_limiter: RateLimiter | None = None
 _config: InternetGatewayConfig | None = None
+_usage_flush_task: asyncio.Task | None = None
 
 
 def _error_json(status: int, message: str, error_type: str) -> JSONResponse:
@@ -69,6 +72,7 @@ class ProxiedChatRequest(BaseModel):
     max_tokens: int = Field(default=2000, ge=1, le=32768)
     temperature: float = Field(default=0.7, ge=0.0, le=2.0)
     top_p: float = Field(default=0.9, ge=0.0, le=1.0)
+    stream: bool = Field(default=False)
 
     model_config = {"extra": "forbid"}
 
@@ -99,12 +103,16 @@ class EmbeddingRequest(BaseModel):
 async def lifespan(app: FastAPI):
     """Initialize and tear down global resources."""
     global _key_manager, _audit_log, _http_client, _violation_tracker, _per_key_limiter, _config
+    global _usage_flush_task
 
     _config = get_inet_config()
     data_dir = _config.resolved_data_dir
     data_dir.mkdir(parents=True, exist_ok=True)
 
-    _key_manager = APIKeyManager(data_dir / "api_keys.db")
+    _key_manager = APIKeyManager(data_dir / "api_keys.db", verify_cache_ttl=_config.key_cache_ttl)
+    _usage_flush_task = asyncio.create_task(
+        _flush_usage_loop(_key_manager, _config.usage_flush_interval)
+    )
     _audit_log = InetAuditLog(data_dir / "audit.db")
     _audit_log.start_background_cleanup()
 
@@ -160,6 +168,9 @@ async def lifespan(app: FastAPI):
     yield
 
     logger.info("Shutting down Internet Gateway...")
+    if _usage_flush_task:
+        _usage_flush_task.cancel()
+        await asyncio.gather(_usage_flush_task, return_exceptions=True)
     try:
         if _http_client:
             await _http_client.aclose()
@@ -183,6 +194,16 @@ async def lifespan(app: FastAPI):
     logger.info("Internet Gateway stopped")
 
 
+async def _flush_usage_loop(key_manager: APIKeyManager, interval: float) -> None:
+    """Periodically write buffered API key usage to SQLite."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(key_manager.flush_usage)
+        except Exception as e:
+            logger.warning("API key usage flush failed: %s", e)
+
+
 app = FastAPI(
     title="Överblick Internet Gateway",
     docs_url=None,
@@ -250,9 +271,11 @@ def _get_client_ip(request: Request) -> str:
     return chain[0] if chain else "unknown"
 
 
-def _verify_bearer_token(request: Request) -> APIKeyRecord | None:
+async def _verify_bearer_token(request: Request) -> APIKeyRecord | None:
     """Extract and verify Bearer token from Authorization header.
 
+    bcrypt runs in a worker thread so it never stalls other connections.
+
     Returns APIKeyRecord if valid, None otherwise.
     """
     assert _key_manager is not None
@@ -261,7 +284,7 @@ def _verify_bearer_token(request: Request) -> APIKeyRecord | None:
         return None
 
     raw_key = auth_header[7:]  # Strip "Bearer " prefix
-    return _key_manager.verify_key(raw_key)
+    return await _key_manager.averify_key(raw_key)
 
 
 async def _proxy_request(
@@ -269,10 +292,13 @@ async def _proxy_request(
     path: str,
     body: bytes | None = None,
     headers: dict | None = None,
+    stream: bool = False,
 ) -> httpx.Response:
     """Forward a request to the internal gateway.
 
-    Strips auth headers and adds internal API key if configured.
+    Strips auth headers and adds internal API key if configured. With
+    stream=True the response is returned as soon as headers arrive and the
+    body is left unread; the caller must close it.
     """
     assert _http_client is not None
     assert _config is not None
@@ -282,6 +308,15 @@ async def _proxy_request(
     if _config.internal_api_key:
         proxy_headers["X-API-Key"] = _config.internal_api_key
 
+    if stream:
+        upstream_request = _http_client.build_request(
+            method=method,
+            url=path,
+            content=body,
+            headers=proxy_headers,
+        )
+        return await _http_client.send(upstream_request, stream=True)
+
     return await _http_client.request(
         method=method,
         url=path,
@@ -290,6 +325,64 @@ async def _proxy_request(
     )
 
 
+def _relay_upstream_stream(
+    upstream: httpx.Response,
+    key_record: APIKeyRecord,
+    client_ip: str,
+    model_name: str,
+    start_time: float,
+) -> StreamingResponse:
+    """Pass an upstream SSE stream through to the client without buffering.
+
+    Bytes are forwarded exactly as received. Lines are only inspected for
+    the final usage chunk so that token accounting and the audit entry
+    (written once the stream ends or the client disconnects) still work.
+    """
+    assert _key_manager is not None
+    assert _audit_log is not None
+
+    async def _relay():
+        usage: dict = {}
+        pending = ""
+        try:
+            async for raw in upstream.aiter_raw():
+                yield raw
+                pending += raw.decode("utf-8", errors="replace")
+                *lines, pending = pending.split("\n")
+                for line in lines:
+                    chunk = parse_sse_line(line)
+                    if isinstance(chunk, dict) and chunk.get("usage"):
+                        usage = chunk["usage"]
+        finally:
+            await upstream.aclose()
+            req_tokens = usage.get("prompt_tokens", 0)
+            resp_tokens = usage.get("completion_tokens", 0)
+            _key_manager.update_usage(
+                key_record.key_id,
+                tokens=req_tokens + resp_tokens,
+                ip=client_ip,
+            )
+            _audit_log.log(
+                key_id=key_record.key_id,
+                key_name=key_record.name,
+                source_ip=client_ip,
+                method="POST",
+                path="/v1/chat/completions",
+                model=model_name,
+                status_code=upstream.status_code,
+                request_tokens=req_tokens,
+                response_tokens=resp_tokens,
+                latency_ms=(time.time() - start_time) * 1000,
+            )
+
+    return StreamingResponse(
+        _relay(),
+        status_code=upstream.status_code,
+        media_type="text/event-stream",
+        headers={"X-Accel-Buffering": "no"},
+    )
+
+
 # --- Health endpoint (no auth) ---
 
 
@@ -317,7 +410,7 @@ async def chat_completions(request: Request):
 
     try:
         # 1. Authenticate
-        key_record = _verify_bearer_token(request)
+        key_record = await _verify_bearer_token(request)
         if not key_record:
             _record_violation(client_ip, "auth_failure")
             _audit_log.log(
@@ -391,7 +484,9 @@ async def chat_completions(request: Request):
         # 6. Proxy to internal gateway
         proxy_body = parsed.model_dump_json().encode()
         try:
-            upstream = await _proxy_request("POST", "/v1/chat/completions", body=proxy_body)
+            upstream = await _proxy_request(
+                "POST", "/v1/chat/completions", body=proxy_body, stream=parsed.stream
+            )
         except httpx.ConnectError:
             logger.error("Internal gateway unreachable")
             _audit_log.log(
@@ -420,6 +515,15 @@ async def chat_completions(request: Request):
             return _error_json(504, "Request timed out", "server_error")
 
         # 7. Process upstream response
+        if parsed.stream:
+            if upstream.status_code < 400:
+                return _relay_upstream_stream(
+                    upstream, key_record, client_ip, model_name, start_time
+                )
+            # Error replies are small JSON bodies — read them and fall through
+            await upstream.aread()
+            await upstream.aclose()
+
         latency_ms = (time.time() - start_time) * 1000
 
         if upstream.status_code >= 500:
@@ -507,7 +611,7 @@ async def embeddings(request: Request):
     assert _config is not None
     client_ip = _get_client_ip(request)
 
-    key_record = _verify_bearer_token(request)
+    key_record = await _verify_bearer_token(request)
     if not key_record:
         _record_violation(client_ip, "auth_failure")
         _audit_log.log(
@@ -572,7 +676,7 @@ async def list_models(request: Request):
     assert _config is not None
     client_ip = _get_client_ip(request)
 
-    key_record = _verify_bearer_token(request)
+    key_record = await _verify_bearer_token(request)
     if not key_record:
         _record_violation(client_ip, "auth_failure")
         _audit_log.log(
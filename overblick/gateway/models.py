@@ -8,7 +8,7 @@ for the priority-based request queuing system.
 from __future__ import annotations
 
 import time as _time
-from asyncio import Future
+from asyncio import Future, Queue
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, IntEnum, StrEnum
@@ -39,6 +39,14 @@ class Complexity(StrEnum):
     EINSTEIN = "einstein"  # Deep reasoning — deepseek-reasoner model (no fallback)
 
 
+class CacheMode(StrEnum):
+    """Per-request response cache behaviour."""
+
+    AUTO = "auto"  # Cache only deterministic (temperature 0) requests
+    FORCE = "force"  # Cache regardless of temperature (caller accepts reuse)
+    OFF = "off"  # Bypass the cache
+
+
 class ChatMessage(BaseModel):
     """A single message in a chat conversation."""
 
@@ -58,6 +66,7 @@ class ChatRequest(BaseModel):
     max_tokens: int = Field(default=2000, ge=1, le=8192, description="Max tokens to generate")
     temperature: float = Field(default=0.7, ge=0.0, le=2.0, description="Sampling temperature")
     top_p: float = Field(default=0.9, ge=0.0, le=1.0, description="Nucleus sampling threshold")
+    stream: bool = Field(default=False, description="Stream tokens as Server-Sent Events")
 
     model_config = {
         "json_schema_extra": {
@@ -131,6 +140,20 @@ class QueuedRequest:
     future: Future | None = field(compare=False, default=None, repr=False)
     backend: str | None = field(compare=False, default=None)
     complexity: str | None = field(compare=False, default=None)
+    # Set for streaming requests: the worker pushes chunks here as they arrive
+    stream_queue: Queue | None = field(compare=False, default=None, repr=False)
+
+
+class BackendQueueStats(BaseModel):
+    """Queue and worker-pool metrics for a single backend."""
+
+    concurrency: int = Field(default=1, description="Worker pool size")
+    queue_size: int = Field(default=0, description="Requests waiting for this backend")
+    active_requests: int = Field(default=0, description="Requests being processed")
+    requests_processed: int = Field(default=0, description="Total requests processed")
+    avg_wait_time_ms: float = Field(default=0.0, description="Average queue wait (last 100)")
+    max_wait_time_ms: float = Field(default=0.0, description="Longest queue wait (last 100)")
+    avg_response_time_ms: float = Field(default=0.0, description="Average processing time in ms")
 
 
 class GatewayStats(BaseModel):
@@ -141,5 +164,17 @@ class GatewayStats(BaseModel):
     requests_high_priority: int = Field(default=0, description="HIGH priority requests")
     requests_low_priority: int = Field(default=0, description="LOW priority requests")
     avg_response_time_ms: float = Field(default=0.0, description="Average response time in ms")
-    is_processing: bool = Field(default=False, description="Whether worker is busy")
+    avg_wait_time_ms: float = Field(default=0.0, description="Average queue wait in ms")
+    is_processing: bool = Field(default=False, description="Whether any worker is busy")
+    active_requests: int = Field(default=0, description="Requests being processed")
     uptime_seconds: float = Field(default=0.0, description="Gateway uptime")
+    backends: dict[str, BackendQueueStats] = Field(
+        default_factory=dict, description="Per-backend queue and worker metrics"
+    )
+    cache_hits: int = Field(default=0, description="Exact-match response cache hits")
+    cache_semantic_hits: int = Field(default=0, description="Embedding-similarity cache hits")
+    cache_misses: int = Field(default=0, description="Cacheable requests sent to a backend")
+    cache_coalesced: int = Field(
+        default=0, description="Requests that shared an identical in-flight request"
+    )
+    cache_entries: int = Field(default=0, description="Responses currently cached")
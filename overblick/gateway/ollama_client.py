@@ -5,12 +5,14 @@ Wraps the Ollama HTTP API with proper error handling and timeout management.
 """
 
 import logging
-from typing import Optional
+from collections.abc import AsyncIterator
+from typing import Any, Optional
 
 import httpx
 
 from .config import GatewayConfig, get_config
 from .models import ChatMessage, ChatRequest, ChatResponse, ChatResponseChoice, ChatResponseUsage
+from .sse import SSE_DONE, parse_sse_line
 from overblick.core.exceptions import LLMError, LLMConnectionError, LLMTimeoutError
 
 logger = logging.getLogger(__name__)
@@ -90,6 +92,22 @@ class OllamaClient:
             logger.error("Failed to list models: %s", e, exc_info=True)
             return []
 
+    @staticmethod
+    def _build_payload(request: ChatRequest, stream: bool) -> dict[str, Any]:
+        """Build the OpenAI-compatible request body for Ollama."""
+        payload: dict[str, Any] = {
+            "model": request.model,
+            "messages": [{"role": m.role, "content": m.content} for m in request.messages],
+            "max_tokens": request.max_tokens,
+            "temperature": request.temperature,
+            "top_p": request.top_p,
+            "stream": stream,
+        }
+        if stream:
+            # Ask for a final usage chunk so streamed requests can be metered
+            payload["stream_options"] = {"include_usage": True}
+        return payload
+
     async def chat_completion(self, request: ChatRequest) -> ChatResponse:
         """
         Send a chat completion request to Ollama.
@@ -108,14 +126,7 @@ class OllamaClient:
         try:
             client = await self._get_client()
 
-            payload = {
-                "model": request.model,
-                "messages": [{"role": m.role, "content": m.content} for m in request.messages],
-                "max_tokens": request.max_tokens,
-                "temperature": request.temperature,
-                "top_p": request.top_p,
-                "stream": False,
-            }
+            payload = self._build_payload(request, stream=False)
 
             logger.debug(
                 "Sending request to Ollama: model=%s, messages=%d",
@@ -185,6 +196,59 @@ class OllamaClient:
             logger.error("Unexpected error calling Ollama: %s", e, exc_info=True)
             raise OllamaError(f"Failed to call Ollama: {e}") from e
 
+    async def chat_completion_stream(self, request: ChatRequest) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream a chat completion from Ollama as OpenAI-style chunk dicts.
+
+        Chunks are yielded as soon as Ollama emits them. The HTTP response
+        is closed when the iterator finishes or is closed early.
+
+        Raises:
+            OllamaConnectionError: If server is unreachable
+            OllamaTimeoutError: If the stream stalls past the read timeout
+            OllamaError: For other errors
+        """
+        payload = self._build_payload(request, stream=True)
+        logger.debug(
+            "Streaming request to Ollama: model=%s, messages=%d",
+            request.model,
+            len(request.messages),
+        )
+
+        try:
+            client = await self._get_client()
+            async with client.stream("POST", "/v1/chat/completions", json=payload) as response:
+                if response.status_code >= 400:
+                    body = (await response.aread()).decode(errors="replace")
+                    raise OllamaError(f"Ollama returned error {response.status_code}: {body}")
+
+                async for line in response.aiter_lines():
+                    chunk = parse_sse_line(line)
+                    if chunk is None:
+                        continue
+                    if chunk == SSE_DONE:
+                        break
+                    yield chunk  # type: ignore[misc]
+
+        except OllamaError:
+            raise
+
+        except httpx.ConnectError as e:
+            logger.error("Connection to Ollama failed: %s", e, exc_info=True)
+            raise OllamaConnectionError(
+                f"Cannot connect to Ollama at {self.config.ollama_base_url}: {e}"
+            ) from e
+
+        except httpx.TimeoutException as e:
+            logger.error("Ollama stream timed out: %s", e, exc_info=True)
+            raise OllamaTimeoutError(
+                f"Stream stalled for {self.config.request_timeout_seconds}s: {e}"
+            ) from e
+
+        except Exception as e:
+            logger.error("Unexpected error streaming from Ollama: %s", e, exc_info=True)
+            raise OllamaError(f"Failed to stream from Ollama: {e}") from e
+
     async def embed(self, text: str, model: str = "nomic-embed-text") -> list[float]:
         """
         Generate an embedding vector via Ollama's /api/embed endpoint.
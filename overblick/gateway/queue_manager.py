@@ -3,7 +3,20 @@ Priority queue manager for LLM requests.
 
 Implements a priority queue where HIGH priority requests (interactive identity
 agents) are processed before LOW priority requests (background tasks).
-A single worker serializes GPU access. Supports multi-backend routing.
+
+Each backend gets its own queue and worker pool, sized by the backend's
+concurrency in BackendRegistry. Local GPU backends default to a single
+worker (strict priority order, serialized GPU access); remote backends such
+as Deepseek drain several requests in parallel, so a slow cloud call never
+holds up local work.
+
+Buffered requests first consult the ResponseCache: deterministic requests
+that were answered recently (or are being answered right now) never reach
+a queue. Streaming requests bypass the cache.
+
+Streaming requests queue exactly like buffered ones; once dequeued, the
+worker relays backend chunks to the caller as they arrive and keeps its
+slot until the stream ends, so GPU serialization is unchanged.
 """
 
 from __future__ import annotations
@@ -12,28 +25,61 @@ import asyncio
 import logging
 import time
 from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Optional
 
 from .config import GatewayConfig, get_config
-from .models import ChatRequest, ChatResponse, GatewayStats, Priority, QueuedRequest
+from .models import (
+    BackendQueueStats,
+    CacheMode,
+    ChatRequest,
+    ChatResponse,
+    GatewayStats,
+    Priority,
+    QueuedRequest,
+)
 from .ollama_client import OllamaClient
+from .response_cache import ResponseCache
 
 if TYPE_CHECKING:
     from .backend_registry import BackendRegistry
 
 logger = logging.getLogger(__name__)
 
+# Marks the end of a streamed response on QueuedRequest.stream_queue
+_STREAM_END = object()
+
+# Pool key used when no BackendRegistry is configured (legacy single client)
+_LEGACY_BACKEND = "default"
+
+
+@dataclass
+class _BackendPool:
+    """Queue, workers and counters for one backend."""
+
+    name: str
+    concurrency: int
+    queue: asyncio.PriorityQueue[QueuedRequest]
+    workers: list[asyncio.Task] = field(default_factory=list)
+    active: int = 0
+    processed: int = 0
+    wait_times: deque[float] = field(default_factory=lambda: deque(maxlen=100))
+    response_times: deque[float] = field(default_factory=lambda: deque(maxlen=100))
+
 
 class QueueManager:
     """
-    Manages the priority queue and worker for LLM requests.
+    Manages the per-backend priority queues and worker pools for LLM requests.
 
     Features:
     - Priority-based ordering (HIGH=1, LOW=5)
     - FIFO within same priority level
-    - Single worker to protect GPU
+    - One queue + worker pool per backend (local: 1 worker to protect GPU)
     - Multi-backend routing via BackendRegistry
-    - Metrics and statistics tracking
+    - Exact/semantic response cache with coalescing of identical requests
+    - Metrics and statistics tracking, overall and per backend
     """
 
     def __init__(
@@ -47,15 +93,13 @@ class QueueManager:
         self.client = client or OllamaClient(self.config)
         self._registry = registry
 
-        self._queue: asyncio.PriorityQueue[QueuedRequest] = asyncio.PriorityQueue(
-            maxsize=self.config.max_queue_size
-        )
-
-        self._semaphore = asyncio.Semaphore(self.config.max_concurrent_requests)
-
-        self._worker_task: asyncio.Task | None = None
         self._running = False
 
+        self._default_backend = registry.default_backend if registry else _LEGACY_BACKEND
+        self._pools: dict[str, _BackendPool] = {}
+        # Queue of the default backend (the only one in legacy mode)
+        self._queue = self._get_pool(self._default_backend).queue
+
         self._stats = {
             "requests_processed": 0,
             "requests_high": 0,
@@ -68,45 +112,97 @@ class QueueManager:
         # Recent response times for averaging (last 100)
         self._response_times: deque[float] = deque(maxlen=100)
 
+        self._cache: ResponseCache | None = None
+        if self.config.cache_enabled:
+            self._cache = ResponseCache(
+                max_entries=self.config.cache_max_entries,
+                ttl_seconds=self.config.cache_ttl_seconds,
+                semantic_threshold=(
+                    self.config.cache_semantic_threshold
+                    if self.config.cache_semantic_enabled
+                    else None
+                ),
+            )
+        # Cache key -> future of the identical request currently in flight
+        self._inflight: dict[str, asyncio.Future[ChatResponse]] = {}
+
     async def start(self) -> None:
-        """Start the queue worker."""
+        """Start the worker pools for all known backends."""
         if self._running:
             logger.warning("Queue manager already running")
             return
 
         self._running = True
         self._start_time = time.time()
-        self._worker_task = asyncio.create_task(self._worker_loop())
-        logger.info("Queue manager started")
+        if self._registry:
+            for name in self._registry.available_backends:
+                self._get_pool(name)
+        for pool in self._pools.values():
+            self._start_workers(pool)
+        logger.info(
+            "Queue manager started (%s)",
+            ", ".join(f"{p.name}={p.concurrency}" for p in self._pools.values()),
+        )
 
     async def stop(self) -> None:
-        """Stop the queue worker gracefully."""
+        """Stop all worker pools gracefully."""
         self._running = False
 
-        if self._worker_task is not None:
-            self._worker_task.cancel()
-            try:
-                await self._worker_task
-            except asyncio.CancelledError:
-                pass
-            self._worker_task = None
+        workers = [w for pool in self._pools.values() for w in pool.workers]
+        for worker in workers:
+            worker.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        for pool in self._pools.values():
+            pool.workers.clear()
 
         await self.client.close()
         logger.info("Queue manager stopped")
 
+    def _get_pool(self, backend: str | None) -> _BackendPool:
+        """Get (or lazily create) the pool for a backend name."""
+        name = backend or self._default_backend
+        pool = self._pools.get(name)
+        if pool is None:
+            if self._registry and name != _LEGACY_BACKEND:
+                concurrency = self._registry.get_concurrency(name)
+            else:
+                concurrency = self.config.max_concurrent_requests
+            pool = _BackendPool(
+                name=name,
+                concurrency=max(1, concurrency),
+                queue=asyncio.PriorityQueue(maxsize=self.config.max_queue_size),
+            )
+            self._pools[name] = pool
+            if self._running:
+                self._start_workers(pool)
+        return pool
+
+    def _start_workers(self, pool: _BackendPool) -> None:
+        """Spawn the worker tasks for a pool."""
+        for i in range(pool.concurrency - len(pool.workers)):
+            pool.workers.append(
+                asyncio.create_task(self._worker_loop(pool), name=f"gateway-{pool.name}-{i}")
+            )
+
     async def submit(
         self,
         request: ChatRequest,
         priority: Priority = Priority.LOW,
         backend: str | None = None,
+        cache: CacheMode = CacheMode.AUTO,
     ) -> ChatResponse:
         """
         Submit a request to the queue and wait for completion.
 
+        Cacheable requests (see ResponseCache.is_cacheable) are answered
+        from the response cache when possible, and identical requests
+        already in flight are shared instead of queued twice.
+
         Args:
             request: The chat request
             priority: Request priority (HIGH or LOW)
             backend: Target backend name (None = default)
+            cache: Response cache mode (AUTO, FORCE or OFF)
 
         Returns:
             The chat response
@@ -125,6 +221,96 @@ class QueueManager:
             # This will raise ValueError if backend doesn't exist
             self._registry.get_client(backend)
 
+        if self._cache is not None and self._cache.is_cacheable(request, cache):
+            return await self._submit_cached(request, priority, backend)
+        return await self._enqueue(request, priority, backend)
+
+    async def _submit_cached(
+        self,
+        request: ChatRequest,
+        priority: Priority,
+        backend: str | None,
+    ) -> ChatResponse:
+        """Serve a cacheable request from the cache, an in-flight twin, or the queue."""
+        assert self._cache is not None
+        pool_name = backend or self._default_backend
+        key = ResponseCache.make_key(request, pool_name)
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            logger.debug("Response cache hit (model=%s, backend=%s)", request.model, pool_name)
+            return cached
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            self._cache.record_coalesced()
+            try:
+                response = await asyncio.wait_for(
+                    asyncio.shield(pending),
+                    timeout=self.config.request_timeout_seconds,
+                )
+            except asyncio.CancelledError:
+                # The leader was cancelled (e.g. its client disconnected), not
+                # us: retry, so one follower takes over as the new leader.
+                task = asyncio.current_task()
+                if not pending.cancelled() or (task is not None and task.cancelling()):
+                    raise
+                return await self._submit_cached(request, priority, backend)
+            return response.model_copy(deep=True)
+
+        context_key = ""
+        embedding: list[float] | None = None
+        if self._cache.semantic_enabled:
+            context_key = ResponseCache.context_key(request, pool_name)
+            embedding = await self._embed_for_cache(request)
+            if embedding:
+                similar = self._cache.get_similar(context_key, embedding)
+                if similar is not None:
+                    logger.debug(
+                        "Semantic cache hit (model=%s, backend=%s)", request.model, pool_name
+                    )
+                    return similar
+
+        self._cache.record_miss()
+        pending = asyncio.get_running_loop().create_future()
+        self._inflight[key] = pending
+        try:
+            response = await self._enqueue(request, priority, backend)
+        except asyncio.CancelledError:
+            pending.cancel()
+            raise
+        except Exception as e:
+            pending.set_exception(e)
+            # Mark retrieved so a twin-less failure doesn't log a warning
+            pending.exception()
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        self._cache.put(key, response, context_key=context_key, embedding=embedding)
+        pending.set_result(response)
+        return response
+
+    async def _embed_for_cache(self, request: ChatRequest) -> list[float] | None:
+        """Embed a request's final message for the semantic cache tier."""
+        client = self._registry.get_client() if self._registry else self.client
+        if not hasattr(client, "embed"):
+            return None
+        try:
+            return await client.embed(
+                request.messages[-1].content, model=self.config.cache_embedding_model
+            )
+        except Exception as e:
+            logger.warning("Semantic cache embedding failed: %s", e)
+            return None
+
+    async def _enqueue(
+        self,
+        request: ChatRequest,
+        priority: Priority,
+        backend: str | None,
+    ) -> ChatResponse:
+        """Queue a request for its backend pool and wait for the response."""
         loop = asyncio.get_running_loop()
         future: asyncio.Future[ChatResponse] = loop.create_future()
 
@@ -144,7 +330,7 @@ class QueueManager:
         )
 
         try:
-            self._queue.put_nowait(queued)
+            self._get_pool(backend).queue.put_nowait(queued)
         except asyncio.QueueFull:
             logger.warning("Queue full, rejecting request %s", queued.request_id)
             raise
@@ -159,76 +345,169 @@ class QueueManager:
             logger.error("Request %s timed out", queued.request_id, exc_info=True)
             raise
 
-    async def _worker_loop(self) -> None:
-        """Main worker loop that processes queued requests."""
-        logger.info("Worker loop started")
+    async def submit_stream(
+        self,
+        request: ChatRequest,
+        priority: Priority = Priority.LOW,
+        backend: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Submit a streaming request and yield chunks as the backend produces them.
+
+        The request waits in the same priority queue as submit(). The
+        request timeout applies to the gap between chunks (including the
+        wait for the first one), not to the whole generation. Closing the
+        iterator early cancels the request and frees the worker.
+
+        Yields:
+            OpenAI-style ``chat.completion.chunk`` dicts
+
+        Raises:
+            asyncio.QueueFull: If queue is at capacity
+            asyncio.TimeoutError: If no chunk arrives within the timeout
+            OllamaError: If the backend stream fails
+            ValueError: If specified backend doesn't exist
+        """
+        if not self._running:
+            raise RuntimeError("Queue manager not running")
+
+        if backend and self._registry:
+            self._registry.get_client(backend)
+
+        loop = asyncio.get_running_loop()
+        queued = QueuedRequest(
+            priority=priority,
+            timestamp=time.time(),
+            request=request,
+            future=loop.create_future(),
+            backend=backend,
+            stream_queue=asyncio.Queue(),
+        )
+        assert queued.future is not None and queued.stream_queue is not None
+
+        logger.debug(
+            "Submitting stream %s with priority %s (backend=%s)",
+            queued.request_id,
+            priority.name,
+            backend or "default",
+        )
+
+        try:
+            self._get_pool(backend).queue.put_nowait(queued)
+        except asyncio.QueueFull:
+            logger.warning("Queue full, rejecting stream %s", queued.request_id)
+            raise
+
+        try:
+            while True:
+                try:
+                    item = await asyncio.wait_for(
+                        queued.stream_queue.get(),
+                        timeout=self.config.request_timeout_seconds,
+                    )
+                except TimeoutError:
+                    logger.error("Stream %s timed out", queued.request_id)
+                    raise
+                if item is _STREAM_END:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            # Signals the worker to stop relaying if the caller went away
+            if not queued.future.done():
+                queued.future.cancel()
+
+    async def _worker_loop(self, pool: _BackendPool) -> None:
+        """Worker loop that processes requests from one backend's queue."""
+        logger.info("Worker loop started (backend=%s)", pool.name)
 
         while self._running:
             try:
                 try:
                     queued = await asyncio.wait_for(
-                        self._queue.get(),
+                        pool.queue.get(),
                         timeout=1.0,
                     )
                 except TimeoutError:
                     continue
 
-                await self._process_request(queued)
+                await self._process_request(pool, queued)
 
             except asyncio.CancelledError:
-                logger.info("Worker loop cancelled")
+                logger.info("Worker loop cancelled (backend=%s)", pool.name)
                 break
             except Exception as e:
                 logger.error("Worker loop error: %s", e, exc_info=True)
                 await asyncio.sleep(0.1)
 
-        logger.info("Worker loop stopped")
+        logger.info("Worker loop stopped (backend=%s)", pool.name)
 
-    async def _process_request(self, queued: QueuedRequest) -> None:
+    async def _process_request(self, pool: _BackendPool, queued: QueuedRequest) -> None:
         """Process a single queued request."""
         if queued.future.cancelled():
             logger.info("Skipping cancelled request %s", queued.request_id)
-            self._queue.task_done()
+            pool.queue.task_done()
             return
 
         start_time = time.time()
+        pool.wait_times.append((start_time - queued.timestamp) * 1000)
+        pool.active += 1
         self._processing_count += 1
 
         try:
-            async with self._semaphore:
-                if queued.future.cancelled():
-                    logger.info("Skipping cancelled request %s after queue wait", queued.request_id)
-                    return
-
-                # Select the right backend client
-                client = self._get_client_for_request(queued)
-
-                logger.info(
-                    "Processing request %s (priority=%s, model=%s, backend=%s)",
-                    queued.request_id,
-                    queued.priority.name,
-                    queued.request.model,
-                    queued.backend or "default",
-                )
+            # Select the right backend client
+            client = self._get_client_for_request(queued)
+
+            logger.info(
+                "Processing request %s (priority=%s, model=%s, backend=%s)",
+                queued.request_id,
+                queued.priority.name,
+                queued.request.model,
+                pool.name,
+            )
 
+            if queued.stream_queue is not None:
+                await self._relay_stream(client, queued)
+            else:
                 response = await client.chat_completion(queued.request)
 
                 if not queued.future.done():
                     queued.future.set_result(response)
 
-                elapsed_ms = (time.time() - start_time) * 1000
-                self._update_stats(queued.priority, elapsed_ms)
+            elapsed_ms = (time.time() - start_time) * 1000
+            self._update_stats(pool, queued.priority, elapsed_ms)
 
-                logger.info("Completed request %s in %.0fms", queued.request_id, elapsed_ms)
+            logger.info("Completed request %s in %.0fms", queued.request_id, elapsed_ms)
 
         except Exception as e:
             logger.error("Failed to process request %s: %s", queued.request_id, e, exc_info=True)
-            if not queued.future.done():
+            if queued.stream_queue is not None:
+                queued.stream_queue.put_nowait(e)
+                if not queued.future.done():
+                    queued.future.set_result(None)
+            elif not queued.future.done():
                 queued.future.set_exception(e)
 
         finally:
+            pool.active -= 1
             self._processing_count -= 1
-            self._queue.task_done()
+            pool.queue.task_done()
+
+    async def _relay_stream(self, client: Any, queued: QueuedRequest) -> None:
+        """Forward backend chunks to the caller's stream queue until done."""
+        assert queued.stream_queue is not None and queued.future is not None
+
+        async with aclosing(client.chat_completion_stream(queued.request)) as stream:
+            async for chunk in stream:
+                if queued.future.done():
+                    logger.info("Stream consumer for %s went away, aborting", queued.request_id)
+                    break
+                queued.stream_queue.put_nowait(chunk)
+
+        queued.stream_queue.put_nowait(_STREAM_END)
+        if not queued.future.done():
+            queued.future.set_result(None)
 
     def _get_client_for_request(self, queued: QueuedRequest) -> Any:
         """Get the appropriate backend client for a queued request."""
@@ -238,11 +517,13 @@ class QueueManager:
             return self._registry.get_client()  # default backend
         return self.client  # legacy single client
 
-    def _update_stats(self, priority: Priority, elapsed_ms: float) -> None:
+    def _update_stats(self, pool: _BackendPool, priority: Priority, elapsed_ms: float) -> None:
         """Update statistics after processing a request."""
         self._stats["requests_processed"] += 1
         self._stats["total_response_time_ms"] += elapsed_ms
         self._response_times.append(elapsed_ms)
+        pool.processed += 1
+        pool.response_times.append(elapsed_ms)
 
         if priority == Priority.HIGH:
             self._stats["requests_high"] += 1
@@ -250,25 +531,59 @@ class QueueManager:
             self._stats["requests_low"] += 1
 
     def get_stats(self) -> GatewayStats:
-        """Get current gateway statistics."""
+        """Get current gateway statistics, including a per-backend breakdown."""
         avg_time = 0.0
         if self._response_times:
             avg_time = sum(self._response_times) / len(self._response_times)
 
+        backends = {name: self._pool_stats(pool) for name, pool in self._pools.items()}
+        waits = [w for pool in self._pools.values() for w in pool.wait_times]
+
         return GatewayStats(
-            queue_size=self._queue.qsize(),
+            queue_size=self.queue_size,
             requests_processed=self._stats["requests_processed"],
             requests_high_priority=self._stats["requests_high"],
             requests_low_priority=self._stats["requests_low"],
             avg_response_time_ms=avg_time,
+            avg_wait_time_ms=sum(waits) / len(waits) if waits else 0.0,
             is_processing=self._processing_count > 0,
+            active_requests=self._processing_count,
             uptime_seconds=time.time() - self._start_time,
+            backends=backends,
+            **self._cache_stats(),
+        )
+
+    def _cache_stats(self) -> dict[str, int]:
+        """Response cache counters for GatewayStats."""
+        if self._cache is None:
+            return {}
+        return {
+            "cache_hits": self._cache.hits,
+            "cache_semantic_hits": self._cache.semantic_hits,
+            "cache_misses": self._cache.misses,
+            "cache_coalesced": self._cache.coalesced,
+            "cache_entries": len(self._cache),
+        }
+
+    @staticmethod
+    def _pool_stats(pool: _BackendPool) -> BackendQueueStats:
+        """Summarize one backend pool."""
+        waits = pool.wait_times
+        responses = pool.response_times
+        return BackendQueueStats(
+            concurrency=pool.concurrency,
+            queue_size=pool.queue.qsize(),
+            active_requests=pool.active,
+            requests_processed=pool.processed,
+            avg_wait_time_ms=sum(waits) / len(waits) if waits else 0.0,
+            max_wait_time_ms=max(waits) if waits else 0.0,
+            avg_response_time_ms=sum(responses) / len(responses) if responses else 0.0,
         )
 
     @property
     def queue_size(self) -> int:
-        """Get current queue size."""
-        return self._queue.qsize()
+        """Get current queue size across all backends."""
+        return sum(pool.queue.qsize() for pool in self._pools.values())
 
     @property
     def is_running(self) -> bool:
@@ -0,0 +1,236 @@
+"""
+Response cache for the LLM Gateway.
+
+Many identities send near-identical background prompts (the same email
+classified by several consultants, heartbeat templates, ethos reviews).
+Deterministic requests are answered from memory instead of re-running
+inference.
+
+Two tiers:
+- Exact: keyed by a SHA-256 of the normalized model, messages and
+  sampling parameters (plus the resolved backend). Always on when the
+  cache is enabled.
+- Semantic (optional): among entries that share everything except the
+  final message, reuse a response whose final message embeds within a
+  cosine-similarity threshold of the new one. Embeddings come from the
+  same backend ``embed()`` call that serves ``/v1/embeddings``.
+
+Only temperature-0 requests are cached unless the caller opts in with
+CacheMode.FORCE; CacheMode.OFF bypasses the cache entirely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from .models import CacheMode, ChatRequest, ChatResponse
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+@dataclass
+class _CacheEntry:
+    """A cached response with its expiry and semantic-tier metadata."""
+
+    response: ChatResponse
+    expires_at: float
+    context_key: str
+    embedding: list[float] | None = None
+
+
+def _normalize(text: str) -> str:
+    """Collapse whitespace runs so formatting noise does not split keys."""
+    return _WHITESPACE.sub(" ", text).strip()
+
+
+def _digest(payload: dict) -> str:
+    """Stable SHA-256 of a JSON-serializable payload."""
+    raw = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _unit(vector: list[float]) -> list[float] | None:
+    """Scale a vector to unit length (None for empty or zero vectors)."""
+    norm = math.sqrt(sum(v * v for v in vector))
+    if not norm:
+        return None
+    return [v / norm for v in vector]
+
+
+class ResponseCache:
+    """
+    In-memory LRU cache of chat completions with a TTL.
+
+    Not thread-safe; it is only touched from the gateway's event loop.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        ttl_seconds: float = 600.0,
+        semantic_threshold: float | None = None,
+    ):
+        """
+        Args:
+            max_entries: Entries kept before the least recently used is evicted
+            ttl_seconds: Lifetime of an entry
+            semantic_threshold: Cosine similarity needed for a semantic hit
+                (None disables the semantic tier)
+        """
+        self.max_entries = max(1, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self.semantic_threshold = semantic_threshold
+        self._entries: OrderedDict[str, _CacheEntry] = OrderedDict()
+        # context key -> exact keys sharing it (semantic tier candidates)
+        self._by_context: dict[str, set[str]] = {}
+
+        self.hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @property
+    def semantic_enabled(self) -> bool:
+        """Whether the embedding-similarity tier is active."""
+        return self.semantic_threshold is not None
+
+    @staticmethod
+    def is_cacheable(request: ChatRequest, mode: CacheMode = CacheMode.AUTO) -> bool:
+        """Whether a request may be served from / stored in the cache."""
+        if mode == CacheMode.OFF or request.stream:
+            return False
+        return mode == CacheMode.FORCE or request.temperature == 0
+
+    @staticmethod
+    def make_key(request: ChatRequest, backend: str | None = None) -> str:
+        """Exact-match key: normalized model, messages and sampling params."""
+        return _digest(
+            {
+                "backend": backend,
+                "model": request.model,
+                "messages": [[m.role, _normalize(m.content)] for m in request.messages],
+                "max_tokens": request.max_tokens,
+                "temperature": request.temperature,
+                "top_p": request.top_p,
+            }
+        )
+
+    @staticmethod
+    def context_key(request: ChatRequest, backend: str | None = None) -> str:
+        """Semantic-tier key: everything except the final message's content."""
+        *history, last = request.messages
+        return _digest(
+            {
+                "backend": backend,
+                "model": request.model,
+                "messages": [[m.role, _normalize(m.content)] for m in history],
+                "last_role": last.role,
+                "max_tokens": request.max_tokens,
+                "temperature": request.temperature,
+                "top_p": request.top_p,
+            }
+        )
+
+    def get(self, key: str) -> ChatResponse | None:
+        """Look up an exact key, counting a hit when found."""
+        entry = self._live_entry(key)
+        if entry is None:
+            return None
+        self.hits += 1
+        return self._fresh_copy(entry.response)
+
+    def get_similar(self, context_key: str, embedding: list[float]) -> ChatResponse | None:
+        """Find the most similar cached response sharing a context key."""
+        if not self.semantic_enabled:
+            return None
+        query = _unit(embedding)
+        if query is None:
+            return None
+
+        best_key, best_score = None, self.semantic_threshold or 0.0
+        for key in list(self._by_context.get(context_key, ())):
+            entry = self._live_entry(key, touch=False)
+            if entry is None or entry.embedding is None or len(entry.embedding) != len(query):
+                continue
+            score = sum(a * b for a, b in zip(query, entry.embedding))
+            if score >= best_score:
+                best_key, best_score = key, score
+
+        if best_key is None:
+            return None
+        self._entries.move_to_end(best_key)
+        self.semantic_hits += 1
+        return self._fresh_copy(self._entries[best_key].response)
+
+    def put(
+        self,
+        key: str,
+        response: ChatResponse,
+        context_key: str = "",
+        embedding: list[float] | None = None,
+    ) -> None:
+        """Store a response, evicting the least recently used entry if full."""
+        if not response.choices or not response.choices[0].message.content:
+            return
+        self._discard(key)
+        self._entries[key] = _CacheEntry(
+            response=response.model_copy(deep=True),
+            expires_at=time.monotonic() + self.ttl_seconds,
+            context_key=context_key,
+            embedding=_unit(embedding) if embedding else None,
+        )
+        if context_key:
+            self._by_context.setdefault(context_key, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._discard(next(iter(self._entries)))
+
+    def record_miss(self) -> None:
+        """Count a lookup that missed every tier."""
+        self.misses += 1
+
+    def record_coalesced(self) -> None:
+        """Count a request that piggybacked on an identical in-flight one."""
+        self.coalesced += 1
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        self._entries.clear()
+        self._by_context.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _live_entry(self, key: str, touch: bool = True) -> _CacheEntry | None:
+        """Return an unexpired entry (dropping it if stale)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.monotonic():
+            self._discard(key)
+            return None
+        if touch:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _discard(self, key: str) -> None:
+        """Remove an entry and its semantic-index reference."""
+        entry = self._entries.pop(key, None)
+        if entry is None or not entry.context_key:
+            return
+        keys = self._by_context.get(entry.context_key)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_context[entry.context_key]
+
+    @staticmethod
+    def _fresh_copy(response: ChatResponse) -> ChatResponse:
+        """Copy a cached response under a new id and timestamp."""
+        fresh = ChatResponse(model=response.model, choices=[], usage=response.usage)
+        return response.model_copy(deep=True, update={"id": fresh.id, "created": fresh.created})
@@ -0,0 +1,42 @@
+"""
+Server-Sent Events helpers for streamed chat completions.
+
+Both backends (Ollama's OpenAI-compatible API and Deepseek) stream
+completions as ``data: {json}`` lines terminated by ``data: [DONE]``.
+The gateway re-emits the same framing to its own clients, so one parser
+and one formatter serve both directions.
+"""
+
+import json
+from typing import Any
+
+SSE_DONE = "[DONE]"
+
+
+def parse_sse_line(line: str) -> dict[str, Any] | str | None:
+    """
+    Parse a single SSE line from an OpenAI-compatible stream.
+
+    Returns:
+        The decoded chunk dict, SSE_DONE for the terminator, or None for
+        blank lines, comments, non-data fields and undecodable payloads.
+    """
+    line = line.strip()
+    if not line.startswith("data:"):
+        return None
+    data = line[5:].strip()
+    if not data:
+        return None
+    if data == SSE_DONE:
+        return SSE_DONE
+    try:
+        chunk = json.loads(data)
+    except json.JSONDecodeError:
+        return None
+    return chunk if isinstance(chunk, dict) else None
+
+
+def format_sse(data: dict[str, Any] | str) -> str:
+    """Format a chunk dict (or the SSE_DONE marker) as one SSE event."""
+    payload = data if isinstance(data, str) else json.dumps(data, separators=(",", ":"))
+    return f"data: {payload}\n\n"
@@ -0,0 +1,111 @@
+"""
+Delta persistence for Compass state.
+
+``compass_state.json`` is a full snapshot: baselines, recent alerts and
+drift history, plus ``journal_seq``, the sequence number of the last
+record it includes. Between snapshots the plugin only appends each tick's
+new records to ``compass_journal.jsonl``:
+
+    {"seq": 42, "kind": "drift" | "alert" | "baseline", "data": {...}}
+
+Loading folds journal records newer than ``journal_seq`` over the
+snapshot, so a crash between writing a snapshot and truncating the
+journal never duplicates records. A torn last line is skipped. The
+plugin writes a fresh snapshot (and removes the journal) once the journal
+grows past a limit and on teardown.
+
+Works on plain dicts so the dashboard can read state without the
+plugin's models.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE = "compass_state.json"
+JOURNAL_FILE = "compass_journal.jsonl"
+
+
+def load_state(directory: Path) -> dict[str, Any]:
+    """
+    Read the snapshot and fold the journal over it.
+
+    Returns:
+        {"baselines": {name: dict}, "alerts": [dict], "drift_history": [dict],
+        "journal_seq": int, "journal_lines": int}
+
+    Raises:
+        ValueError: If the snapshot is not valid JSON
+    """
+    directory = Path(directory)
+    state_path = directory / STATE_FILE
+    journal_path = directory / JOURNAL_FILE
+
+    snapshot: dict[str, Any] = {}
+    if state_path.exists():
+        snapshot = json.loads(state_path.read_text())
+
+    baselines = dict(snapshot.get("baselines", {}))
+    alerts = list(snapshot.get("alerts", []))
+    drift_history = list(snapshot.get("drift_history", []))
+    seq = snapshot.get("journal_seq", 0)
+    lines = 0
+
+    if journal_path.exists():
+        with open(journal_path, "rb") as f:
+            data = f.read()
+        # Anything after the last newline is a torn write
+        for line in data[: data.rfind(b"\n") + 1].splitlines():
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                logger.warning("Compass journal: skipping corrupt line")
+                continue
+            lines += 1
+            if record.get("seq", 0) <= seq:
+                continue
+            seq = record["seq"]
+            kind, payload = record.get("kind"), record.get("data", {})
+            if kind == "baseline":
+                baselines[payload.get("identity_name", "")] = payload
+            elif kind == "alert":
+                alerts.append(payload)
+            elif kind == "drift":
+                drift_history.append(payload)
+
+    return {
+        "baselines": baselines,
+        "alerts": alerts,
+        "drift_history": drift_history,
+        "journal_seq": seq,
+        "journal_lines": lines,
+    }
+
+
+def append_records(directory: Path, records: list[dict[str, Any]]) -> None:
+    """Append journal records (each with seq, kind and data) as JSON lines."""
+    if not records:
+        return
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    with open(directory / JOURNAL_FILE, "a", encoding="utf-8") as f:
+        f.write("".join(json.dumps(r, default=str) + "\n" for r in records))
+
+
+def write_snapshot(directory: Path, state: dict[str, Any]) -> None:
+    """Atomically replace the snapshot, then drop the journal it supersedes."""
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    state_path = directory / STATE_FILE
+    tmp_path = state_path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(state, indent=2, default=str))
+    os.replace(tmp_path, state_path)
+    (directory / JOURNAL_FILE).unlink(missing_ok=True)
@@ -13,19 +13,26 @@ Architecture: Event-driven. Subscribes to LLM output events -> maintains
 rolling window of stylometric metrics per identity -> compares against
 baseline -> alerts when threshold exceeded.
 
+Incremental: each tick analyzes only the outputs buffered since the last
+one, as a batch; baselines and windows keep running statistics, drift is
+re-checked only for identities that got new samples, and only the new
+records are appended to the state journal. Tick cost is O(new outputs),
+independent of accumulated history.
+
 Security: Pure analysis, no LLM calls. Read-only access to output data.
 """
 
-import json
 import logging
-import statistics
-import time
-from typing import Any, Optional
+from collections import deque
+from itertools import islice
+from pathlib import Path
+from typing import Any
 
 from overblick.core.plugin_base import PluginBase, PluginContext
 
-from .models import BaselineProfile, DriftAlert, DriftMetrics, StyleMetrics
-from .stylometry import analyze_text, compute_drift_score
+from .journal import append_records, load_state, write_snapshot
+from .models import BaselineProfile, DriftAlert, DriftMetrics
+from .stylometry import RunningStats, StyleWindow, analyze_texts, compute_drift_score
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +41,7 @@ _DEFAULT_BASELINE_SAMPLES = 10  # Samples needed to establish baseline
 _DEFAULT_DRIFT_THRESHOLD = 2.0  # Z-score threshold for alerts
 _MAX_ALERTS_STORED = 200
 _MAX_HISTORY_STORED = 500
+_MAX_JOURNAL_LINES = 500  # Journal records before a fresh snapshot is written
 
 
 class CompassPlugin(PluginBase):
@@ -56,14 +64,19 @@ class CompassPlugin(PluginBase):
 
         # Per-identity data
         self._baselines: dict[str, BaselineProfile] = {}
-        self._windows: dict[str, list[StyleMetrics]] = {}
+        self._windows: dict[str, StyleWindow] = {}
+        self._pending_baselines: dict[str, RunningStats] = {}  # Not yet established
         self._output_buffer: list[tuple[str, str]] = []  # (identity, text)
 
         # History and alerts
-        self._drift_history: list[DriftMetrics] = []
-        self._alerts: list[DriftAlert] = []
-
-        self._state_file: Any | None = None
+        self._drift_history: deque[DriftMetrics] = deque(maxlen=_MAX_HISTORY_STORED)
+        self._alerts: deque[DriftAlert] = deque(maxlen=_MAX_ALERTS_STORED)
+
+        # Delta persistence: records not yet appended to the journal
+        self._state_dir: Path | None = None
+        self._unsaved: list[dict[str, Any]] = []
+        self._journal_seq: int = 0
+        self._journal_lines: int = 0
         self._tick_count: int = 0
 
     async def setup(self) -> None:
@@ -79,7 +92,7 @@ class CompassPlugin(PluginBase):
         self._drift_threshold = compass_config.get("drift_threshold", _DEFAULT_DRIFT_THRESHOLD)
 
         # State persistence
-        self._state_file = self.ctx.data_dir / "compass_state.json"
+        self._state_dir = self.ctx.data_dir
         self._load_state()
 
         # Subscribe to LLM output events if event bus is available
@@ -104,19 +117,20 @@ class CompassPlugin(PluginBase):
         # Process any buffered outputs
         buffer = self._output_buffer[:]
         self._output_buffer.clear()
+        updated = self._process_outputs(buffer)
 
-        for identity_name, text in buffer:
-            self._process_output(identity_name, text)
-
-        # Check drift for all identities with enough data
+        # Only identities with new samples can have drifted since the last check
         for identity_name, baseline in self._baselines.items():
-            window = self._windows.get(identity_name, [])
-            if len(window) < 3:
+            if identity_name not in updated:
+                continue
+            window = self._windows.get(identity_name)
+            if window is None or len(window) < 3:
                 continue
 
             drift = self._check_drift(identity_name, baseline, window)
             if drift:
                 self._drift_history.append(drift)
+                self._record("drift", drift)
 
                 if drift.drift_score > self._drift_threshold:
                     alert = DriftAlert(
@@ -131,6 +145,7 @@ class CompassPlugin(PluginBase):
                         ),
                     )
                     self._alerts.append(alert)
+                    self._record("alert", alert)
 
                     self.ctx.audit_log.log(
                         action="compass_drift_alert",
@@ -156,13 +171,7 @@ class CompassPlugin(PluginBase):
                         drift.drift_score,
                     )
 
-        # Trim history
-        if len(self._drift_history) > _MAX_HISTORY_STORED:
-            self._drift_history = self._drift_history[-_MAX_HISTORY_STORED:]
-        if len(self._alerts) > _MAX_ALERTS_STORED:
-            self._alerts = self._alerts[-_MAX_ALERTS_STORED:]
-
-        self._save_state()
+        self._save_delta()
 
     def record_output(self, identity_name: str, text: str) -> None:
         """Record an LLM output for analysis (called externally or via event)."""
@@ -175,54 +184,63 @@ class CompassPlugin(PluginBase):
         if identity_name and text:
             self.record_output(identity_name, text)
 
-    def _process_output(self, identity_name: str, text: str) -> None:
-        """Analyze a text output and add to the rolling window."""
-        metrics = analyze_text(text)
-        if metrics.word_count < 10:
-            return  # Skip very short outputs
-
-        # Add to rolling window
-        if identity_name not in self._windows:
-            self._windows[identity_name] = []
-        window = self._windows[identity_name]
-        window.append(metrics)
-
-        # Trim window
-        if len(window) > self._window_size * 2:
-            self._windows[identity_name] = window[-self._window_size :]
-
-        # Establish baseline if not yet established
-        if identity_name not in self._baselines:
-            if len(window) >= self._baseline_samples:
-                self._establish_baseline(identity_name, window[: self._baseline_samples])
-
-    def _establish_baseline(self, identity_name: str, samples: list[StyleMetrics]) -> None:
-        """Establish the baseline metrics from initial samples."""
-        avg_metrics = self._average_metrics(samples)
-        std_devs = self._compute_std_devs(samples)
-
-        self._baselines[identity_name] = BaselineProfile(
+    def _process_outputs(self, outputs: list[tuple[str, str]]) -> set[str]:
+        """
+        Analyze a batch of outputs and add them to the rolling windows.
+
+        Returns:
+            Names of identities that received at least one new sample
+        """
+        updated: set[str] = set()
+        if not outputs:
+            return updated
+
+        all_metrics = analyze_texts(text for _, text in outputs)
+        for (identity_name, _), metrics in zip(outputs, all_metrics):
+            if metrics.word_count < 10:
+                continue  # Skip very short outputs
+
+            window = self._windows.get(identity_name)
+            if window is None:
+                window = self._windows[identity_name] = StyleWindow(self._window_size)
+            window.add(metrics)
+            updated.add(identity_name)
+
+            # Accumulate the baseline from the first samples until established
+            if identity_name not in self._baselines:
+                pending = self._pending_baselines.setdefault(identity_name, RunningStats())
+                pending.add(metrics)
+                if pending.count >= self._baseline_samples:
+                    del self._pending_baselines[identity_name]
+                    self._establish_baseline(identity_name, pending)
+
+        return updated
+
+    def _establish_baseline(self, identity_name: str, samples: RunningStats) -> None:
+        """Establish the baseline metrics from the initial samples' statistics."""
+        baseline = BaselineProfile(
             identity_name=identity_name,
-            metrics=avg_metrics,
-            sample_count=len(samples),
-            std_devs=std_devs,
+            metrics=samples.mean(),
+            sample_count=samples.count,
+            std_devs=samples.std_devs(),
         )
+        self._baselines[identity_name] = baseline
+        self._record("baseline", baseline)
 
         logger.info(
             "CompassPlugin: baseline established for %s (%d samples)",
             identity_name,
-            len(samples),
+            samples.count,
         )
 
     def _check_drift(
         self,
         identity_name: str,
         baseline: BaselineProfile,
-        window: list[StyleMetrics],
+        window: StyleWindow,
     ) -> DriftMetrics | None:
         """Check current window against baseline for drift."""
-        recent = window[-self._window_size :]
-        current = self._average_metrics(recent)
+        current = window.mean()
 
         drift_score, drifted = compute_drift_score(current, baseline.metrics, baseline.std_devs)
 
@@ -231,95 +249,78 @@ class CompassPlugin(PluginBase):
             current_metrics=current,
             drift_score=drift_score,
             drifted_dimensions=drifted,
-            sample_count=len(recent),
-        )
-
-    def _average_metrics(self, samples: list[StyleMetrics]) -> StyleMetrics:
-        """Compute average metrics across samples."""
-        if not samples:
-            return StyleMetrics()
-
-        n = len(samples)
-        return StyleMetrics(
-            avg_sentence_length=round(sum(s.avg_sentence_length for s in samples) / n, 2),
-            avg_word_length=round(sum(s.avg_word_length for s in samples) / n, 2),
-            vocabulary_richness=round(sum(s.vocabulary_richness for s in samples) / n, 4),
-            punctuation_frequency=round(sum(s.punctuation_frequency for s in samples) / n, 2),
-            question_ratio=round(sum(s.question_ratio for s in samples) / n, 4),
-            exclamation_ratio=round(sum(s.exclamation_ratio for s in samples) / n, 4),
-            comma_frequency=round(sum(s.comma_frequency for s in samples) / n, 2),
-            formality_score=round(sum(s.formality_score for s in samples) / n, 4),
-            word_count=sum(s.word_count for s in samples) // n,
+            sample_count=len(window),
         )
 
-    def _compute_std_devs(self, samples: list[StyleMetrics]) -> dict[str, float]:
-        """Compute standard deviations for each metric dimension."""
-        if len(samples) < 2:
-            return {}
-
-        dimensions = [
-            "avg_sentence_length",
-            "avg_word_length",
-            "vocabulary_richness",
-            "punctuation_frequency",
-            "question_ratio",
-            "exclamation_ratio",
-            "comma_frequency",
-            "formality_score",
-        ]
-
-        std_devs = {}
-        for dim in dimensions:
-            values = [getattr(s, dim, 0.0) for s in samples]
-            try:
-                std_devs[dim] = round(statistics.stdev(values), 4)
-            except statistics.StatisticsError:
-                std_devs[dim] = 0.1  # Default small std dev
-
-        return std_devs
-
     def get_alerts(self, limit: int = 50) -> list[DriftAlert]:
         """Get recent drift alerts (newest first)."""
-        return list(reversed(self._alerts[-limit:]))
+        return list(islice(reversed(self._alerts), limit))
 
     def get_drift_history(
         self, identity_name: str | None = None, limit: int = 50
     ) -> list[DriftMetrics]:
         """Get drift history, optionally filtered by identity."""
-        history = self._drift_history
+        history = reversed(self._drift_history)
         if identity_name:
-            history = [h for h in history if h.identity_name == identity_name]
-        return list(reversed(history[-limit:]))
+            history = (h for h in history if h.identity_name == identity_name)
+        return list(islice(history, limit))
 
     def get_baseline(self, identity_name: str) -> BaselineProfile | None:
         """Get the baseline profile for an identity."""
         return self._baselines.get(identity_name)
 
+    def _record(self, kind: str, record: BaselineProfile | DriftAlert | DriftMetrics) -> None:
+        """Queue a new record for the next journal append."""
+        self._journal_seq += 1
+        self._unsaved.append(
+            {"seq": self._journal_seq, "kind": kind, "data": record.model_dump(mode="json")}
+        )
+
     def _load_state(self) -> None:
-        if self._state_file and self._state_file.exists():
-            try:
-                data = json.loads(self._state_file.read_text())
-                for name, bl in data.get("baselines", {}).items():
-                    self._baselines[name] = BaselineProfile.model_validate(bl)
-                for alert_data in data.get("alerts", []):
-                    self._alerts.append(DriftAlert.model_validate(alert_data))
-                for hist_data in data.get("drift_history", []):
-                    self._drift_history.append(DriftMetrics.model_validate(hist_data))
-            except Exception as e:
-                logger.warning("CompassPlugin: failed to load state: %s", e)
+        if not self._state_dir:
+            return
+        try:
+            state = load_state(self._state_dir)
+            for name, bl in state["baselines"].items():
+                self._baselines[name] = BaselineProfile.model_validate(bl)
+            for alert_data in state["alerts"]:
+                self._alerts.append(DriftAlert.model_validate(alert_data))
+            for hist_data in state["drift_history"]:
+                self._drift_history.append(DriftMetrics.model_validate(hist_data))
+            self._journal_seq = state["journal_seq"]
+            self._journal_lines = state["journal_lines"]
+        except Exception as e:
+            logger.warning("CompassPlugin: failed to load state: %s", e)
+
+    def _save_delta(self) -> None:
+        """Append records produced since the last save; snapshot when the journal is long."""
+        if not self._state_dir or not self._unsaved:
+            return
+        if self._journal_lines + len(self._unsaved) > _MAX_JOURNAL_LINES:
+            self._save_state()
+            return
+        try:
+            append_records(self._state_dir, self._unsaved)
+            self._journal_lines += len(self._unsaved)
+            self._unsaved.clear()
+        except Exception as e:
+            logger.warning("CompassPlugin: failed to append state journal: %s", e)
 
     def _save_state(self) -> None:
-        if self._state_file:
+        """Write a full snapshot, superseding the journal."""
+        if self._state_dir:
             try:
                 data = {
-                    "baselines": {name: bl.model_dump() for name, bl in self._baselines.items()},
-                    "alerts": [a.model_dump() for a in self._alerts[-_MAX_ALERTS_STORED:]],
-                    "drift_history": [
-                        h.model_dump() for h in self._drift_history[-_MAX_HISTORY_STORED:]
-                    ],
+                    "baselines": {
+                        name: bl.model_dump(mode="json") for name, bl in self._baselines.items()
+                    },
+                    "alerts": [a.model_dump(mode="json") for a in self._alerts],
+                    "drift_history": [h.model_dump(mode="json") for h in self._drift_history],
+                    "journal_seq": self._journal_seq,
                 }
-                self._state_file.parent.mkdir(parents=True, exist_ok=True)
-                self._state_file.write_text(json.dumps(data, indent=2))
+                write_snapshot(self._state_dir, data)
+                self._unsaved.clear()
+                self._journal_lines = 0
             except Exception as e:
                 logger.warning("CompassPlugin: failed to save state: %s", e)
 
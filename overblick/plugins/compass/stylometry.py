@@ -3,14 +3,98 @@ Pure Python stylometric analysis functions.
 
 Measures text characteristics that form a unique stylometric fingerprint
 for each identity. No external NLP dependencies required.
+
+Incremental engine: analyze_texts() extracts a whole batch of outputs at
+once (shared compiled patterns, repeated texts analyzed once), and
+RunningStats / StyleWindow keep Welford running means and variances, so
+baselines and rolling windows are updated per new sample instead of
+re-summing the history.
 """
 
+import math
 import re
 import string
-from typing import Optional
+from collections import deque
+from collections.abc import Iterable
 
 from .models import StyleMetrics
 
+# Metric dimensions compared for drift, with the rounding applied to averages
+STYLE_DIMENSIONS = (
+    "avg_sentence_length",
+    "avg_word_length",
+    "vocabulary_richness",
+    "punctuation_frequency",
+    "question_ratio",
+    "exclamation_ratio",
+    "comma_frequency",
+    "formality_score",
+)
+_DIMENSION_DIGITS = (2, 2, 4, 2, 4, 4, 2, 4)
+
+# Rebuild a window's running sums from its samples after this many updates
+# per slot, so floating-point error from add/remove cannot accumulate
+_RESUM_FACTOR = 64
+
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+_WORD = re.compile(r"\b\w+\b")
+_STRIP_PUNCTUATION = str.maketrans("", "", string.punctuation)
+
+_CONTRACTIONS = frozenset(
+    {
+        "don't",
+        "won't",
+        "can't",
+        "isn't",
+        "aren't",
+        "wasn't",
+        "weren't",
+        "hasn't",
+        "haven't",
+        "hadn't",
+        "doesn't",
+        "didn't",
+        "wouldn't",
+        "couldn't",
+        "shouldn't",
+        "mustn't",
+        "i'm",
+        "you're",
+        "he's",
+        "she's",
+        "it's",
+        "we're",
+        "they're",
+        "i've",
+        "you've",
+        "we've",
+        "they've",
+        "i'd",
+        "you'd",
+        "he'd",
+        "she'd",
+        "we'd",
+        "they'd",
+        "i'll",
+        "you'll",
+        "he'll",
+        "she'll",
+        "we'll",
+        "they'll",
+        "that's",
+        "there's",
+        "here's",
+        "what's",
+        "who's",
+        "gonna",
+        "wanna",
+        "gotta",
+        "kinda",
+        "sorta",
+    }
+)
+_FIRST_PERSON = frozenset({"i", "me", "my", "mine", "myself", "we", "us", "our", "ours"})
+
 
 def analyze_text(text: str) -> StyleMetrics:
     """
@@ -38,8 +122,7 @@ def analyze_text(text: str) -> StyleMetrics:
         return StyleMetrics(word_count=0)
 
     # Character counts
-    len(text)
-    punct_count = sum(1 for c in text if c in string.punctuation)
+    punct_count = len(text) - len(text.translate(_STRIP_PUNCTUATION))
     question_count = text.count("?")
     exclamation_count = text.count("!")
     comma_count = text.count(",")
@@ -51,7 +134,8 @@ def analyze_text(text: str) -> StyleMetrics:
     avg_word_length = sum(len(w) for w in words) / word_count
 
     # Vocabulary richness (type-token ratio)
-    unique_words = {w.lower() for w in words}
+    lower_words = [w.lower() for w in words]
+    unique_words = set(lower_words)
     vocabulary_richness = len(unique_words) / word_count if word_count > 0 else 0.0
 
     # Punctuation frequency (per 100 words)
@@ -65,7 +149,7 @@ def analyze_text(text: str) -> StyleMetrics:
     comma_frequency = (comma_count / word_count) * 100
 
     # Formality score (heuristic: longer words + fewer contractions = more formal)
-    formality_score = _compute_formality(words, avg_word_length)
+    formality_score = _compute_formality(lower_words, avg_word_length)
 
     return StyleMetrics(
         avg_sentence_length=round(avg_sentence_length, 2),
@@ -80,6 +164,120 @@ def analyze_text(text: str) -> StyleMetrics:
     )
 
 
+def analyze_texts(texts: Iterable[str]) -> list[StyleMetrics]:
+    """
+    Compute stylometric metrics for a batch of text samples.
+
+    Identical texts in the batch are analyzed once.
+
+    Returns:
+        One StyleMetrics per input text, in input order.
+    """
+    seen: dict[str, StyleMetrics] = {}
+    results = []
+    for text in texts:
+        metrics = seen.get(text)
+        if metrics is None:
+            metrics = seen[text] = analyze_text(text)
+        results.append(metrics)
+    return results
+
+
+class RunningStats:
+    """
+    Welford running mean and variance of StyleMetrics over STYLE_DIMENSIONS.
+
+    Samples are added (and removed) in O(1), so neither a growing baseline
+    nor a rolling window ever has to be re-summed.
+    """
+
+    __slots__ = ("_m2", "_mean", "_words", "count")
+
+    def __init__(self) -> None:
+        self.clear()
+
+    def clear(self) -> None:
+        """Forget all samples."""
+        self.count = 0
+        self._mean = [0.0] * len(STYLE_DIMENSIONS)
+        self._m2 = [0.0] * len(STYLE_DIMENSIONS)
+        self._words = 0
+
+    def add(self, metrics: StyleMetrics) -> None:
+        """Fold one sample into the statistics."""
+        self.count += 1
+        self._words += metrics.word_count
+        mean, m2 = self._mean, self._m2
+        for i, dim in enumerate(STYLE_DIMENSIONS):
+            x = getattr(metrics, dim)
+            delta = x - mean[i]
+            mean[i] += delta / self.count
+            m2[i] += delta * (x - mean[i])
+
+    def remove(self, metrics: StyleMetrics) -> None:
+        """Take back a sample previously added (reverse Welford update)."""
+        if self.count <= 1:
+            self.clear()
+            return
+        self.count -= 1
+        self._words -= metrics.word_count
+        mean, m2 = self._mean, self._m2
+        for i, dim in enumerate(STYLE_DIMENSIONS):
+            x = getattr(metrics, dim)
+            old_mean = mean[i]
+            mean[i] -= (x - old_mean) / self.count
+            m2[i] = max(m2[i] - (x - mean[i]) * (x - old_mean), 0.0)
+
+    def mean(self) -> StyleMetrics:
+        """Average metrics of the samples (same rounding as per-text metrics)."""
+        if not self.count:
+            return StyleMetrics()
+        values = {
+            dim: round(value, digits)
+            for dim, value, digits in zip(STYLE_DIMENSIONS, self._mean, _DIMENSION_DIGITS)
+        }
+        return StyleMetrics(**values, word_count=self._words // self.count)
+
+    def std_devs(self) -> dict[str, float]:
+        """Sample standard deviation per dimension ({} with fewer than 2 samples)."""
+        if self.count < 2:
+            return {}
+        return {
+            dim: round(math.sqrt(m2 / (self.count - 1)), 4)
+            for dim, m2 in zip(STYLE_DIMENSIONS, self._m2)
+        }
+
+
+class StyleWindow:
+    """The most recent ``size`` samples of one identity, with running statistics."""
+
+    def __init__(self, size: int):
+        self._samples: deque[StyleMetrics] = deque(maxlen=max(size, 1))
+        self._stats = RunningStats()
+        self._updates = 0
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add(self, metrics: StyleMetrics) -> None:
+        """Append a sample, evicting the oldest once the window is full."""
+        if len(self._samples) == self._samples.maxlen:
+            self._stats.remove(self._samples[0])
+        self._samples.append(metrics)
+        self._stats.add(metrics)
+
+        self._updates += 1
+        if self._updates >= _RESUM_FACTOR * self._samples.maxlen:
+            self._updates = 0
+            self._stats.clear()
+            for sample in self._samples:
+                self._stats.add(sample)
+
+    def mean(self) -> StyleMetrics:
+        """Average metrics over the window."""
+        return self._stats.mean()
+
+
 def compute_drift_score(
     current: StyleMetrics,
     baseline: StyleMetrics,
@@ -97,21 +295,10 @@ def compute_drift_score(
     if std_devs is None:
         std_devs = {}
 
-    dimensions = [
-        "avg_sentence_length",
-        "avg_word_length",
-        "vocabulary_richness",
-        "punctuation_frequency",
-        "question_ratio",
-        "exclamation_ratio",
-        "comma_frequency",
-        "formality_score",
-    ]
-
     drifted: list[str] = []
     total_sq = 0.0
 
-    for dim in dimensions:
+    for dim in STYLE_DIMENSIONS:
         current_val = getattr(current, dim, 0.0)
         baseline_val = getattr(baseline, dim, 0.0)
 
@@ -130,96 +317,41 @@ def compute_drift_score(
             drifted.append(dim)
 
     # Root mean square of z-scores
-    drift_score = (total_sq / len(dimensions)) ** 0.5
+    drift_score = (total_sq / len(STYLE_DIMENSIONS)) ** 0.5
     return round(drift_score, 4), drifted
 
 
 def _split_sentences(text: str) -> list[str]:
     """Split text into sentences."""
     # Simple sentence splitting on .!? followed by space or end
-    parts = re.split(r"(?<=[.!?])\s+", text)
+    parts = _SENTENCE_BOUNDARY.split(text)
     return [s.strip() for s in parts if s.strip()]
 
 
 def _extract_words(text: str) -> list[str]:
     """Extract words from text (alphanumeric sequences)."""
-    return re.findall(r"\b\w+\b", text)
+    return _WORD.findall(text)
 
 
-def _compute_formality(words: list[str], avg_word_length: float) -> float:
+def _compute_formality(lower_words: list[str], avg_word_length: float) -> float:
     """
-    Compute a formality score (0-1 scale).
+    Compute a formality score (0-1 scale) from lowercased words.
 
     Higher = more formal. Based on:
     - Average word length (longer = more formal)
     - Contraction frequency (fewer = more formal)
     - First person pronoun frequency (fewer = more formal)
     """
-    word_count = len(words)
+    word_count = len(lower_words)
     if word_count == 0:
         return 0.5
 
-    lower_words = [w.lower() for w in words]
-
     # Contraction detection
-    contractions = {
-        "don't",
-        "won't",
-        "can't",
-        "isn't",
-        "aren't",
-        "wasn't",
-        "weren't",
-        "hasn't",
-        "haven't",
-        "hadn't",
-        "doesn't",
-        "didn't",
-        "wouldn't",
-        "couldn't",
-        "shouldn't",
-        "mustn't",
-        "i'm",
-        "you're",
-        "he's",
-        "she's",
-        "it's",
-        "we're",
-        "they're",
-        "i've",
-        "you've",
-        "we've",
-        "they've",
-        "i'd",
-        "you'd",
-        "he'd",
-        "she'd",
-        "we'd",
-        "they'd",
-        "i'll",
-        "you'll",
-        "he'll",
-        "she'll",
-        "we'll",
-        "they'll",
-        "that's",
-        "there's",
-        "here's",
-        "what's",
-        "who's",
-        "gonna",
-        "wanna",
-        "gotta",
-        "kinda",
-        "sorta",
-    }
-
-    contraction_count = sum(1 for w in lower_words if w in contractions)
+    contraction_count = sum(1 for w in lower_words if w in _CONTRACTIONS)
     contraction_ratio = contraction_count / word_count
 
     # First person pronouns
-    first_person = {"i", "me", "my", "mine", "myself", "we", "us", "our", "ours"}
-    first_person_count = sum(1 for w in lower_words if w in first_person)
+    first_person_count = sum(1 for w in lower_words if w in _FIRST_PERSON)
     first_person_ratio = first_person_count / word_count
 
     # Formality components (each 0-1, weighted)
@@ -21,7 +21,7 @@ import time
 from pathlib import Path
 from typing import Optional
 
-from overblick.core.agentic.models import AgentGoal
+from overblick.core.agentic.models import AgentGoal, PlannedAction
 from overblick.core.agentic.plugin_base import AgenticPluginBase
 from overblick.core.agentic.protocols import ActionHandler, Observer, PlanningPromptConfig
 from overblick.core.plugin_base import PluginContext
@@ -76,6 +76,18 @@ _DEFAULT_GOALS = [
     ),
 ]
 
+# Actions that run opencode or git in the one workspace checkout; they
+# never run concurrently with each other (analysis reads the checkout too)
+_WORKSPACE_ACTIONS = frozenset(
+    {
+        ActionType.ANALYZE_BUG.value,
+        ActionType.FIX_BUG.value,
+        ActionType.RUN_TESTS.value,
+        ActionType.CREATE_PR.value,
+        ActionType.CLEAN_WORKSPACE.value,
+    }
+)
+
 
 class DevAgentPlugin(AgenticPluginBase):
     """
@@ -120,6 +132,8 @@ class DevAgentPlugin(AgenticPluginBase):
         self._dry_run = da_config.get("dry_run", True)
         da_config.get("max_fix_attempts", 3)
         max_actions_per_tick = da_config.get("max_actions_per_tick", 3)
+        max_concurrent_actions = da_config.get("max_concurrent_actions", 2)
+        plan_staleness_minutes = da_config.get("plan_staleness_minutes", 60)
         tick_interval_minutes = da_config.get("tick_interval_minutes", 30)
         self._check_interval = tick_interval_minutes * 60
 
@@ -215,6 +229,8 @@ class DevAgentPlugin(AgenticPluginBase):
         await self.setup_agentic_loop(
             max_actions_per_tick=max_actions_per_tick,
             audit_action_prefix="dev_agent",
+            max_concurrent_actions=max_concurrent_actions,
+            plan_staleness_seconds=plan_staleness_minutes * 60,
         )
 
         # Register IPC handlers
@@ -282,6 +298,12 @@ class DevAgentPlugin(AgenticPluginBase):
         """Return set of valid dev agent action type strings."""
         return {a.value for a in ActionType}
 
+    def get_action_group(self, action: PlannedAction) -> str | None:
+        """Serialize every action that uses the single workspace checkout."""
+        if action.action_type in _WORKSPACE_ACTIONS:
+            return "workspace"
+        return None
+
     # ── Plugin-specific methods ──────────────────────────────────────────
 
     def _register_ipc_handlers(self) -> None:
@@ -326,6 +348,7 @@ class DevAgentPlugin(AgenticPluginBase):
 
     async def teardown(self) -> None:
         """Cleanup database."""
+        await self.wait_for_agentic_loop()
         if self._db:
             await self._db.close()
         logger.info("DevAgentPlugin teardown complete")
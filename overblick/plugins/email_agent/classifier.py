@@ -132,16 +132,13 @@ class EmailClassifier:
         text = f"{subject} {body[:2000]}"
         return any(p.search(text) for p in _PHISHING_PATTERNS)
 
-    async def classify(
-        self,
-        sender: str,
-        subject: str,
-        body: str,
-        sender_reputation: str = "",
-        email_signals: str = "",
-    ) -> EmailClassification | None:
-        """Run classification with pre-LLM safety checks, then LLM decision."""
-        # Pre-LLM safety: blocked domains
+    def prefilter(self, sender: str, subject: str, body: str) -> EmailClassification | None:
+        """
+        Pre-LLM safety checks (blocked domains, phishing patterns).
+
+        Returns an IGNORE classification if one triggers, else None. Cheap
+        enough to run over a whole batch before any LLM call.
+        """
         if self.is_blocked_domain(sender):
             logger.info(
                 "EmailAgent: sender %s blocked (domain blocklist), auto-ignore",
@@ -154,7 +151,6 @@ class EmailClassifier:
                 priority="low",
             )
 
-        # Pre-LLM safety: phishing detection
         if self.detect_phishing(subject, body):
             logger.warning(
                 "EmailAgent: phishing pattern detected in email from %s: %s",
@@ -167,6 +163,21 @@ class EmailClassifier:
                 reasoning="Phishing/social engineering pattern detected",
                 priority="low",
             )
+        return None
+
+    async def classify(
+        self,
+        sender: str,
+        subject: str,
+        body: str,
+        sender_reputation: str = "",
+        email_signals: str = "",
+    ) -> EmailClassification | None:
+        """Run classification with pre-LLM safety checks, then LLM decision."""
+        prefiltered = self.prefilter(sender, subject, body)
+        if prefiltered:
+            return prefiltered
+
         goals_text = (
             "\n".join(f"- {g.description} (priority: {g.priority})" for g in self._state.goals)
             or "No active goals"
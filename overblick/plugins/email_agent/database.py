@@ -171,6 +171,19 @@ class EmailAgentDB:
         )
         return (count or 0) > 0
 
+    async def filter_processed(self, gmail_message_ids: list[str]) -> set[str]:
+        """Subset of the given message IDs that were already processed (one query)."""
+        ids = list(dict.fromkeys(mid for mid in gmail_message_ids if mid))
+        if not ids:
+            return set()
+        placeholders = ", ".join("?" for _ in ids)
+        rows = await self._db.fetch_all(
+            f"SELECT gmail_message_id FROM email_records "
+            f"WHERE gmail_message_id IN ({placeholders})",
+            tuple(ids),
+        )
+        return {row["gmail_message_id"] for row in rows}
+
     async def record_email(self, record: EmailRecord) -> int:
         """Record a processed email classification."""
         row_id = await self._db.execute_returning_id(
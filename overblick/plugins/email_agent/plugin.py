@@ -15,6 +15,9 @@ Tick cycle:
    - ASK_BOSS: Send IPC to supervisor, await guidance
 4. Record classification + outcome in database
 5. If boss provides feedback, update learnings
+
+Between ticks, GmailCapability's IMAP IDLE push (``imap_push``, on by
+default) runs the same cycle as soon as new mail arrives.
 """
 
 import asyncio
@@ -23,6 +26,8 @@ import json
 import logging
 import math
 import time
+from collections.abc import Coroutine
+from dataclasses import dataclass
 from datetime import UTC, datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
@@ -73,6 +78,21 @@ _DEFAULT_GOALS = [
 ]
 
 
+@dataclass
+class _TriagedEmail:
+    """An email between pipeline stages, with what earlier stages found."""
+
+    email: dict[str, Any]
+    sender: str
+    domain: str
+    sender_rep: dict[str, Any]
+    domain_rep: dict[str, Any]
+    safe_sender: str
+    safe_subject: str
+    safe_body: str
+    classification: EmailClassification | None = None
+
+
 class EmailAgentPlugin(PluginBase):
     """
     Agentic email plugin — prompt-driven email classification and action.
@@ -126,6 +146,14 @@ class EmailAgentPlugin(PluginBase):
         self._classifier: EmailClassifier | None = None
         self._reputation: ReputationManager | None = None
         self._reply_gen: ReplyGenerator | None = None
+        # IMAP IDLE push (GmailCapability.on_new_mail)
+        self._imap_push: bool = True
+        self._push_registered = False
+        self._push_task: asyncio.Task | None = None
+        self._push_again = False
+        self._inbox_lock = asyncio.Lock()
+        # Emails classified concurrently per batch (LLM calls in flight)
+        self._classify_concurrency: int = 4
 
     async def setup(self) -> None:
         """Initialize the email agent: database, state, goals, prompt."""
@@ -217,6 +245,12 @@ class EmailAgentPlugin(PluginBase):
             if self._dry_run:
                 logger.info("EmailAgentPlugin running in DRY RUN mode — no emails will be sent")
 
+            # Push: handle new mail on IMAP IDLE notification, not just per tick
+            self._imap_push = ea_config.get("imap_push", True)
+
+            # Pipeline: how many emails are classified at once
+            self._classify_concurrency = max(1, int(ea_config.get("classify_concurrency", 4)))
+
             # Draft replies: send a second Telegram message with Stål's suggested reply
             self._show_draft_replies = ea_config.get("show_draft_replies", False)
             if self._show_draft_replies:
@@ -310,6 +344,15 @@ class EmailAgentPlugin(PluginBase):
         if self._state.last_check and (now - self._state.last_check < self._check_interval):
             return
 
+        await self._check_inbox()
+
+    async def _check_inbox(self, trigger: str = "tick") -> None:
+        """
+        Fetch and process unread emails, then check Telegram feedback.
+
+        Shared by the scheduled tick and IMAP push; the lock keeps a push
+        that lands mid-tick from processing the same inbox concurrently.
+        """
         if self.ctx.quiet_hours_checker and self.ctx.quiet_hours_checker.is_quiet_hours():
             return
 
@@ -317,18 +360,45 @@ class EmailAgentPlugin(PluginBase):
             logger.debug("EmailAgent: no LLM pipeline available")
             return
 
-        self._state.last_check = now
-        logger.info("EmailAgent: tick started")
+        async with self._inbox_lock:
+            self._state.last_check = time.time()
+            logger.info("EmailAgent: %s started", trigger)
+            self._register_push()
 
-        try:
-            emails = await self._fetch_unread()
-            logger.info("EmailAgent: tick fetched %d unread email(s)", len(emails))
-            for email in emails:
-                await self._process_email(email)
-            await self._check_tg_feedback()
-        except Exception as e:
-            logger.error("EmailAgent tick failed: %s", e, exc_info=True)
-            self._state.current_health = "degraded"
+            try:
+                emails = await self._fetch_unread()
+                logger.info("EmailAgent: %s fetched %d unread email(s)", trigger, len(emails))
+                await self._process_emails(emails)
+                await self._check_tg_feedback()
+            except Exception as e:
+                logger.error("EmailAgent %s failed: %s", trigger, e, exc_info=True)
+                self._state.current_health = "degraded"
+
+    def _register_push(self) -> None:
+        """Ask GmailCapability for IMAP IDLE push (once, if enabled)."""
+        if self._push_registered or not self._imap_push:
+            return
+        gmail_cap = self.ctx.get_capability("gmail")
+        if not gmail_cap or not hasattr(gmail_cap, "on_new_mail"):
+            return
+        self._push_registered = True
+        if gmail_cap.on_new_mail(self._on_new_mail):
+            logger.info("EmailAgent: IMAP push enabled — new mail is handled on arrival")
+
+    def _on_new_mail(self) -> None:
+        """IMAP push callback: run an inbox check now instead of at the next tick."""
+        if self._push_task and not self._push_task.done():
+            # A check is pending or running — make it go round once more
+            self._push_again = True
+            return
+        self._push_task = asyncio.create_task(self._run_push_checks())
+
+    async def _run_push_checks(self) -> None:
+        while True:
+            self._push_again = False
+            await self._check_inbox(trigger="push")
+            if not self._push_again:
+                return
 
     async def _fetch_unread(self) -> list[dict[str, Any]]:
         """
@@ -348,7 +418,10 @@ class EmailAgentPlugin(PluginBase):
         if self._max_email_age_hours is not None:
             since_days = max(1, math.ceil(self._max_email_age_hours / 24))
 
-        messages = await gmail_cap.fetch_unread(max_results=10, since_days=since_days)
+        # Already-processed mail is dropped after a header-only pass, so its
+        # bodies are never downloaded again
+        skip = self._db.filter_processed if self._db else None
+        messages = await gmail_cap.fetch_unread(max_results=10, since_days=since_days, skip=skip)
 
         results = []
         for msg in messages:
@@ -414,6 +487,103 @@ class EmailAgentPlugin(PluginBase):
         """
         pass
 
+    async def _process_emails(self, emails: list[dict[str, Any]]) -> None:
+        """
+        Process a batch of emails as a staged pipeline.
+
+        A backlog used to go through _process_email one email at a time,
+        mostly waiting on the LLM and IPC. The stages are now:
+
+        1. Prefilters, in order and without the LLM: dedup (one query),
+           learned auto-ignore, blocked domains and phishing patterns
+        2. LLM classification, ``classify_concurrency`` emails at a time
+        3. Identity consultations and confidence checks, all at once
+        4. Actions, concurrently across senders but in fetch order within
+           each sender domain — so per-sender ordering, domain stats and
+           the per-domain reply rate limit behave as in a serial run
+
+        An email that fails in one stage is logged and dropped; the rest
+        of the batch carries on.
+        """
+        if not emails:
+            return
+
+        processed: set[str] = set()
+        if self._db:
+            processed = await self._db.filter_processed([e.get("message_id", "") for e in emails])
+
+        # 1. Prefilters
+        pending: list[_TriagedEmail] = []
+        for msg in emails:
+            try:
+                triaged = await self._prefilter(msg, processed)
+            except Exception as e:
+                logger.error(
+                    "EmailAgent: prefilter failed for %s: %s",
+                    msg.get("sender", ""),
+                    e,
+                    exc_info=True,
+                )
+                continue
+            if triaged:
+                pending.append(triaged)
+            # The same message twice in one batch is handled once
+            if msg.get("message_id"):
+                processed.add(msg["message_id"])
+
+        # 2. Classification (bounded)
+        await self._gather_bounded(
+            [self._classify_triaged(t) for t in pending if t.classification is None],
+            "classification",
+        )
+        pending = [t for t in pending if t.classification is not None]
+
+        # 3. Consultations (fanned out)
+        await self._gather_bounded([self._review(t) for t in pending], "consultation", limit=0)
+
+        # 4. Actions, one lane per sender domain
+        lanes: dict[str, list[_TriagedEmail]] = {}
+        for triaged in pending:
+            lanes.setdefault(triaged.domain or triaged.sender, []).append(triaged)
+        await self._gather_bounded([self._apply_lane(lane) for lane in lanes.values()], "action")
+
+    async def _gather_bounded(
+        self,
+        coros: list[Coroutine[Any, Any, Any]],
+        stage: str,
+        limit: int | None = None,
+    ) -> None:
+        """Run coroutines with at most ``limit`` in flight (0 = unbounded), logging failures."""
+        if not coros:
+            return
+        limit = self._classify_concurrency if limit is None else limit
+        semaphore = asyncio.Semaphore(limit) if limit else None
+
+        async def run(coro: Coroutine[Any, Any, Any]) -> Any:
+            if semaphore is None:
+                return await coro
+            async with semaphore:
+                return await coro
+
+        results = await asyncio.gather(*(run(c) for c in coros), return_exceptions=True)
+        for result in results:
+            if isinstance(result, BaseException):
+                logger.error(
+                    "EmailAgent: %s stage failed: %s",
+                    stage,
+                    result,
+                    exc_info=result,
+                )
+
+    async def _apply_lane(self, lane: list[_TriagedEmail]) -> None:
+        for triaged in lane:
+            try:
+                await self._apply(triaged)
+            except Exception as e:
+                logger.error(
+                    "EmailAgent: action failed for %s: %s", triaged.sender, e, exc_info=True
+                )
+
     async def _process_email(self, email: dict[str, Any]) -> None:
         """
         Process a single email through the classification pipeline.
@@ -427,18 +597,51 @@ class EmailAgentPlugin(PluginBase):
         6. Confidence check → ASK_BOSS if low
         7. Execute action
         8. Update sender + domain reputation
+
+        Batches go through _process_emails, which runs the same steps as
+        concurrent stages.
+        """
+        triaged = await self._prefilter(email)
+        if not triaged:
+            return
+        if triaged.classification is None:
+            await self._classify_triaged(triaged)
+            if triaged.classification is None:
+                return
+        await self._review(triaged)
+        await self._apply(triaged)
+
+    async def _prefilter(
+        self,
+        email: dict[str, Any],
+        processed: set[str] | None = None,
+    ) -> _TriagedEmail | None:
+        """
+        Steps 1-3 plus the classifier's pre-LLM safety checks.
+
+        Returns None if the email needs no further work (duplicate or
+        auto-ignored, already recorded). A returned email whose
+        classification is already set skips the LLM.
+
+        Args:
+            email: Email dict from _fetch_unread
+            processed: Known-processed message IDs; None checks the DB
         """
         sender = email.get("sender", "")
         subject = email.get("subject", "")
         body = email.get("body", "")
         snippet = email.get("snippet", body[:200])
         message_id = email.get("message_id", "")
-        headers = email.get("headers", {})
 
         # 1. Deduplication
-        if message_id and self._db and await self._db.has_been_processed(message_id):
-            logger.debug("EmailAgent: skipping already-processed email %s", message_id)
-            return
+        if message_id:
+            if processed is not None:
+                duplicate = message_id in processed
+            else:
+                duplicate = bool(self._db and await self._db.has_been_processed(message_id))
+            if duplicate:
+                logger.debug("EmailAgent: skipping already-processed email %s", message_id)
+                return None
 
         # 2. Get sender + domain reputation
         sender_rep = await self._reputation.get_sender_reputation(sender)
@@ -479,26 +682,46 @@ class EmailAgentPlugin(PluginBase):
             await self._reputation.update_sender_profile(sender, classification)
             if self._db and domain:
                 await self._db.update_domain_stats(domain, "ignore")
-            return
+            return None
 
-        # 4. Wrap external content and classify via LLM with context
-        safe_sender = wrap_external_content(sender, "email_sender")
-        safe_subject = wrap_external_content(subject, "email_subject")
-        safe_body = wrap_external_content(body[:3000], "email_body")
+        # 4a. Wrap external content; blocklist + phishing need no LLM
+        triaged = _TriagedEmail(
+            email=email,
+            sender=sender,
+            domain=domain,
+            sender_rep=sender_rep,
+            domain_rep=domain_rep,
+            safe_sender=wrap_external_content(sender, "email_sender"),
+            safe_subject=wrap_external_content(subject, "email_subject"),
+            safe_body=wrap_external_content(body[:3000], "email_body"),
+        )
+        triaged.classification = self._classifier.prefilter(
+            triaged.safe_sender, triaged.safe_subject, triaged.safe_body
+        )
+        return triaged
 
-        reputation_context = self._classifier.build_reputation_context(sender_rep, domain_rep)
-        email_signals = self._classifier.build_email_signals(headers)
+    async def _classify_triaged(self, triaged: _TriagedEmail) -> None:
+        """Step 4: classify via LLM with reputation context + header signals."""
+        reputation_context = self._classifier.build_reputation_context(
+            triaged.sender_rep, triaged.domain_rep
+        )
+        email_signals = self._classifier.build_email_signals(triaged.email.get("headers", {}))
 
-        classification = await self._classifier.classify(
-            safe_sender,
-            safe_subject,
-            safe_body,
+        triaged.classification = await self._classifier.classify(
+            triaged.safe_sender,
+            triaged.safe_subject,
+            triaged.safe_body,
             sender_reputation=reputation_context,
             email_signals=email_signals,
         )
-        if not classification:
-            logger.warning("EmailAgent: classification failed for email from %s", sender)
-            return
+        if not triaged.classification:
+            logger.warning("EmailAgent: classification failed for email from %s", triaged.sender)
+
+    async def _review(self, triaged: _TriagedEmail) -> None:
+        """Steps 5-6: identity consultation and confidence escalation."""
+        classification = triaged.classification
+        assert classification is not None
+        sender = triaged.sender
 
         # 5. Cross-identity consultation for moderate-confidence NOTIFY
         if (
@@ -507,7 +730,7 @@ class EmailAgentPlugin(PluginBase):
             <= classification.confidence
             <= self._consultation_confidence_high
         ):
-            advice = await self._consult_identity_relevance(email, classification)
+            advice = await self._consult_identity_relevance(triaged.email, classification)
             if advice and advice.strip().upper().startswith("NO"):
                 logger.info(
                     "EmailAgent: identity consultation downgraded NOTIFY → IGNORE for %s",
@@ -525,15 +748,24 @@ class EmailAgentPlugin(PluginBase):
                 sender,
             )
 
+    async def _apply(self, triaged: _TriagedEmail) -> None:
+        """Steps 7-8: record, execute the action, update reputation."""
+        email = triaged.email
+        classification = triaged.classification
+        assert classification is not None
+        sender = triaged.sender
+        domain = triaged.domain
+        body = email.get("body", "")
+
         # Record in database FIRST to get record_id for notification tracking
         email_record_id = None
         if self._db:
             email_record_id = await self._db.record_email(
                 EmailRecord(
-                    gmail_message_id=message_id,
+                    gmail_message_id=email.get("message_id", ""),
                     email_from=sender,
-                    email_subject=subject,
-                    email_snippet=snippet,
+                    email_subject=email.get("subject", ""),
+                    email_snippet=email.get("snippet", body[:200]),
                     classified_intent=classification.intent.value,
                     confidence=classification.confidence,
                     reasoning=classification.reasoning,
@@ -552,7 +784,7 @@ class EmailAgentPlugin(PluginBase):
             await self._db.update_action_taken(email_record_id, action_taken)
 
         self._state.emails_processed += 1
-        await self._mark_email_read(message_id)
+        await self._mark_email_read(email.get("message_id", ""))
 
         # 8. Update sender profile + domain reputation
         await self._reputation.update_sender_profile(sender, classification)
@@ -1213,7 +1445,17 @@ class EmailAgentPlugin(PluginBase):
         }
 
     async def teardown(self) -> None:
-        """Cleanup database connection."""
+        """Stop IMAP push and close the database connection."""
+        if self._push_registered:
+            gmail_cap = self.ctx.get_capability("gmail")
+            if gmail_cap:
+                gmail_cap.on_new_mail(None)
+        if self._push_task and not self._push_task.done():
+            self._push_task.cancel()
+            try:
+                await self._push_task
+            except asyncio.CancelledError:
+                pass
         if self._db:
             await self._db.close()
         logger.info("EmailAgentPlugin teardown complete")
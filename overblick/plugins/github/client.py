@@ -3,12 +3,24 @@ Async GitHub REST API client.
 
 Wraps aiohttp for authenticated access to the GitHub API.
 Handles rate limiting, retries, and Bearer token auth.
+
+GET responses are cached with their ETag / Last-Modified validators and
+revalidated with If-None-Match / If-Modified-Since. An unchanged
+resource comes back as 304 Not Modified — served from the cache and,
+on GitHub, not counted against the hourly rate limit. The observer
+re-reads the same issue/PR/check-run/status endpoints every tick, so most
+of those calls become free. An optional ResponseStore (GitHubDB) keeps
+the cache across restarts.
 """
 
 import asyncio
 import base64
+import json as jsonlib
 import logging
-from typing import Any, Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Optional, Protocol
+from urllib.parse import urlencode
 
 import aiohttp
 from overblick.core.exceptions import PluginError
@@ -30,6 +42,21 @@ class RateLimitError(GitHubAPIError):
         self.reset_at = reset_at
 
 
+class ResponseStore(Protocol):
+    """Persistent backing for the conditional-request cache (GitHubDB)."""
+
+    async def get_http_cache(self, key: str) -> dict | None: ...
+
+    async def put_http_cache(self, key: str, etag: str, last_modified: str, body: str) -> None: ...
+
+
+@dataclass
+class _CachedResponse:
+    etag: str
+    last_modified: str
+    body: str  # Raw JSON text — decoded per call so callers can't share objects
+
+
 class GitHubAPIClient:
     """
     Async client for the GitHub REST API.
@@ -40,17 +67,99 @@ class GitHubAPIClient:
 
     BASE_URL = "https://api.github.com"
 
-    def __init__(self, token: str = "", base_url: str = ""):
+    def __init__(
+        self,
+        token: str = "",
+        base_url: str = "",
+        cache_store: ResponseStore | None = None,
+        cache_size: int = 256,
+    ):
+        """
+        Args:
+            token: GitHub PAT (empty for anonymous, read-only access)
+            base_url: API root (GitHub Enterprise); defaults to api.github.com
+            cache_store: Persists cached GET responses across restarts
+            cache_size: Responses kept in memory (the store holds the rest)
+        """
         self._token = token
         self._base_url = (base_url or self.BASE_URL).rstrip("/")
         self._session: aiohttp.ClientSession | None = None
         self._rate_limit_remaining: int = 5000
         self._rate_limit_reset: int = 0
+        self._cache: OrderedDict[str, _CachedResponse] = OrderedDict()
+        self._cache_store = cache_store
+        self._cache_size = max(0, cache_size)
+        self._requests = 0
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     @property
     def rate_limit_remaining(self) -> int:
         return self._rate_limit_remaining
 
+    def cache_stats(self) -> dict[str, Any]:
+        """Conditional-request cache and rate-budget figures for monitoring."""
+        revalidated = self._cache_hits + self._cache_misses
+        return {
+            "requests": self._requests,
+            "cache_hits": self._cache_hits,
+            "cache_misses": self._cache_misses,
+            "hit_rate": round(self._cache_hits / revalidated, 3) if revalidated else 0.0,
+            "cached_entries": len(self._cache),
+            # 304s don't count against the limit: this many calls were free
+            "rate_limit_saved": self._cache_hits,
+            "rate_limit_remaining": self._rate_limit_remaining,
+            "rate_limit_reset": self._rate_limit_reset,
+        }
+
+    @staticmethod
+    def _cache_key(method: str, url: str, params: dict | None) -> str:
+        query = urlencode(sorted((k, str(v)) for k, v in params.items())) if params else ""
+        return f"{method} {url}?{query}" if query else f"{method} {url}"
+
+    async def _cache_get(self, key: str) -> _CachedResponse | None:
+        entry = self._cache.get(key)
+        if entry is not None:
+            self._cache.move_to_end(key)
+            return entry
+        if self._cache_store is None:
+            return None
+        try:
+            row = await self._cache_store.get_http_cache(key)
+        except Exception as e:
+            logger.debug("GitHub response cache read failed: %s", e)
+            return None
+        if not row:
+            return None
+        entry = _CachedResponse(
+            etag=row.get("etag") or "",
+            last_modified=row.get("last_modified") or "",
+            body=row.get("body") or "",
+        )
+        self._cache_remember(key, entry)
+        return entry
+
+    def _cache_remember(self, key: str, entry: _CachedResponse) -> None:
+        if not self._cache_size:
+            return
+        self._cache[key] = entry
+        self._cache.move_to_end(key)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    async def _cache_put(self, key: str, headers: Any, body: str) -> None:
+        """Cache a 200 response if it carries a validator."""
+        etag = headers.get("ETag", "") or ""
+        last_modified = headers.get("Last-Modified", "") or ""
+        if not etag and not last_modified:
+            return
+        self._cache_remember(key, _CachedResponse(etag, last_modified, body))
+        if self._cache_store is not None:
+            try:
+                await self._cache_store.put_http_cache(key, etag, last_modified, body)
+            except Exception as e:
+                logger.debug("GitHub response cache write failed: %s", e)
+
     async def _ensure_session(self) -> None:
         """Create HTTP session if needed."""
         if self._session is None or self._session.closed:
@@ -86,10 +195,24 @@ class GitHubAPIClient:
         json: dict | None = None,
         retry_count: int = 3,
     ) -> Any:
-        """Make an authenticated API request with retry logic."""
+        """
+        Make an authenticated API request with retry logic.
+
+        GETs are revalidated against the response cache; a 304 returns
+        the cached body.
+        """
         await self._ensure_session()
         url = f"{self._base_url}{endpoint}"
 
+        cache_key = self._cache_key(method, url, params) if method == "GET" else ""
+        cached = await self._cache_get(cache_key) if cache_key else None
+        conditional: dict[str, str] = {}
+        if cached is not None:
+            if cached.etag:
+                conditional["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                conditional["If-Modified-Since"] = cached.last_modified
+
         for attempt in range(retry_count):
             try:
                 async with self._session.request(
@@ -97,12 +220,23 @@ class GitHubAPIClient:
                     url,
                     params=params,
                     json=json,
+                    headers=conditional or None,
                     timeout=aiohttp.ClientTimeout(total=30),
                 ) as response:
+                    self._requests += 1
                     self._update_rate_limit(response.headers)
 
+                    if response.status == 304 and cached is not None:
+                        self._cache_hits += 1
+                        return jsonlib.loads(cached.body)
+
                     if response.status == 200 or response.status == 201:
-                        return await response.json()
+                        if not cache_key:
+                            return await response.json()
+                        self._cache_misses += 1
+                        body = await response.text()
+                        await self._cache_put(cache_key, response.headers, body)
+                        return jsonlib.loads(body)
 
                     raw_body = await response.text()
 
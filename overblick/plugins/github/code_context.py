@@ -109,25 +109,27 @@ class CodeContextBuilder:
             logger.debug("GitHub: tree unchanged for %s (sha=%s)", repo, root_sha[:8])
             return False
 
-        # Clear old entries and rebuild
-        await self._db.clear_tree(repo)
-
+        # Write only what changed since the cached tree (batched, not per file)
         tree_items = tree_data.get("tree", [])
-        for item in tree_items:
-            if item.get("type") != "blob":
-                continue
-            path = item.get("path", "")
-            if not self._should_include(path):
-                continue
-            entry = FileTreeEntry(
-                path=path,
+        entries = [
+            FileTreeEntry(
+                path=item.get("path", ""),
                 sha=item.get("sha", ""),
                 size=item.get("size", 0),
             )
-            await self._db.upsert_tree_entry(repo, entry)
+            for item in tree_items
+            if item.get("type") == "blob" and self._should_include(item.get("path", ""))
+        ]
+        upserted, deleted = await self._db.sync_tree(repo, entries)
 
         await self._db.update_tree_meta(repo, root_sha)
-        logger.info("GitHub: refreshed tree for %s (%d files)", repo, len(tree_items))
+        logger.info(
+            "GitHub: refreshed tree for %s (%d files, %d changed, %d removed)",
+            repo,
+            len(entries),
+            upserted,
+            deleted,
+        )
         return True
 
     def _should_include(self, path: str) -> bool:
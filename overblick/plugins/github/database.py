@@ -3,7 +3,7 @@ Database layer for the GitHub agent plugin.
 
 Wraps DatabaseBackend with GitHub-specific tables for event
 deduplication, comment tracking, file tree/content caching,
-and PR tracking. Uses the framework's migration system for
+PR tracking and the API client's conditional-request cache. Uses the framework's migration system for
 schema management.
 
 Agentic tables (goals, actions, learnings, tick logs) are provided
@@ -24,7 +24,7 @@ from overblick.plugins.github.models import (
 
 logger = logging.getLogger(__name__)
 
-# GitHub-specific migrations (v1-v5 + v10-v11)
+# GitHub-specific migrations (v1-v5 + v10-v12)
 GITHUB_MIGRATIONS = [
     Migration(
         version=1,
@@ -143,6 +143,20 @@ GITHUB_MIGRATIONS = [
         """,
         down_sql="DROP TABLE IF EXISTS repo_summaries;",
     ),
+    Migration(
+        version=12,
+        name="http_cache",
+        up_sql="""
+            CREATE TABLE IF NOT EXISTS http_cache (
+                cache_key TEXT PRIMARY KEY,
+                etag TEXT DEFAULT '',
+                last_modified TEXT DEFAULT '',
+                body TEXT NOT NULL,
+                updated_at TEXT DEFAULT (datetime('now'))
+            );
+        """,
+        down_sql="DROP TABLE IF EXISTS http_cache;",
+    ),
 ]
 
 # Combined migrations: GitHub-specific + agentic core
@@ -287,14 +301,49 @@ class GitHubDB:
                 (repo, root_sha),
             )
 
-    async def upsert_tree_entry(self, repo: str, entry: FileTreeEntry) -> None:
-        """Insert or update a file tree entry."""
-        await self._db.execute(
-            "INSERT INTO file_tree_cache (repo, path, sha, size, last_refreshed) "
-            "VALUES (?, ?, ?, ?, datetime('now')) "
-            "ON CONFLICT(repo, path) DO UPDATE SET sha = ?, size = ?, last_refreshed = datetime('now')",
-            (repo, entry.path, entry.sha, entry.size, entry.sha, entry.size),
+    async def get_tree_shas(self, repo: str) -> dict[str, str]:
+        """Get ``{path: sha}`` for every cached tree entry of a repo."""
+        rows = await self._db.fetch_all(
+            "SELECT path, sha FROM file_tree_cache WHERE repo = ?",
+            (repo,),
         )
+        return {r["path"]: r["sha"] for r in rows}
+
+    async def sync_tree(self, repo: str, entries: list[FileTreeEntry]) -> tuple[int, int]:
+        """
+        Bring the cached tree for a repo in line with ``entries``.
+
+        Only the difference is written: paths no longer present are deleted
+        and new or changed (different sha) entries are upserted, each as one
+        batched statement. Unchanged rows are not touched.
+
+        Returns:
+            (upserted, deleted) row counts
+        """
+        current = await self.get_tree_shas(repo)
+        wanted = {entry.path: entry for entry in entries}
+
+        removed = [(repo, path) for path in current if path not in wanted]
+        changed = [
+            (repo, e.path, e.sha, e.size, e.sha, e.size)
+            for e in wanted.values()
+            if current.get(e.path) != e.sha
+        ]
+
+        if removed:
+            await self._db.execute_many(
+                "DELETE FROM file_tree_cache WHERE repo = ? AND path = ?",
+                removed,
+            )
+        if changed:
+            await self._db.execute_many(
+                "INSERT INTO file_tree_cache (repo, path, sha, size, last_refreshed) "
+                "VALUES (?, ?, ?, ?, datetime('now')) "
+                "ON CONFLICT(repo, path) DO UPDATE SET sha = ?, size = ?, "
+                "last_refreshed = datetime('now')",
+                changed,
+            )
+        return len(changed), len(removed)
 
     async def get_tree_paths(self, repo: str) -> list[str]:
         """Get all cached file paths for a repo."""
@@ -304,13 +353,6 @@ class GitHubDB:
         )
         return [r["path"] for r in rows]
 
-    async def clear_tree(self, repo: str) -> None:
-        """Clear all cached tree entries for a repo."""
-        await self._db.execute(
-            "DELETE FROM file_tree_cache WHERE repo = ?",
-            (repo,),
-        )
-
     # ── File content cache ────────────────────────────────────────────────
 
     async def get_cached_file(self, repo: str, sha: str) -> CachedFile | None:
@@ -403,6 +445,46 @@ class GitHubDB:
             ),
         )
 
+    async def upsert_pr_tracking_many(self, repo: str, prs: list[dict[str, Any]]) -> int:
+        """
+        Insert or update tracking records for several PRs in one batch.
+
+        Each dict carries ``pr_number`` plus the keyword fields accepted by
+        :meth:`upsert_pr_tracking`.
+        """
+        params = []
+        for pr in prs:
+            ci_status = pr.get("ci_status", "unknown")
+            merged = 1 if pr.get("merged", False) else 0
+            auto_merged = 1 if pr.get("auto_merged", False) else 0
+            params.append(
+                (
+                    repo,
+                    pr["pr_number"],
+                    pr.get("title", ""),
+                    pr.get("author", ""),
+                    1 if pr.get("is_dependabot", False) else 0,
+                    pr.get("version_bump", ""),
+                    ci_status,
+                    merged,
+                    auto_merged,
+                    ci_status,
+                    merged,
+                    auto_merged,
+                )
+            )
+        if not params:
+            return 0
+        return await self._db.execute_many(
+            "INSERT INTO pr_tracking "
+            "(repo, pr_number, title, author, is_dependabot, version_bump, "
+            "ci_status, merged, auto_merged) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT(repo, pr_number) DO UPDATE SET "
+            "ci_status = ?, merged = ?, auto_merged = ?, last_checked = datetime('now')",
+            params,
+        )
+
     async def was_pr_auto_merged(self, repo: str, pr_number: int) -> bool:
         """Check if a PR was already auto-merged by us."""
         count = await self._db.fetch_scalar(
@@ -438,6 +520,34 @@ class GitHubDB:
             (repo, summary, file_count, primary_language, summary, file_count, primary_language),
         )
 
+    # ── HTTP response cache (ETag / Last-Modified) ────────────────────────
+
+    async def get_http_cache(self, key: str) -> dict | None:
+        """Get a cached API response with its validators."""
+        row = await self._db.fetch_one(
+            "SELECT etag, last_modified, body FROM http_cache WHERE cache_key = ?",
+            (key,),
+        )
+        return dict(row) if row else None
+
+    async def put_http_cache(self, key: str, etag: str, last_modified: str, body: str) -> None:
+        """Insert or replace a cached API response."""
+        await self._db.execute(
+            "INSERT INTO http_cache (cache_key, etag, last_modified, body) "
+            "VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(cache_key) DO UPDATE SET "
+            "etag = ?, last_modified = ?, body = ?, updated_at = datetime('now')",
+            (key, etag, last_modified, body, etag, last_modified, body),
+        )
+
+    async def prune_http_cache(self, keep: int = 2000) -> int:
+        """Drop all but the ``keep`` most recently stored responses."""
+        return await self._db.execute(
+            "DELETE FROM http_cache WHERE cache_key NOT IN "
+            "(SELECT cache_key FROM http_cache ORDER BY updated_at DESC LIMIT ?)",
+            (keep,),
+        )
+
     # ── Stats ─────────────────────────────────────────────────────────────
 
     async def get_stats(self) -> dict:
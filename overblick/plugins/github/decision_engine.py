@@ -10,6 +10,7 @@ import time
 from datetime import UTC
 from typing import Optional
 
+from overblick.capabilities.engagement.keyword_matcher import KeywordMatcher
 from overblick.plugins.github.models import (
     DecisionResult,
     EventAction,
@@ -47,6 +48,7 @@ class GitHubDecisionEngine:
         self._respond_threshold = respond_threshold
         self._notify_threshold = notify_threshold
         self._interest_keywords = [k.lower() for k in (interest_keywords or [])]
+        self._keyword_matcher = KeywordMatcher(self._interest_keywords)
         self._respond_labels = [l.lower() for l in (respond_labels or ["question", "help wanted"])]
         self._priority_repos = [r.lower() for r in (priority_repos or [])]
         self._max_issue_age_hours = max_issue_age_hours
@@ -93,12 +95,7 @@ class GitHubDecisionEngine:
                 break  # Only count once
 
         # Interest keywords
-        keyword_match = False
-        for keyword in self._interest_keywords:
-            if keyword in text:
-                keyword_match = True
-                break
-        if keyword_match:
+        if self._keyword_matcher.exact(text):
             factors["keyword_match"] = 20
             score += 20
 
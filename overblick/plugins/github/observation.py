@@ -6,6 +6,7 @@ into a RepoObservation that represents the complete world state
 at a point in time.
 """
 
+import asyncio
 import logging
 import re
 from datetime import UTC, datetime, timezone
@@ -23,6 +24,9 @@ from overblick.plugins.github.models import (
 
 logger = logging.getLogger(__name__)
 
+# PRs snapshotted at once (each snapshot makes 2-3 API calls)
+DEFAULT_PR_CONCURRENCY = 4
+
 # Dependabot author names
 _DEPENDABOT_AUTHORS = frozenset({"dependabot[bot]", "dependabot"})
 
@@ -79,12 +83,14 @@ class ObservationCollector:
         bot_username: str = "",
         stale_pr_hours: float = 48.0,
         unanswered_issue_hours: float = 24.0,
+        pr_concurrency: int = DEFAULT_PR_CONCURRENCY,
     ):
         self._client = client
         self._db = db
         self._bot_username = bot_username.lower()
         self.stale_pr_hours = stale_pr_hours
         self.unanswered_issue_hours = unanswered_issue_hours
+        self._pr_concurrency = max(1, pr_concurrency)
 
     async def observe(self, repo: str) -> RepoObservation:
         """
@@ -95,9 +101,11 @@ class ObservationCollector:
         """
         observed_at = datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
 
-        # Fetch PRs and issues in parallel-ish (sequential for now)
-        open_prs = await self._collect_prs(repo)
-        open_issues = await self._collect_issues(repo)
+        # Fetch PRs and issues in parallel
+        open_prs, open_issues = await asyncio.gather(
+            self._collect_prs(repo),
+            self._collect_issues(repo),
+        )
 
         # Categorize
         dependabot_prs = [pr for pr in open_prs if pr.is_dependabot]
@@ -146,28 +154,41 @@ class ObservationCollector:
         return observation
 
     async def _collect_prs(self, repo: str) -> list[PRSnapshot]:
-        """Fetch and snapshot all open PRs."""
-        prs: list[PRSnapshot] = []
+        """
+        Fetch and snapshot all open PRs.
+
+        Up to ``pr_concurrency`` PRs are snapshotted at once; the tracking
+        rows are then written in a single batch. Order follows the API.
+        """
         try:
             raw_prs = await self._client.list_pulls(repo, state="open")
         except GitHubAPIError as e:
             logger.warning("GitHub: failed to list PRs for %s: %s", repo, e)
-            return prs
-
-        for raw in raw_prs:
-            pr = await self._snapshot_pr(repo, raw)
-            prs.append(pr)
-
-            # Track in database
-            await self._db.upsert_pr_tracking(
-                repo,
-                pr.number,
-                title=pr.title,
-                author=pr.author,
-                is_dependabot=pr.is_dependabot,
-                version_bump=pr.version_bump.value,
-                ci_status=pr.ci_status.value,
-            )
+            return []
+
+        semaphore = asyncio.Semaphore(self._pr_concurrency)
+
+        async def snapshot(raw: dict) -> PRSnapshot:
+            async with semaphore:
+                return await self._snapshot_pr(repo, raw)
+
+        prs = list(await asyncio.gather(*(snapshot(raw) for raw in raw_prs)))
+
+        # Track in database
+        await self._db.upsert_pr_tracking_many(
+            repo,
+            [
+                {
+                    "pr_number": pr.number,
+                    "title": pr.title,
+                    "author": pr.author,
+                    "is_dependabot": pr.is_dependabot,
+                    "version_bump": pr.version_bump.value,
+                    "ci_status": pr.ci_status.value,
+                }
+                for pr in prs
+            ],
+        )
 
         return prs
 
@@ -190,14 +211,16 @@ class ObservationCollector:
             # GitHub hasn't computed mergeability yet
             mergeable = False
 
-        # Get CI status
+        # CI status and review state are independent — fetch both at once
         ci_status = CIStatus.UNKNOWN
         ci_details: list[dict[str, str]] = []
         if head_sha:
-            ci_status, ci_details = await self._get_ci_status(repo, head_sha)
-
-        # Get review state
-        review_state = await self._get_review_state(repo, number)
+            (ci_status, ci_details), review_state = await asyncio.gather(
+                self._get_ci_status(repo, head_sha),
+                self._get_review_state(repo, number),
+            )
+        else:
+            review_state = await self._get_review_state(repo, number)
 
         labels = [l.get("name", "") for l in raw.get("labels", [])]
 
@@ -14,6 +14,8 @@ The agent keeps repos healthy by:
 - Learning from outcomes to improve over time
 """
 
+import hashlib
+import json
 import logging
 import time
 from typing import Any, Optional
@@ -124,6 +126,8 @@ class GitHubAgentPlugin(AgenticPluginBase):
         bot_username = gh_config.get("bot_username", "")
         default_branch = gh_config.get("default_branch", "main")
         max_actions_per_tick = gh_config.get("max_actions_per_tick", 5)
+        max_concurrent_actions = gh_config.get("max_concurrent_actions", 3)
+        plan_staleness_minutes = gh_config.get("plan_staleness_minutes", 60)
         tick_interval_minutes = gh_config.get("tick_interval_minutes", 10)
         self._check_interval = tick_interval_minutes * 60
 
@@ -165,8 +169,9 @@ class GitHubAgentPlugin(AgenticPluginBase):
         # Store agentic DB reference for the base class
         self._agentic_db = self._db.agentic
 
-        # API client
-        self._client = GitHubAPIClient(token=token)
+        # API client — GET responses are revalidated with ETags, cached in the DB
+        await self._db.prune_http_cache()
+        self._client = GitHubAPIClient(token=token, cache_store=self._db)
 
         # System prompt
         system_prompt = self.get_system_prompt()
@@ -196,6 +201,7 @@ class GitHubAgentPlugin(AgenticPluginBase):
             client=self._client,
             db=self._db,
             bot_username=bot_username,
+            pr_concurrency=gh_config.get("pr_concurrency", 4),
         )
 
         # Dependabot handler
@@ -236,6 +242,8 @@ class GitHubAgentPlugin(AgenticPluginBase):
         await self.setup_agentic_loop(
             max_actions_per_tick=max_actions_per_tick,
             audit_action_prefix="github_agent",
+            max_concurrent_actions=max_concurrent_actions,
+            plan_staleness_seconds=plan_staleness_minutes * 60,
         )
 
         # Load stats
@@ -376,12 +384,14 @@ class GitHubAgentPlugin(AgenticPluginBase):
             "notifications_sent": self._state.notifications_sent,
             "repos_monitored": self._state.repos_monitored,
             "rate_limit_remaining": self._state.rate_limit_remaining,
+            "api_cache": self._client.cache_stats() if self._client else {},
             "dry_run": self._dry_run,
             "health": self._state.current_health,
         }
 
     async def teardown(self) -> None:
         """Cleanup database and HTTP session."""
+        await self.wait_for_agentic_loop()
         if self._client:
             await self._client.close()
         if self._db:
@@ -389,6 +399,17 @@ class GitHubAgentPlugin(AgenticPluginBase):
         logger.info("GitHubAgentPlugin teardown complete")
 
 
+# RepoObservation lists whose snapshots carry an age_hours that grows every tick
+_SNAPSHOT_LISTS = (
+    "open_prs",
+    "open_issues",
+    "dependabot_prs",
+    "failing_ci",
+    "stale_prs",
+    "unanswered_issues",
+)
+
+
 class _MultiRepoObserver:
     """
     Adapter that wraps ObservationCollector to implement the Observer protocol.
@@ -420,3 +441,21 @@ class _MultiRepoObserver:
             return "No observations available."
 
         return "\n\n".join(self._observer.format_for_planner(obs) for obs in observation.values())
+
+    def fingerprint(self, observation: Any) -> str:
+        """Digest of the world state without observed_at and PR/issue ages."""
+        if not observation or not isinstance(observation, dict):
+            return ""
+
+        snapshot = {
+            repo: obs.model_dump(
+                mode="json",
+                exclude={
+                    "observed_at": True,
+                    **{field: {"__all__": {"age_hours"}} for field in _SNAPSHOT_LISTS},
+                },
+            )
+            for repo, obs in observation.items()
+        }
+        encoded = json.dumps(snapshot, sort_keys=True).encode()
+        return hashlib.sha256(encoded).hexdigest()
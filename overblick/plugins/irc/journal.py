@@ -0,0 +1,260 @@
+"""
+Append-only conversation journal for the IRC plugin.
+
+The plugin used to rewrite the whole ``conversations.json`` (re-sorted,
+``indent=2``) after every turn, and every reader parsed the entire file.
+The journal splits storage so that a turn costs two small appends:
+
+- ``journal/<conversation-id>.jsonl`` — one JSON line per turn, in order.
+- ``journal/index.jsonl`` — one JSON line per conversation header update
+  (topic, participants, state, timestamps, turn count; never turns).
+  Readers fold it, last line per id wins. When superseded lines pile up
+  the index is compacted: rewritten with one line per conversation and
+  atomically swapped in. Conversations beyond ``max_conversations`` are
+  evicted (oldest ``updated_at`` first) together with their turn files.
+
+Readers keep the byte offset they have consumed per file and only parse
+what was appended since, so paging conversations and tailing the live
+one cost O(new data), independent of how much history exists. A torn
+last line (crash mid-write) is ignored until it is completed.
+
+Works on plain dicts (``IRCConversation.model_dump(mode="json")``) so the
+dashboard can read journals without the plugin's models.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILE = "index.jsonl"
+# Compact once the index holds this many lines per live conversation
+_COMPACT_RATIO = 4
+_MIN_COMPACT_LINES = 64
+# Block size for reading turn files backwards
+_TAIL_BLOCK = 8192
+
+
+def _read_new_lines(path: Path, offset: int) -> tuple[list[dict[str, Any]], int]:
+    """
+    Parse complete JSON lines appended to ``path`` after ``offset``.
+
+    Returns the records and the offset just past the last complete line.
+    A trailing partial line is left for the next read.
+    """
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+    end = data.rfind(b"\n")
+    if end < 0:
+        return [], offset
+    records = []
+    for line in data[: end + 1].splitlines():
+        if not line.strip():
+            continue
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            logger.warning("IRC journal: skipping corrupt line in %s", path.name)
+    return records, offset + end + 1
+
+
+def _read_last_lines(path: Path, count: int) -> list[dict[str, Any]]:
+    """Parse the last ``count`` complete lines of ``path`` without reading it all."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        buf = b""
+        # Stop at the last newline: anything after it is a torn write
+        while pos > 0:
+            step = min(_TAIL_BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+            if buf.count(b"\n") > count:
+                break
+    end = buf.rfind(b"\n")
+    lines = buf[: end + 1].splitlines() if end >= 0 else []
+    if pos > 0:
+        lines = lines[1:]  # First line may be cut off by the block boundary
+    records: deque[dict[str, Any]] = deque(maxlen=count)
+    for line in lines:
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            continue
+    return list(records)
+
+
+class ConversationJournal:
+    """
+    Conversation storage under one directory (``<data_dir>/journal``).
+
+    The plugin is the only writer; any number of readers (the dashboard)
+    may open the same directory. Not thread-safe.
+    """
+
+    def __init__(self, directory: Path, max_conversations: int = 50):
+        self.directory = Path(directory)
+        self.max_conversations = max_conversations
+        self._index_path = self.directory / INDEX_FILE
+        self._headers: dict[str, dict[str, Any]] = {}
+        self._index_offset = 0
+        self._index_lines = 0
+        self._index_inode: int | None = None
+        # conversation id -> (bytes consumed, turns read so far)
+        self._turns: dict[str, tuple[int, list[dict[str, Any]]]] = {}
+
+    def exists(self) -> bool:
+        return self._index_path.exists()
+
+    # ── Writing ──────────────────────────────────────────────────────────
+
+    def record(self, conversation: dict[str, Any]) -> int:
+        """
+        Persist a conversation snapshot; only what changed is written.
+
+        Turns beyond the stored turn count are appended to the turn file
+        and one header line is appended to the index.
+
+        Returns:
+            Number of turns appended
+        """
+        self.refresh()
+        self.directory.mkdir(parents=True, exist_ok=True)
+        conv_id = conversation["id"]
+        turns = conversation.get("turns", [])
+        stored = self._headers.get(conv_id, {}).get("turn_count", 0)
+        if stored > len(turns):
+            stored = 0  # History was replaced — start the turn file over
+            self._turn_path(conv_id).unlink(missing_ok=True)
+            self._turns.pop(conv_id, None)
+
+        new_turns = turns[stored:]
+        if new_turns:
+            with open(self._turn_path(conv_id), "a", encoding="utf-8") as f:
+                f.write("".join(json.dumps(t, default=str) + "\n" for t in new_turns))
+
+        header = {k: v for k, v in conversation.items() if k != "turns"}
+        header["turn_count"] = len(turns)
+        is_new = conv_id not in self._headers
+        with open(self._index_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(header, default=str) + "\n")
+            self._index_offset = f.tell()
+        self._headers[conv_id] = header
+        self._index_lines += 1
+        if self._index_inode is None:
+            self._index_inode = os.stat(self._index_path).st_ino
+
+        if is_new and len(self._headers) > self.max_conversations:
+            self._evict()
+            self.compact()
+        elif self._index_lines > max(_COMPACT_RATIO * len(self._headers), _MIN_COMPACT_LINES):
+            self.compact()
+        return len(new_turns)
+
+    def compact(self) -> None:
+        """Rewrite the index with one line per conversation (atomic swap)."""
+        tmp = self._index_path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for header in self._headers.values():
+                f.write(json.dumps(header, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+            offset = f.tell()
+        os.replace(tmp, self._index_path)
+        self._index_offset = offset
+        self._index_lines = len(self._headers)
+        self._index_inode = os.stat(self._index_path).st_ino
+
+    def _evict(self) -> None:
+        """Drop the oldest conversations beyond max_conversations."""
+        by_age = sorted(self._headers.values(), key=lambda h: h.get("updated_at", 0))
+        for header in by_age[: len(self._headers) - self.max_conversations]:
+            conv_id = header["id"]
+            del self._headers[conv_id]
+            self._turns.pop(conv_id, None)
+            self._turn_path(conv_id).unlink(missing_ok=True)
+
+    # ── Reading ──────────────────────────────────────────────────────────
+
+    def refresh(self) -> None:
+        """Fold index lines appended since the last read (full reload after compaction)."""
+        try:
+            st = os.stat(self._index_path)
+        except FileNotFoundError:
+            self._headers.clear()
+            self._turns.clear()
+            self._index_offset = self._index_lines = 0
+            self._index_inode = None
+            return
+        if st.st_ino != self._index_inode or st.st_size < self._index_offset:
+            self._headers.clear()
+            self._index_offset = self._index_lines = 0
+            self._index_inode = st.st_ino
+        if st.st_size == self._index_offset:
+            return
+        records, self._index_offset = _read_new_lines(self._index_path, self._index_offset)
+        for header in records:
+            if "id" in header:
+                self._headers[header["id"]] = header
+        self._index_lines += len(records)
+
+    def conversations(self, limit: int = 20, offset: int = 0) -> list[dict[str, Any]]:
+        """Conversation headers, most recently updated first (no turns)."""
+        self.refresh()
+        ordered = sorted(self._headers.values(), key=lambda h: h.get("updated_at", 0), reverse=True)
+        return [dict(h) for h in ordered[offset : offset + limit]]
+
+    def count(self) -> int:
+        self.refresh()
+        return len(self._headers)
+
+    def header(self, conversation_id: str) -> dict[str, Any] | None:
+        self.refresh()
+        header = self._headers.get(conversation_id)
+        return dict(header) if header else None
+
+    def turns(self, conversation_id: str, tail: int | None = None) -> list[dict[str, Any]]:
+        """
+        Turns of one conversation, in order.
+
+        Args:
+            tail: Only the last ``tail`` turns. On a conversation not read
+                before, these are read from the end of the file.
+        """
+        path = self._turn_path(conversation_id)
+        if not path.exists():
+            self._turns.pop(conversation_id, None)
+            return []
+        cached = self._turns.get(conversation_id)
+        if cached is None and tail is not None:
+            return _read_last_lines(path, tail) if tail > 0 else []
+        consumed, turns = cached or (0, [])
+        if path.stat().st_size < consumed:
+            consumed, turns = 0, []
+        new, consumed = _read_new_lines(path, consumed)
+        turns = turns + new if new else turns
+        self._turns[conversation_id] = (consumed, turns)
+        if tail is not None:
+            return list(turns[-tail:]) if tail > 0 else []
+        return list(turns)
+
+    def conversation(self, conversation_id: str, tail: int | None = None) -> dict[str, Any] | None:
+        """Header plus turns for one conversation, or None if unknown."""
+        header = self.header(conversation_id)
+        if header is None:
+            return None
+        header["turns"] = self.turns(conversation_id, tail=tail)
+        return header
+
+    def _turn_path(self, conversation_id: str) -> Path:
+        # IDs are generated as "irc-<hex>"; keep anything else inside the directory
+        safe = "".join(c if c.isalnum() or c in "-_" else "_" for c in conversation_id)
+        return self.directory / f"{safe}.jsonl"
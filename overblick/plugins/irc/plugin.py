@@ -9,7 +9,7 @@ Architecture:
 2. Participants are chosen based on interest scores
 3. Turn Coordinator manages the conversation flow via event bus
 4. Load Guard checks system health before each turn
-5. Conversations are stored as JSON for the dashboard to display
+5. Conversations are journaled (append-only JSONL) for the dashboard to display
 
 Scheduling:
 - Triggered periodically by the Scheduler
@@ -29,6 +29,7 @@ from typing import Any, Optional
 
 from overblick.core.plugin_base import PluginBase, PluginContext
 
+from .journal import ConversationJournal
 from .models import ConversationState, IRCConversation, IRCEventType, IRCTurn
 from .topic_manager import select_participants, select_topic, topic_to_channel
 
@@ -65,6 +66,7 @@ class IRCPlugin(PluginBase):
         self._used_topics: list[str] = []
         self._identities: dict[str, Any] = {}  # Loaded identity objects
         self._data_dir: Path | None = None
+        self._journal: ConversationJournal | None = None
         self._running = False
         self._host_inspector = None
         self._recent_participants: list[str] = []  # Track recent participants for diversity
@@ -613,9 +615,19 @@ class IRCPlugin(PluginBase):
     # Storage
     # -------------------------------------------------------------------------
 
-    def _save_conversation(self, conversation: IRCConversation) -> None:
-        """Save a conversation to disk."""
+    def _get_journal(self) -> ConversationJournal | None:
+        """Journal under the current data dir (None before setup)."""
         if not self._data_dir:
+            return None
+        directory = self._data_dir / "journal"
+        if self._journal is None or self._journal.directory != directory:
+            self._journal = ConversationJournal(directory, _MAX_STORED_CONVERSATIONS)
+        return self._journal
+
+    def _save_conversation(self, conversation: IRCConversation) -> None:
+        """Journal a conversation — appends only the turns not yet stored."""
+        journal = self._get_journal()
+        if journal is None:
             return
 
         # Update in-memory list
@@ -629,26 +641,47 @@ class IRCPlugin(PluginBase):
 
         self._conversations = existing
 
-        # Write to disk
-        data = [c.model_dump() for c in self._conversations]
-        conversations_file = self._data_dir / "conversations.json"
-        conversations_file.write_text(json.dumps(data, indent=2, default=str))
+        journal.record(conversation.model_dump(mode="json"))
 
     def _load_conversations(self) -> list[IRCConversation]:
-        """Load conversations from disk."""
-        if not self._data_dir:
+        """
+        Load stored conversations from the journal.
+
+        A legacy ``conversations.json`` is imported into the journal once.
+        """
+        journal = self._get_journal()
+        if journal is None:
+            return []
+
+        if not journal.exists():
+            self._import_legacy_conversations(journal)
+
+        try:
+            return [
+                IRCConversation.model_validate(journal.conversation(header["id"]))
+                for header in journal.conversations(limit=_MAX_STORED_CONVERSATIONS)
+            ]
+        except Exception as e:
+            logger.warning("IRC: Failed to load conversations: %s", e)
             return []
 
+    def _import_legacy_conversations(self, journal: ConversationJournal) -> None:
+        """Move conversations from the old single-file format into the journal."""
         conversations_file = self._data_dir / "conversations.json"
         if not conversations_file.exists():
-            return []
+            return
 
         try:
             data = json.loads(conversations_file.read_text())
-            return [IRCConversation.model_validate(c) for c in data]
+            conversations = [IRCConversation.model_validate(c) for c in data]
         except Exception as e:
             logger.warning("IRC: Failed to load conversations: %s", e)
-            return []
+            return
+
+        for conv in sorted(conversations, key=lambda c: c.updated_at):
+            journal.record(conv.model_dump(mode="json"))
+        conversations_file.rename(conversations_file.with_suffix(".json.migrated"))
+        logger.info("IRC: Imported %d conversations into the journal", len(conversations))
 
     # -------------------------------------------------------------------------
     # Public API (for dashboard)
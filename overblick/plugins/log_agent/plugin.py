@@ -99,6 +99,7 @@ class LogAgentPlugin(AgenticPluginBase):
         tick_interval_minutes = la_config.get("tick_interval_minutes", 5)
         self._check_interval = tick_interval_minutes * 60
         self._dry_run = la_config.get("dry_run", True)
+        plan_staleness_minutes = la_config.get("plan_staleness_minutes", 30)
 
         # Alert config
         alert_config = la_config.get("alerting", {})
@@ -128,6 +129,7 @@ class LogAgentPlugin(AgenticPluginBase):
         await self.setup_agentic_loop(
             max_actions_per_tick=3,
             audit_action_prefix="log_agent",
+            plan_staleness_seconds=plan_staleness_minutes * 60,
         )
 
         mode = "DRY RUN" if self._dry_run else "LIVE"
@@ -2,7 +2,8 @@
 Feed processor — polls Moltbook feed and deduplicates items.
 
 Tracks seen post IDs to avoid re-processing. Uses a deque alongside
-a set for O(1) lookup + guaranteed FIFO eviction order.
+a set for O(1) lookup + guaranteed FIFO eviction order. With a
+SeenIndex attached, seen IDs also persist across restarts.
 """
 
 import logging
@@ -10,6 +11,7 @@ from collections import deque
 from typing import Optional
 
 from .models import FeedItem, Post
+from .seen_index import SeenIndex
 
 logger = logging.getLogger(__name__)
 
@@ -19,15 +21,24 @@ class FeedProcessor:
     Processes the Moltbook feed, deduplicating and scoring items.
 
     Memory-bounded: evicts oldest seen IDs when max_seen is exceeded.
+    IDs evicted from memory are still remembered by the seen index.
     """
 
-    def __init__(self, max_seen: int = 5000):
+    def __init__(self, max_seen: int = 5000, seen_index: SeenIndex | None = None):
         self._seen_post_ids: set[str] = set()
         self._seen_order: deque[str] = deque()
         self._max_seen = max_seen
+        self._seen_index = seen_index
+
+    def _is_seen(self, item_id: str) -> bool:
+        if item_id in self._seen_post_ids:
+            return True
+        return self._seen_index is not None and f"post:{item_id}" in self._seen_index
 
     def _track_seen(self, item_id: str) -> None:
         """Track an item as seen, evicting oldest if over capacity."""
+        if self._seen_index is not None:
+            self._seen_index.add(f"post:{item_id}")
         self._seen_post_ids.add(item_id)
         self._seen_order.append(item_id)
 
@@ -40,7 +51,7 @@ class FeedProcessor:
         """Filter to only posts we haven't seen yet."""
         new_posts = []
         for post in posts:
-            if post.id and post.id not in self._seen_post_ids:
+            if post.id and not self._is_seen(post.id):
                 new_posts.append(post)
                 self._track_seen(post.id)
 
@@ -54,7 +65,7 @@ class FeedProcessor:
         new_items = []
         for item in items:
             item_id = item.post_id or item.id
-            if item_id and item_id not in self._seen_post_ids:
+            if item_id and not self._is_seen(item_id):
                 new_items.append(item)
                 self._track_seen(item_id)
 
@@ -62,14 +73,14 @@ class FeedProcessor:
 
     def mark_seen(self, post_id: str) -> None:
         """Manually mark a post as seen."""
-        if post_id not in self._seen_post_ids:
+        if not self._is_seen(post_id):
             self._track_seen(post_id)
 
     def is_seen(self, post_id: str) -> bool:
         """Check if a post has been seen."""
-        return post_id in self._seen_post_ids
+        return self._is_seen(post_id)
 
     @property
     def seen_count(self) -> int:
-        """Number of tracked post IDs."""
+        """Number of tracked post IDs (in memory)."""
         return len(self._seen_post_ids)
@@ -35,6 +35,7 @@ from .opening_selector import OpeningSelector
 from .reply_queue import ReplyQueueManager
 from .response_gen import ResponseGenerator
 from .response_router import ResponseRouter
+from .seen_index import SeenIndex
 
 logger = logging.getLogger(__name__)
 
@@ -61,6 +62,8 @@ class MoltbookPlugin(PluginBase):
         self._opening_selector: OpeningSelector | None = None
         self._knowledge_loader: KnowledgeLoader | None = None
         self._challenge_handler: PerContentChallengeHandler | None = None
+        # Persistent seen posts/comments (opened in setup when data_dir exists)
+        self._seen_index: SeenIndex | None = None
 
         # Capabilities (loaded via CapabilityRegistry)
         self._capabilities: dict[str, CapabilityBase] = {}
@@ -158,8 +161,14 @@ class MoltbookPlugin(PluginBase):
             llm_pipeline=self.ctx.llm_pipeline,
         )
 
-        # Feed processor
-        self._feed_processor = FeedProcessor()
+        # Feed processor — seen posts (and scanned replies) persist across restarts
+        data_dir = self.ctx.data_dir
+        if isinstance(data_dir, Path):
+            try:
+                self._seen_index = await asyncio.to_thread(SeenIndex, data_dir, "moltbook_seen")
+            except OSError as e:
+                logger.warning("Seen index unavailable, dedup is in-memory only: %s", e)
+        self._feed_processor = FeedProcessor(seen_index=self._seen_index)
 
         # Reply queue
         self._reply_queue = ReplyQueueManager(
@@ -175,7 +184,6 @@ class MoltbookPlugin(PluginBase):
             topic_count=topic_count,
         )
         # Restore topic rotation state from disk
-        data_dir = self.ctx.data_dir
         if isinstance(data_dir, Path):
             await asyncio.to_thread(self._heartbeat.load_state, data_dir)
 
@@ -321,7 +329,9 @@ class MoltbookPlugin(PluginBase):
                 "agent_name",
                 self.ctx.identity.name,
             )
-            for post in new_posts:
+            # Score the whole page's keywords in one batch
+            decisions = self._decision_engine.evaluate_posts(new_posts) if new_posts else []
+            for post, decision in zip(new_posts, decisions):
                 if self._comments_this_cycle >= self._max_comments_per_cycle:
                     break
 
@@ -335,13 +345,6 @@ class MoltbookPlugin(PluginBase):
                     await self._handle_moltcaptcha(post.id, post)
                     continue
 
-                decision = self._decision_engine.evaluate_post(
-                    title=post.title,
-                    content=post.content,
-                    agent_name=post.agent_name,
-                    submolt=getattr(post, "submolt", ""),
-                )
-
                 if decision.action == "comment":
                     await self._engage_with_post(post, decision)
                 elif decision.action == "upvote":
@@ -355,15 +358,22 @@ class MoltbookPlugin(PluginBase):
                     except MoltbookError as e:
                         logger.warning("Upvote failed: %s", e)
 
-            # Step 5: Process reply queue
-            if self._reply_queue:
-                await self._reply_queue.process_queue(self._handle_reply)
-
-            # Step 6: Check replies to our posts
-            await self._check_own_post_replies()
+            # Step 5: Process reply queue — LLM reply generation runs in the
+            # background while steps 6/6b fetch and scan the next posts
+            reply_task = (
+                asyncio.create_task(self._reply_queue.process_queue(self._handle_reply))
+                if self._reply_queue
+                else None
+            )
+            try:
+                # Step 6: Check replies to our posts
+                await self._check_own_post_replies()
 
-            # Step 6b: Check replies to our comments on OTHER people's posts
-            await self._check_own_comment_replies()
+                # Step 6b: Check replies to our comments on OTHER people's posts
+                await self._check_own_comment_replies()
+            finally:
+                if reply_task:
+                    await reply_task
 
             # Step 7: Handle direct messages
             await self._handle_dms()
@@ -550,24 +560,26 @@ class MoltbookPlugin(PluginBase):
         - Engaging comments (above reply threshold): upvote AND queue reply
         - Normal comments (below reply threshold): upvote only
 
-        Checks at most 3 recent posts per tick to limit API calls.
+        Checks at most 3 recent posts per tick to limit API calls. Posts
+        are fetched concurrently and each is scanned as soon as it arrives.
         """
         max_posts_to_check = self.ctx.identity.raw_config.get("reply_check_limit", 3)
         my_post_ids = await self.ctx.engagement_db.get_my_post_ids(limit=max_posts_to_check)
         if not my_post_ids:
             return
 
-        for post_id in my_post_ids:
+        async for post_id, post in self._fetch_posts_with_comments(my_post_ids):
+            if isinstance(post, MoltbookError):
+                logger.debug("Could not check replies for %s: %s", post_id, post)
+                continue
             try:
-                post = await self._client.get_post(post_id, include_comments=True)
                 if not post.comments:
                     continue
 
-                for comment in post.comments:
-                    if not comment.id:
-                        continue
-                    if await self.ctx.engagement_db.is_reply_processed(comment.id):
-                        continue
+                by_id = {c.id: c for c in post.comments if c.id}
+                unprocessed = await self._filter_unprocessed_replies(list(by_id))
+                for comment_id in unprocessed:
+                    comment = by_id[comment_id]
 
                     # Check for MoltCaptcha challenge directed at us
                     agent_name = self.ctx.identity.raw_config.get(
@@ -577,7 +589,7 @@ class MoltbookPlugin(PluginBase):
                     if is_challenge_text(comment.content, agent_name):
                         logger.info("MoltCaptcha challenge detected from %s", comment.agent_name)
                         await self._handle_moltcaptcha(post.id, comment)
-                        await self.ctx.engagement_db.mark_reply_processed(
+                        await self._mark_reply_processed(
                             comment.id,
                             post_id,
                             "challenge_solved",
@@ -593,7 +605,7 @@ class MoltbookPlugin(PluginBase):
 
                     # Hostile/spam: skip entirely — no upvote, no reply
                     if decision.hostile:
-                        await self.ctx.engagement_db.mark_reply_processed(
+                        await self._mark_reply_processed(
                             comment.id,
                             post_id,
                             "hostile_skip",
@@ -608,14 +620,14 @@ class MoltbookPlugin(PluginBase):
                         logger.debug("Upvote failed for comment %s: %s", comment.id, e)
 
                     if decision.should_engage:
-                        await self.ctx.engagement_db.queue_reply_action(
+                        await self._queue_reply_action(
                             comment_id=comment.id,
                             post_id=post_id,
                             action="reply",
                             relevance_score=decision.score,
                         )
                     else:
-                        await self.ctx.engagement_db.mark_reply_processed(
+                        await self._mark_reply_processed(
                             comment.id,
                             post_id,
                             "skip",
@@ -645,29 +657,32 @@ class MoltbookPlugin(PluginBase):
             self.ctx.identity.name,
         )
 
+        my_ids_by_post: dict[str, set[str]] = {}
         for post_id in post_ids:
-            try:
-                my_comment_ids = await self.ctx.engagement_db.get_my_comment_ids_for_post(post_id)
-                if not my_comment_ids:
-                    continue
+            my_comment_ids = await self.ctx.engagement_db.get_my_comment_ids_for_post(post_id)
+            if my_comment_ids:
+                my_ids_by_post[post_id] = set(my_comment_ids)
 
-                my_ids_set = set(my_comment_ids)
-                post = await self._client.get_post(post_id, include_comments=True)
+        async for post_id, post in self._fetch_posts_with_comments(list(my_ids_by_post)):
+            if isinstance(post, MoltbookError):
+                logger.debug("Could not check comment replies for %s: %s", post_id, post)
+                continue
+            try:
                 if not post or not post.comments:
                     continue
 
-                for comment in post.comments:
-                    if not comment.id:
-                        continue
-                    # Only care about replies TO our comments
-                    parent_id = getattr(comment, "parent_id", None)
-                    if not parent_id or parent_id not in my_ids_set:
-                        continue
-                    # Skip our own replies
-                    if getattr(comment, "agent_name", "") == agent_name:
-                        continue
-                    if await self.ctx.engagement_db.is_reply_processed(comment.id):
-                        continue
+                my_ids_set = my_ids_by_post[post_id]
+                # Only care about replies TO our comments, not our own replies
+                by_id = {
+                    c.id: c
+                    for c in post.comments
+                    if c.id
+                    and getattr(c, "parent_id", None) in my_ids_set
+                    and getattr(c, "agent_name", "") != agent_name
+                }
+                unprocessed = await self._filter_unprocessed_replies(list(by_id))
+                for comment_id in unprocessed:
+                    comment = by_id[comment_id]
 
                     decision = self._decision_engine.evaluate_reply(
                         comment_content=comment.content,
@@ -676,7 +691,7 @@ class MoltbookPlugin(PluginBase):
                     )
 
                     if decision.hostile:
-                        await self.ctx.engagement_db.mark_reply_processed(
+                        await self._mark_reply_processed(
                             comment.id,
                             post_id,
                             "hostile_skip",
@@ -691,14 +706,14 @@ class MoltbookPlugin(PluginBase):
                         logger.debug("Upvote failed for reply %s: %s", comment.id, e)
 
                     if decision.should_engage:
-                        await self.ctx.engagement_db.queue_reply_action(
+                        await self._queue_reply_action(
                             comment_id=comment.id,
                             post_id=post_id,
                             action="reply",
                             relevance_score=decision.score,
                         )
                     else:
-                        await self.ctx.engagement_db.mark_reply_processed(
+                        await self._mark_reply_processed(
                             comment.id,
                             post_id,
                             "skip",
@@ -708,6 +723,68 @@ class MoltbookPlugin(PluginBase):
             except MoltbookError as e:
                 logger.debug("Could not check comment replies for %s: %s", post_id, e)
 
+    async def _filter_unprocessed_replies(self, comment_ids: list[str]) -> list[str]:
+        """Comment ids not yet processed or queued.
+
+        Ids in the seen index were recorded by an earlier scan and skip the
+        database entirely; the rest are checked with one bulk query, and any
+        the database already knows are added to the index for next time.
+        """
+        if self._seen_index is None:
+            return await self.ctx.engagement_db.filter_unprocessed(comment_ids)
+        fresh = [cid for cid in comment_ids if f"comment:{cid}" not in self._seen_index]
+        if not fresh:
+            return []
+        unprocessed = await self.ctx.engagement_db.filter_unprocessed(fresh)
+        for comment_id in set(fresh).difference(unprocessed):
+            self._seen_index.add(f"comment:{comment_id}")
+        return unprocessed
+
+    async def _mark_reply_processed(
+        self, comment_id: str, post_id: str, action: str, score: float
+    ) -> None:
+        await self.ctx.engagement_db.mark_reply_processed(comment_id, post_id, action, score)
+        if self._seen_index is not None:
+            self._seen_index.add(f"comment:{comment_id}")
+
+    async def _queue_reply_action(
+        self, comment_id: str, post_id: str, action: str, relevance_score: float
+    ) -> None:
+        await self.ctx.engagement_db.queue_reply_action(
+            comment_id=comment_id,
+            post_id=post_id,
+            action=action,
+            relevance_score=relevance_score,
+        )
+        if self._seen_index is not None:
+            self._seen_index.add(f"comment:{comment_id}")
+
+    async def _fetch_posts_with_comments(self, post_ids: list[str]):
+        """Fetch posts concurrently, yielding (post_id, post) as each arrives.
+
+        A failed fetch yields its MoltbookError in place of the post so the
+        caller can log it per post. Every request still goes through the
+        client's token-bucket rate limiter; ``reply_scan_concurrency`` only
+        caps how many are in flight at once.
+        """
+        limit = max(1, int(self.ctx.identity.raw_config.get("reply_scan_concurrency", 4)))
+        semaphore = asyncio.Semaphore(limit)
+
+        async def fetch(post_id: str):
+            async with semaphore:
+                try:
+                    return post_id, await self._client.get_post(post_id, include_comments=True)
+                except MoltbookError as e:
+                    return post_id, e
+
+        tasks = [asyncio.create_task(fetch(post_id)) for post_id in post_ids]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
     async def _handle_dms(self) -> None:
         """Handle incoming DM requests and conversations.
 
@@ -1149,6 +1226,9 @@ class MoltbookPlugin(PluginBase):
 
         if self._client:
             await self._client.close()
+        if self._seen_index is not None:
+            self._seen_index.close()
+            self._seen_index = None
         logger.info("MoltbookPlugin teardown complete")
 
     async def _setup_capabilities(self, enabled_modules: list[str], system_prompt: str) -> None:
@@ -0,0 +1,196 @@
+"""
+Persistent seen-ID index — survives restarts without re-reading history.
+
+FeedProcessor's in-memory set forgot everything on restart, so the agent
+re-scored (and could re-engage with) posts it had already handled. This
+index keeps 64-bit fingerprints of seen IDs in an open-addressing hash
+table that lives in a memory-mapped file under the identity's data dir:
+
+- Opening is O(1): the file is mmap'ed, nothing is parsed or replayed.
+- A slot is 8 bytes, so a million IDs take ~11 MB at the maximum load
+  factor (a Python set of the same string IDs needs ~10x that).
+- Writes go straight to the shared mapping, so a process crash loses
+  nothing; only an OS crash can drop the last unflushed pages.
+
+Two generations rotate: when the current table reaches its load limit,
+the previous one is dropped and a fresh table takes over. Lookups check
+both, so at least one full generation of history is always remembered.
+Fingerprint collisions (a new ID reported as seen) have a probability of
+about n / 2**64 — negligible at any realistic size.
+"""
+
+import hashlib
+import logging
+import mmap
+import os
+import struct
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"OVSEEN01"
+# magic, used slots, total slots
+_HEADER = struct.Struct("<8sII")
+_SLOT_SIZE = 8
+# Rotate once a generation is this full (linear probing degrades past it)
+MAX_LOAD = 0.7
+
+
+def _fingerprint(item_id: str) -> int:
+    """Non-zero 64-bit fingerprint of an ID (0 marks an empty slot)."""
+    digest = hashlib.blake2b(item_id.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") or 1
+
+
+class _Generation:
+    """One memory-mapped open-addressing table of fingerprints."""
+
+    def __init__(self, path: Path, capacity: int):
+        self.path = path
+        size = _HEADER.size + capacity * _SLOT_SIZE
+        # O_BINARY exists (and matters) only on Windows
+        fd = os.open(path, os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0), 0o600)
+        try:
+            existing = os.fstat(fd).st_size
+            if existing and not self._valid(fd, existing):
+                logger.warning("Seen index %s is corrupt — starting fresh", path)
+                existing = 0
+            if not existing:
+                os.ftruncate(fd, 0)
+                os.ftruncate(fd, size)
+            self._mmap = mmap.mmap(fd, 0)
+        finally:
+            os.close(fd)
+        if not existing:
+            _HEADER.pack_into(self._mmap, 0, _MAGIC, 0, capacity)
+
+        _, self.count, self.capacity = _HEADER.unpack_from(self._mmap, 0)
+        self._mask = self.capacity - 1
+        self._slots = memoryview(self._mmap)[_HEADER.size :].cast("Q")
+
+    @staticmethod
+    def _valid(fd: int, size: int) -> bool:
+        # lseek + read rather than pread, which Windows lacks
+        os.lseek(fd, 0, os.SEEK_SET)
+        header = os.read(fd, _HEADER.size)
+        if len(header) < _HEADER.size:
+            return False
+        magic, count, capacity = _HEADER.unpack(header)
+        return (
+            magic == _MAGIC
+            and capacity > 0
+            and capacity & (capacity - 1) == 0
+            and count <= capacity
+            and size == _HEADER.size + capacity * _SLOT_SIZE
+        )
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.capacity * MAX_LOAD
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._mmap)
+
+    def _probe(self, fp: int) -> int:
+        """Slot holding fp, or the empty slot where it would go."""
+        slots, mask = self._slots, self._mask
+        i = fp & mask
+        while True:
+            value = slots[i]
+            if value == fp or value == 0:
+                return i
+            i = (i + 1) & mask
+
+    def __contains__(self, fp: int) -> bool:
+        return self._slots[self._probe(fp)] == fp
+
+    def add(self, fp: int) -> bool:
+        """Insert fp; returns False if it was already present."""
+        i = self._probe(fp)
+        if self._slots[i] == fp:
+            return False
+        self._slots[i] = fp
+        self.count += 1
+        _HEADER.pack_into(self._mmap, 0, _MAGIC, self.count, self.capacity)
+        return True
+
+    def flush(self) -> None:
+        self._mmap.flush()
+
+    def close(self) -> None:
+        self._slots.release()
+        self._mmap.close()
+
+
+class SeenIndex:
+    """
+    Persistent set of seen IDs for one identity.
+
+    Not thread-safe; the plugin only touches it from its event loop.
+    Callers namespace IDs themselves when one index holds several kinds
+    (e.g. ``"post:<id>"`` vs ``"comment:<id>"``).
+    """
+
+    def __init__(self, directory: Path, name: str = "seen", generation_capacity: int = 1 << 18):
+        """
+        Args:
+            directory: Where the index files live (created if missing)
+            name: File stem; ``<name>.cur.idx`` and ``<name>.prev.idx``
+            generation_capacity: Slots per generation, rounded up to a power
+                of two. Each generation holds capacity * MAX_LOAD IDs.
+        """
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._current_path = self._directory / f"{name}.cur.idx"
+        self._previous_path = self._directory / f"{name}.prev.idx"
+        self._capacity = 1 << max(4, (generation_capacity - 1).bit_length())
+        self._current = _Generation(self._current_path, self._capacity)
+        self._previous = (
+            _Generation(self._previous_path, self._capacity)
+            if self._previous_path.exists()
+            else None
+        )
+
+    def __contains__(self, item_id: str) -> bool:
+        fp = _fingerprint(item_id)
+        return fp in self._current or (self._previous is not None and fp in self._previous)
+
+    def __len__(self) -> int:
+        return self._current.count + (self._previous.count if self._previous else 0)
+
+    def add(self, item_id: str) -> bool:
+        """Record an ID; returns False if it was already seen."""
+        fp = _fingerprint(item_id)
+        if fp in self._current or (self._previous is not None and fp in self._previous):
+            return False
+        if self._current.full:
+            self._rotate()
+        return self._current.add(fp)
+
+    def _rotate(self) -> None:
+        """Retire the previous generation and start an empty current one."""
+        if self._previous is not None:
+            self._previous.close()
+        self._current.close()
+        os.replace(self._current_path, self._previous_path)
+        self._previous = _Generation(self._previous_path, self._capacity)
+        self._current = _Generation(self._current_path, self._capacity)
+        logger.debug("Seen index rotated (%s)", self._current_path.name)
+
+    @property
+    def memory_bytes(self) -> int:
+        """Size of the mapped tables (resident only as pages are touched)."""
+        return self._current.nbytes + (self._previous.nbytes if self._previous else 0)
+
+    def flush(self) -> None:
+        """Force mapped pages to disk (only needed to survive an OS crash)."""
+        self._current.flush()
+        if self._previous is not None:
+            self._previous.flush()
+
+    def close(self) -> None:
+        self.flush()
+        self._current.close()
+        if self._previous is not None:
+            self._previous.close()
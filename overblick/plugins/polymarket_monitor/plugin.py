@@ -43,6 +43,7 @@ from .models import (
     TradingOpportunity,
 )
 from .polymarket_client import PolymarketAPIError, PolymarketClient
+from .screening import binary_prices, screen_markets
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +53,11 @@ _DEFAULT_MAX_MARKETS_TO_MONITOR = 50
 _DEFAULT_MIN_PROBABILITY_EDGE = 0.03  # 3% minimum edge
 _DEFAULT_MIN_VOLUME_USD = 1000.0  # Minimum liquidity to consider
 _DEFAULT_MAX_POSITION_SIZE_PERCENT = 5.0  # Max 5% of portfolio per trade
+_DEFAULT_MAX_SPREAD = 0.10  # Max |yes + no - 1| before a market is skipped
+_DEFAULT_MIN_PRICE = 0.01  # YES price must lie inside [min, 1 - min]
+_DEFAULT_LLM_CONCURRENCY = 4  # Parallel LLM probability estimates per scan
+_DEFAULT_REESTIMATE_PRICE_MOVE = 0.02  # Re-ask the LLM once price moves this much
+_DEFAULT_ESTIMATE_TTL_HOURS = 24.0  # ...or once the estimate is this old
 
 
 class PolymarketMonitorPlugin(PluginBase):
@@ -83,6 +89,8 @@ class PolymarketMonitorPlugin(PluginBase):
         self._alert_conditions: list[AlertCondition] = []
         self._recent_opportunities: list[TradingOpportunity] = []
         self._active_alerts: list[Alert] = []
+        # market_id -> (YES price at estimate time, LLM probability, timestamp)
+        self._estimates: dict[str, tuple[float, float, float]] = {}
 
         # Configuration
         self._config = {
@@ -90,6 +98,11 @@ class PolymarketMonitorPlugin(PluginBase):
             "min_probability_edge": _DEFAULT_MIN_PROBABILITY_EDGE,
             "min_volume_usd": _DEFAULT_MIN_VOLUME_USD,
             "max_position_size_percent": _DEFAULT_MAX_POSITION_SIZE_PERCENT,
+            "max_spread": _DEFAULT_MAX_SPREAD,
+            "min_price": _DEFAULT_MIN_PRICE,
+            "llm_concurrency": _DEFAULT_LLM_CONCURRENCY,
+            "reestimate_price_move": _DEFAULT_REESTIMATE_PRICE_MOVE,
+            "estimate_ttl_hours": _DEFAULT_ESTIMATE_TTL_HOURS,
             "simulation_mode": True,  # Start in simulation mode (no real trades)
         }
 
@@ -110,6 +123,17 @@ class PolymarketMonitorPlugin(PluginBase):
                 "max_position_size_percent": plugin_config.get(
                     "max_position_size_percent", _DEFAULT_MAX_POSITION_SIZE_PERCENT
                 ),
+                "max_spread": plugin_config.get("max_spread", _DEFAULT_MAX_SPREAD),
+                "min_price": plugin_config.get("min_price", _DEFAULT_MIN_PRICE),
+                "llm_concurrency": max(
+                    1, int(plugin_config.get("llm_concurrency", _DEFAULT_LLM_CONCURRENCY))
+                ),
+                "reestimate_price_move": plugin_config.get(
+                    "reestimate_price_move", _DEFAULT_REESTIMATE_PRICE_MOVE
+                ),
+                "estimate_ttl_hours": plugin_config.get(
+                    "estimate_ttl_hours", _DEFAULT_ESTIMATE_TTL_HOURS
+                ),
                 "simulation_mode": plugin_config.get("simulation_mode", True),
             }
         )
@@ -192,19 +216,35 @@ class PolymarketMonitorPlugin(PluginBase):
         # Update monitored markets list (prioritize active, liquid markets)
         self._update_monitored_markets(markets)
 
-        # Analyze each monitored market
-        opportunities = []
+        # Cheap numeric filters over the whole fetched set before any LLM call
+        screened = {
+            m.id
+            for m in screen_markets(
+                markets,
+                min_volume=self._config["min_volume_usd"],
+                max_spread=self._config["max_spread"],
+                min_price=self._config["min_price"],
+            )
+        }
+        by_id = {m.id: m for m in markets}
+        candidates = []
         for market_id in self._monitored_markets[: self._config["max_markets"]]:
-            market = next((m for m in markets if m.id == market_id), None)
-            if not market:
+            market = by_id.get(market_id)
+            if not market or market_id not in screened:
                 continue
 
             # Skip markets that don't meet basic criteria
             if not self._is_market_tradable(market):
                 continue
+            candidates.append(market)
 
-            # Analyze market for opportunities
-            opportunity = await self._analyze_market(market)
+        # Probability estimates run concurrently; analysis stays in monitored order
+        estimates = await self._estimate_probabilities(candidates)
+
+        # Analyze each candidate market
+        opportunities = []
+        for market, our_probability in zip(candidates, estimates):
+            opportunity = await self._analyze_market(market, our_probability)
             if opportunity:
                 opportunities.append(opportunity)
 
@@ -227,8 +267,9 @@ class PolymarketMonitorPlugin(PluginBase):
         self._save_state()
 
         logger.info(
-            "PolymarketMonitor: scan complete — %d markets, %d opportunities",
+            "PolymarketMonitor: scan complete — %d markets, %d analyzed, %d opportunities",
             len(markets),
+            len(candidates),
             len(opportunities),
         )
 
@@ -240,6 +281,7 @@ class PolymarketMonitorPlugin(PluginBase):
                 plugin="polymarket_monitor",
                 details={
                     "markets_scanned": len(markets),
+                    "markets_analyzed": len(candidates),
                     "opportunities_found": len(opportunities),
                     "monitored_markets": len(self._monitored_markets),
                     "active_alerts": len(self._active_alerts),
@@ -324,7 +366,9 @@ class PolymarketMonitorPlugin(PluginBase):
             added
         )
 
-    async def _analyze_market(self, market: PolymarketMarket) -> TradingOpportunity | None:
+    async def _analyze_market(
+        self, market: PolymarketMarket, our_probability: float | None = None
+    ) -> TradingOpportunity | None:
         """
         Analyze a market for trading opportunities.
 
@@ -333,6 +377,10 @@ class PolymarketMonitorPlugin(PluginBase):
         2. Statistical analysis of historical data
         3. Market microstructure analysis
         4. Sentiment analysis (if available)
+
+        Args:
+            our_probability: Estimate already obtained for this market
+                (e.g. by a batched scan); estimated here if omitted.
         """
         # For binary markets, calculate basic opportunity
         if len(market.outcomes) != 2:
@@ -346,7 +394,8 @@ class PolymarketMonitorPlugin(PluginBase):
             return None
 
         # Calculate our probability estimate
-        our_probability = await self._estimate_probability(market)
+        if our_probability is None:
+            our_probability = await self._estimate_probability(market)
         if our_probability is None:
             return None
 
@@ -428,13 +477,57 @@ class PolymarketMonitorPlugin(PluginBase):
             urgency=urgency,
         )
 
+    async def _estimate_probabilities(self, markets: list[PolymarketMarket]) -> list[float | None]:
+        """Estimate several markets at once, at most llm_concurrency LLM calls in flight."""
+        semaphore = asyncio.Semaphore(self._config["llm_concurrency"])
+
+        async def estimate(market: PolymarketMarket) -> float | None:
+            if self._cached_estimate(market) is not None:
+                return await self._estimate_probability(market)
+            async with semaphore:
+                return await self._estimate_probability(market)
+
+        return list(await asyncio.gather(*(estimate(m) for m in markets)))
+
+    @staticmethod
+    def _yes_price(market: PolymarketMarket) -> float | None:
+        prices = binary_prices(market)
+        return prices[0] if prices else market.implied_probability
+
+    def _cached_estimate(self, market: PolymarketMarket) -> float | None:
+        """
+        Last LLM estimate for a market, unless it went stale.
+
+        An estimate is reused until the YES price has moved more than
+        reestimate_price_move from where it was when the LLM answered,
+        or until it is older than estimate_ttl_hours.
+        """
+        cached = self._estimates.get(market.id)
+        if cached is None:
+            return None
+        price_then, probability, estimated_at = cached
+        price_now = self._yes_price(market)
+        if (
+            price_now is None
+            or abs(price_now - price_then) > self._config["reestimate_price_move"]
+            or time.time() - estimated_at > self._config["estimate_ttl_hours"] * 3600
+        ):
+            del self._estimates[market.id]
+            return None
+        return probability
+
     async def _estimate_probability(self, market: PolymarketMarket) -> float | None:
         """
         Estimate the true probability of a market outcome.
 
         Uses LLM analysis enhanced with statistical reasoning.
+        LLM answers are cached per market (see _cached_estimate).
         Falls back to market price if LLM is unavailable.
         """
+        cached = self._cached_estimate(market)
+        if cached is not None:
+            return cached
+
         if not self.ctx.llm_pipeline:
             # Fallback to market price (no edge)
             if market.implied_probability is not None:
@@ -479,6 +572,9 @@ class PolymarketMonitorPlugin(PluginBase):
 
                     # Validate range
                     if 0 <= probability <= 1:
+                        price = self._yes_price(market)
+                        if price is not None:
+                            self._estimates[market.id] = (price, probability, time.time())
                         return probability
                 except ValueError:
                     logger.debug("PolymarketMonitor: failed to parse LLM probability")
@@ -644,6 +740,9 @@ class PolymarketMonitorPlugin(PluginBase):
                 TradingOpportunity(**opp) for opp in data.get("recent_opportunities", [])
             ]
             self._last_check_time = data.get("last_check_time", 0)
+            self._estimates = {
+                market_id: tuple(entry) for market_id, entry in data.get("estimates", {}).items()
+            }
             logger.debug(
                 "PolymarketMonitor: loaded state with %d monitored markets",
                 len(self._monitored_markets),
@@ -659,12 +758,18 @@ class PolymarketMonitorPlugin(PluginBase):
             return
 
         try:
+            monitored = set(self._monitored_markets)
             data = {
                 "monitored_markets": self._monitored_markets,
                 "recent_opportunities": [
-                    opp.model_dump() for opp in self._recent_opportunities[-50:]
+                    opp.model_dump(mode="json") for opp in self._recent_opportunities[-50:]
                 ],
                 "last_check_time": self._last_check_time,
+                "estimates": {
+                    market_id: list(entry)
+                    for market_id, entry in self._estimates.items()
+                    if market_id in monitored
+                },
                 "saved_at": datetime.now().isoformat(),
             }
             self._state_file.write_text(json.dumps(data, indent=2))
@@ -0,0 +1,88 @@
+"""
+Numeric pre-screen for Polymarket markets.
+
+LLM probability estimates are the expensive part of a scan, so every
+fetched market first goes through filters that only need the market's own
+numbers, evaluated over the whole set at once:
+
+- Liquidity: 24h volume at least ``min_volume``.
+- Spread: the YES and NO prices of a binary market should sum to ~1; an
+  overround (``|yes + no - 1|``) beyond ``max_spread`` eats any edge.
+- Kelly odds: the YES price must lie inside ``[min_price, 1 - min_price]``.
+  Near-certain markets pay odds too thin (or undefined, at 0/1) for a
+  Kelly stake to be worth sizing.
+
+Only binary YES/NO markets pass — the analysis does not handle others.
+Uses numpy when installed, plain Python otherwise; both give the same result.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from .models import PolymarketMarket
+
+# numpy is optional — the screen falls back to pure Python without it
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:
+    np = None
+    HAS_NUMPY = False
+
+
+def binary_prices(market: PolymarketMarket) -> tuple[float, float] | None:
+    """(YES price, NO price) of a binary market, or None for any other market."""
+    if len(market.outcomes) != 2:
+        return None
+    prices = {o.ticker.upper(): o.price for o in market.outcomes}
+    if "YES" not in prices or "NO" not in prices:
+        return None
+    return prices["YES"], prices["NO"]
+
+
+def screen_markets(
+    markets: Sequence[PolymarketMarket],
+    min_volume: float,
+    max_spread: float,
+    min_price: float,
+    use_numpy: bool = HAS_NUMPY,
+) -> list[PolymarketMarket]:
+    """
+    Markets passing the liquidity, spread and Kelly-odds filters, in input order.
+
+    Args:
+        markets: Fetched markets (any status; only numbers are checked here)
+        min_volume: Minimum 24h volume in USD
+        max_spread: Maximum ``|yes + no - 1|``
+        min_price: YES price must lie inside ``[min_price, 1 - min_price]``
+        use_numpy: Evaluate with numpy arrays (ignored if numpy is missing)
+    """
+    binary = []
+    for market in markets:
+        prices = binary_prices(market)
+        if prices is not None:
+            binary.append((market, prices))
+    if not binary:
+        return []
+
+    if use_numpy and HAS_NUMPY:
+        volume = np.fromiter((m.volume_24h for m, _ in binary), dtype=float, count=len(binary))
+        yes = np.fromiter((p[0] for _, p in binary), dtype=float, count=len(binary))
+        no = np.fromiter((p[1] for _, p in binary), dtype=float, count=len(binary))
+        keep = (
+            (volume >= min_volume)
+            & (np.abs(yes + no - 1.0) <= max_spread)
+            & (yes >= min_price)
+            & (yes <= 1.0 - min_price)
+        )
+        return [m for (m, _), ok in zip(binary, keep.tolist()) if ok]
+
+    return [
+        m
+        for m, (yes_price, no_price) in binary
+        if m.volume_24h >= min_volume
+        and abs(yes_price + no_price - 1.0) <= max_spread
+        and min_price <= yes_price <= 1.0 - min_price
+    ]
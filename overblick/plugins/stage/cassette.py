@@ -0,0 +1,152 @@
+"""
+Record/replay cassette for Stage scenario LLM calls.
+
+CassettePipeline stands in for SafeLLMPipeline in scenario runs. Each
+chat request is keyed by a hash of what determines the response (the
+messages plus temperature, max_tokens, top_p and complexity — not audit
+metadata), and the response is stored in a JSONL cassette, one line per
+recorded request:
+
+    {"key": "<sha256>", "prompt": "<last user message>", "result": {...}}
+
+Modes:
+- ``record`` — always call the wrapped pipeline and store the response
+  (a re-recorded key replaces the earlier line on load; last line wins).
+- ``replay`` — answer only from the cassette; a request that was never
+  recorded raises CassetteMiss. No pipeline is needed, so suites run
+  offline and deterministically (suitable for regression gating).
+- ``auto`` — replay when recorded, otherwise call the pipeline and record.
+
+Only unblocked responses are recorded, so a rate-limit or safety block
+during recording is never replayed as the identity's answer.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from overblick.core.llm.pipeline import PipelineResult
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_MODES = ("record", "replay", "auto")
+
+# PipelineResult fields kept in the cassette (timings and raw payloads are not)
+_RECORDED_FIELDS = {"content", "blocked", "block_reason", "deflection", "reasoning_content"}
+
+
+class CassetteMiss(LookupError):
+    """Replay mode received a request that is not in the cassette."""
+
+
+def request_key(
+    messages: list[dict[str, str]],
+    temperature: float | None = None,
+    max_tokens: int | None = None,
+    top_p: float | None = None,
+    complexity: str | None = None,
+) -> str:
+    """Stable hash of the parts of a chat request that determine the response."""
+    payload = {
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "top_p": top_p,
+        "complexity": complexity,
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class CassettePipeline:
+    """
+    Chat-only pipeline that records responses once and replays them.
+
+    Args:
+        path: Cassette file (JSONL); created on first record
+        pipeline: Wrapped SafeLLMPipeline (not needed in replay mode)
+        mode: "record", "replay" or "auto"
+    """
+
+    def __init__(self, path: Path, pipeline: Any = None, mode: str = "auto"):
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode: {mode!r}")
+        if mode != "replay" and pipeline is None:
+            raise ValueError(f"Cassette mode {mode!r} needs an LLM pipeline to record from")
+        self.path = Path(path)
+        self.mode = mode
+        self._pipeline = pipeline
+        self._entries: dict[str, dict[str, Any]] = {}
+        self.hits = 0
+        self.recorded = 0
+        self._load()
+
+    async def chat(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        top_p: float | None = None,
+        complexity: str | None = None,
+        **kwargs: Any,
+    ) -> PipelineResult:
+        """Same call shape as SafeLLMPipeline.chat()."""
+        key = request_key(messages, temperature, max_tokens, top_p, complexity)
+
+        if self.mode != "record":
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                return PipelineResult.model_validate(entry["result"])
+            if self.mode == "replay":
+                raise CassetteMiss(f"No recorded response for request {key[:12]} in {self.path}")
+
+        result = await self._pipeline.chat(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            top_p=top_p,
+            complexity=complexity,
+            **kwargs,
+        )
+        if not result.blocked:
+            self._record(key, messages, result)
+        return result
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "mode": self.mode,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "recorded": self.recorded,
+        }
+
+    def _record(self, key: str, messages: list[dict[str, str]], result: PipelineResult) -> None:
+        prompt = next((m["content"] for m in reversed(messages) if m.get("role") == "user"), "")
+        entry = {
+            "key": key,
+            "prompt": prompt,
+            "result": result.model_dump(mode="json", include=_RECORDED_FIELDS),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self._entries[key] = entry
+        self.recorded += 1
+
+    def _load(self) -> None:
+        if not self.path.exists():
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                    self._entries[entry["key"]] = entry
+                except (ValueError, KeyError, TypeError):
+                    logger.warning("Stage cassette %s: skipping bad line %d", self.path, line_no)
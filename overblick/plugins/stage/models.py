@@ -78,3 +78,17 @@ class ScenarioResult(BaseModel):
         if self.total_constraints == 0:
             return 1.0
         return self.passed_constraints / self.total_constraints
+
+
+class RunSummary(BaseModel):
+    """Timing summary of one run_all_scenarios() call."""
+
+    scenarios: int = 0
+    passed: int = 0
+    failed: int = 0
+    max_concurrent: int = 1
+    wall_ms: float = 0.0  # Elapsed time of the whole run
+    serial_ms: float = 0.0  # Sum of per-scenario wall times (serial runner estimate)
+    speedup: float = 1.0  # serial_ms / wall_ms
+    cassette: dict[str, Any] | None = None  # CassettePipeline.stats(), when used
+    run_at: float = Field(default_factory=time.time)
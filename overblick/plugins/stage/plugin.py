@@ -9,23 +9,31 @@ Architecture: On-demand (CLI command + dashboard UI). Parse YAML scenario
 -> for each step: inject input -> run through SafeLLMPipeline -> evaluate
 output against constraints -> aggregate results -> generate report.
 
+run_all_scenarios() runs independent scenarios concurrently (bounded by
+max_concurrent_scenarios; steps within a scenario stay in order). With a
+cassette configured, LLM responses are recorded once and replayed, so a
+suite can run offline and deterministically.
+
 Security: All LLM calls go through SafeLLMPipeline.
 """
 
+import asyncio
 import json
 import logging
 import time
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any
 
 import yaml
 
 from overblick.core.plugin_base import PluginBase, PluginContext
 
+from .cassette import CassettePipeline
 from .evaluator import evaluate_constraint
 from .models import (
     Constraint,
     ConstraintResult,
+    RunSummary,
     Scenario,
     ScenarioResult,
     ScenarioStep,
@@ -35,6 +43,7 @@ from .models import (
 logger = logging.getLogger(__name__)
 
 _MAX_RESULTS_STORED = 200
+_DEFAULT_MAX_CONCURRENT = 4  # Scenarios run at once by run_all_scenarios()
 
 
 class StagePlugin(PluginBase):
@@ -55,6 +64,9 @@ class StagePlugin(PluginBase):
         super().__init__(ctx)
         self._scenario_dirs: list[Path] = []
         self._results: list[ScenarioResult] = []
+        self._last_run: RunSummary | None = None
+        self._max_concurrent: int = _DEFAULT_MAX_CONCURRENT
+        self._cassette: CassettePipeline | None = None
         self._state_file: Any | None = None
         self._tick_count: int = 0
 
@@ -77,6 +89,22 @@ class StagePlugin(PluginBase):
             if default_dir.exists():
                 self._scenario_dirs = [default_dir]
 
+        self._max_concurrent = max(
+            int(stage_config.get("max_concurrent_scenarios", _DEFAULT_MAX_CONCURRENT)), 1
+        )
+
+        # Optional record/replay cassette for scenario LLM calls
+        cassette_mode = stage_config.get("cassette_mode", "")
+        if cassette_mode:
+            cassette_path = stage_config.get("cassette", "")
+            path = Path(cassette_path) if cassette_path else self.ctx.data_dir / "cassette.jsonl"
+            try:
+                self._cassette = CassettePipeline(
+                    path, pipeline=self.ctx.llm_pipeline, mode=cassette_mode
+                )
+            except ValueError as e:
+                raise RuntimeError(f"StagePlugin: {e}") from e
+
         # State persistence
         self._state_file = self.ctx.data_dir / "stage_state.json"
         self._load_state()
@@ -87,6 +115,8 @@ class StagePlugin(PluginBase):
                 "plugin": self.name,
                 "identity": identity.name,
                 "scenario_dirs": [str(d) for d in self._scenario_dirs],
+                "max_concurrent_scenarios": self._max_concurrent,
+                "cassette_mode": self._cassette.mode if self._cassette is not None else None,
             },
         )
         logger.info(
@@ -108,8 +138,16 @@ class StagePlugin(PluginBase):
         Returns:
             ScenarioResult with pass/fail for each step and constraint.
         """
-        start_time = time.time()
-        pipeline = self.ctx.llm_pipeline
+        result = await self._execute_scenario(scenario)
+        if result.error is None:
+            self._record_result(result)
+            self._save_state()
+        return result
+
+    async def _execute_scenario(self, scenario: Scenario) -> ScenarioResult:
+        """Run a scenario's steps in order; does not store the result."""
+        start_time = time.monotonic()
+        pipeline = self._cassette if self._cassette is not None else self.ctx.llm_pipeline
 
         if not pipeline:
             return ScenarioResult(
@@ -195,9 +233,9 @@ class StagePlugin(PluginBase):
                 )
                 all_passed = False
 
-        duration_ms = (time.time() - start_time) * 1000
+        duration_ms = (time.monotonic() - start_time) * 1000
 
-        scenario_result = ScenarioResult(
+        return ScenarioResult(
             scenario_name=scenario.name,
             identity=scenario.identity,
             step_results=step_results,
@@ -208,53 +246,103 @@ class StagePlugin(PluginBase):
             duration_ms=round(duration_ms, 1),
         )
 
-        self._results.append(scenario_result)
+    def _record_result(self, result: ScenarioResult) -> None:
+        """Store a completed scenario result and audit it."""
+        self._results.append(result)
 
         # Trim results
         if len(self._results) > _MAX_RESULTS_STORED:
             self._results = self._results[-_MAX_RESULTS_STORED:]
 
-        self._save_state()
-
         self.ctx.audit_log.log(
             action="stage_scenario_complete",
             details={
-                "scenario": scenario.name,
-                "identity": scenario.identity,
-                "passed": all_passed,
-                "total_constraints": total_constraints,
-                "passed_constraints": passed_constraints,
-                "duration_ms": duration_ms,
+                "scenario": result.scenario_name,
+                "identity": result.identity,
+                "passed": result.passed,
+                "total_constraints": result.total_constraints,
+                "passed_constraints": result.passed_constraints,
+                "duration_ms": result.duration_ms,
             },
         )
 
-        return scenario_result
-
-    async def run_all_scenarios(self, directory: Path | None = None) -> list[ScenarioResult]:
+    async def run_all_scenarios(
+        self,
+        directory: Path | None = None,
+        max_concurrent: int | None = None,
+    ) -> list[ScenarioResult]:
         """
         Run all scenarios found in a directory.
 
+        Scenarios are independent, so up to max_concurrent run at once.
+        Results keep discovery order; state is saved once at the end.
+        The run's timing (wall time, serial estimate, speedup) is
+        available from get_last_run().
+
         Args:
             directory: Directory containing YAML scenario files.
                 If None, uses configured directories.
+            max_concurrent: Scenarios run at once (default: the
+                max_concurrent_scenarios config; 1 = serial).
 
         Returns:
             List of ScenarioResults.
         """
         dirs = [directory] if directory else self._scenario_dirs
         scenarios = self._discover_scenarios(dirs)
+        limit = max(max_concurrent or self._max_concurrent, 1)
+        semaphore = asyncio.Semaphore(limit)
+
+        async def run_bounded(scenario: Scenario) -> ScenarioResult:
+            async with semaphore:
+                return await self._execute_scenario(scenario)
+
+        start_time = time.monotonic()
+        results = list(await asyncio.gather(*(run_bounded(s) for s in scenarios)))
+        wall_ms = (time.monotonic() - start_time) * 1000
+
+        for result in results:
+            if result.error is None:
+                self._record_result(result)
+
+        serial_ms = sum(r.duration_ms for r in results)
+        self._last_run = RunSummary(
+            scenarios=len(results),
+            passed=sum(1 for r in results if r.passed),
+            failed=sum(1 for r in results if not r.passed),
+            max_concurrent=limit,
+            wall_ms=round(wall_ms, 1),
+            serial_ms=round(serial_ms, 1),
+            speedup=round(serial_ms / wall_ms, 2) if wall_ms > 0 else 1.0,
+            cassette=self._cassette.stats() if self._cassette is not None else None,
+        )
+        self._save_state()
 
-        results: list[ScenarioResult] = []
-        for scenario in scenarios:
-            result = await self.run_scenario(scenario)
-            results.append(result)
+        logger.info(
+            "StagePlugin: %d scenarios in %.0fms (serial %.0fms, %.1fx, concurrency %d)",
+            len(results),
+            self._last_run.wall_ms,
+            self._last_run.serial_ms,
+            self._last_run.speedup,
+            limit,
+        )
+        for result in results:
+            logger.info(
+                "StagePlugin:   %s [%s] %s in %.0fms",
+                result.scenario_name,
+                result.identity,
+                "PASS" if result.passed else "FAIL",
+                result.duration_ms,
+            )
 
         if self.ctx.event_bus:
             await self.ctx.event_bus.emit(
                 "stage.run_complete",
                 scenarios=len(results),
-                passed=sum(1 for r in results if r.passed),
-                failed=sum(1 for r in results if not r.passed),
+                passed=self._last_run.passed,
+                failed=self._last_run.failed,
+                wall_ms=self._last_run.wall_ms,
+                speedup=self._last_run.speedup,
             )
 
         return results
@@ -308,12 +396,18 @@ class StagePlugin(PluginBase):
         """Get results for a specific identity."""
         return [r for r in self._results if r.identity == name]
 
+    def get_last_run(self) -> RunSummary | None:
+        """Timing summary of the most recent run_all_scenarios() call."""
+        return self._last_run
+
     def _load_state(self) -> None:
         if self._state_file and self._state_file.exists():
             try:
                 data = json.loads(self._state_file.read_text())
                 for result_data in data.get("results", []):
                     self._results.append(ScenarioResult.model_validate(result_data))
+                if data.get("last_run"):
+                    self._last_run = RunSummary.model_validate(data["last_run"])
             except Exception as e:
                 logger.warning("StagePlugin: failed to load state: %s", e)
 
@@ -322,6 +416,7 @@ class StagePlugin(PluginBase):
             try:
                 data = {
                     "results": [r.model_dump() for r in self._results[-_MAX_RESULTS_STORED:]],
+                    "last_run": self._last_run.model_dump() if self._last_run else None,
                 }
                 self._state_file.parent.mkdir(parents=True, exist_ok=True)
                 self._state_file.write_text(json.dumps(data, indent=2))
@@ -5,11 +5,12 @@ Receives messages via Telegram Bot API, routes them through the
 personality-driven LLM pipeline, and responds in character.
 
 Features:
-- Webhook or polling mode for receiving messages
+- Background long-poll listener (or tick-driven short polling)
+- Per-chat ordered handling, chats handled concurrently
 - Personality-driven responses via SafeLLMPipeline
 - Conversation context tracking (per-chat history)
 - Permission-gated actions (send, forward, admin)
-- Rate limiting per user
+- Rate limiting per user, bounded concurrent LLM calls
 - Command routing (/start, /help, /ask, /status)
 - Department routing (forward to other agents via event bus)
 
@@ -23,10 +24,12 @@ Security:
 import asyncio
 import logging
 import time
+from collections import deque
 from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 
+from overblick.core.exceptions import PluginError
 from overblick.core.plugin_base import PluginBase, PluginContext
 from overblick.core.security.input_sanitizer import wrap_external_content
 
@@ -98,6 +101,24 @@ class UserRateLimit(BaseModel):
         self.message_timestamps.append(time.time())
 
 
+# Long-poll defaults (Telegram holds getUpdates open for up to 50s)
+DEFAULT_POLL_TIMEOUT = 30
+MAX_POLL_TIMEOUT = 50
+# Back-off after a failed long poll
+POLL_RETRY_DELAY = 1.0
+MAX_POLL_RETRY_DELAY = 60.0
+# LLM calls in flight at once across all chats
+DEFAULT_MAX_CONCURRENT_LLM = 4
+
+
+class TelegramAPIError(PluginError):
+    """getUpdates failed (HTTP error status or ``ok: false``)."""
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 # Telegram Bot API commands
 COMMANDS = {
     "/start": "Start a conversation with the bot",
@@ -113,7 +134,12 @@ class TelegramPlugin(PluginBase):
     Telegram bot plugin.
 
     Drives a personality-driven conversational agent on Telegram.
-    Uses polling mode by default, webhook mode for production.
+
+    By default a background task long-polls getUpdates, so messages are
+    picked up as they arrive rather than at the next scheduler tick. Each
+    chat has its own queue: one chat's messages are handled in order,
+    different chats concurrently, with at most ``max_concurrent_llm``
+    pipeline calls in flight.
     """
 
     name = "telegram"
@@ -126,6 +152,8 @@ class TelegramPlugin(PluginBase):
         self._bot_username: str | None = None
         self._polling_task: asyncio.Task | None = None
         self._running = False
+        self._long_poll = True
+        self._poll_timeout = DEFAULT_POLL_TIMEOUT
         self._last_update_id = 0
         self._session: Any | None = None  # aiohttp.ClientSession — created in setup()
 
@@ -133,6 +161,12 @@ class TelegramPlugin(PluginBase):
         self._conversations: dict[int, ConversationContext] = {}
         self._user_rate_limits: dict[int, UserRateLimit] = {}
 
+        # Per-chat update queues, each drained by its own worker task
+        self._chat_queues: dict[int, deque[dict]] = {}
+        self._chat_workers: dict[int, asyncio.Task] = {}
+        self._llm_slots = asyncio.Semaphore(DEFAULT_MAX_CONCURRENT_LLM)
+        self._llm_in_flight = 0
+
         # Configuration
         self._allowed_chat_ids: set[int] = set()  # Empty = all allowed
         self._system_prompt: str = ""
@@ -171,6 +205,15 @@ class TelegramPlugin(PluginBase):
         self._max_per_minute = tg_config.get("rate_limit_per_minute", 10)
         self._max_per_hour = tg_config.get("rate_limit_per_hour", 60)
 
+        # Update delivery and backpressure
+        self._long_poll = tg_config.get("long_poll", True)
+        self._poll_timeout = max(
+            1, min(int(tg_config.get("poll_timeout", DEFAULT_POLL_TIMEOUT)), MAX_POLL_TIMEOUT)
+        )
+        self._llm_slots = asyncio.Semaphore(
+            max(1, int(tg_config.get("max_concurrent_llm", DEFAULT_MAX_CONCURRENT_LLM)))
+        )
+
         # Create persistent HTTP session (reused across all API calls)
         import aiohttp
 
@@ -185,10 +228,12 @@ class TelegramPlugin(PluginBase):
 
     async def tick(self) -> None:
         """
-        Poll for new messages from Telegram.
+        Housekeeping, plus polling when the long-poll listener is off.
 
-        Called periodically by the scheduler. In production, this would
-        be replaced by webhook handling.
+        With ``long_poll`` enabled (the default) the first tick starts the
+        background listener and later ticks only restart it if it died.
+        Otherwise each tick short-polls once and waits for the updates it
+        fetched to be handled.
         """
         if not self._bot_token:
             return
@@ -196,39 +241,111 @@ class TelegramPlugin(PluginBase):
         # Clean up stale conversations
         self._cleanup_stale_conversations()
 
+        if self._long_poll:
+            if self._polling_task is None or self._polling_task.done():
+                self._running = True
+                self._polling_task = asyncio.create_task(self._poll_loop())
+                logger.info("Telegram long-poll listener started (timeout=%ds)", self._poll_timeout)
+            return
+
         try:
             updates = await self._poll_updates()
             for update in updates:
-                await self._handle_update(update)
+                self._dispatch(update)
+            await self._drain_chats()
         except Exception as e:
             self._errors += 1
             logger.error("Telegram polling error: %s", e, exc_info=True)
 
-    async def _poll_updates(self) -> list[dict]:
-        """Poll Telegram Bot API for new updates."""
+    async def _poll_loop(self) -> None:
+        """Long-poll getUpdates until teardown, dispatching updates as they arrive."""
+        retry_delay = POLL_RETRY_DELAY
+        while self._running:
+            try:
+                updates = await self._poll_updates(timeout=self._poll_timeout)
+                retry_delay = POLL_RETRY_DELAY
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._errors += 1
+                # Honour Telegram's retry_after (429) when it asks for longer
+                delay = max(retry_delay, getattr(e, "retry_after", 0.0))
+                logger.warning("Telegram long poll failed: %s — retrying in %.0fs", e, delay)
+                await asyncio.sleep(delay)
+                retry_delay = min(retry_delay * 2, MAX_POLL_RETRY_DELAY)
+                continue
+            for update in updates:
+                self._dispatch(update)
+
+    def _dispatch(self, update: dict) -> None:
+        """Queue an update on its chat; start the chat's worker if idle."""
+        chat_id = ((update.get("message") or {}).get("chat") or {}).get("id", 0)
+        self._chat_queues.setdefault(chat_id, deque()).append(update)
+        worker = self._chat_workers.get(chat_id)
+        if worker is None or worker.done():
+            self._chat_workers[chat_id] = asyncio.create_task(self._drain_chat(chat_id))
+
+    async def _drain_chat(self, chat_id: int) -> None:
+        """Handle one chat's queued updates in arrival order."""
+        queue = self._chat_queues[chat_id]
+        try:
+            while queue:
+                update = queue.popleft()
+                try:
+                    await self._handle_update(update)
+                except Exception as e:
+                    self._errors += 1
+                    logger.error("Telegram update handling error: %s", e, exc_info=True)
+        finally:
+            if not queue:
+                self._chat_queues.pop(chat_id, None)
+            self._chat_workers.pop(chat_id, None)
+
+    async def _drain_chats(self) -> None:
+        """Wait until every queued update has been handled."""
+        while self._chat_workers:
+            await asyncio.gather(*list(self._chat_workers.values()), return_exceptions=True)
+
+    async def _poll_updates(self, timeout: int = 1) -> list[dict]:
+        """
+        Fetch new updates from the Telegram Bot API.
+
+        Args:
+            timeout: Seconds Telegram may hold the request open waiting for
+                updates (1 = short poll, up to 50 = long poll)
+
+        Raises:
+            TelegramAPIError: On a non-200 status (401 bad token, 409 another
+                poller or webhook, 429 flood control), ``ok: false``, or
+                when there is no HTTP session
+        """
         import aiohttp
 
         if not self._session:
-            return []
+            raise TelegramAPIError("No HTTP session (plugin not set up)")
 
         url = f"https://api.telegram.org/bot{self._bot_token}/getUpdates"
         params = {
             "offset": self._last_update_id + 1,
-            "timeout": 1,  # Short poll in tick mode
+            "timeout": timeout,
             "allowed_updates": ["message"],
         }
 
         async with self._session.get(
-            url, params=params, timeout=aiohttp.ClientTimeout(total=5)
+            url, params=params, timeout=aiohttp.ClientTimeout(total=timeout + 10)
         ) as resp:
-            if resp.status != 200:
-                logger.warning("Telegram API returned %d", resp.status)
-                return []
-            data = await resp.json()
-
-        if not data.get("ok"):
-            logger.warning("Telegram API error: %s", data.get("description", "unknown"))
-            return []
+            try:
+                data = await resp.json(content_type=None)
+            except ValueError:
+                data = {}
+            status = resp.status
+
+        if status != 200 or not data.get("ok"):
+            hints = data.get("parameters") or {}
+            raise TelegramAPIError(
+                f"getUpdates returned {status}: {data.get('description', 'unknown')}",
+                retry_after=float(hints.get("retry_after", 0)),
+            )
 
         updates = data.get("result", [])
         if updates:
@@ -349,12 +466,17 @@ class TelegramPlugin(PluginBase):
             logger.warning("No LLM pipeline available, using fallback")
             await self._send_message(chat_id, "I'm not available right now.", reply_to=message_id)
             return
-        result = await self.ctx.llm_pipeline.chat(
-            messages=messages,
-            user_id=str(user_id),
-            audit_action="telegram_response",
-            audit_details={"chat_id": chat_id, "username": username},
-        )
+        async with self._llm_slots:
+            self._llm_in_flight += 1
+            try:
+                result = await self.ctx.llm_pipeline.chat(
+                    messages=messages,
+                    user_id=str(user_id),
+                    audit_action="telegram_response",
+                    audit_details={"chat_id": chat_id, "username": username},
+                )
+            finally:
+                self._llm_in_flight -= 1
 
         if result.blocked:
             logger.warning("Response blocked by pipeline: %s", result.block_reason)
@@ -463,13 +585,24 @@ class TelegramPlugin(PluginBase):
             "messages_sent": self._messages_sent,
             "active_conversations": len(self._conversations),
             "errors": self._errors,
+            "long_poll": bool(self._polling_task and not self._polling_task.done()),
+            "queued_updates": sum(len(q) for q in self._chat_queues.values()),
+            "llm_in_flight": self._llm_in_flight,
         }
 
     async def teardown(self) -> None:
         """Cleanup resources."""
         self._running = False
+        tasks = [*self._chat_workers.values()]
         if self._polling_task and not self._polling_task.done():
-            self._polling_task.cancel()
+            tasks.append(self._polling_task)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._polling_task = None
+        self._chat_workers.clear()
+        self._chat_queues.clear()
         self._conversations.clear()
         if self._session and not self._session.closed:
             await self._session.close()
@@ -9,11 +9,20 @@ SECURITY: Messages include an auth_token field. The server validates
 the token before processing any message. Tokens are generated at
 supervisor startup and shared with child processes via a token file
 (mode 0o600 on Unix) in the socket directory — never via environment variables.
+
+Two connection styles share the same JSON-line framing:
+- One-shot: connect, send one message, read one reply, close.
+- Session: the first message is ``session_open`` (authenticated once).
+  The connection then stays open; requests are matched to replies by
+  request_id so many can be in flight at once, and the server can push
+  messages (e.g. routed agent messages) without being polled.
 """
 
 import asyncio
 import hashlib
 import hmac
+import inspect
+import itertools
 import json
 import logging
 import os
@@ -22,7 +31,7 @@ import socket
 import tempfile
 import time
 from collections import deque
-from collections.abc import Callable, Coroutine
+from collections.abc import Awaitable, Callable, Coroutine
 from datetime import UTC, datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
@@ -44,6 +53,13 @@ _SOCKET_DIR = Path(tempfile.gettempdir()) / "overblick"
 # Maximum IPC message size (1 MB) — prevents OOM via oversized messages
 _MAX_MESSAGE_SIZE = 1024 * 1024
 
+# Session protocol message types
+SESSION_OPEN = "session_open"
+SESSION_ACK = "session_ack"
+# Sent on a session in place of a reply (no handler / handler returned
+# None / rate limited), so the client's pending request resolves at once
+NO_RESPONSE = "no_response"
+
 
 def generate_ipc_token() -> str:
     """Generate a cryptographically secure IPC authentication token."""
@@ -278,6 +294,30 @@ class IPCMessage(BaseModel):
 # Type alias for message handlers
 MessageHandler = Callable[[IPCMessage], Coroutine[Any, Any, IPCMessage | None]]
 
+# Called with the agent name when a session opens (server side)
+SessionOpenHandler = Callable[[str], Awaitable[None]]
+
+# Called with each server-pushed message (client side); may be async
+PushHandler = Callable[[IPCMessage], Awaitable[None] | None]
+
+
+class _IPCSession:
+    """Server side of one persistent agent connection."""
+
+    def __init__(self, agent: str, writer: asyncio.StreamWriter):
+        self.agent = agent
+        self.writer = writer
+        self._write_lock = asyncio.Lock()
+
+    async def send(self, message: IPCMessage) -> None:
+        """Write one message line (serialized against concurrent replies)."""
+        async with self._write_lock:
+            self.writer.write((message.to_json() + "\n").encode())
+            await self.writer.drain()
+
+    def close(self) -> None:
+        self.writer.close()
+
 
 class IPCServer:
     """
@@ -309,11 +349,45 @@ class IPCServer:
         self._rate_limiter = _IPCRateLimiter(max_per_minute=rate_limit_per_minute)
         self._rate_limited_count = 0
         self._tcp_port: int | None = None
+        # Open sessions by agent name (one per agent; a reconnect replaces it)
+        self._sessions: dict[str, _IPCSession] = {}
+        self._session_open_handler: SessionOpenHandler | None = None
+        self._session_tasks: set[asyncio.Task[Any]] = set()
 
     @property
     def socket_path(self) -> Path:
         return self._socket_path
 
+    @property
+    def session_count(self) -> int:
+        return len(self._sessions)
+
+    def has_session(self, agent: str) -> bool:
+        """Whether an agent currently holds an open session."""
+        return agent in self._sessions
+
+    def on_session_open(self, handler: SessionOpenHandler) -> None:
+        """Register a callback run (in the background) when an agent opens a session."""
+        self._session_open_handler = handler
+
+    async def push(self, agent: str, message: IPCMessage) -> bool:
+        """
+        Push a message to an agent over its open session.
+
+        Returns:
+            True if the message was written, False if the agent has no
+            session or the connection failed.
+        """
+        session = self._sessions.get(agent)
+        if session is None:
+            return False
+        try:
+            await session.send(message)
+            return True
+        except (ConnectionError, OSError) as e:
+            logger.debug("IPC push to '%s' failed: %s", agent, e)
+            return False
+
     @property
     def rejected_count(self) -> int:
         return self._rejected_count
@@ -473,6 +547,12 @@ class IPCServer:
 
     async def stop(self) -> None:
         """Stop the server and cleanup socket/token/conn files."""
+        # Sessions hold their connections open; close them so the
+        # server's wait_closed() does not wait on them forever
+        for session in list(self._sessions.values()):
+            session.close()
+        for task in list(self._session_tasks):
+            task.cancel()
         if self._server:
             self._server.close()
             await self._server.wait_closed()
@@ -535,6 +615,10 @@ class IPCServer:
 
             logger.debug("IPC received: %s from %s", msg.msg_type, msg.sender)
 
+            if msg.msg_type == SESSION_OPEN:
+                await self._run_session(msg, reader, writer)
+                return
+
             handler = self._handlers.get(msg.msg_type)
             if handler:
                 response = await handler(msg)
@@ -567,6 +651,101 @@ class IPCServer:
             except Exception as e:
                 logger.debug("Error during IPC cleanup: %s", e)
 
+    async def _run_session(
+        self,
+        hello: IPCMessage,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """
+        Serve a persistent session until the client disconnects.
+
+        The session_open message has already passed auth and rate
+        limiting. Later messages are not re-authenticated, and their
+        sender is pinned to the session's agent so it cannot be spoofed.
+        Requests are dispatched concurrently; replies carry the request_id.
+        """
+        agent = hello.sender
+        session = _IPCSession(agent, writer)
+        if agent:
+            previous = self._sessions.get(agent)
+            if previous is not None:
+                previous.close()
+            self._sessions[agent] = session
+        logger.info("IPC session opened by '%s'", agent or "anonymous")
+
+        tasks: set[asyncio.Task[Any]] = set()
+        try:
+            await session.send(
+                IPCMessage(msg_type=SESSION_ACK, request_id=hello.request_id, sender=self._name)
+            )
+            if agent and self._session_open_handler:
+                self._track(tasks, self._session_open_handler(agent))
+
+            while True:
+                try:
+                    data = await reader.readuntil(b"\n")
+                except asyncio.IncompleteReadError:
+                    break  # client closed the session
+                try:
+                    request = IPCMessage.from_json(data.decode().strip())
+                except (json.JSONDecodeError, KeyError) as e:
+                    logger.warning("Invalid IPC session message from '%s': %s", agent, e)
+                    continue
+                request = request.model_copy(update={"sender": agent})
+
+                if not self._rate_limiter.allow(agent or "unknown"):
+                    self._rate_limited_count += 1
+                    logger.warning(
+                        "IPC rate limited sender '%s' (total: %d)",
+                        agent,
+                        self._rate_limited_count,
+                    )
+                    self._track(tasks, self._reply(session, request, None))
+                    continue
+
+                logger.debug("IPC session received: %s from %s", request.msg_type, agent)
+                self._track(tasks, self._dispatch_session_request(session, request))
+        finally:
+            if agent and self._sessions.get(agent) is session:
+                del self._sessions[agent]
+            for task in tasks:
+                task.cancel()
+            logger.info("IPC session closed by '%s'", agent or "anonymous")
+
+    def _track(self, tasks: set[asyncio.Task[Any]], coro: Coroutine[Any, Any, Any]) -> None:
+        """Run a coroutine as a task owned by a session."""
+        task = asyncio.create_task(coro)
+        tasks.add(task)
+        self._session_tasks.add(task)
+        task.add_done_callback(tasks.discard)
+        task.add_done_callback(self._session_tasks.discard)
+
+    async def _dispatch_session_request(self, session: _IPCSession, request: IPCMessage) -> None:
+        """Run the handler for one session request and send its reply."""
+        response: IPCMessage | None = None
+        handler = self._handlers.get(request.msg_type)
+        if handler is None:
+            logger.warning("No handler for message type: %s", request.msg_type)
+        else:
+            try:
+                response = await handler(request)
+            except Exception as e:
+                logger.error("IPC handler error: %s", e, exc_info=True)
+        await self._reply(session, request, response)
+
+    async def _reply(
+        self, session: _IPCSession, request: IPCMessage, response: IPCMessage | None
+    ) -> None:
+        """Send a reply tagged with the request's id (NO_RESPONSE if None)."""
+        if response is None:
+            response = IPCMessage(msg_type=NO_RESPONSE, sender=self._name)
+        response = response.model_copy(update={"request_id": request.request_id})
+        try:
+            await session.send(response)
+        except (ConnectionError, OSError):
+            logger.debug("IPC session to '%s' closed before reply could be sent", session.agent)
+
 
 class IPCClient:
     """
@@ -576,14 +755,26 @@ class IPCClient:
     or TCP localhost (Windows) to send messages and receive responses.
 
     If auth_token is set, it is included in all outgoing messages.
+
+    With persistent=True the client keeps one session open instead of
+    connecting per message: it authenticates once, multiplexes requests
+    by request_id, receives server pushes (routed agent messages land in
+    take_routed_messages()), and reconnects with backoff if the
+    connection drops. If the server does not accept sessions, it falls
+    back to one-shot connections.
     """
 
+    _RECONNECT_INITIAL_DELAY = 0.5
+
     def __init__(
         self,
         target: str = "supervisor",
         socket_dir: Path | None = None,
         auth_token: str = "",
         tcp_port: int | None = None,
+        identity: str = "",
+        persistent: bool = False,
+        reconnect_max_delay: float = 30.0,
     ):
         self._socket_dir = socket_dir or _SOCKET_DIR
         self._target = target
@@ -591,6 +782,33 @@ class IPCClient:
         self._conn_path = self._socket_dir / f"overblick-{target}.conn"
         self._auth_token = auth_token
         self._tcp_port = tcp_port
+        self._identity = identity
+
+        # Persistent session state
+        self._persistent = persistent
+        self._reconnect_max_delay = reconnect_max_delay
+        self._writer: asyncio.StreamWriter | None = None
+        self._reader_task: asyncio.Task[None] | None = None
+        self._reconnect_task: asyncio.Task[None] | None = None
+        self._session_lock = asyncio.Lock()
+        self._write_lock = asyncio.Lock()
+        self._inflight: dict[str, asyncio.Future[IPCMessage | None]] = {}
+        self._request_ids = itertools.count(1)
+        self._push_handlers: dict[str, PushHandler] = {}
+        self._push_tasks: set[asyncio.Task[Any]] = set()
+        self._routed_inbox: list[dict[str, Any]] = []
+        self._routed_event = asyncio.Event()
+        self._closed = False
+
+    @property
+    def connected(self) -> bool:
+        """Whether a persistent session is currently open."""
+        return self._writer is not None and not self._writer.is_closing()
+
+    @property
+    def receives_pushes(self) -> bool:
+        """Whether routed messages currently arrive by push (no polling needed)."""
+        return self._persistent and bool(self._identity) and self.connected
 
     async def _open_connection(self, timeout: float) -> tuple:
         """Open a connection using the appropriate transport.
@@ -602,12 +820,12 @@ class IPCClient:
             if port is None:
                 raise FileNotFoundError(f"No connection file found: {self._conn_path}")
             return await asyncio.wait_for(
-                asyncio.open_connection("127.0.0.1", port),
+                asyncio.open_connection("127.0.0.1", port, limit=_MAX_MESSAGE_SIZE),
                 timeout=timeout,
             )
         else:
             return await asyncio.wait_for(
-                asyncio.open_unix_connection(str(self._socket_path)),
+                asyncio.open_unix_connection(str(self._socket_path), limit=_MAX_MESSAGE_SIZE),
                 timeout=timeout,
             )
 
@@ -633,6 +851,12 @@ class IPCClient:
         If auth_token is configured, it is injected into the message.
         Returns the response message, or None if no response.
         """
+        if self._persistent and not self._closed and await self._ensure_session(timeout):
+            return await self._send_on_session(message, timeout)
+        return await self._send_once(message, timeout)
+
+    async def _send_once(self, message: IPCMessage, timeout: float) -> IPCMessage | None:
+        """Send a message over a fresh one-shot connection."""
         # Inject auth token (copy to avoid mutating caller's message object)
         if self._auth_token and not message.auth_token:
             message = message.model_copy(update={"auth_token": self._auth_token})
@@ -694,3 +918,179 @@ class IPCClient:
         if response and response.msg_type == "permission_response":
             return response.payload.get("granted", False)
         return False
+
+    # ── Persistent session ───────────────────────────────────────────────
+
+    def on_push(self, msg_type: str, handler: PushHandler) -> None:
+        """Register a callback for server-pushed messages of a type."""
+        self._push_handlers[msg_type] = handler
+
+    def take_routed_messages(self) -> list[dict[str, Any]]:
+        """Return and clear routed agent messages received by push."""
+        messages, self._routed_inbox = self._routed_inbox, []
+        self._routed_event.clear()
+        return messages
+
+    async def wait_routed_messages(self, timeout: float | None = None) -> list[dict[str, Any]]:
+        """Wait until routed messages have been pushed, then take them."""
+        if not self._routed_inbox:
+            try:
+                await asyncio.wait_for(self._routed_event.wait(), timeout=timeout)
+            except TimeoutError:
+                return []
+        return self.take_routed_messages()
+
+    async def connect(self, timeout: float = 5.0) -> bool:
+        """Open the persistent session now (so pushes start flowing)."""
+        if not self._persistent or self._closed:
+            return False
+        return await self._ensure_session(timeout)
+
+    async def close(self) -> None:
+        """Close the persistent session and stop reconnecting."""
+        self._closed = True
+        for task in (self._reconnect_task, self._reader_task):
+            if task and not task.done():
+                task.cancel()
+        self._reconnect_task = None
+        self._drop_session()
+        for task in list(self._push_tasks):
+            task.cancel()
+
+    def _next_request_id(self) -> str:
+        return f"{self._identity or 'client'}-{next(self._request_ids)}"
+
+    async def _ensure_session(self, timeout: float) -> bool:
+        """Open the session if needed. Returns False if none could be opened."""
+        if self.connected:
+            return True
+        async with self._session_lock:
+            if self.connected:
+                return True
+            try:
+                reader, writer = await self._open_connection(timeout)
+            except (FileNotFoundError, ConnectionError, TimeoutError, OSError) as e:
+                logger.debug("IPC session connect to %s failed: %s", self._target, e)
+                return False
+
+            hello = IPCMessage(
+                msg_type=SESSION_OPEN,
+                sender=self._identity,
+                auth_token=self._auth_token,
+                request_id=self._next_request_id(),
+            )
+            ack: IPCMessage | None = None
+            try:
+                writer.write((hello.to_json() + "\n").encode())
+                await writer.drain()
+                data = await asyncio.wait_for(reader.readline(), timeout=timeout)
+                if data:
+                    ack = IPCMessage.from_json(data.decode().strip())
+            except (TimeoutError, ConnectionError, OSError, json.JSONDecodeError, KeyError) as e:
+                logger.debug("IPC session handshake with %s failed: %s", self._target, e)
+
+            if ack is None or ack.msg_type != SESSION_ACK:
+                writer.close()
+                logger.warning(
+                    "IPC session to %s not accepted — using one-shot connections", self._target
+                )
+                self._persistent = False
+                return False
+
+            self._writer = writer
+            self._reader_task = asyncio.create_task(self._read_loop(reader, writer))
+            logger.info("IPC session open to %s", self._target)
+            return True
+
+    async def _send_on_session(self, message: IPCMessage, timeout: float) -> IPCMessage | None:
+        """Send a request on the open session and wait for its reply."""
+        request_id = message.request_id
+        if not request_id or request_id in self._inflight:
+            request_id = self._next_request_id()
+        # The session was authenticated when it opened
+        message = message.model_copy(update={"request_id": request_id, "auth_token": ""})
+
+        future: asyncio.Future[IPCMessage | None] = asyncio.get_running_loop().create_future()
+        self._inflight[request_id] = future
+        try:
+            writer = self._writer
+            if writer is None:
+                return None
+            async with self._write_lock:
+                writer.write((message.to_json() + "\n").encode())
+                await writer.drain()
+            return await asyncio.wait_for(future, timeout=timeout)
+        except TimeoutError:
+            logger.warning("IPC timeout waiting for response to %s", message.msg_type)
+        except (ConnectionError, OSError) as e:
+            logger.debug("IPC session send failed: %s", e)
+        finally:
+            self._inflight.pop(request_id, None)
+        return None
+
+    async def _read_loop(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Route replies to waiting requests and pushes to handlers."""
+        try:
+            while True:
+                data = await reader.readline()
+                if not data:
+                    break
+                try:
+                    msg = IPCMessage.from_json(data.decode().strip())
+                except (json.JSONDecodeError, KeyError) as e:
+                    logger.warning("Invalid IPC message from %s: %s", self._target, e)
+                    continue
+
+                future = self._inflight.pop(msg.request_id, None) if msg.request_id else None
+                if future is not None:
+                    if not future.done():
+                        future.set_result(None if msg.msg_type == NO_RESPONSE else msg)
+                    continue
+                self._handle_push(msg)
+        except (ConnectionError, OSError, ValueError) as e:
+            logger.debug("IPC session to %s lost: %s", self._target, e)
+        finally:
+            if self._writer is writer:
+                self._drop_session()
+                if not self._closed:
+                    logger.warning("IPC session to %s closed — reconnecting", self._target)
+                    self._reconnect_task = asyncio.create_task(self._reconnect_loop())
+
+    def _handle_push(self, msg: IPCMessage) -> None:
+        """Deliver a server-pushed message."""
+        if msg.msg_type == "routed_messages":
+            self._routed_inbox.extend(msg.payload.get("messages", []))
+            self._routed_event.set()
+        handler = self._push_handlers.get(msg.msg_type)
+        if handler is None:
+            if msg.msg_type != "routed_messages":
+                logger.debug("Unhandled IPC push: %s", msg.msg_type)
+            return
+        try:
+            result = handler(msg)
+        except Exception as e:
+            logger.error("IPC push handler error: %s", e, exc_info=True)
+            return
+        if inspect.isawaitable(result):
+            task = asyncio.ensure_future(result)
+            self._push_tasks.add(task)
+            task.add_done_callback(self._push_tasks.discard)
+
+    def _drop_session(self) -> None:
+        """Forget the current connection and fail requests waiting on it."""
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.close()
+        inflight, self._inflight = self._inflight, {}
+        for future in inflight.values():
+            if not future.done():
+                future.set_result(None)
+
+    async def _reconnect_loop(self) -> None:
+        """Reopen the session with exponential backoff until it succeeds."""
+        delay = self._RECONNECT_INITIAL_DELAY
+        while not self._closed and self._persistent:
+            await asyncio.sleep(delay)
+            if await self._ensure_session(timeout=5.0):
+                return
+            delay = min(delay * 2, self._reconnect_max_delay)
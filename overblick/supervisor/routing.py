@@ -26,6 +26,7 @@ Usage by plugins:
 
 import logging
 import time
+from collections.abc import Callable
 from enum import Enum
 from typing import Any, Optional
 
@@ -96,19 +97,25 @@ class MessageRouter:
     Routes messages between agents via the Supervisor.
 
     All routing goes through a central queue. Messages are delivered
-    when the target agent polls or when pushed via IPC.
+    when the target agent polls or when pushed via IPC: on_pending is
+    called with the target's identity each time a message is queued.
     """
 
     MAX_DELIVERED = 1000
     MAX_DEAD_LETTERS = 1000
 
-    def __init__(self, audit_log: Any = None):
+    def __init__(
+        self,
+        audit_log: Any = None,
+        on_pending: Callable[[str], None] | None = None,
+    ):
         self._capabilities: dict[str, AgentCapabilities] = {}
         self._pending: list[RoutedMessage] = []
         self._dead_letters: list[RoutedMessage] = []
         self._delivered: list[RoutedMessage] = []
         self._audit = audit_log
         self._message_counter = 0
+        self.on_pending = on_pending
 
     def register_agent(
         self,
@@ -192,6 +199,8 @@ class MessageRouter:
         self._pending.append(msg)
         self._cleanup_if_needed()
         self._log_route(msg, success=True)
+        if self.on_pending:
+            self.on_pending(target)
         return msg
 
     def broadcast(
@@ -252,6 +261,22 @@ class MessageRouter:
         self._pending = remaining
         return collected
 
+    def requeue(self, messages: list[RoutedMessage]) -> None:
+        """
+        Put collected messages back at the front of the queue.
+
+        Used when a push delivery fails after collect() so the messages
+        are not lost.
+        """
+        if not messages:
+            return
+        ids = {id(m) for m in messages}
+        self._delivered = [m for m in self._delivered if id(m) not in ids]
+        for msg in messages:
+            msg.status = RouteStatus.PENDING
+            msg.delivered_at = None
+        self._pending[:0] = messages
+
     def get_pending_count(self, agent: str | None = None) -> int:
         """Get count of pending messages, optionally filtered by agent."""
         if agent:
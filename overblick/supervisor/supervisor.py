@@ -24,7 +24,7 @@ from overblick.supervisor.health_handler import HealthInquiryHandler
 from overblick.supervisor.ipc import IPCMessage, IPCServer, generate_ipc_token
 from overblick.supervisor.process import AgentProcess, ProcessState
 from overblick.supervisor.research_handler import ResearchHandler
-from overblick.supervisor.routing import MessageRouter, RouteStatus
+from overblick.supervisor.routing import MessageRouter, RoutedMessage, RouteStatus
 
 logger = logging.getLogger(__name__)
 
@@ -84,8 +84,12 @@ class Supervisor:
         # Research handler (lazy LLM initialization)
         self._research_handler = ResearchHandler(audit_log=self._audit_log)
 
-        # Inter-agent message router
-        self._message_router = MessageRouter(audit_log=self._audit_log)
+        # Inter-agent message router (pushes to agents with an IPC session)
+        self._message_router = MessageRouter(
+            audit_log=self._audit_log,
+            on_pending=self._on_message_pending,
+        )
+        self._push_tasks: set[asyncio.Task] = set()
 
     @property
     def state(self) -> SupervisorState:
@@ -111,6 +115,7 @@ class Supervisor:
         self._ipc.on("route_message", self._handle_route_message)
         self._ipc.on("collect_messages", self._handle_collect_messages)
         self._ipc.on("shutdown", self._handle_shutdown)
+        self._ipc.on_session_open(self._push_routed_messages)
 
         self._audit_log.log("supervisor_starting", category="lifecycle")
 
@@ -208,6 +213,8 @@ class Supervisor:
 
         # Stop IPC server
         await self._ipc.stop()
+        for push_task in list(self._push_tasks):
+            push_task.cancel()
 
         # Cancel and await remaining monitor tasks
         for task in self._monitor_tasks.values():
@@ -471,22 +478,57 @@ class Supervisor:
 
         return IPCMessage(
             msg_type="collect_response",
-            payload={
-                "messages": [
-                    {
-                        "message_id": m.message_id,
-                        "source_agent": m.source_agent,
-                        "message_type": m.message_type,
-                        "payload": m.payload,
-                        "created_at": m.created_at,
-                    }
-                    for m in messages
-                ],
-                "count": len(messages),
-            },
+            payload=self._routed_payload(messages),
             sender="supervisor",
         )
 
+    @staticmethod
+    def _routed_payload(messages: list[RoutedMessage]) -> dict:
+        """Wire format for routed messages (collect response and push)."""
+        return {
+            "messages": [
+                {
+                    "message_id": m.message_id,
+                    "source_agent": m.source_agent,
+                    "message_type": m.message_type,
+                    "payload": m.payload,
+                    "created_at": m.created_at,
+                }
+                for m in messages
+            ],
+            "count": len(messages),
+        }
+
+    def _on_message_pending(self, target: str) -> None:
+        """Router callback: push to the target now if it holds a session."""
+        if not self._ipc.has_session(target):
+            return  # delivered when the agent polls or opens a session
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self._push_routed_messages(target))
+        self._push_tasks.add(task)
+        task.add_done_callback(self._push_tasks.discard)
+
+    async def _push_routed_messages(self, agent: str) -> None:
+        """Push an agent's pending routed messages over its IPC session."""
+        if not self._ipc.has_session(agent):
+            return
+        messages = self._message_router.collect(agent)
+        if not messages:
+            return
+        pushed = await self._ipc.push(
+            agent,
+            IPCMessage(
+                msg_type="routed_messages",
+                payload=self._routed_payload(messages),
+                sender="supervisor",
+            ),
+        )
+        if not pushed:
+            self._message_router.requeue(messages)
+
     async def _handle_shutdown(self, msg: IPCMessage) -> IPCMessage | None:
         """Handle shutdown request."""
         logger.info("Shutdown requested by '%s'", msg.sender)
@@ -100,11 +100,21 @@ def _mock_imap(search_uids=None, fetch_data=None):
             if cmd == "search":
                 return ("OK", [uid_bytes])
             elif cmd == "fetch":
+                # Batched UID set ("1,2,3"); answer like a server, one
+                # literal per message tagged with its UID
                 uid_arg = args[0]
-                uid_key = uid_arg.encode() if isinstance(uid_arg, str) else uid_arg
-                if fetch_data and uid_key in fetch_data:
-                    return ("OK", [(b"1 (RFC822 {1234})", fetch_data[uid_key])])
-                return ("OK", None)
+                uid_set = uid_arg.encode() if isinstance(uid_arg, str) else uid_arg
+                headers_only = "HEADER" in args[1]
+                data = []
+                for seq, uid_key in enumerate(uid_set.split(b","), start=1):
+                    if not fetch_data or uid_key not in fetch_data:
+                        continue
+                    raw = fetch_data[uid_key]
+                    if headers_only:
+                        raw = raw.split(b"\n\n", 1)[0] + b"\n\n"
+                    data.append((b"%d (UID %s BODY[] {%d}" % (seq, uid_key, len(raw)), raw))
+                    data.append(b")")
+                return ("OK", data or [None])
             elif cmd == "store":
                 return ("OK", [b"1"])
             return ("NO", [])
@@ -907,3 +917,105 @@ class TestTeardown:
         await cap.teardown()
 
         assert cap._uid_map == {}
+
+    @pytest.mark.asyncio
+    async def test_teardown_closes_imap_session(self):
+        """teardown() logs out of the persistent IMAP session."""
+        ctx = _make_ctx()
+        cap = GmailCapability(ctx)
+        await cap.setup()
+
+        mock_imap = _mock_imap(search_uids=[])
+        with patch(
+            "overblick.capabilities.communication.gmail.imaplib.IMAP4_SSL", return_value=mock_imap
+        ):
+            await cap.fetch_unread()
+            await cap.teardown()
+
+        mock_imap.logout.assert_called_once()
+        assert cap._session is None
+
+
+class TestPersistentSession:
+    """IMAP work shares one logged-in connection."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_and_mark_reuse_connection(self):
+        """fetch_unread() and mark_as_read() log in once between them."""
+        ctx = _make_ctx()
+        cap = GmailCapability(ctx)
+        await cap.setup()
+
+        mock_imap = _mock_imap(
+            search_uids=[b"7"],
+            fetch_data={b"7": _build_raw_email(message_id="<reuse@example.com>")},
+        )
+        with patch(
+            "overblick.capabilities.communication.gmail.imaplib.IMAP4_SSL", return_value=mock_imap
+        ) as imap_cls:
+            await cap.fetch_unread()
+            await cap.fetch_unread()
+            assert await cap.mark_as_read("<reuse@example.com>") is True
+            await cap.teardown()
+
+        imap_cls.assert_called_once()
+        mock_imap.login.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_fetch_batches_uids(self):
+        """All selected messages come back from a single UID FETCH."""
+        ctx = _make_ctx()
+        cap = GmailCapability(ctx)
+        await cap.setup()
+
+        mock_imap = _mock_imap(
+            search_uids=[b"1", b"2", b"3"],
+            fetch_data={
+                uid: _build_raw_email(message_id=f"<b{uid.decode()}@example.com>")
+                for uid in (b"1", b"2", b"3")
+            },
+        )
+        with patch(
+            "overblick.capabilities.communication.gmail.imaplib.IMAP4_SSL", return_value=mock_imap
+        ):
+            results = await cap.fetch_unread()
+            await cap.teardown()
+
+        fetches = [c for c in mock_imap.uid.call_args_list if c.args[0] == "fetch"]
+        assert fetches == [call("fetch", "3,2,1", "(BODY.PEEK[])")]
+        assert [m.message_id for m in results] == [
+            "<b3@example.com>",
+            "<b2@example.com>",
+            "<b1@example.com>",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_skip_filters_before_body_fetch(self):
+        """Messages reported by skip() are never body-fetched."""
+        ctx = _make_ctx()
+        cap = GmailCapability(ctx)
+        await cap.setup()
+
+        mock_imap = _mock_imap(
+            search_uids=[b"1", b"2"],
+            fetch_data={
+                b"1": _build_raw_email(message_id="<old@example.com>"),
+                b"2": _build_raw_email(message_id="<new@example.com>"),
+            },
+        )
+
+        async def skip(message_ids):
+            assert sorted(message_ids) == ["<new@example.com>", "<old@example.com>"]
+            return {"<old@example.com>"}
+
+        with patch(
+            "overblick.capabilities.communication.gmail.imaplib.IMAP4_SSL", return_value=mock_imap
+        ):
+            results = await cap.fetch_unread(skip=skip)
+            await cap.teardown()
+
+        assert [m.message_id for m in results] == ["<new@example.com>"]
+        body_fetches = [
+            c for c in mock_imap.uid.call_args_list if c.args[:3] == ("fetch", "2", "(BODY.PEEK[])")
+        ]
+        assert len(body_fetches) == 1
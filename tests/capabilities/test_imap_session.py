@@ -0,0 +1,359 @@
+"""
+Tests for the persistent IMAP session (IDLE push, reconnect, batching).
+
+Runs against a small in-process IMAP stand-in over plain TCP, so the real
+imaplib client code paths are exercised without a network.
+"""
+
+import asyncio
+import imaplib
+import re
+import socket
+import socketserver
+import threading
+from email.mime.text import MIMEText
+
+import pytest
+
+from overblick.capabilities.communication.gmail import GmailCapability
+from overblick.capabilities.communication.imap_session import ImapSession
+from tests.capabilities.test_gmail_capability import _make_ctx
+
+_COMMAND = re.compile(rb"^(\S+) (UID )?(\S+) ?(.*)$")
+
+
+def _raw_email(n: int) -> bytes:
+    msg = MIMEText(f"Body {n}", "plain", "utf-8")
+    msg["From"] = f"sender{n}@example.com"
+    msg["Subject"] = f"Subject {n}"
+    msg["Message-ID"] = f"<m{n}@example.com>"
+    msg["Date"] = "Mon, 10 Feb 2026 14:30:00 +0100"
+    return msg.as_bytes().replace(b"\n", b"\r\n")
+
+
+class FakeImapServer(socketserver.ThreadingTCPServer):
+    """Just enough IMAP4rev1 + IDLE for the session and GmailCapability."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, messages: dict[int, bytes], idle: bool = True):
+        super().__init__(("127.0.0.1", 0), _FakeImapHandler)
+        self.messages = messages
+        self.idle = idle
+        self.commands: list[str] = []
+        self.logins = 0
+        self.seen: set[int] = set()
+        self.idling = threading.Event()
+        self.done = threading.Event()
+        self._clients: list[_FakeImapHandler] = []
+        self._lock = threading.Lock()
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+    def connect(self) -> imaplib.IMAP4:
+        imap = imaplib.IMAP4("127.0.0.1", self.port, timeout=5)
+        imap.login("user", "secret")
+        imap.select("INBOX")
+        return imap
+
+    def deliver(self, n: int, raw: bytes) -> None:
+        """Add a message and notify idling clients, like a real server."""
+        self.messages[n] = raw
+        with self._lock:
+            for client in self._clients:
+                if client.in_idle:
+                    client.send(b"* %d EXISTS\r\n" % len(self.messages))
+
+    def drop_clients(self) -> None:
+        """Simulate the server side closing every connection."""
+        with self._lock:
+            for client in self._clients:
+                client.request.shutdown(socket.SHUT_RDWR)
+            self._clients.clear()
+
+
+class _FakeImapHandler(socketserver.StreamRequestHandler):
+    server: FakeImapServer
+
+    def setup(self) -> None:
+        super().setup()
+        self.in_idle = False
+        self._send_lock = threading.Lock()
+        with self.server._lock:
+            self.server._clients.append(self)
+
+    def send(self, data: bytes) -> None:
+        with self._send_lock:
+            self.wfile.write(data)
+            self.wfile.flush()
+
+    def handle(self) -> None:
+        caps = b"IMAP4rev1 IDLE" if self.server.idle else b"IMAP4rev1"
+        self.send(b"* OK [CAPABILITY " + caps + b"] fake ready\r\n")
+        try:
+            while True:
+                line = self.rfile.readline()
+                if not line:
+                    return
+                match = _COMMAND.match(line.rstrip(b"\r\n"))
+                if not match:
+                    continue
+                tag, uid, cmd, args = match.groups()
+                cmd = cmd.upper()
+                self.server.commands.append(((uid or b"") + cmd + b" " + args).decode().strip())
+                if not self._dispatch(tag, cmd, args, caps):
+                    return
+        except OSError:
+            return
+
+    def _dispatch(self, tag: bytes, cmd: bytes, args: bytes, caps: bytes) -> bool:
+        ok = tag + b" OK done\r\n"
+        if cmd == b"CAPABILITY":
+            self.send(b"* CAPABILITY " + caps + b"\r\n" + ok)
+        elif cmd == b"LOGIN":
+            self.server.logins += 1
+            self.send(ok)
+        elif cmd == b"SELECT":
+            self.send(b"* %d EXISTS\r\n" % len(self.server.messages) + ok)
+        elif cmd == b"SEARCH":
+            unseen = sorted(n for n in self.server.messages if n not in self.server.seen)
+            self.send(b"* SEARCH " + b" ".join(b"%d" % n for n in unseen) + b"\r\n" + ok)
+        elif cmd == b"FETCH":
+            uid_set, _, items = args.partition(b" ")
+            for seq, uid in enumerate(uid_set.split(b","), start=1):
+                raw = self.server.messages.get(int(uid))
+                if raw is None:
+                    continue
+                if b"HEADER" in items:
+                    raw = raw.split(b"\r\n\r\n", 1)[0] + b"\r\n\r\n"
+                self.send(b"* %d FETCH (UID %s BODY[] {%d}\r\n" % (seq, uid, len(raw)))
+                self.send(raw + b")\r\n")
+            self.send(ok)
+        elif cmd == b"STORE":
+            uid_set = args.split(b" ", 1)[0]
+            self.server.seen.update(int(uid) for uid in uid_set.split(b","))
+            self.send(ok)
+        elif cmd == b"IDLE":
+            if not self.server.idle:
+                self.send(tag + b" BAD unknown command\r\n")
+                return True
+            self.in_idle = True
+            self.send(b"+ idling\r\n")
+            self.server.idling.set()
+            done = self.rfile.readline()
+            self.in_idle = False
+            self.server.idling.clear()
+            if done.strip().upper() != b"DONE":
+                return False
+            self.server.done.set()
+            self.send(tag + b" OK IDLE terminated\r\n")
+        elif cmd == b"LOGOUT":
+            self.send(b"* BYE logging out\r\n" + ok)
+            return False
+        else:
+            self.send(ok)
+        return True
+
+
+@pytest.fixture
+def server():
+    srv = FakeImapServer({1: _raw_email(1), 2: _raw_email(2), 3: _raw_email(3)})
+    thread = threading.Thread(target=srv.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield srv
+    srv.shutdown()
+    srv.server_close()
+
+
+@pytest.fixture
+def session(server):
+    sess = ImapSession(server.connect, name="test")
+    yield sess
+    sess.close()
+
+
+def _search(imap):
+    return imap.uid("search", "UNSEEN")[1][0].split()
+
+
+class TestImapSession:
+    @pytest.mark.asyncio
+    async def test_jobs_share_one_connection(self, server, session):
+        """Many jobs, one TCP connection and one LOGIN."""
+        for _ in range(5):
+            assert await session.run(_search) == [b"1", b"2", b"3"]
+
+        assert session.connects == 1
+        assert server.logins == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_jobs_run_in_order(self, session):
+        """Jobs submitted together run one at a time, in submission order."""
+        order = []
+
+        def job(n):
+            def run(imap):
+                order.append(n)
+                imap.noop()
+                return n
+
+            return run
+
+        results = await asyncio.gather(*(session.run(job(n)) for n in range(10)))
+
+        assert results == list(range(10))
+        assert order == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_reconnects_after_drop(self, server, session):
+        """A connection closed by the server is reopened and the job retried."""
+        await session.run(_search)
+        server.drop_clients()
+
+        assert await session.run(_search) == [b"1", b"2", b"3"]
+        assert session.connects == 2
+
+    @pytest.mark.asyncio
+    async def test_job_errors_propagate(self, session):
+        """Non-connection errors go back to the caller without a reconnect."""
+
+        def bad(imap):
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            await session.run(bad)
+        assert session.connects == 1
+
+    @pytest.mark.asyncio
+    async def test_idle_push_on_new_mail(self, server, session):
+        """New mail announced during IDLE reaches the push handler."""
+        pushed = threading.Event()
+        session.set_push_handler(pushed.set)
+        assert server.idling.wait(5)
+
+        server.deliver(4, _raw_email(4))
+
+        assert pushed.wait(5)
+        assert session.idle_events == 1
+        assert server.done.is_set()
+
+    @pytest.mark.asyncio
+    async def test_job_interrupts_idle(self, server, session):
+        """A job submitted mid-IDLE ends it with DONE, runs, and IDLE resumes."""
+        session.set_push_handler(lambda: None)
+        assert server.idling.wait(5)
+
+        assert await session.run(_search) == [b"1", b"2", b"3"]
+
+        assert server.done.is_set()
+        assert server.idling.wait(5)
+        assert session.connects == 1
+
+    @pytest.mark.asyncio
+    async def test_idle_unsupported_disables_push(self, session):
+        """Without IDLE the session still serves jobs, just without push."""
+        srv = FakeImapServer({1: _raw_email(1)}, idle=False)
+        threading.Thread(target=srv.serve_forever, args=(0.05,), daemon=True).start()
+        sess = ImapSession(srv.connect, name="no-idle")
+        try:
+            sess.set_push_handler(lambda: None)
+            assert await sess.run(_search) == [b"1"]
+            assert sess.idling is False
+        finally:
+            sess.close()
+            srv.shutdown()
+            srv.server_close()
+
+    @pytest.mark.asyncio
+    async def test_close_logs_out_and_rejects_jobs(self, server, session):
+        await session.run(_search)
+
+        session.close()
+
+        assert "LOGOUT" in server.commands
+        with pytest.raises(RuntimeError):
+            session.submit(_search)
+
+    @pytest.mark.asyncio
+    async def test_idle_thread_exits_after_linger(self, server):
+        """Without push, an unused connection is logged out and the thread ends."""
+        sess = ImapSession(server.connect, name="linger", linger=0.05)
+        try:
+            await sess.run(_search)
+            thread = sess._thread
+            thread.join(5)
+
+            assert not thread.is_alive()
+            assert not sess.connected
+            assert await sess.run(_search) == [b"1", b"2", b"3"]
+            assert sess.connects == 2
+        finally:
+            sess.close()
+
+
+class TestGmailOverSession:
+    """GmailCapability end to end against the stand-in server."""
+
+    @pytest.fixture
+    async def gmail(self, server):
+        cap = GmailCapability(_make_ctx())
+        await cap.setup()
+        cap._imap_connect = server.connect
+        yield cap
+        await cap.teardown()
+
+    @pytest.mark.asyncio
+    async def test_fetch_batches_bodies_into_one_uid_fetch(self, server, gmail):
+        messages = await gmail.fetch_unread(max_results=10)
+
+        assert [m.message_id for m in messages] == [
+            "<m3@example.com>",
+            "<m2@example.com>",
+            "<m1@example.com>",
+        ]
+        fetches = [c for c in server.commands if c.startswith("UID FETCH")]
+        assert fetches == ["UID FETCH 3,2,1 (BODY.PEEK[])"]
+
+    @pytest.mark.asyncio
+    async def test_skip_fetches_headers_before_bodies(self, server, gmail):
+        async def skip(message_ids):
+            return {"<m2@example.com>"}
+
+        messages = await gmail.fetch_unread(max_results=10, skip=skip)
+
+        assert [m.message_id for m in messages] == ["<m3@example.com>", "<m1@example.com>"]
+        fetches = [c for c in server.commands if c.startswith("UID FETCH")]
+        assert fetches == [
+            "UID FETCH 3,2,1 (BODY.PEEK[HEADER.FIELDS (MESSAGE-ID)])",
+            "UID FETCH 3,1 (BODY.PEEK[])",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_mark_as_read_share_one_store(self, server, gmail):
+        await gmail.fetch_unread(max_results=10)
+
+        results = await asyncio.gather(
+            gmail.mark_as_read("<m1@example.com>"),
+            gmail.mark_as_read("<m3@example.com>"),
+        )
+
+        assert results == [True, True]
+        stores = [c for c in server.commands if c.startswith("UID STORE")]
+        assert stores == ["UID STORE 1,3 +FLAGS \\Seen"]
+        assert server.seen == {1, 3}
+        assert server.logins == 1
+
+    @pytest.mark.asyncio
+    async def test_on_new_mail_calls_back_on_loop(self, server, gmail):
+        arrived = asyncio.Event()
+
+        assert gmail.on_new_mail(arrived.set) is True
+        assert await asyncio.to_thread(server.idling.wait, 5)
+        server.deliver(4, _raw_email(4))
+
+        await asyncio.wait_for(arrived.wait(), 5)
+        messages = await gmail.fetch_unread(max_results=1)
+        assert messages[0].message_id == "<m4@example.com>"
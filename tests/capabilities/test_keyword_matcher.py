@@ -0,0 +1,116 @@
+"""
+Tests for KeywordMatcher — batched exact + fuzzy keyword matching.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from rapidfuzz import fuzz
+
+from overblick.capabilities.engagement import keyword_matcher
+from overblick.capabilities.engagement.decision_engine import DecisionEngine
+from overblick.capabilities.engagement.keyword_matcher import KeywordMatch, KeywordMatcher
+
+KEYWORDS = ["crypto", "philosophy", "ai", "consciousness", "blockchain"]
+
+TEXTS = [
+    "the future of crypto and ai",
+    "thoughts on philosophical questions and consciousnes",
+    "my cat photos",
+    "blockchains, cryptography and more",
+    "",
+]
+
+
+def _reference(text: str, keywords: list[str], threshold: int = 75) -> KeywordMatch:
+    """The pre-matcher algorithm: partial_ratio per keyword x word."""
+    long_words = [w for w in text.split() if len(w) >= 3]
+    exact = {k for k in keywords if k in text}
+    fuzzy = {
+        k
+        for k in keywords
+        if k not in exact and any(fuzz.partial_ratio(k, w) >= threshold for w in long_words)
+    }
+    return KeywordMatch(exact=frozenset(exact), fuzzy=frozenset(fuzzy))
+
+
+class TestKeywordMatcher:
+    def test_exact(self):
+        matcher = KeywordMatcher(["Crypto", "AI", "crypto"])
+        assert matcher.keywords == ("crypto", "ai")
+        assert matcher.exact("crypto and ai") == {"crypto", "ai"}
+        assert matcher.exact("nothing here") == frozenset()
+
+    def test_empty_matcher(self):
+        matcher = KeywordMatcher([])
+        assert not matcher
+        assert matcher.match("anything at all") == KeywordMatch()
+
+    @pytest.mark.parametrize("use_numpy", [True, False])
+    def test_matches_reference_algorithm(self, monkeypatch, use_numpy):
+        """Batched scoring agrees with per-word partial_ratio, with and without NumPy."""
+        if use_numpy and not keyword_matcher.HAS_NUMPY:
+            pytest.skip("numpy not installed")
+        monkeypatch.setattr(keyword_matcher, "HAS_NUMPY", use_numpy)
+        matcher = KeywordMatcher(KEYWORDS)
+
+        batch = matcher.match_many(TEXTS)
+        single = [matcher.match(t) for t in TEXTS]
+
+        expected = [_reference(t, KEYWORDS) for t in TEXTS]
+        assert batch == expected
+        assert single == expected
+
+    def test_cached_per_key(self, monkeypatch):
+        matcher = KeywordMatcher(KEYWORDS)
+        first = matcher.match("crypto talk", key="p1")
+
+        calls = []
+        monkeypatch.setattr(matcher, "exact", lambda text: calls.append(text) or frozenset())
+        assert matcher.match("crypto talk", key="p1") is first
+        assert calls == []
+
+    def test_cache_invalidated_when_text_changes(self):
+        matcher = KeywordMatcher(KEYWORDS)
+        matcher.match("crypto talk", key="p1")
+        edited = matcher.match("philosophy talk", key="p1")
+        assert edited.exact == {"philosophy"}
+
+    def test_cache_is_bounded(self):
+        matcher = KeywordMatcher(KEYWORDS, cache_size=2)
+        for i in range(5):
+            matcher.match(f"crypto {i}", key=f"p{i}")
+        assert list(matcher._cache) == ["p3", "p4"]
+
+
+class TestEvaluatePosts:
+    def test_batch_matches_single_evaluation(self):
+        engine = DecisionEngine(
+            interest_keywords=KEYWORDS,
+            engagement_threshold=30.0,
+            self_agent_name="TestBot",
+        )
+        posts = [
+            SimpleNamespace(
+                id=f"p{i}",
+                title=text[:20],
+                content=text + " — is this worth discussing at some length?",
+                agent_name="TestBot" if i == 2 else "Other",
+                submolt="",
+            )
+            for i, text in enumerate(TEXTS)
+        ]
+
+        batch = engine.evaluate_posts(posts)
+
+        fresh = DecisionEngine(
+            interest_keywords=KEYWORDS,
+            engagement_threshold=30.0,
+            self_agent_name="TestBot",
+        )
+        singles = [fresh.evaluate_post(p.title, p.content, p.agent_name, p.submolt) for p in posts]
+        assert batch == singles
+        assert batch[2].reason == "own post"
+
+    def test_empty_batch(self):
+        assert DecisionEngine(interest_keywords=KEYWORDS).evaluate_posts([]) == []
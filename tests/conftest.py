@@ -59,6 +59,7 @@ def mock_engagement_db():
     db.record_engagement = AsyncMock()
     db.record_heartbeat = AsyncMock()
     db.is_reply_processed = AsyncMock(return_value=False)
+    db.filter_unprocessed = AsyncMock(side_effect=lambda ids: list(ids))
     db.mark_reply_processed = AsyncMock()
     db.queue_reply_action = AsyncMock()
     db.get_pending_reply_actions = AsyncMock(return_value=[])
@@ -35,6 +35,22 @@ class TestAgenticMigrations:
         applied = await mgr.apply(AGENTIC_MIGRATIONS)
         assert applied == 0
 
+    @pytest.mark.asyncio
+    async def test_planner_skipped_added_after_historical_v904(self, sqlite_backend):
+        """A database that recorded the old v904 still gets the column."""
+        mgr = MigrationManager(sqlite_backend)
+        await mgr.apply([m for m in AGENTIC_MIGRATIONS if m.version < 904])
+        await sqlite_backend.execute(
+            "INSERT INTO _migrations (version, name) VALUES (?, ?)",
+            (904, "agentic_add_missing_columns"),
+        )
+
+        await mgr.apply(AGENTIC_MIGRATIONS)
+        db = AgenticDB(sqlite_backend)
+        await db.log_tick(TickLog(tick_number=1, planner_skipped=True))
+
+        assert await db.get_planner_skip_count() == 1
+
     @pytest.mark.asyncio
     async def test_migration_versions_900_plus(self):
         """All agentic migrations have version >= 900."""
@@ -140,6 +156,24 @@ class TestAgenticDB:
         assert recent[0]["action_type"] == "test_action"
         assert recent[0]["success"] == 1
 
+    @pytest.mark.asyncio
+    async def test_log_actions_batch(self, agentic_db):
+        outcomes = [
+            ActionOutcome(
+                action=PlannedAction(action_type=f"action_{i}", target=f"t{i}"),
+                success=i % 2 == 0,
+            )
+            for i in range(3)
+        ]
+
+        await agentic_db.log_actions(tick_number=7, outcomes=outcomes)
+        await agentic_db.log_actions(tick_number=8, outcomes=[])
+
+        recent = await agentic_db.get_recent_actions(limit=5)
+        assert [r["action_type"] for r in recent] == ["action_2", "action_1", "action_0"]
+        assert [r["success"] for r in recent] == [1, 0, 1]
+        assert {r["tick_number"] for r in recent} == {7}
+
     # ── Learnings ─────────────────────────────────────────────────────
 
     @pytest.mark.asyncio
@@ -198,3 +232,12 @@ class TestAgenticDB:
         await agentic_db.log_tick(TickLog(tick_number=2))
 
         assert await agentic_db.get_tick_count() == 2
+
+    @pytest.mark.asyncio
+    async def test_planner_skip_count(self, agentic_db):
+        await agentic_db.log_tick(TickLog(tick_number=1))
+        await agentic_db.log_tick(TickLog(tick_number=2, planner_skipped=True))
+        await agentic_db.log_tick(TickLog(tick_number=3, planner_skipped=True))
+
+        assert await agentic_db.get_tick_count() == 3
+        assert await agentic_db.get_planner_skip_count() == 2
@@ -2,6 +2,7 @@
 Tests for ActionExecutor — dispatch, timing, max-actions.
 """
 
+import asyncio
 from unittest.mock import AsyncMock
 
 import pytest
@@ -175,3 +176,168 @@ class TestActionExecutor:
 
         assert len(received_obs) == 1
         assert received_obs[0] == {"key": "value"}
+
+
+class TrackingHandler:
+    """Handler that records start/end order and peak concurrency."""
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.events: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def handle(self, action, observation):
+        self.events.append(f"start:{action.target}")
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        self.events.append(f"end:{action.target}")
+        return ActionOutcome(action=action, success=True, result=action.target)
+
+
+class TestConcurrentExecution:
+    """Independent actions run concurrently; dependent ones stay ordered."""
+
+    @pytest.mark.asyncio
+    async def test_default_is_sequential(self):
+        handler = TrackingHandler()
+        executor = ActionExecutor(handlers={"a": handler})
+
+        plan = ActionPlan(
+            actions=[PlannedAction(action_type="a", target=f"t{i}") for i in range(3)]
+        )
+        await executor.execute(plan, observation=None)
+
+        assert handler.max_in_flight == 1
+        assert handler.events == [f"{event}:t{i}" for i in range(3) for event in ("start", "end")]
+
+    @pytest.mark.asyncio
+    async def test_different_targets_run_concurrently_with_cap(self):
+        handler = TrackingHandler()
+        executor = ActionExecutor(handlers={"a": handler}, max_concurrent=2)
+
+        plan = ActionPlan(
+            actions=[PlannedAction(action_type="a", target=f"t{i}") for i in range(4)]
+        )
+        outcomes = await executor.execute(plan, observation=None)
+
+        assert handler.max_in_flight == 2
+        # Outcomes stay in plan order regardless of completion order
+        assert [o.result for o in outcomes] == ["t0", "t1", "t2", "t3"]
+
+    @pytest.mark.asyncio
+    async def test_same_target_runs_in_order(self):
+        handler = TrackingHandler()
+        executor = ActionExecutor(handlers={"a": handler}, max_concurrent=5)
+
+        plan = ActionPlan(
+            actions=[
+                PlannedAction(action_type="a", target="first", repo="o/r", target_number=42),
+                PlannedAction(action_type="a", target="other", repo="o/r", target_number=7),
+                PlannedAction(action_type="a", target="second", repo="o/r", target_number=42),
+            ]
+        )
+        await executor.execute(plan, observation=None)
+
+        assert handler.max_in_flight == 2
+        assert handler.events.index("end:first") < handler.events.index("start:second")
+
+    @pytest.mark.asyncio
+    async def test_planner_group_hint_serializes(self):
+        handler = TrackingHandler()
+        executor = ActionExecutor(handlers={"a": handler}, max_concurrent=5)
+
+        plan = ActionPlan(
+            actions=[
+                PlannedAction(action_type="a", target="merge", group="release"),
+                PlannedAction(action_type="a", target="announce", group="release"),
+            ]
+        )
+        await executor.execute(plan, observation=None)
+
+        assert handler.max_in_flight == 1
+        assert handler.events.index("end:merge") < handler.events.index("start:announce")
+
+    @pytest.mark.asyncio
+    async def test_plugin_group_key(self):
+        handler = TrackingHandler()
+        executor = ActionExecutor(
+            handlers={"a": handler, "b": handler},
+            max_concurrent=5,
+            group_key=lambda action: "shared" if action.action_type == "a" else None,
+        )
+
+        plan = ActionPlan(
+            actions=[
+                PlannedAction(action_type="a", target="x"),
+                PlannedAction(action_type="a", target="y"),
+                PlannedAction(action_type="b", target="z"),
+            ]
+        )
+        await executor.execute(plan, observation=None)
+
+        assert handler.max_in_flight == 2
+        assert handler.events.index("end:x") < handler.events.index("start:y")
+
+    @pytest.mark.asyncio
+    async def test_conflicting_hints_cannot_split_plugin_group(self):
+        handler = TrackingHandler()
+        executor = ActionExecutor(
+            handlers={"a": handler},
+            max_concurrent=5,
+            group_key=lambda action: "workspace",
+        )
+
+        plan = ActionPlan(
+            actions=[
+                PlannedAction(action_type="a", target="x", group="fix"),
+                PlannedAction(action_type="a", target="y", group="tests"),
+            ]
+        )
+        await executor.execute(plan, observation=None)
+
+        assert handler.max_in_flight == 1
+        assert handler.events.index("end:x") < handler.events.index("start:y")
+
+    @pytest.mark.asyncio
+    async def test_hint_joins_target_groups(self):
+        handler = TrackingHandler()
+        executor = ActionExecutor(handlers={"a": handler}, max_concurrent=5)
+
+        # PR 1 actions stay ordered despite different hints; the "release"
+        # hint then pulls PR 2 into the same chain.
+        plan = ActionPlan(
+            actions=[
+                PlannedAction(action_type="a", target="p1", repo="o/r", target_number=1),
+                PlannedAction(
+                    action_type="a", target="p1b", repo="o/r", target_number=1, group="release"
+                ),
+                PlannedAction(
+                    action_type="a", target="p2", repo="o/r", target_number=2, group="release"
+                ),
+                PlannedAction(action_type="a", target="free", repo="o/r", target_number=3),
+            ]
+        )
+        await executor.execute(plan, observation=None)
+
+        assert handler.max_in_flight == 2
+        events = handler.events
+        assert events.index("end:p1") < events.index("start:p1b") < events.index("start:p2")
+
+    def test_group_for(self):
+        executor = ActionExecutor(handlers={})
+
+        by_number = PlannedAction(action_type="a", target="PR #1", repo="o/r", target_number=1)
+        by_text = PlannedAction(action_type="b", target=" Owner ", repo="o/r")
+        hinted = by_number.model_copy(update={"group": "g"})
+
+        assert executor.group_for(by_number) == executor.group_for(
+            by_number.model_copy(update={"target": "merge it"})
+        )
+        assert executor.group_for(by_text) == executor.group_for(
+            by_text.model_copy(update={"target": "owner"})
+        )
+        # Hints are layered on top by execute(), never part of the base key
+        assert executor.group_for(hinted) == executor.group_for(by_number)
@@ -2,6 +2,7 @@
 Tests for AgentLoop — full cycle with mock observer/handlers.
 """
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -32,6 +33,16 @@ class MockObserver:
         return f"Observed {len(observation.get('items', []))} items"
 
 
+class FingerprintObserver(MockObserver):
+    """Observer whose fingerprint ignores the volatile 'seen_at' field."""
+
+    def format_for_planner(self, observation):
+        return f"{observation['items']} at {observation['seen_at']}"
+
+    def fingerprint(self, observation):
+        return ",".join(observation["items"])
+
+
 class MockHandler:
     """Mock handler that succeeds."""
 
@@ -39,47 +50,48 @@ class MockHandler:
         return ActionOutcome(action=action, success=True, result="Done")
 
 
-class TestAgentLoop:
-    """Test full agentic cycle."""
+@pytest.fixture
+def mock_components(mock_agentic_db):
+    """Create all mock components for the loop."""
+    # Goal tracker
+    goal_tracker = GoalTracker(db=mock_agentic_db)
+    goal_tracker._goals = [
+        AgentGoal(name="test_goal", description="Test", priority=80),
+    ]
+
+    # Planner that returns a plan
+    planner = MagicMock(spec=ActionPlanner)
+    planner.plan = AsyncMock(
+        return_value=ActionPlan(
+            actions=[
+                PlannedAction(action_type="test_action", target="t1", priority=90),
+            ],
+            reasoning="Test plan",
+        )
+    )
 
-    @pytest.fixture
-    def mock_components(self, mock_agentic_db):
-        """Create all mock components for the loop."""
-        # Goal tracker
-        goal_tracker = GoalTracker(db=mock_agentic_db)
-        goal_tracker._goals = [
-            AgentGoal(name="test_goal", description="Test", priority=80),
-        ]
+    # Executor
+    executor = ActionExecutor(
+        handlers={"test_action": MockHandler()},
+        max_actions_per_tick=5,
+    )
 
-        # Planner that returns a plan
-        planner = MagicMock(spec=ActionPlanner)
-        planner.plan = AsyncMock(
-            return_value=ActionPlan(
-                actions=[
-                    PlannedAction(action_type="test_action", target="t1", priority=90),
-                ],
-                reasoning="Test plan",
-            )
-        )
+    # Reflection
+    reflection = MagicMock(spec=ReflectionPipeline)
+    reflection.reflect = AsyncMock()
 
-        # Executor
-        executor = ActionExecutor(
-            handlers={"test_action": MockHandler()},
-            max_actions_per_tick=5,
-        )
+    return {
+        "observer": MockObserver(),
+        "goal_tracker": goal_tracker,
+        "planner": planner,
+        "executor": executor,
+        "reflection": reflection,
+        "db": mock_agentic_db,
+    }
 
-        # Reflection
-        reflection = MagicMock(spec=ReflectionPipeline)
-        reflection.reflect = AsyncMock()
 
-        return {
-            "observer": MockObserver(),
-            "goal_tracker": goal_tracker,
-            "planner": planner,
-            "executor": executor,
-            "reflection": reflection,
-            "db": mock_agentic_db,
-        }
+class TestAgentLoop:
+    """Test full agentic cycle."""
 
     @pytest.mark.asyncio
     async def test_full_cycle(self, mock_components):
@@ -96,7 +108,8 @@ class TestAgentLoop:
         assert tick_log.actions_succeeded == 1
         assert tick_log.duration_ms > 0
 
-        # Verify reflection was called
+        # Verify reflection was called (it runs in the background)
+        await loop.wait_for_reflections()
         mock_components["reflection"].reflect.assert_called_once()
 
         # Verify tick was logged
@@ -199,7 +212,40 @@ class TestAgentLoop:
 
         await loop.tick()
 
-        mock_components["db"].log_action.assert_called_once()
+        mock_components["db"].log_actions.assert_called_once()
+        tick_number, outcomes = mock_components["db"].log_actions.call_args.args
+        assert tick_number == 1
+        assert len(outcomes) == 1
+
+    @pytest.mark.asyncio
+    async def test_reflection_does_not_block_tick(self, mock_components):
+        """The tick returns while reflection is still running."""
+        release = asyncio.Event()
+
+        async def slow_reflect(*args):
+            await release.wait()
+
+        mock_components["reflection"].reflect = AsyncMock(side_effect=slow_reflect)
+        loop = AgentLoop(**mock_components)
+        await loop.setup()
+
+        tick_log = await asyncio.wait_for(loop.tick(), timeout=1)
+        assert tick_log.actions_executed == 1
+        assert loop._reflection_tasks
+
+        release.set()
+        await loop.wait_for_reflections()
+        assert not loop._reflection_tasks
+
+    @pytest.mark.asyncio
+    async def test_reflection_failure_is_contained(self, mock_components):
+        mock_components["reflection"].reflect = AsyncMock(side_effect=RuntimeError("boom"))
+        loop = AgentLoop(**mock_components)
+        await loop.setup()
+
+        await loop.tick()
+        await loop.wait_for_reflections()
+        assert await loop.tick() is not None
 
     @pytest.mark.asyncio
     async def test_count_observations_dict(self):
@@ -239,3 +285,118 @@ class TestAgentLoop:
         text = AgentLoop._format_recent_actions(rows)
         assert "[OK] merge_pr" in text
         assert "[FAIL] notify" in text
+
+
+class TestNoopPlanCache:
+    """Skipping the planner while the world state is unchanged."""
+
+    @pytest.fixture
+    def idle_components(self, mock_components):
+        mock_components["planner"].plan = AsyncMock(
+            return_value=ActionPlan(reasoning="Nothing to do"),
+        )
+        return mock_components
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self, idle_components):
+        loop = AgentLoop(**idle_components)
+        await loop.setup()
+
+        await loop.tick()
+        tick_log = await loop.tick()
+
+        assert idle_components["planner"].plan.await_count == 2
+        assert not tick_log.planner_skipped
+
+    @pytest.mark.asyncio
+    async def test_unchanged_state_skips_planner(self, idle_components):
+        loop = AgentLoop(**idle_components, plan_staleness_seconds=600)
+        await loop.setup()
+
+        first = await loop.tick()
+        second = await loop.tick()
+
+        assert idle_components["planner"].plan.await_count == 1
+        assert not first.planner_skipped
+        assert second.planner_skipped
+        assert second.tick_number == 2
+        assert second.reasoning_summary == "Nothing to do"
+        logged = idle_components["db"].log_tick.call_args.args[0]
+        assert logged.planner_skipped
+
+    @pytest.mark.asyncio
+    async def test_changed_observation_replans(self, idle_components):
+        observation = {"items": ["a"]}
+        idle_components["observer"] = MockObserver(observation)
+        loop = AgentLoop(**idle_components, plan_staleness_seconds=600)
+        await loop.setup()
+
+        await loop.tick()
+        observation["items"].append("b")
+        tick_log = await loop.tick()
+
+        assert idle_components["planner"].plan.await_count == 2
+        assert not tick_log.planner_skipped
+
+    @pytest.mark.asyncio
+    async def test_changed_context_replans(self, idle_components):
+        commands = []
+        idle_components["get_extra_context"] = lambda: "\n".join(commands)
+        loop = AgentLoop(**idle_components, plan_staleness_seconds=600)
+        await loop.setup()
+
+        await loop.tick()
+        commands.append("Owner says: merge PR #42")
+        await loop.tick()
+
+        assert idle_components["planner"].plan.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_observer_fingerprint_ignores_volatile_fields(self, idle_components):
+        observation = {"items": ["a"], "seen_at": "10:00"}
+        idle_components["observer"] = FingerprintObserver(observation)
+        loop = AgentLoop(**idle_components, plan_staleness_seconds=600)
+        await loop.setup()
+
+        await loop.tick()
+        observation["seen_at"] = "10:05"
+        tick_log = await loop.tick()
+
+        assert idle_components["planner"].plan.await_count == 1
+        assert tick_log.planner_skipped
+
+    @pytest.mark.asyncio
+    async def test_stale_plan_replans(self, idle_components, monkeypatch):
+        clock = [1000.0]
+        monkeypatch.setattr("overblick.core.agentic.loop.time.monotonic", lambda: clock[0])
+        loop = AgentLoop(**idle_components, plan_staleness_seconds=600)
+        await loop.setup()
+
+        await loop.tick()
+        clock[0] += 599
+        assert (await loop.tick()).planner_skipped
+        clock[0] += 1
+        assert not (await loop.tick()).planner_skipped
+        assert idle_components["planner"].plan.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_planner_failure_not_cached(self, idle_components):
+        idle_components["planner"].plan = AsyncMock(return_value=ActionPlan())
+        loop = AgentLoop(**idle_components, plan_staleness_seconds=600)
+        await loop.setup()
+
+        await loop.tick()
+        await loop.tick()
+
+        assert idle_components["planner"].plan.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_plan_with_actions_not_cached(self, mock_components):
+        loop = AgentLoop(**mock_components, plan_staleness_seconds=600)
+        await loop.setup()
+
+        await loop.tick()
+        await loop.tick()
+        await loop.wait_for_reflections()
+
+        assert mock_components["planner"].plan.await_count == 2
@@ -128,6 +128,23 @@ class TestActionPlanner:
         assert len(plan.actions) == 1
         assert plan.actions[0].action_type == "anything_goes"
 
+    def test_parse_group_hint(self):
+        """Planner keeps the optional group hint."""
+        planner = ActionPlanner(llm_pipeline=None)
+
+        raw = json.dumps(
+            {
+                "actions": [
+                    {"action_type": "a", "group": "release"},
+                    {"action_type": "b", "group": None},
+                    {"action_type": "c"},
+                ],
+            }
+        )
+
+        plan = planner._parse_plan(raw, max_actions=5)
+        assert [a.group for a in plan.actions] == ["release", "", ""]
+
     def test_parse_respects_max_actions(self):
         """Planner caps actions at max_actions."""
         planner = ActionPlanner(llm_pipeline=None)
@@ -1,5 +1,6 @@
 """Tests for the database abstraction layer."""
 
+import asyncio
 from pathlib import Path
 
 import pytest
@@ -57,6 +58,15 @@ class TestDatabaseConfig:
         config = DatabaseConfig.from_dict({})
         assert config.backend == "sqlite"
 
+    def test_from_dict_sqlite_read_pool(self):
+        data = {
+            "sqlite": {"path": "data/test.db", "read_pool_size": 5, "mmap_size": 0},
+        }
+        config = DatabaseConfig.from_dict(data)
+        assert config.sqlite_read_pool_size == 5
+        assert config.sqlite_mmap_size == 0
+        assert config.sqlite_statement_cache == 128
+
 
 # ---------------------------------------------------------------------------
 # Factory
@@ -245,6 +255,309 @@ class TestSQLiteBackend:
         count = await db.fetch_scalar("SELECT COUNT(*) FROM cr")
         assert count == 1
 
+    @pytest.mark.asyncio
+    async def test_read_pool_size_configurable(self, tmp_path):
+        config = DatabaseConfig(sqlite_path=str(tmp_path / "pool.db"), sqlite_read_pool_size=5)
+        backend = SQLiteBackend(config)
+        assert backend._read_executor._max_workers == 5
+        await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_read_connections_are_reused(self, db):
+        await db.execute_script("CREATE TABLE rc (id INTEGER PRIMARY KEY);")
+        for _ in range(20):
+            await db.fetch_scalar("SELECT COUNT(*) FROM rc")
+        # At most one connection per reader thread, however many reads
+        assert 1 <= len(db._read_conns) <= db._read_executor._max_workers
+
+    @pytest.mark.asyncio
+    async def test_read_connections_see_new_writes(self, db):
+        await db.execute_script("CREATE TABLE fresh (id INTEGER PRIMARY KEY);")
+        assert await db.fetch_scalar("SELECT COUNT(*) FROM fresh") == 0
+        await db.execute("INSERT INTO fresh (id) VALUES (1)")
+        assert await db.fetch_scalar("SELECT COUNT(*) FROM fresh") == 1
+
+    @pytest.mark.asyncio
+    async def test_read_connections_are_query_only(self, db):
+        import sqlite3
+
+        await db.execute_script("CREATE TABLE ro (id INTEGER PRIMARY KEY);")
+        with pytest.raises(sqlite3.OperationalError):
+            await db.fetch_one("INSERT INTO ro (id) VALUES (1) RETURNING id")
+
+    @pytest.mark.asyncio
+    async def test_close_releases_read_connections(self, tmp_path):
+        config = DatabaseConfig(sqlite_path=str(tmp_path / "close.db"))
+        backend = SQLiteBackend(config)
+        await backend.connect()
+        await backend.fetch_scalar("SELECT 1")
+        assert backend._read_conns
+
+        await backend.close()
+        assert backend._read_conns == []
+
+    def test_reads_open_one_connection_per_thread(self, tmp_path, monkeypatch):
+        """300 reads on one thread cost one connect, not one per query."""
+        import sqlite3
+
+        from overblick.core.database import sqlite_backend
+
+        path = tmp_path / "reads.db"
+        setup = sqlite3.connect(path)
+        setup.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, val TEXT)")
+        setup.executemany("INSERT INTO t VALUES (?, ?)", [(i, f"v{i}") for i in range(1000)])
+        setup.commit()
+        setup.close()
+
+        connects = []
+        real_connect = sqlite3.connect
+
+        def counting_connect(*args, **kwargs):
+            connects.append(args[0] if args else kwargs.get("database"))
+            return real_connect(*args, **kwargs)
+
+        monkeypatch.setattr(sqlite_backend.sqlite3, "connect", counting_connect)
+        backend = SQLiteBackend(DatabaseConfig(sqlite_path=str(path)))
+        try:
+            rows = [
+                backend._fetch_one_sync("SELECT * FROM t WHERE id = ?", (i,)) for i in range(300)
+            ]
+        finally:
+            for conn in backend._read_conns:
+                conn.close()
+            backend._executor.shutdown()
+            backend._read_executor.shutdown()
+
+        assert rows[299]["val"] == "v299"
+        assert len(connects) == 1
+
+    @pytest.mark.benchmark
+    def test_pooled_reads_faster_than_per_call_connect(self, tmp_path):
+        """Benchmark: pooled read connection vs. a fresh connect per query."""
+        import sqlite3
+        import time
+
+        path = tmp_path / "bench.db"
+        setup = sqlite3.connect(path)
+        setup.execute("PRAGMA journal_mode=WAL")
+        setup.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, val TEXT)")
+        setup.executemany("INSERT INTO t VALUES (?, ?)", [(i, f"v{i}") for i in range(1000)])
+        setup.commit()
+        setup.close()
+
+        backend = SQLiteBackend(DatabaseConfig(sqlite_path=str(path)))
+        sql, n = "SELECT * FROM t WHERE id = ?", 300
+
+        def per_call(i):
+            conn = sqlite3.connect(str(path))
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA foreign_keys=ON")
+            try:
+                return dict(conn.execute(sql, (i,)).fetchone())
+            finally:
+                conn.close()
+
+        start = time.perf_counter()
+        for i in range(n):
+            per_call(i)
+        per_call_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for i in range(n):
+            backend._fetch_one_sync(sql, (i,))
+        pooled_time = time.perf_counter() - start
+
+        for conn in backend._read_conns:
+            conn.close()
+        backend._executor.shutdown()
+        backend._read_executor.shutdown()
+
+        assert pooled_time * 3 < per_call_time, (pooled_time, per_call_time)
+
+
+# ---------------------------------------------------------------------------
+# Durability and group commit
+# ---------------------------------------------------------------------------
+
+
+class TestSQLiteGroupCommit:
+    @pytest.fixture
+    async def db(self, tmp_path):
+        config = DatabaseConfig(
+            sqlite_path=str(tmp_path / "group.db"),
+            sqlite_group_commit=True,
+            sqlite_group_commit_window_ms=5,
+        )
+        backend = SQLiteBackend(config)
+        await backend.connect()
+        await backend.execute_script(
+            "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT UNIQUE NOT NULL);"
+        )
+        yield backend
+        await backend.close()
+
+    def test_from_dict_durability_and_group_commit(self):
+        config = DatabaseConfig.from_dict(
+            {
+                "sqlite": {
+                    "synchronous": "NORMAL",
+                    "table_durability": {"audit": "FULL"},
+                    "group_commit": True,
+                    "group_commit_window_ms": 4,
+                    "group_commit_max_batch": 64,
+                }
+            }
+        )
+        assert config.sqlite_synchronous == "NORMAL"
+        assert config.sqlite_table_durability == {"audit": "FULL"}
+        assert config.sqlite_group_commit is True
+        assert config.sqlite_group_commit_window_ms == 4
+        assert config.sqlite_group_commit_max_batch == 64
+
+    def test_invalid_synchronous_level_rejected(self):
+        with pytest.raises(ValueError, match="synchronous"):
+            SQLiteBackend(DatabaseConfig(sqlite_synchronous="SOMETIMES"))
+
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_share_one_transaction(self, db):
+        calls = []
+        original = db._commit_batch_sync
+
+        def spy(batch):
+            calls.append(len(batch))
+            return original(batch)
+
+        db._commit_batch_sync = spy
+        ids = await asyncio.gather(
+            *(
+                db.execute_returning_id("INSERT INTO items (name) VALUES (?)", (f"n{i}",))
+                for i in range(20)
+            )
+        )
+
+        assert calls == [20]
+        assert sorted(ids) == list(range(1, 21))
+        assert await db.fetch_scalar("SELECT COUNT(*) FROM items") == 20
+
+    @pytest.mark.asyncio
+    async def test_failing_write_only_fails_its_caller(self, db):
+        import sqlite3
+
+        results = await asyncio.gather(
+            db.execute("INSERT INTO items (name) VALUES (?)", ("a",)),
+            db.execute("INSERT INTO items (name) VALUES (?)", ("a",)),
+            db.execute_many("INSERT INTO items (name) VALUES (?)", [("b",), ("c",)]),
+            return_exceptions=True,
+        )
+
+        assert results[0] == 1
+        assert isinstance(results[1], sqlite3.IntegrityError)
+        assert results[2] == 2
+        rows = await db.fetch_all("SELECT name FROM items ORDER BY name")
+        assert [r["name"] for r in rows] == ["a", "b", "c"]
+
+    @pytest.mark.asyncio
+    async def test_max_batch_flushes_early(self, tmp_path):
+        config = DatabaseConfig(
+            sqlite_path=str(tmp_path / "batch.db"),
+            sqlite_group_commit=True,
+            sqlite_group_commit_window_ms=10_000,
+            sqlite_group_commit_max_batch=3,
+        )
+        backend = SQLiteBackend(config)
+        await backend.connect()
+        await backend.execute_script("CREATE TABLE t (id INTEGER PRIMARY KEY);")
+        try:
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    *(backend.execute("INSERT INTO t DEFAULT VALUES") for _ in range(3))
+                ),
+                timeout=2,
+            )
+            assert results == [1, 1, 1]
+        finally:
+            await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_script_runs_after_queued_writes(self, db):
+        write = asyncio.ensure_future(db.execute("INSERT INTO items (name) VALUES ('x')"))
+        await asyncio.sleep(0)
+        await db.execute_script("UPDATE items SET name = 'y' WHERE name = 'x';")
+
+        assert await write == 1
+        assert await db.fetch_scalar("SELECT name FROM items") == "y"
+
+    @pytest.mark.asyncio
+    async def test_close_commits_pending_writes(self, tmp_path):
+        path = tmp_path / "close.db"
+        config = DatabaseConfig(
+            sqlite_path=str(path),
+            sqlite_group_commit=True,
+            sqlite_group_commit_window_ms=10_000,
+        )
+        backend = SQLiteBackend(config)
+        await backend.connect()
+        await backend.execute_script("CREATE TABLE t (id INTEGER PRIMARY KEY);")
+        write = asyncio.ensure_future(backend.execute("INSERT INTO t DEFAULT VALUES"))
+        await asyncio.sleep(0)
+        await backend.close()
+
+        assert await write == 1
+        reopened = SQLiteBackend(DatabaseConfig(sqlite_path=str(path)))
+        await reopened.connect()
+        assert await reopened.fetch_scalar("SELECT COUNT(*) FROM t") == 1
+        await reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_per_table_durability(self, tmp_path):
+        config = DatabaseConfig(
+            sqlite_path=str(tmp_path / "durable.db"),
+            sqlite_synchronous="NORMAL",
+            sqlite_table_durability={"audit": "FULL"},
+        )
+        backend = SQLiteBackend(config)
+        await backend.connect()
+        await backend.execute_script(
+            "CREATE TABLE audit (id INTEGER PRIMARY KEY);"
+            "CREATE TABLE cache (id INTEGER PRIMARY KEY);"
+        )
+
+        def synchronous():
+            return backend._conn.execute("PRAGMA synchronous").fetchone()[0]
+
+        try:
+            assert synchronous() == 1  # NORMAL
+            await backend.execute("INSERT INTO audit DEFAULT VALUES")
+            assert synchronous() == 2  # FULL
+            await backend.execute('DELETE FROM "cache"')
+            assert synchronous() == 1
+            assert backend._durability_for("UPDATE OR IGNORE audit SET id = 1") == 2
+        finally:
+            await backend.close()
+
+    @pytest.mark.asyncio
+    async def test_batch_uses_strongest_durability(self, tmp_path):
+        config = DatabaseConfig(
+            sqlite_path=str(tmp_path / "mixed.db"),
+            sqlite_synchronous="NORMAL",
+            sqlite_table_durability={"audit": "FULL"},
+            sqlite_group_commit=True,
+        )
+        backend = SQLiteBackend(config)
+        await backend.connect()
+        await backend.execute_script(
+            "CREATE TABLE audit (id INTEGER PRIMARY KEY);"
+            "CREATE TABLE cache (id INTEGER PRIMARY KEY);"
+        )
+        try:
+            await asyncio.gather(
+                backend.execute("INSERT INTO cache DEFAULT VALUES"),
+                backend.execute("INSERT INTO audit DEFAULT VALUES"),
+            )
+            assert backend._conn.execute("PRAGMA synchronous").fetchone()[0] == 2
+        finally:
+            await backend.close()
+
 
 # ---------------------------------------------------------------------------
 # MigrationManager
@@ -333,6 +646,23 @@ class TestMigrationManager:
         assert applied == 1  # Only the new one
         assert await mgr.current_version() == 2
 
+    @pytest.mark.asyncio
+    async def test_lower_numbered_migration_added_later(self, db):
+        mgr = MigrationManager(db)
+        shared = [
+            Migration(version=900, name="shared", up_sql="CREATE TABLE low1 (id INTEGER);"),
+        ]
+        await mgr.apply(shared)
+
+        # A plugin migration numbered below the current version still runs once
+        plugin = [
+            Migration(version=12, name="plugin", up_sql="CREATE TABLE low2 (id INTEGER);"),
+        ]
+        assert await mgr.apply(plugin + shared) == 1
+        assert await db.table_exists("low2")
+        assert await mgr.apply(plugin + shared) == 0
+        assert await mgr.current_version() == 900
+
     @pytest.mark.asyncio
     async def test_real_migrations(self, db):
         """Apply the actual Överblick migrations."""
@@ -67,6 +67,27 @@ class TestReplyProcessing:
         await db.mark_reply_processed("comment_dup", "post_abc", "upvote", 0.7)
         assert await db.is_reply_processed("comment_dup") is True
 
+    @pytest.mark.asyncio
+    async def test_filter_unprocessed(self, db):
+        """filter_unprocessed() drops processed and queued ids, keeping order."""
+        await db.mark_reply_processed("c2", "post_abc", "skip", 0.1)
+        await db.queue_reply_action("c4", "post_abc", "reply", 0.9)
+        result = await db.filter_unprocessed(["c5", "c2", "", "c1", "c4", "c5"])
+        assert result == ["c5", "c1"]
+
+    @pytest.mark.asyncio
+    async def test_filter_unprocessed_empty(self, db):
+        assert await db.filter_unprocessed([]) == []
+
+    @pytest.mark.asyncio
+    async def test_filter_unprocessed_chunks_large_input(self, db):
+        """More ids than one query's chunk are all checked."""
+        ids = [f"c{i}" for i in range(EngagementDB._FILTER_CHUNK_SIZE * 2 + 5)]
+        await db.mark_reply_processed(ids[-1], "post_abc", "skip", 0.1)
+        await db.mark_reply_processed(ids[3], "post_abc", "skip", 0.1)
+        result = await db.filter_unprocessed(ids)
+        assert result == [cid for cid in ids if cid not in (ids[3], ids[-1])]
+
 
 class TestReplyActionQueue:
     """Queue operations."""
@@ -0,0 +1,140 @@
+"""Unit tests for the learning EmbeddingIndex."""
+
+import random
+import time
+
+import pytest
+
+from overblick.core.learning.index import (
+    HAS_NUMPY,
+    RECENCY_BOOST,
+    RECENCY_WINDOW,
+    EmbeddingIndex,
+)
+from overblick.core.learning.store import _cosine_similarity
+
+BACKENDS = [
+    pytest.param(True, id="numpy", marks=pytest.mark.skipif(not HAS_NUMPY, reason="numpy")),
+    pytest.param(False, id="python"),
+]
+
+
+def _legacy_ranking(vectors, query, limit):
+    """The pre-index scoring: cosine + linear recency boost over the newest rows."""
+    newest_first = list(reversed(list(enumerate(vectors))))
+    scored = []
+    for i, (learning_id, vector) in enumerate(newest_first[:RECENCY_WINDOW]):
+        boost = (RECENCY_WINDOW - i) / RECENCY_WINDOW * RECENCY_BOOST
+        scored.append((_cosine_similarity(query, vector) + boost, learning_id))
+    scored.sort(key=lambda x: x[0], reverse=True)
+    return [learning_id for _, learning_id in scored[:limit]]
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+class TestEmbeddingIndex:
+    def test_ranks_by_similarity(self, use_numpy):
+        index = EmbeddingIndex(use_numpy=use_numpy)
+        index.add(1, [1.0, 0.0, 0.0])
+        index.add(2, [0.0, 1.0, 0.0])
+        index.add(3, [0.7, 0.7, 0.0])
+
+        ids = [i for i, _ in index.search([1.0, 0.1, 0.0], limit=2)]
+        assert ids == [1, 3]
+
+    def test_matches_legacy_scoring(self, use_numpy):
+        rng = random.Random(7)
+        vectors = [[rng.uniform(-1, 1) for _ in range(16)] for _ in range(300)]
+        index = EmbeddingIndex(use_numpy=use_numpy)
+        for learning_id, vector in enumerate(vectors):
+            index.add(learning_id, vector)
+
+        for _ in range(5):
+            query = [rng.uniform(-1, 1) for _ in range(16)]
+            ids = [i for i, _ in index.search(query, limit=8)]
+            assert ids == _legacy_ranking(vectors, query, 8)
+
+    def test_recency_boost_breaks_ties(self, use_numpy):
+        index = EmbeddingIndex(use_numpy=use_numpy)
+        for learning_id in range(5):
+            index.add(learning_id, [1.0, 1.0])
+
+        results = index.search([1.0, 1.0], limit=5)
+        assert [i for i, _ in results] == [4, 3, 2, 1, 0]
+        assert results[0][1] == pytest.approx(1.0 + RECENCY_BOOST, abs=1e-5)
+
+    def test_searches_beyond_recency_window(self, use_numpy):
+        index = EmbeddingIndex(use_numpy=use_numpy)
+        index.add(0, [1.0, 0.0])  # oldest, outside the boost window
+        for learning_id in range(1, RECENCY_WINDOW + 50):
+            index.add(learning_id, [0.0, 1.0])
+
+        assert index.search([1.0, 0.0], limit=1)[0][0] == 0
+
+    def test_limit_larger_than_index(self, use_numpy):
+        index = EmbeddingIndex(use_numpy=use_numpy)
+        index.add(1, [1.0, 0.0])
+        index.add(2, [0.0, 1.0])
+        assert {i for i, _ in index.search([1.0, 1.0], limit=10)} == {1, 2}
+
+    def test_empty_index(self, use_numpy):
+        assert EmbeddingIndex(use_numpy=use_numpy).search([1.0], limit=3) == []
+
+    def test_zero_vectors_score_zero_similarity(self, use_numpy):
+        index = EmbeddingIndex(use_numpy=use_numpy)
+        index.add(1, [0.0, 0.0])
+        ((learning_id, score),) = index.search([1.0, 0.0], limit=1)
+        assert learning_id == 1
+        assert score == pytest.approx(RECENCY_BOOST)
+
+    def test_dimension_mismatch(self, use_numpy):
+        index = EmbeddingIndex(use_numpy=use_numpy)
+        assert index.add(1, [1.0, 0.0])
+        assert not index.add(2, [1.0, 0.0, 0.0])
+        assert len(index) == 1
+        with pytest.raises(ValueError, match="dims"):
+            index.search([1.0, 0.0, 0.0], limit=1)
+
+    def test_grows_past_initial_capacity(self, use_numpy):
+        index = EmbeddingIndex(use_numpy=use_numpy)
+        for learning_id in range(500):
+            index.add(learning_id, [float(learning_id), 1.0])
+        assert len(index) == 500
+        assert index.search([1.0, 0.0], limit=1)[0][0] == 499
+
+    def test_stats(self, use_numpy):
+        index = EmbeddingIndex(use_numpy=use_numpy)
+        for learning_id in range(10):
+            index.add(learning_id, [1.0] * 8)
+        index.search([1.0] * 8, limit=3)
+
+        stats = index.stats()
+        assert stats["backend"] == ("numpy" if use_numpy else "python")
+        assert stats["entries"] == 10
+        assert stats["dim"] == 8
+        assert stats["memory_bytes"] > 0
+        assert stats["queries"] == 1
+        assert stats["avg_query_ms"] >= 0
+
+
+@pytest.mark.benchmark
+@pytest.mark.skipif(not HAS_NUMPY, reason="numpy not installed")
+def test_numpy_index_faster_than_per_row_scoring():
+    """Benchmark: vectorized search vs. the old per-row cosine loop."""
+    rng = random.Random(1)
+    vectors = [[rng.uniform(-1, 1) for _ in range(128)] for _ in range(1000)]
+    index = EmbeddingIndex(use_numpy=True)
+    for learning_id, vector in enumerate(vectors):
+        index.add(learning_id, vector)
+    query = [rng.uniform(-1, 1) for _ in range(128)]
+
+    start = time.perf_counter()
+    legacy = _legacy_ranking(vectors, query, 8)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(10):
+        ids = [i for i, _ in index.search(query, limit=8)]
+    index_time = (time.perf_counter() - start) / 10
+
+    assert ids == legacy
+    assert index_time * 10 < legacy_time, (index_time, legacy_time)
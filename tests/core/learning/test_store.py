@@ -21,6 +21,10 @@ def _mock_reviewer(status=LearningStatus.APPROVED, reason="Good"):
     return reviewer
 
 
+def index_stats_entries(store):
+    return store.index_stats()["entries"]
+
+
 @pytest.fixture
 def db_path(tmp_path):
     return tmp_path / "test_learnings.db"
@@ -175,6 +179,69 @@ class TestGetRelevant:
         assert len(results) > 0
         assert all(r.status == LearningStatus.APPROVED for r in results)
 
+    @pytest.mark.asyncio
+    async def test_index_loaded_once_and_updated_on_insert(self, db_path):
+        vectors = {"alpha": [1.0, 0.0], "beta": [0.0, 1.0], "gamma": [0.6, 0.8]}
+
+        async def embed(text):
+            return vectors.get(text, [1.0, 0.0])
+
+        s = LearningStore(db_path=db_path, ethos_text="x", embed_fn=embed)
+        await s.setup()
+        s._reviewer = _mock_reviewer()
+        await s.propose(content="alpha")
+        await s.propose(content="beta")
+
+        assert s.index_stats() is None
+        results = await s.get_relevant("query", limit=1)
+        assert [r.content for r in results] == ["alpha"]
+        index = s._index
+        assert index_stats_entries(s) == 2
+
+        # New approved learnings join the loaded index without a reload
+        await s.propose(content="gamma")
+        vectors["query2"] = [0.6, 0.8]
+        results = await s.get_relevant("query2", limit=1)
+        assert s._index is index
+        assert [r.content for r in results] == ["gamma"]
+        assert index_stats_entries(s) == 3
+
+    @pytest.mark.asyncio
+    async def test_index_excludes_rejected(self, db_path):
+        async def embed(text):
+            return [1.0, 0.0]
+
+        s = LearningStore(db_path=db_path, ethos_text="x", embed_fn=embed)
+        await s.setup()
+        s._reviewer = _mock_reviewer(status=LearningStatus.REJECTED)
+        await s.propose(content="nope")
+
+        assert await s.get_relevant("anything") == []
+        assert index_stats_entries(s) == 0
+
+    @pytest.mark.asyncio
+    async def test_searches_entire_approved_set(self, db_path):
+        """Old learnings beyond the previous 1000-row window are still found."""
+        import sqlite3
+
+        async def embed(text):
+            return [1.0, 0.0] if text == "needle" else [0.0, 1.0]
+
+        s = LearningStore(db_path=db_path, ethos_text="x", embed_fn=embed)
+        await s.setup()
+        conn = sqlite3.connect(db_path)
+        rows = [("needle", _pack_embedding([1.0, 0.0]))]
+        rows += [(f"hay {i}", _pack_embedding([0.0, 1.0])) for i in range(1100)]
+        conn.executemany(
+            "INSERT INTO identity_learnings (content, status, embedding) VALUES (?, 'approved', ?)",
+            rows,
+        )
+        conn.commit()
+        conn.close()
+
+        results = await s.get_relevant("needle", limit=1)
+        assert [r.content for r in results] == ["needle"]
+
     @pytest.mark.asyncio
     async def test_fallback_without_embeddings(self, store):
         await store.propose(content="First")
@@ -18,6 +18,7 @@ import aiohttp
 import pytest
 
 from overblick.core.exceptions import LLMConnectionError, LLMTimeoutError
+from overblick.core.llm.client import ThinkTokenStreamFilter
 from overblick.core.llm.gateway_client import GatewayClient
 
 # ---------------------------------------------------------------------------
@@ -364,6 +365,21 @@ class TestGatewayClientChat:
 
         url = session.post.call_args[0][0]
         assert "complexity" not in url
+        assert "cache" not in url
+
+    async def test_chat_url_with_cache_mode(self):
+        """chat() passes the response cache mode through to the gateway."""
+        session = _make_mock_session()
+        client = _make_client(session)
+
+        await client.chat(
+            messages=[{"role": "user", "content": "Classify"}],
+            priority="low",
+            cache="off",
+        )
+
+        url = session.post.call_args[0][0]
+        assert "cache=off" in url
 
 
 # ---------------------------------------------------------------------------
@@ -371,6 +387,90 @@ class TestGatewayClientChat:
 # ---------------------------------------------------------------------------
 
 
+class _FakeStreamContent:
+    """Async line iterator standing in for aiohttp's StreamReader."""
+
+    def __init__(self, lines: list[bytes]):
+        self._lines = lines
+
+    def __aiter__(self):
+        return self._iter()
+
+    async def _iter(self):
+        for line in self._lines:
+            yield line
+
+
+def _make_stream_session(lines: list[bytes], status: int = 200):
+    session = _make_mock_session(response_status=status)
+    session.post.return_value.content = _FakeStreamContent(lines)
+    return session
+
+
+class TestGatewayClientStream:
+    """Test GatewayClient.chat_stream SSE consumption."""
+
+    @pytest.fixture(autouse=True)
+    def _allow_client(self, monkeypatch):
+        monkeypatch.setenv("OVERBLICK_ALLOW_DIRECT_LLM", "1")
+
+    @pytest.mark.asyncio
+    async def test_yields_deltas_and_strips_think(self):
+        lines = [
+            b'data: {"choices":[{"delta":{"content":"<thi"}}]}\n',
+            b"\n",
+            b'data: {"choices":[{"delta":{"content":"nk>plan</think>  Hel"}}]}\n',
+            b'data: {"choices":[{"delta":{"content":"lo"}}]}\n',
+            b"data: [DONE]\n",
+        ]
+        session = _make_stream_session(lines)
+        client = _make_client(session=session)
+
+        deltas = [d async for d in client.chat_stream([{"role": "user", "content": "Hi"}])]
+
+        assert "".join(deltas) == "Hello"
+        payload = session.post.call_args.kwargs["json"]
+        assert payload["stream"] is True
+
+    @pytest.mark.asyncio
+    async def test_in_band_error_raises(self):
+        lines = [b'data: {"error":{"message":"LLM stream interrupted"}}\n']
+        client = _make_client(session=_make_stream_session(lines))
+
+        with pytest.raises(LLMConnectionError, match="interrupted"):
+            async for _ in client.chat_stream([{"role": "user", "content": "Hi"}]):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_http_error_raises(self):
+        client = _make_client(session=_make_stream_session([], status=503))
+
+        with pytest.raises(LLMConnectionError, match="503"):
+            async for _ in client.chat_stream([{"role": "user", "content": "Hi"}]):
+                pass
+
+
+class TestThinkTokenStreamFilter:
+    """The streaming filter must agree with strip_think_tokens."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "<think>reasoning here</think>\n\nThe answer.",
+            "No thinking at all.",
+            "Before <think>x</think> after",
+            "Ends with a lone < sign",
+        ],
+    )
+    def test_matches_batch_strip_for_any_split(self, text):
+        expected = GatewayClient.strip_think_tokens(text)
+        for size in (1, 2, 3, 7):
+            f = ThinkTokenStreamFilter()
+            out = "".join(f.feed(text[i : i + size]) for i in range(0, len(text), size))
+            out += f.flush()
+            assert out.rstrip() == expected
+
+
 class TestGatewayClientErrors:
     """Test error handling in chat()."""
 
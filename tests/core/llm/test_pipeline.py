@@ -6,7 +6,13 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from overblick.core.llm.pipeline import PipelineResult, PipelineStage, SafeLLMPipeline
+from overblick.core.llm.pipeline import (
+    PipelineResult,
+    PipelineStage,
+    PipelineStreamChunk,
+    SafeLLMPipeline,
+)
+from overblick.core.security.output_safety import OutputSafety
 from overblick.core.security.preflight import PreflightResult, ThreatLevel, ThreatType
 
 
@@ -590,3 +596,124 @@ class TestSafeLLMPipeline:
         assert result.blocked
         assert isinstance(result.stage_timings, dict)
         assert "rate_limit" in result.stage_timings
+
+
+def _streaming_llm(deltas: list[str]):
+    """LLM mock whose chat_stream yields the given deltas."""
+    client = AsyncMock()
+    client.closed = False
+
+    async def _chat_stream(**kwargs):
+        try:
+            for d in deltas:
+                yield d
+        finally:
+            client.closed = True
+
+    client.chat_stream = MagicMock(side_effect=_chat_stream)
+    return client
+
+
+async def _collect(pipeline: SafeLLMPipeline, **kwargs) -> list[PipelineStreamChunk]:
+    return [
+        chunk
+        async for chunk in pipeline.chat_stream(
+            messages=[{"role": "user", "content": "Hello"}], **kwargs
+        )
+    ]
+
+
+class TestSafeLLMPipelineStream:
+    @pytest.mark.asyncio
+    async def test_stream_happy_path(self, mock_audit, mock_output_safety):
+        words = [f"word{i} " for i in range(100)]
+        llm = _streaming_llm(words)
+        pipeline = SafeLLMPipeline(
+            llm_client=llm, audit_log=mock_audit, output_safety=mock_output_safety
+        )
+
+        chunks = await _collect(pipeline)
+
+        deltas = [c.delta for c in chunks if not c.done]
+        final = chunks[-1]
+        assert final.done and not final.result.blocked
+        assert len(deltas) > 1  # released incrementally, not in one piece
+        assert "".join(deltas) == "".join(words)
+        assert final.result.content == "".join(words)
+        assert PipelineStage.COMPLETE in final.result.stages_passed
+        assert mock_audit.log.call_args.kwargs["details"]["streamed"] is True
+
+    @pytest.mark.asyncio
+    async def test_stream_short_reply_released_at_end(self):
+        pipeline = SafeLLMPipeline(llm_client=_streaming_llm(["Hi ", "there!"]))
+
+        chunks = await _collect(pipeline)
+
+        assert [c.delta for c in chunks if not c.done] == ["Hi there!"]
+        assert chunks[-1].result.content == "Hi there!"
+
+    @pytest.mark.asyncio
+    async def test_stream_blocks_before_unsafe_text_is_released(self):
+        safe = [f"word{i} " for i in range(60)]
+        unsafe = ["as ", "an ", "aside, ", "i ", "am ", "an ", "ai ", "model "]
+        tail = [f"more{i} " for i in range(60)]
+        llm = _streaming_llm(safe + unsafe + tail)
+        pipeline = SafeLLMPipeline(llm_client=llm, output_safety=OutputSafety("Test"))
+
+        chunks = await _collect(pipeline)
+
+        released = "".join(c.delta for c in chunks if not c.done)
+        final = chunks[-1].result
+        assert final.blocked
+        assert final.block_stage == PipelineStage.OUTPUT_SAFETY
+        assert final.deflection
+        assert "i am" not in released
+        assert llm.closed  # upstream stream stopped early
+
+    @pytest.mark.asyncio
+    async def test_stream_preflight_blocks_without_llm_call(self, mock_preflight):
+        mock_preflight.check = AsyncMock(
+            return_value=PreflightResult(
+                allowed=False,
+                threat_level=ThreatLevel.HOSTILE,
+                threat_type=ThreatType.JAILBREAK,
+                threat_score=0.9,
+                reason="jailbreak attempt",
+            )
+        )
+        llm = _streaming_llm(["never"])
+        pipeline = SafeLLMPipeline(llm_client=llm, preflight_checker=mock_preflight)
+
+        chunks = await _collect(pipeline)
+
+        assert len(chunks) == 1
+        assert chunks[0].result.block_stage == PipelineStage.PREFLIGHT
+        llm.chat_stream.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_stream_llm_error(self, mock_audit):
+        llm = AsyncMock()
+
+        async def _broken(**kwargs):
+            yield "partial "
+            raise ConnectionError("gone")
+
+        llm.chat_stream = MagicMock(side_effect=_broken)
+        pipeline = SafeLLMPipeline(llm_client=llm, audit_log=mock_audit)
+
+        chunks = await _collect(pipeline)
+
+        assert chunks[-1].result.blocked
+        assert chunks[-1].result.block_stage == PipelineStage.LLM_CALL
+        assert pipeline._circuit_breaker.failure_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_passes_priority(self):
+        llm = _streaming_llm(["ok"])
+        pipeline = SafeLLMPipeline(llm_client=llm)
+
+        await _collect(pipeline, priority="low", complexity="high")
+
+        kwargs = llm.chat_stream.call_args.kwargs
+        assert kwargs["priority"] == "low"
+        assert kwargs["complexity"] == "high"
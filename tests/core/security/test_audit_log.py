@@ -63,6 +63,98 @@ class TestAuditLog:
         assert log.count(action="old_action") == 0
 
 
+class TestAuditLogHashChain:
+    def test_chain_tip_seeded_from_existing_db(self, tmp_path):
+        path = tmp_path / "audit.db"
+        log = AuditLog(path, identity="test")
+        log.log(action="first")
+        tip = log._chain_tip
+        log.close()
+
+        reopened = AuditLog(path, identity="test")
+        assert reopened._chain_tip == tip == reopened._get_last_hash()
+        reopened.log(action="second")
+        assert reopened.verify_chain() == (True, [])
+        reopened.close()
+
+    def test_log_does_not_reread_last_row(self, tmp_path):
+        log = AuditLog(tmp_path / "audit.db", identity="test")
+        log._get_last_hash = lambda: pytest.fail("write path re-read the chain tip")
+        for i in range(3):
+            log.log(action="step", details={"i": i})
+        assert log.verify_chain() == (True, [])
+        log.close()
+
+    def test_verify_detects_tampering(self, tmp_path):
+        log = AuditLog(tmp_path / "audit.db", identity="test")
+        ids = [log.log(action="entry", details={"i": i}) for i in range(4)]
+        log._conn.execute("UPDATE audit_log SET action = 'forged' WHERE id = ?", (ids[1],))
+        log._conn.commit()
+
+        valid, tampered = log.verify_chain()
+        assert not valid
+        # The row after the forged one no longer links to it
+        assert tampered[0] == ids[2]
+        log.close()
+
+    def test_incremental_verify_resumes_from_checkpoint(self, tmp_path):
+        log = AuditLog(tmp_path / "audit.db", identity="test")
+        for i in range(5):
+            log.log(action="old", details={"i": i})
+        assert log.verify_chain() == (True, [])
+        checkpoint = log._conn.execute(
+            "SELECT last_id FROM audit_chain_checkpoint WHERE id = 1"
+        ).fetchone()
+        assert checkpoint == (5,)
+
+        new_ids = [log.log(action="new", details={"i": i}) for i in range(3)]
+        hashed = []
+        original = log._hash_row
+        log._hash_row = lambda row: hashed.append(row) or original(row)
+
+        assert log.verify_chain(incremental=True) == (True, [])
+        # Checkpointed row plus the three new ones, not the whole log
+        assert len(hashed) == 4
+        assert log._conn.execute("SELECT last_id FROM audit_chain_checkpoint").fetchone() == (
+            new_ids[-1],
+        )
+        log.close()
+
+    def test_incremental_verify_detects_tampering_after_checkpoint(self, tmp_path):
+        log = AuditLog(tmp_path / "audit.db", identity="test")
+        for i in range(3):
+            log.log(action="old", details={"i": i})
+        log.verify_chain()
+        ids = [log.log(action="new", details={"i": i}) for i in range(3)]
+        log._conn.execute("UPDATE audit_log SET error = 'x' WHERE id = ?", (ids[0],))
+        log._conn.commit()
+
+        valid, tampered = log.verify_chain(incremental=True)
+        assert not valid
+        assert tampered[0] == ids[1]
+        # A failed run keeps the old checkpoint so the problem keeps showing
+        assert log._conn.execute("SELECT last_id FROM audit_chain_checkpoint").fetchone() == (3,)
+        log.close()
+
+    def test_incremental_verify_detects_modified_checkpoint_row(self, tmp_path):
+        log = AuditLog(tmp_path / "audit.db", identity="test")
+        for i in range(3):
+            log.log(action="entry", details={"i": i})
+        log.verify_chain()
+        log._conn.execute("UPDATE audit_log SET action = 'forged' WHERE id = 3")
+        log._conn.commit()
+
+        assert log.verify_chain(incremental=True) == (False, [3])
+        log.close()
+
+    def test_incremental_without_checkpoint_is_full_verify(self, tmp_path):
+        log = AuditLog(tmp_path / "audit.db", identity="test")
+        for i in range(3):
+            log.log(action="entry", details={"i": i})
+        assert log.verify_chain(incremental=True) == (True, [])
+        log.close()
+
+
 class TestAuditLogBackgroundCleanup:
     @pytest.mark.asyncio
     async def test_start_background_cleanup_creates_task(self, tmp_path):
@@ -125,3 +217,58 @@ class TestAuditLogBackgroundCleanup:
         log.stop_background_cleanup()
 
         assert log.count(action="ancient") == 0
+
+
+class TestAuditLogGroupCommit:
+    @pytest.mark.asyncio
+    async def test_entries_batched_into_one_commit(self, tmp_path):
+        log = AuditLog(tmp_path / "audit.db", identity="test", group_commit_window_ms=5)
+        calls = []
+        original = log._flush_pending_sync
+
+        def spy():
+            written = original()
+            calls.append(written)
+            return written
+
+        log._flush_pending_sync = spy
+        for i in range(10):
+            log.log(action="batched", details={"i": i})
+        assert log.count(action="batched") == 0
+
+        await asyncio.sleep(0.1)
+        await asyncio.to_thread(log._write_executor.submit(lambda: None).result)
+
+        assert calls == [10]
+        assert log.count(action="batched") == 10
+        log.close()
+
+    @pytest.mark.asyncio
+    async def test_batched_entries_keep_hash_chain(self, tmp_path):
+        log = AuditLog(tmp_path / "audit.db", identity="test", group_commit_window_ms=5)
+        log._log_sync("before", "general", None, None, True, None, None)
+        for i in range(5):
+            log.log(action="batched", details={"i": i}, duration_ms=float(i))
+        log.flush()
+        log.log(action="after")
+        log.flush()
+
+        assert log.count() == 7
+        assert log.verify_chain() == (True, [])
+        log.close()
+
+    @pytest.mark.asyncio
+    async def test_close_writes_pending_entries(self, tmp_path):
+        path = tmp_path / "audit.db"
+        log = AuditLog(path, identity="test", group_commit_window_ms=10_000)
+        log.log(action="pending")
+        log.close()
+
+        reopened = AuditLog(path, identity="test")
+        assert reopened.count(action="pending") == 1
+        reopened.close()
+
+    def test_audit_log_stays_fully_synchronous(self, tmp_path):
+        log = AuditLog(tmp_path / "audit.db", identity="test", group_commit_window_ms=5)
+        assert log._conn.execute("PRAGMA synchronous").fetchone()[0] == 2
+        log.close()
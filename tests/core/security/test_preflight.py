@@ -23,6 +23,12 @@ class TestNormalize:
         result = _normalize_for_patterns("h\u0435llo")
         assert "e" in result
 
+    def test_strips_combining_marks_and_modifiers(self):
+        assert _normalize_for_patterns("caf\u00e9 ^x`") == "cafe x"
+
+    def test_greek_lookalikes(self):
+        assert _normalize_for_patterns("\u03c1r\u03bfmpt") == "prompt"
+
 
 class TestPatternDetection:
     @pytest.mark.asyncio
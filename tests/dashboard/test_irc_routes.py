@@ -365,3 +365,72 @@ class TestIdentityColor:
         color = _identity_color("test")
         assert color.startswith("hsl(")
         assert color.endswith(")")
+
+
+class TestIRCServiceJournal:
+    """IRCService reading the plugin's append-only journal."""
+
+    @staticmethod
+    def _journal(tmp_path, identity="anomal"):
+        from overblick.plugins.irc.journal import ConversationJournal
+
+        return ConversationJournal(tmp_path / "data" / identity / "irc" / "journal")
+
+    @staticmethod
+    def _conv(conv_id, turns, state="active", updated_at=1000.0):
+        return IRCConversation(
+            id=conv_id,
+            topic=f"Topic {conv_id}",
+            participants=["anomal", "cherry"],
+            state=state,
+            updated_at=updated_at,
+            turns=[
+                IRCTurn(identity="anomal", content=f"turn {n}", turn_number=n) for n in range(turns)
+            ],
+        ).model_dump(mode="json")
+
+    def test_pages_headers_without_turns(self, tmp_path):
+        journal = self._journal(tmp_path)
+        for n in range(5):
+            journal.record(self._conv(f"c{n}", 3, state="completed", updated_at=float(n)))
+
+        svc = IRCService(tmp_path)
+
+        assert svc.has_data()
+        page = svc.get_conversations(limit=2, offset=1)
+        assert [c["id"] for c in page] == ["c3", "c2"]
+        assert "turns" not in page[0]
+
+    def test_current_conversation_tails_new_turns(self, tmp_path):
+        journal = self._journal(tmp_path)
+        journal.record(self._conv("old", 2, state="completed", updated_at=5000.0))
+        journal.record(self._conv("live", 2))
+        svc = IRCService(tmp_path)
+
+        current = svc.get_current_conversation()
+        assert current["id"] == "live"
+        assert len(current["turns"]) == 2
+
+        journal.record(self._conv("live", 4, updated_at=6000.0))
+
+        assert [t["content"] for t in svc.get_current_conversation(tail=2)["turns"]] == [
+            "turn 2",
+            "turn 3",
+        ]
+        assert svc.get_conversations()[0]["id"] == "live"
+
+    def test_merges_journal_and_legacy_identities(self, tmp_path):
+        import json
+
+        self._journal(tmp_path, "anomal").record(self._conv("j1", 1, updated_at=2000.0))
+        legacy_dir = tmp_path / "data" / "cherry" / "irc"
+        legacy_dir.mkdir(parents=True)
+        (legacy_dir / "conversations.json").write_text(
+            json.dumps([self._conv("l1", 1, updated_at=1000.0)])
+        )
+
+        svc = IRCService(tmp_path)
+
+        assert [c["id"] for c in svc.get_conversations()] == ["j1", "l1"]
+        assert svc.get_conversation("l1")["turns"][0]["content"] == "turn 0"
+        assert svc.get_conversation("j1")["turns"][0]["content"] == "turn 0"
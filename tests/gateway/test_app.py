@@ -1,13 +1,14 @@
 """Tests for FastAPI application."""
 
 import asyncio
+import json
 from collections.abc import Generator
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from fastapi.testclient import TestClient
 
-from overblick.gateway.models import ChatMessage, ChatResponse, Priority
+from overblick.gateway.models import CacheMode, ChatMessage, ChatResponse, Priority
 from overblick.gateway.ollama_client import OllamaConnectionError
 
 
@@ -54,8 +55,11 @@ class TestFastAPIApp:
                 requests_high_priority=5,
                 requests_low_priority=5,
                 avg_response_time_ms=100.0,
+                avg_wait_time_ms=20.0,
                 is_processing=False,
+                active_requests=0,
                 uptime_seconds=3600.0,
+                backends={},
             )
         )
         return qm
@@ -142,6 +146,26 @@ class TestFastAPIApp:
         call_args = mock_queue_manager.submit.call_args
         assert call_args[0][1] == Priority.HIGH
 
+    @pytest.mark.parametrize(
+        "query, expected",
+        [
+            ("", CacheMode.AUTO),
+            ("?cache=off", CacheMode.OFF),
+            ("?cache=FORCE", CacheMode.FORCE),
+            ("?cache=bogus", CacheMode.AUTO),
+        ],
+    )
+    def test_chat_completion_cache_mode(self, client, mock_queue_manager, query, expected):
+        payload = {
+            "model": "qwen3:8b",
+            "messages": [{"role": "user", "content": "Hello!"}],
+        }
+
+        response = client.post(f"/v1/chat/completions{query}", json=payload)
+
+        assert response.status_code == 200
+        assert mock_queue_manager.submit.call_args.kwargs["cache"] == expected
+
     def test_chat_completion_connection_error(self, client, mock_queue_manager):
         mock_queue_manager.submit = AsyncMock(side_effect=OllamaConnectionError("Cannot connect"))
 
@@ -166,6 +190,69 @@ class TestFastAPIApp:
 
         assert response.status_code == 504
 
+    def test_chat_completion_stream(self, client, mock_queue_manager):
+        async def fake_stream(request, priority, backend=None):
+            for text in ("Hel", "lo"):
+                yield {"choices": [{"index": 0, "delta": {"content": text}}]}
+
+        mock_queue_manager.submit_stream = MagicMock(side_effect=fake_stream)
+
+        payload = {
+            "model": "qwen3:8b",
+            "messages": [{"role": "user", "content": "Hello!"}],
+            "stream": True,
+        }
+
+        response = client.post("/v1/chat/completions?priority=high", json=payload)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = [line[6:] for line in response.text.splitlines() if line.startswith("data: ")]
+        assert events[-1] == "[DONE]"
+        deltas = [json.loads(e)["choices"][0]["delta"]["content"] for e in events[:-1]]
+        assert deltas == ["Hel", "lo"]
+        mock_queue_manager.submit.assert_not_called()
+
+    def test_chat_completion_stream_connection_error(self, client, mock_queue_manager):
+        """Errors before the first chunk still map to HTTP status codes."""
+
+        async def failing_stream(request, priority, backend=None):
+            raise OllamaConnectionError("Cannot connect")
+            yield  # pragma: no cover
+
+        mock_queue_manager.submit_stream = MagicMock(side_effect=failing_stream)
+
+        payload = {
+            "model": "qwen3:8b",
+            "messages": [{"role": "user", "content": "Hello!"}],
+            "stream": True,
+        }
+
+        response = client.post("/v1/chat/completions", json=payload)
+
+        assert response.status_code == 503
+
+    def test_chat_completion_stream_mid_stream_error(self, client, mock_queue_manager):
+        async def breaking_stream(request, priority, backend=None):
+            yield {"choices": [{"index": 0, "delta": {"content": "Hel"}}]}
+            raise OllamaConnectionError("connection reset")
+
+        mock_queue_manager.submit_stream = MagicMock(side_effect=breaking_stream)
+
+        payload = {
+            "model": "qwen3:8b",
+            "messages": [{"role": "user", "content": "Hello!"}],
+            "stream": True,
+        }
+
+        response = client.post("/v1/chat/completions", json=payload)
+
+        assert response.status_code == 200
+        events = [line[6:] for line in response.text.splitlines() if line.startswith("data: ")]
+        assert "error" in json.loads(events[-2])
+        assert "connection reset" not in response.text
+        assert events[-1] == "[DONE]"
+
     def test_chat_completion_invalid_request(self, client):
         payload = {"model": "qwen3:8b"}
 
@@ -15,7 +15,11 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 import pytest_asyncio
 
-from overblick.gateway.backend_registry import BackendConfig, BackendRegistry
+from overblick.gateway.backend_registry import (
+    DEFAULT_REMOTE_CONCURRENCY,
+    BackendConfig,
+    BackendRegistry,
+)
 from overblick.gateway.config import GatewayConfig
 
 
@@ -258,6 +262,27 @@ class TestClientRetrieval:
         assert registry.get_model("local") == "qwen3:8b"
 
 
+class TestConcurrency:
+    """Tests for per-backend worker concurrency."""
+
+    def test_defaults_local_serial_remote_parallel(self, multi_backend_config):
+        registry = BackendRegistry(multi_backend_config)
+        assert registry.get_concurrency("local") == 1
+        assert registry.get_concurrency("deepseek") == DEFAULT_REMOTE_CONCURRENCY
+
+    def test_configured_concurrency(self, multi_backend_config):
+        multi_backend_config.backends["local"]["concurrency"] = 2
+        multi_backend_config.backends["deepseek"]["concurrency"] = 8
+        registry = BackendRegistry(multi_backend_config)
+        assert registry.get_concurrency("local") == 2
+        assert registry.get_concurrency("deepseek") == 8
+
+    def test_legacy_fallback_uses_max_concurrent(self, base_config):
+        base_config.max_concurrent_requests = 3
+        registry = BackendRegistry(base_config)
+        assert registry.get_concurrency() == 3
+
+
 class TestProperties:
     """Tests for registry properties."""
 
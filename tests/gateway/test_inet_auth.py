@@ -171,3 +171,167 @@ class TestAPIKeyManager:
 
         assert raw_1 != raw_2
         assert rec_1.key_id != rec_2.key_id
+
+
+class TestVerifiedKeyCache:
+    """Tests for the verified-key cache and async verification."""
+
+    @pytest.fixture
+    def checkpw(self, monkeypatch):
+        """Count bcrypt.checkpw calls made by the key manager."""
+        import bcrypt
+
+        from overblick.gateway import inet_auth
+
+        calls = []
+        real = bcrypt.checkpw
+
+        def counting(password, hashed):
+            calls.append(password)
+            return real(password, hashed)
+
+        monkeypatch.setattr(inet_auth.bcrypt, "checkpw", counting)
+        return calls
+
+    def test_repeat_verification_skips_bcrypt(self, key_manager: APIKeyManager, checkpw):
+        raw_key, record = key_manager.create_key(name="cached")
+
+        assert key_manager.verify_key(raw_key).key_id == record.key_id
+        assert key_manager.verify_key(raw_key).key_id == record.key_id
+        assert len(checkpw) == 1
+
+    def test_revoke_invalidates_cache(self, key_manager: APIKeyManager):
+        raw_key, record = key_manager.create_key(name="revoked")
+        assert key_manager.verify_key(raw_key) is not None
+
+        key_manager.revoke_key(record.key_id)
+        assert key_manager.verify_key(raw_key) is None
+
+    def test_revoke_during_verify_is_not_cached(self, key_manager: APIKeyManager, monkeypatch):
+        """A verify that selected the row before a revoke must not cache it."""
+        import bcrypt
+
+        from overblick.gateway import inet_auth
+
+        raw_key, record = key_manager.create_key(name="racing")
+        real = bcrypt.checkpw
+
+        def revoke_mid_compare(password, hashed):
+            key_manager.revoke_key(record.key_id)
+            return real(password, hashed)
+
+        monkeypatch.setattr(inet_auth.bcrypt, "checkpw", revoke_mid_compare)
+        assert key_manager.verify_key(raw_key) is not None
+        monkeypatch.setattr(inet_auth.bcrypt, "checkpw", real)
+
+        assert key_manager.verify_key(raw_key) is None
+
+    def test_rotate_invalidates_cache(self, key_manager: APIKeyManager):
+        raw_key, record = key_manager.create_key(name="rotated")
+        assert key_manager.verify_key(raw_key) is not None
+
+        key_manager.rotate_key(record.key_id)
+        assert key_manager.verify_key(raw_key) is None
+
+    def test_cache_entry_expires(self, tmp_path: Path, checkpw, monkeypatch):
+        from overblick.gateway import inet_auth
+
+        now = [1000.0]
+        monkeypatch.setattr(inet_auth.time, "monotonic", lambda: now[0])
+        manager = APIKeyManager(tmp_path / "ttl.db", verify_cache_ttl=10)
+        try:
+            raw_key, _ = manager.create_key(name="ttl")
+            manager.verify_key(raw_key)
+            now[0] += 11
+            manager.verify_key(raw_key)
+        finally:
+            manager.close()
+
+        assert len(checkpw) == 2
+
+    def test_cache_disabled(self, tmp_path: Path, checkpw):
+        manager = APIKeyManager(tmp_path / "nocache.db", verify_cache_ttl=0)
+        try:
+            raw_key, _ = manager.create_key(name="nocache")
+            manager.verify_key(raw_key)
+            manager.verify_key(raw_key)
+        finally:
+            manager.close()
+
+        assert len(checkpw) == 2
+
+    def test_unknown_keys_always_pay_bcrypt(self, key_manager: APIKeyManager, checkpw):
+        key_manager.create_key(name="real")
+        bogus = "sk-ob-" + "0" * 32
+
+        assert key_manager.verify_key(bogus) is None
+        assert key_manager.verify_key(bogus) is None
+        assert len(checkpw) == 2
+
+    async def test_averify_key(self, key_manager: APIKeyManager, checkpw):
+        raw_key, record = key_manager.create_key(name="async")
+
+        first = await key_manager.averify_key(raw_key)
+        second = await key_manager.averify_key(raw_key)
+
+        assert first.key_id == second.key_id == record.key_id
+        assert len(checkpw) == 1
+        assert await key_manager.averify_key("not-a-key") is None
+
+
+class TestBatchedUsage:
+    """Tests for buffered usage counters."""
+
+    @staticmethod
+    def _stored_usage(key_manager: APIKeyManager, key_id: str) -> tuple:
+        return (
+            key_manager._get_conn()
+            .execute(
+                "SELECT total_requests, total_tokens_used, last_used_ip FROM api_keys "
+                "WHERE key_id = ?",
+                (key_id,),
+            )
+            .fetchone()
+        )
+
+    def test_usage_buffered_until_flush(self, key_manager: APIKeyManager):
+        _, record = key_manager.create_key(name="batched")
+
+        key_manager.update_usage(record.key_id, tokens=10, ip="1.1.1.1")
+        key_manager.update_usage(record.key_id, tokens=5)
+        assert self._stored_usage(key_manager, record.key_id) == (0, 0, "")
+
+        assert key_manager.flush_usage() == 1
+        assert self._stored_usage(key_manager, record.key_id) == (2, 15, "1.1.1.1")
+        assert key_manager.flush_usage() == 0
+
+    def test_cached_record_tracks_flushed_usage(self, key_manager: APIKeyManager):
+        raw_key, record = key_manager.create_key(name="cached-usage")
+        key_manager.verify_key(raw_key)  # populate cache
+
+        key_manager.update_usage(record.key_id, tokens=7)
+        key_manager.flush_usage()
+        key_manager.update_usage(record.key_id, tokens=3)
+
+        verified = key_manager.verify_key(raw_key)
+        assert verified.total_requests == 2
+        assert verified.total_tokens_used == 10
+
+    def test_list_keys_includes_pending_usage(self, key_manager: APIKeyManager):
+        _, record = key_manager.create_key(name="listed")
+        key_manager.update_usage(record.key_id, tokens=42)
+
+        (listed,) = key_manager.list_keys()
+        assert listed.total_tokens_used == 42
+
+    def test_close_flushes(self, tmp_path: Path):
+        manager = APIKeyManager(tmp_path / "close.db")
+        raw_key, record = manager.create_key(name="closing")
+        manager.update_usage(record.key_id, tokens=9)
+        manager.close()
+
+        reopened = APIKeyManager(tmp_path / "close.db")
+        try:
+            assert reopened.verify_key(raw_key).total_tokens_used == 9
+        finally:
+            reopened.close()
@@ -496,6 +496,74 @@ class TestViolationTracker:
         assert tracker.is_banned("2.2.2.2") is False
 
 
+class TestChatStreaming:
+    """Tests for SSE pass-through on /v1/chat/completions."""
+
+    def test_stream_passed_through(
+        self,
+        client: TestClient,
+        key_manager: APIKeyManager,
+        audit_log: InetAuditLog,
+    ):
+        import overblick.gateway.internet_gateway as gw
+
+        _, headers = _create_key_and_header(key_manager)
+        body = (
+            b'data: {"choices":[{"index":0,"delta":{"content":"Hel"}}]}\n\n'
+            b'data: {"choices":[{"index":0,"delta":{"content":"lo"}}]}\n\n'
+            b'data: {"choices":[],"usage":{"prompt_tokens":7,"completion_tokens":2}}\n\n'
+            b"data: [DONE]\n\n"
+        )
+        upstream = httpx.Response(200, stream=httpx.ByteStream(body))
+        gw._http_client.send.return_value = upstream  # type: ignore
+
+        response = client.post(
+            "/v1/chat/completions",
+            headers=headers,
+            json={
+                "model": "qwen3:8b",
+                "messages": [{"role": "user", "content": "hello"}],
+                "stream": True,
+            },
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.content == body
+        assert gw._http_client.send.call_args.kwargs["stream"] is True  # type: ignore
+        gw._http_client.request.assert_not_called()  # type: ignore
+
+        entries = audit_log.query(limit=10)
+        assert entries[0]["request_tokens"] == 7
+        assert entries[0]["response_tokens"] == 2
+
+    def test_stream_upstream_error_masked(
+        self,
+        client: TestClient,
+        key_manager: APIKeyManager,
+    ):
+        import overblick.gateway.internet_gateway as gw
+
+        _, headers = _create_key_and_header(key_manager)
+        upstream = httpx.Response(
+            503, stream=httpx.ByteStream(b'{"detail": "Queue is full. Try again later."}')
+        )
+        gw._http_client.send.return_value = upstream  # type: ignore
+
+        response = client.post(
+            "/v1/chat/completions",
+            headers=headers,
+            json={
+                "model": "qwen3:8b",
+                "messages": [{"role": "user", "content": "hello"}],
+                "stream": True,
+            },
+        )
+
+        assert response.status_code == 502
+        assert "Queue" not in response.text
+
+
 class TestAuditLogging:
     """Tests for audit trail writing."""
 
@@ -1,5 +1,6 @@
 """Tests for Ollama client."""
 
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -195,3 +196,48 @@ class TestOllamaClient:
     async def test_embed_empty_text(self, client):
         result = await client.embed("")
         assert result == []
+
+    async def test_chat_completion_stream(self, client, sample_request):
+        body = (
+            'data: {"choices":[{"index":0,"delta":{"content":"Hi"}}]}\n\n'
+            ": keep-alive comment\n\n"
+            'data: {"choices":[{"index":0,"delta":{"content":" there"}}]}\n\n'
+            "data: [DONE]\n\n"
+        )
+        seen = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen["payload"] = json.loads(request.content)
+            return httpx.Response(200, text=body)
+
+        client._client = httpx.AsyncClient(
+            base_url="http://ollama.test", transport=httpx.MockTransport(handler)
+        )
+
+        chunks = [c async for c in client.chat_completion_stream(sample_request)]
+
+        assert [c["choices"][0]["delta"]["content"] for c in chunks] == ["Hi", " there"]
+        assert seen["payload"]["stream"] is True
+        assert seen["payload"]["stream_options"] == {"include_usage": True}
+
+    async def test_chat_completion_stream_http_error(self, client, sample_request):
+        client._client = httpx.AsyncClient(
+            base_url="http://ollama.test",
+            transport=httpx.MockTransport(lambda r: httpx.Response(404, text="model not found")),
+        )
+
+        with pytest.raises(OllamaError, match="404"):
+            async for _ in client.chat_completion_stream(sample_request):
+                pass
+
+    async def test_chat_completion_stream_connection_error(self, client, sample_request):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("Connection refused")
+
+        client._client = httpx.AsyncClient(
+            base_url="http://ollama.test", transport=httpx.MockTransport(handler)
+        )
+
+        with pytest.raises(OllamaConnectionError):
+            async for _ in client.chat_completion_stream(sample_request):
+                pass
@@ -1,7 +1,7 @@
 """Tests for QueueManager."""
 
 import asyncio
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -187,3 +187,182 @@ class TestQueueManager:
             assert qm.queue_size == 0
         finally:
             await qm.stop()
+
+    async def test_submit_stream_yields_chunks(self, config, sample_request):
+        chunks = [{"choices": [{"index": 0, "delta": {"content": t}}]} for t in ("He", "llo")]
+
+        async def fake_stream(request):
+            for chunk in chunks:
+                yield chunk
+
+        mock_client = AsyncMock()
+        mock_client.chat_completion_stream = fake_stream
+        qm = QueueManager(config=config, client=mock_client)
+        await qm.start()
+
+        try:
+            received = [c async for c in qm.submit_stream(sample_request, Priority.HIGH)]
+            assert received == chunks
+            assert qm.get_stats().requests_high_priority == 1
+        finally:
+            await qm.stop()
+
+    async def test_submit_stream_error_propagation(self, config, sample_request):
+        async def broken_stream(request):
+            yield {"choices": [{"index": 0, "delta": {"content": "partial"}}]}
+            raise Exception("Stream broke")
+
+        mock_client = AsyncMock()
+        mock_client.chat_completion_stream = broken_stream
+        qm = QueueManager(config=config, client=mock_client)
+        await qm.start()
+
+        try:
+            received = []
+            with pytest.raises(Exception, match="Stream broke"):
+                async for chunk in qm.submit_stream(sample_request):
+                    received.append(chunk)
+            assert len(received) == 1
+        finally:
+            await qm.stop()
+
+    async def test_submit_stream_early_close_frees_worker(self, config, sample_request):
+        """Closing the stream early stops the relay so the next request runs."""
+        backend_closed = asyncio.Event()
+
+        async def endless_stream(request):
+            try:
+                while True:
+                    await asyncio.sleep(0.01)
+                    yield {"choices": [{"index": 0, "delta": {"content": "x"}}]}
+            finally:
+                backend_closed.set()
+
+        mock_client = AsyncMock()
+        mock_client.chat_completion_stream = endless_stream
+        mock_client.chat_completion.return_value = ChatResponse.from_message(
+            model="qwen3:8b", content="after"
+        )
+        qm = QueueManager(config=config, client=mock_client)
+        await qm.start()
+
+        try:
+            stream = qm.submit_stream(sample_request)
+            await anext(stream)
+            await stream.aclose()
+
+            await asyncio.wait_for(backend_closed.wait(), timeout=2.0)
+            response = await qm.submit(sample_request)
+            assert response.choices[0].message.content == "after"
+        finally:
+            await qm.stop()
+
+
+class TestBackendPools:
+    """Per-backend queues and worker pools."""
+
+    @pytest.fixture
+    def config(self):
+        return GatewayConfig(max_queue_size=10, request_timeout_seconds=5.0)
+
+    @staticmethod
+    def _registry(clients: dict, concurrency: dict):
+        registry = MagicMock()
+        registry.default_backend = "local"
+        registry.available_backends = list(clients)
+        registry.get_client = MagicMock(side_effect=lambda name=None: clients[name or "local"])
+        registry.get_concurrency = MagicMock(side_effect=lambda name=None: concurrency[name])
+        return registry
+
+    @staticmethod
+    def _request(text: str) -> ChatRequest:
+        return ChatRequest(model="qwen3:8b", messages=[ChatMessage(role="user", content=text)])
+
+    async def test_slow_remote_does_not_block_local(self, config):
+        release_remote = asyncio.Event()
+
+        async def slow_remote(request):
+            await release_remote.wait()
+            return ChatResponse.from_message("deepseek-chat", "remote")
+
+        local = AsyncMock()
+        local.chat_completion.return_value = ChatResponse.from_message("qwen3:8b", "local")
+        remote = AsyncMock()
+        remote.chat_completion.side_effect = slow_remote
+
+        registry = self._registry({"local": local, "deepseek": remote}, {"local": 1, "deepseek": 2})
+        qm = QueueManager(config=config, client=local, registry=registry)
+        await qm.start()
+
+        try:
+            remote_tasks = [
+                asyncio.create_task(qm.submit(self._request("r"), backend="deepseek"))
+                for _ in range(2)
+            ]
+            await asyncio.sleep(0.05)
+
+            response = await asyncio.wait_for(qm.submit(self._request("l")), timeout=1.0)
+            assert response.choices[0].message.content == "local"
+
+            stats = qm.get_stats()
+            assert stats.backends["deepseek"].active_requests == 2
+            assert stats.backends["deepseek"].concurrency == 2
+            assert stats.backends["local"].requests_processed == 1
+
+            release_remote.set()
+            await asyncio.gather(*remote_tasks)
+        finally:
+            await qm.stop()
+
+    async def test_remote_pool_runs_in_parallel(self, config):
+        in_flight = 0
+        peak = 0
+
+        async def tracked(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return ChatResponse.from_message("deepseek-chat", "ok")
+
+        remote = AsyncMock()
+        remote.chat_completion.side_effect = tracked
+        local = AsyncMock()
+
+        registry = self._registry({"local": local, "deepseek": remote}, {"local": 1, "deepseek": 3})
+        qm = QueueManager(config=config, client=local, registry=registry)
+        await qm.start()
+
+        try:
+            await asyncio.gather(
+                *(qm.submit(self._request(str(i)), backend="deepseek") for i in range(6))
+            )
+            assert peak == 3
+            assert qm.get_stats().backends["deepseek"].avg_wait_time_ms > 0
+        finally:
+            await qm.stop()
+
+    async def test_local_pool_keeps_priority_order(self, config):
+        order = []
+
+        async def record(request):
+            order.append(request.messages[-1].content)
+            await asyncio.sleep(0.02)
+            return ChatResponse.from_message("qwen3:8b", "ok")
+
+        local = AsyncMock()
+        local.chat_completion.side_effect = record
+        registry = self._registry({"local": local}, {"local": 1})
+        qm = QueueManager(config=config, client=local, registry=registry)
+        await qm.start()
+
+        try:
+            first = asyncio.create_task(qm.submit(self._request("first")))
+            await asyncio.sleep(0.005)
+            low = asyncio.create_task(qm.submit(self._request("low"), Priority.LOW))
+            high = asyncio.create_task(qm.submit(self._request("high"), Priority.HIGH))
+            await asyncio.gather(first, low, high)
+            assert order == ["first", "high", "low"]
+        finally:
+            await qm.stop()
@@ -0,0 +1,296 @@
+"""Tests for the gateway response cache."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from overblick.gateway.config import GatewayConfig
+from overblick.gateway.models import CacheMode, ChatMessage, ChatRequest, ChatResponse, Priority
+from overblick.gateway.queue_manager import QueueManager
+from overblick.gateway.response_cache import ResponseCache
+
+
+def _request(content: str = "Classify this email", temperature: float = 0.0, **kw) -> ChatRequest:
+    return ChatRequest(
+        model="qwen3:8b",
+        messages=[
+            ChatMessage(role="system", content="You are a classifier."),
+            ChatMessage(role="user", content=content),
+        ],
+        temperature=temperature,
+        **kw,
+    )
+
+
+def _response(content: str = "spam") -> ChatResponse:
+    return ChatResponse.from_message(model="qwen3:8b", content=content)
+
+
+class TestResponseCache:
+    """Unit tests for ResponseCache."""
+
+    def test_key_normalizes_whitespace(self):
+        a = ResponseCache.make_key(_request("Classify  this\nemail "))
+        b = ResponseCache.make_key(_request("Classify this email"))
+        assert a == b
+
+    def test_key_includes_sampling_params_and_backend(self):
+        base = ResponseCache.make_key(_request(), "local")
+        assert base != ResponseCache.make_key(_request(max_tokens=50), "local")
+        assert base != ResponseCache.make_key(_request(top_p=0.5), "local")
+        assert base != ResponseCache.make_key(_request(), "deepseek")
+
+    def test_cacheable_rules(self):
+        assert ResponseCache.is_cacheable(_request(temperature=0.0))
+        assert not ResponseCache.is_cacheable(_request(temperature=0.7))
+        assert ResponseCache.is_cacheable(_request(temperature=0.7), CacheMode.FORCE)
+        assert not ResponseCache.is_cacheable(_request(temperature=0.0), CacheMode.OFF)
+        assert not ResponseCache.is_cacheable(_request(stream=True), CacheMode.FORCE)
+
+    def test_hit_returns_fresh_copy(self):
+        cache = ResponseCache()
+        original = _response()
+        cache.put("k", original)
+
+        hit = cache.get("k")
+        assert hit is not None
+        assert hit.choices[0].message.content == "spam"
+        assert hit.id != original.id
+        assert cache.hits == 1
+
+        hit.choices[0].message.content = "mutated"
+        assert cache.get("k").choices[0].message.content == "spam"
+
+    def test_ttl_expiry(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("overblick.gateway.response_cache.time.monotonic", lambda: now[0])
+        cache = ResponseCache(ttl_seconds=10)
+        cache.put("k", _response())
+
+        now[0] += 9
+        assert cache.get("k") is not None
+        now[0] += 2
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        cache.put("a", _response("a"))
+        cache.put("b", _response("b"))
+        cache.get("a")  # a is now most recently used
+        cache.put("c", _response("c"))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_empty_responses_not_cached(self):
+        cache = ResponseCache()
+        cache.put("k", _response(""))
+        assert len(cache) == 0
+
+    def test_semantic_lookup(self):
+        cache = ResponseCache(semantic_threshold=0.95)
+        cache.put("k", _response(), context_key="ctx", embedding=[1.0, 0.0, 0.0])
+
+        assert cache.get_similar("ctx", [0.99, 0.05, 0.0]) is not None
+        assert cache.semantic_hits == 1
+        assert cache.get_similar("ctx", [0.0, 1.0, 0.0]) is None
+        assert cache.get_similar("other", [1.0, 0.0, 0.0]) is None
+
+    def test_semantic_disabled(self):
+        cache = ResponseCache()
+        cache.put("k", _response(), context_key="ctx", embedding=[1.0, 0.0])
+        assert cache.get_similar("ctx", [1.0, 0.0]) is None
+
+    def test_eviction_cleans_semantic_index(self):
+        cache = ResponseCache(max_entries=1, semantic_threshold=0.9)
+        cache.put("a", _response(), context_key="ctx", embedding=[1.0, 0.0])
+        cache.put("b", _response(), context_key="other", embedding=[1.0, 0.0])
+        assert cache.get_similar("ctx", [1.0, 0.0]) is None
+        assert "ctx" not in cache._by_context
+
+
+class TestQueueManagerCache:
+    """Response cache integration in QueueManager.submit()."""
+
+    @pytest.fixture
+    def config(self):
+        return GatewayConfig(max_queue_size=10, request_timeout_seconds=5.0)
+
+    @pytest.fixture
+    def mock_client(self):
+        client = AsyncMock()
+        client.chat_completion.return_value = _response()
+        client.close.return_value = None
+        return client
+
+    async def test_deterministic_request_served_from_cache(self, config, mock_client):
+        qm = QueueManager(config=config, client=mock_client)
+        await qm.start()
+        try:
+            first = await qm.submit(_request(), Priority.LOW)
+            second = await qm.submit(_request(), Priority.LOW)
+        finally:
+            await qm.stop()
+
+        assert mock_client.chat_completion.await_count == 1
+        assert second.choices[0].message.content == first.choices[0].message.content
+        stats = qm.get_stats()
+        assert stats.cache_hits == 1
+        assert stats.cache_misses == 1
+        assert stats.cache_entries == 1
+        # Cache hits never reach a worker
+        assert stats.requests_processed == 1
+
+    async def test_sampled_request_not_cached_unless_forced(self, config, mock_client):
+        qm = QueueManager(config=config, client=mock_client)
+        await qm.start()
+        try:
+            await qm.submit(_request(temperature=0.7), Priority.LOW)
+            await qm.submit(_request(temperature=0.7), Priority.LOW)
+            assert mock_client.chat_completion.await_count == 2
+
+            await qm.submit(_request(temperature=0.7), Priority.LOW, cache=CacheMode.FORCE)
+            await qm.submit(_request(temperature=0.7), Priority.LOW, cache=CacheMode.FORCE)
+            assert mock_client.chat_completion.await_count == 3
+        finally:
+            await qm.stop()
+
+    async def test_opt_out(self, config, mock_client):
+        qm = QueueManager(config=config, client=mock_client)
+        await qm.start()
+        try:
+            await qm.submit(_request(), Priority.LOW)
+            await qm.submit(_request(), Priority.LOW, cache=CacheMode.OFF)
+        finally:
+            await qm.stop()
+
+        assert mock_client.chat_completion.await_count == 2
+
+    async def test_cache_disabled_in_config(self, mock_client):
+        config = GatewayConfig(cache_enabled=False)
+        qm = QueueManager(config=config, client=mock_client)
+        await qm.start()
+        try:
+            await qm.submit(_request(), Priority.LOW)
+            await qm.submit(_request(), Priority.LOW)
+        finally:
+            await qm.stop()
+
+        assert mock_client.chat_completion.await_count == 2
+        assert qm.get_stats().cache_misses == 0
+
+    async def test_identical_inflight_requests_coalesce(self, config, mock_client):
+        release = asyncio.Event()
+
+        async def slow_chat(request):
+            await release.wait()
+            return _response()
+
+        mock_client.chat_completion.side_effect = slow_chat
+        qm = QueueManager(config=config, client=mock_client)
+        await qm.start()
+        try:
+            tasks = [asyncio.create_task(qm.submit(_request(), Priority.LOW)) for _ in range(3)]
+            await asyncio.sleep(0.05)
+            release.set()
+            responses = await asyncio.gather(*tasks)
+        finally:
+            await qm.stop()
+
+        assert mock_client.chat_completion.await_count == 1
+        assert all(r.choices[0].message.content == "spam" for r in responses)
+        assert qm.get_stats().cache_coalesced == 2
+
+    async def test_leader_cancel_does_not_fail_followers(self, config, mock_client):
+        release = asyncio.Event()
+
+        async def slow_chat(request):
+            await release.wait()
+            return _response()
+
+        mock_client.chat_completion.side_effect = slow_chat
+        qm = QueueManager(config=config, client=mock_client)
+        await qm.start()
+        try:
+            leader = asyncio.create_task(qm.submit(_request(), Priority.LOW))
+            await asyncio.sleep(0.01)
+            followers = [asyncio.create_task(qm.submit(_request(), Priority.LOW)) for _ in range(2)]
+            await asyncio.sleep(0.01)
+
+            leader.cancel()
+            await asyncio.sleep(0.01)
+            release.set()
+            responses = await asyncio.gather(*followers)
+        finally:
+            await qm.stop()
+
+        assert leader.cancelled()
+        assert all(r.choices[0].message.content == "spam" for r in responses)
+        # One follower was promoted; the other coalesced onto it
+        assert qm.get_stats().cache_coalesced == 3
+
+    async def test_follower_cancel_is_not_retried(self, config, mock_client):
+        release = asyncio.Event()
+
+        async def slow_chat(request):
+            await release.wait()
+            return _response()
+
+        mock_client.chat_completion.side_effect = slow_chat
+        qm = QueueManager(config=config, client=mock_client)
+        await qm.start()
+        try:
+            leader = asyncio.create_task(qm.submit(_request(), Priority.LOW))
+            await asyncio.sleep(0.01)
+            follower = asyncio.create_task(qm.submit(_request(), Priority.LOW))
+            await asyncio.sleep(0.01)
+
+            follower.cancel()
+            await asyncio.sleep(0.01)
+            release.set()
+            response = await leader
+        finally:
+            await qm.stop()
+
+        assert follower.cancelled()
+        assert response.choices[0].message.content == "spam"
+        assert mock_client.chat_completion.await_count == 1
+
+    async def test_errors_are_not_cached(self, config, mock_client):
+        mock_client.chat_completion.side_effect = [RuntimeError("boom"), _response()]
+        qm = QueueManager(config=config, client=mock_client)
+        await qm.start()
+        try:
+            with pytest.raises(RuntimeError):
+                await qm.submit(_request(), Priority.LOW)
+            response = await qm.submit(_request(), Priority.LOW)
+        finally:
+            await qm.stop()
+
+        assert response.choices[0].message.content == "spam"
+        assert mock_client.chat_completion.await_count == 2
+
+    async def test_semantic_tier_uses_embeddings(self, mock_client):
+        config = GatewayConfig(cache_semantic_enabled=True, cache_semantic_threshold=0.9)
+        vectors = {
+            "Classify this email": [1.0, 0.0],
+            "Classify this e-mail": [0.98, 0.1],
+            "Write a poem": [0.0, 1.0],
+        }
+        mock_client.embed = AsyncMock(side_effect=lambda text, model: vectors[text])
+        qm = QueueManager(config=config, client=mock_client)
+        await qm.start()
+        try:
+            await qm.submit(_request("Classify this email"), Priority.LOW)
+            await qm.submit(_request("Classify this e-mail"), Priority.LOW)
+            await qm.submit(_request("Write a poem"), Priority.LOW)
+        finally:
+            await qm.stop()
+
+        assert mock_client.chat_completion.await_count == 2
+        stats = qm.get_stats()
+        assert stats.cache_semantic_hits == 1
+        assert stats.cache_misses == 2
@@ -1,7 +1,7 @@
 """Tests for CompassPlugin — identity drift detector."""
 
 import json
-import time
+import random
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -12,7 +12,7 @@ from overblick.plugins.compass.models import (
     DriftMetrics,
     StyleMetrics,
 )
-from overblick.plugins.compass.plugin import CompassPlugin
+from overblick.plugins.compass.plugin import _MAX_JOURNAL_LINES, CompassPlugin
 
 
 class TestSetup:
@@ -352,3 +352,171 @@ class TestTeardown:
 
         state_file = compass_context.data_dir / "compass_state.json"
         assert state_file.exists()
+
+
+_STYLES = (
+    "This is a consistent test output with the same style and tone. "
+    "Always writing with similar sentence length and vocabulary richness.",
+    "Furthermore, the comprehensive analysis demonstrates significant "
+    "correlations between the observed phenomena and established predictions.",
+    "Honestly, I think we should try it again? It worked last time, and "
+    "we learned a lot from the first attempt, right?",
+)
+
+
+def _synthetic_output(rng, i: int) -> str:
+    words = _STYLES[i % len(_STYLES)].split()
+    rng.shuffle(words)
+    return " ".join(words) + f" Sample {i}."
+
+
+class TestIncrementalTick:
+    """Drift checks and persistence only touch new data."""
+
+    @staticmethod
+    async def _plugin_with_baseline(compass_context) -> CompassPlugin:
+        plugin = CompassPlugin(compass_context)
+        await plugin.setup()
+        for _ in range(6):
+            plugin.record_output("anomal", _STYLES[0])
+        await plugin.tick()
+        assert "anomal" in plugin._baselines
+        return plugin
+
+    @pytest.mark.asyncio
+    async def test_idle_tick_checks_and_writes_nothing(self, compass_context):
+        plugin = await self._plugin_with_baseline(compass_context)
+        history = len(plugin._drift_history)
+        journal = compass_context.data_dir / "compass_journal.jsonl"
+        size = journal.stat().st_size
+
+        await plugin.tick()
+
+        assert len(plugin._drift_history) == history
+        assert journal.stat().st_size == size
+
+    @pytest.mark.asyncio
+    async def test_only_updated_identities_checked(self, compass_context):
+        plugin = await self._plugin_with_baseline(compass_context)
+        for _ in range(6):
+            plugin.record_output("cherry", _STYLES[1])
+        await plugin.tick()
+
+        plugin.record_output("cherry", _STYLES[1])
+        await plugin.tick()
+
+        last = plugin.get_drift_history(limit=1)[0]
+        assert last.identity_name == "cherry"
+        assert len(plugin.get_drift_history(identity_name="anomal")) == 1
+
+    @pytest.mark.asyncio
+    async def test_tick_appends_only_new_records(self, compass_context):
+        plugin = await self._plugin_with_baseline(compass_context)
+        journal = compass_context.data_dir / "compass_journal.jsonl"
+        before = journal.read_bytes()
+
+        plugin.record_output("anomal", _STYLES[0])
+        await plugin.tick()
+
+        after = journal.read_bytes()
+        assert after.startswith(before)
+        new_lines = [json.loads(line) for line in after[len(before) :].splitlines()]
+        assert [r["kind"] for r in new_lines] == ["drift"]
+        assert not (compass_context.data_dir / "compass_state.json").exists()
+
+    @pytest.mark.asyncio
+    async def test_journal_survives_restart(self, compass_context):
+        plugin = await self._plugin_with_baseline(compass_context)
+        plugin.record_output("anomal", _STYLES[0])
+        await plugin.tick()
+
+        plugin2 = CompassPlugin(compass_context)
+        await plugin2.setup()
+
+        assert plugin2.get_baseline("anomal") == plugin.get_baseline("anomal")
+        assert plugin2.get_drift_history() == plugin.get_drift_history()
+
+    @pytest.mark.asyncio
+    async def test_snapshot_supersedes_journal(self, compass_context):
+        plugin = await self._plugin_with_baseline(compass_context)
+        journal = compass_context.data_dir / "compass_journal.jsonl"
+        stale = journal.read_bytes()
+        await plugin.teardown()
+        assert not journal.exists()
+
+        # A journal left behind by a crash mid-compaction is not replayed twice
+        journal.write_bytes(stale)
+        plugin2 = CompassPlugin(compass_context)
+        await plugin2.setup()
+        assert len(plugin2._drift_history) == len(plugin._drift_history)
+
+    @pytest.mark.asyncio
+    async def test_torn_journal_line_ignored(self, compass_context):
+        plugin = await self._plugin_with_baseline(compass_context)
+        journal = compass_context.data_dir / "compass_journal.jsonl"
+        with open(journal, "a") as f:
+            f.write('{"seq": 99, "kind": "drift", "da')
+
+        plugin2 = CompassPlugin(compass_context)
+        await plugin2.setup()
+        assert len(plugin2._drift_history) == len(plugin._drift_history)
+
+    @pytest.mark.asyncio
+    async def test_long_journal_compacted_into_snapshot(self, compass_context):
+        plugin = await self._plugin_with_baseline(compass_context)
+        for _ in range(_MAX_JOURNAL_LINES + 5):
+            plugin.record_output("anomal", _STYLES[0])
+            await plugin.tick()
+
+        state = json.loads((compass_context.data_dir / "compass_state.json").read_text())
+        journal = compass_context.data_dir / "compass_journal.jsonl"
+        journal_lines = len(journal.read_text().splitlines()) if journal.exists() else 0
+        assert journal_lines <= _MAX_JOURNAL_LINES
+        assert "anomal" in state["baselines"]
+
+        plugin2 = CompassPlugin(compass_context)
+        await plugin2.setup()
+        assert plugin2.get_drift_history(limit=500) == plugin.get_drift_history(limit=500)
+
+
+@pytest.mark.asyncio
+async def test_tick_work_independent_of_history(compass_context, monkeypatch):
+    """Thousands of outputs; late ticks analyze and persist no more than early ones."""
+    from overblick.plugins.compass import plugin as compass_plugin
+
+    analyzed: list[int] = []
+    appended: list[int] = []
+    real_analyze, real_append = compass_plugin.analyze_texts, compass_plugin.append_records
+
+    def counting_analyze(texts):
+        texts = list(texts)
+        analyzed.append(len(texts))
+        return real_analyze(texts)
+
+    def counting_append(directory, records):
+        appended.append(len(records))
+        real_append(directory, records)
+
+    monkeypatch.setattr(compass_plugin, "analyze_texts", counting_analyze)
+    monkeypatch.setattr(compass_plugin, "append_records", counting_append)
+
+    rng = random.Random(5)
+    identities = ["anomal", "cherry", "blixt", "stal"]
+    per_tick = 20
+    ticks = 200  # 4000 outputs
+
+    plugin = CompassPlugin(compass_context)
+    await plugin.setup()
+    for t in range(ticks):
+        for i in range(per_tick):
+            n = t * per_tick + i
+            plugin.record_output(identities[n % len(identities)], _synthetic_output(rng, n))
+        await plugin.tick()
+
+    assert len(plugin._drift_history) == 500  # History capped and full
+    assert all(name in plugin._baselines for name in identities)
+
+    # O(new outputs): every tick analyzes only its own outputs, and a tick
+    # with full history persists no more records than one before it
+    assert analyzed == [per_tick] * ticks
+    assert max(appended[-30:]) <= max(appended[:40]), (appended[:40], appended[-30:])
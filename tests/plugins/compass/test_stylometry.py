@@ -1,9 +1,19 @@
 """Tests for stylometric analysis functions."""
 
+import random
+import statistics
+
 import pytest
 
 from overblick.plugins.compass.models import StyleMetrics
-from overblick.plugins.compass.stylometry import analyze_text, compute_drift_score
+from overblick.plugins.compass.stylometry import (
+    STYLE_DIMENSIONS,
+    RunningStats,
+    StyleWindow,
+    analyze_text,
+    analyze_texts,
+    compute_drift_score,
+)
 
 
 class TestAnalyzeText:
@@ -116,3 +126,94 @@ class TestComputeDriftScore:
         score_tight, _ = compute_drift_score(current, baseline, tight)
         score_loose, _ = compute_drift_score(current, baseline, loose)
         assert score_tight > score_loose
+
+
+def _random_metrics(rng: random.Random) -> StyleMetrics:
+    return StyleMetrics(
+        **{dim: round(rng.uniform(0, 20), 4) for dim in STYLE_DIMENSIONS},
+        word_count=rng.randint(10, 300),
+    )
+
+
+class TestAnalyzeTexts:
+    """Batch extraction."""
+
+    def test_matches_per_text_analysis(self):
+        texts = [
+            "This is a simple test. It has two sentences.",
+            "",
+            "lol yeah?! gonna do it!! haha wow!!",
+            "This is a simple test. It has two sentences.",
+        ]
+        assert analyze_texts(texts) == [analyze_text(t) for t in texts]
+
+    def test_accepts_generator(self):
+        assert len(analyze_texts(t for t in ["One two three.", "Four five."])) == 2
+
+
+class TestRunningStats:
+    """Welford running statistics."""
+
+    def test_matches_batch_mean_and_stdev(self):
+        rng = random.Random(7)
+        samples = [_random_metrics(rng) for _ in range(50)]
+        stats = RunningStats()
+        for sample in samples:
+            stats.add(sample)
+
+        mean = stats.mean()
+        std_devs = stats.std_devs()
+        for dim, digits in zip(STYLE_DIMENSIONS, (2, 2, 4, 2, 4, 4, 2, 4)):
+            values = [getattr(s, dim) for s in samples]
+            assert getattr(mean, dim) == round(statistics.fmean(values), digits)
+            assert std_devs[dim] == pytest.approx(round(statistics.stdev(values), 4), abs=1e-4)
+        assert mean.word_count == sum(s.word_count for s in samples) // 50
+
+    def test_std_devs_need_two_samples(self):
+        stats = RunningStats()
+        assert stats.std_devs() == {}
+        stats.add(StyleMetrics(avg_sentence_length=10.0))
+        assert stats.std_devs() == {}
+        assert stats.mean().avg_sentence_length == 10.0
+
+    def test_remove_reverses_add(self):
+        rng = random.Random(3)
+        kept = [_random_metrics(rng) for _ in range(5)]
+        extra = _random_metrics(rng)
+
+        stats = RunningStats()
+        for sample in kept:
+            stats.add(sample)
+        stats.add(extra)
+        stats.remove(extra)
+
+        expected = RunningStats()
+        for sample in kept:
+            expected.add(sample)
+        assert stats.count == 5
+        assert stats.mean() == expected.mean()
+        assert stats.std_devs() == pytest.approx(expected.std_devs(), abs=1e-4)
+
+    def test_remove_last_sample_resets(self):
+        stats = RunningStats()
+        stats.add(StyleMetrics(avg_sentence_length=10.0, word_count=20))
+        stats.remove(StyleMetrics(avg_sentence_length=10.0, word_count=20))
+        assert stats.count == 0
+        assert stats.mean() == StyleMetrics()
+
+
+class TestStyleWindow:
+    """Rolling window with running statistics."""
+
+    def test_mean_covers_last_size_samples(self):
+        rng = random.Random(11)
+        samples = [_random_metrics(rng) for _ in range(2000)]
+        window = StyleWindow(size=20)
+        for sample in samples:
+            window.add(sample)
+
+        recent = RunningStats()
+        for sample in samples[-20:]:
+            recent.add(sample)
+        assert len(window) == 20
+        assert window.mean() == recent.mean()
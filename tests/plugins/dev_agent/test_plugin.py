@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, MagicMock, PropertyMock, patch
 
 import pytest
 
+from overblick.core.agentic.models import PlannedAction
 from overblick.plugins.dev_agent.models import ActionType
 from overblick.plugins.dev_agent.plugin import DevAgentPlugin
 
@@ -116,6 +117,16 @@ class TestDevAgentPlugin:
         assert types == {a.value for a in ActionType}
         assert len(types) == 7
 
+    def test_workspace_actions_share_a_group(self, mock_ctx):
+        plugin = DevAgentPlugin(mock_ctx)
+
+        def group(action_type):
+            return plugin.get_action_group(PlannedAction(action_type=action_type))
+
+        assert group("fix_bug") == group("run_tests") == group("analyze_bug") == "workspace"
+        assert group("notify_owner") is None
+        assert group("skip") is None
+
     def test_get_learning_categories(self, mock_ctx):
         plugin = DevAgentPlugin(mock_ctx)
         cats = plugin.get_learning_categories()
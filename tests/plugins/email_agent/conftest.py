@@ -128,6 +128,7 @@ def mock_gmail_capability():
     cap.fetch_unread = AsyncMock(return_value=[])
     cap.send_reply = AsyncMock(return_value=True)
     cap.mark_as_read = AsyncMock(return_value=True)
+    cap.on_new_mail = MagicMock(return_value=True)
     return cap
 
 
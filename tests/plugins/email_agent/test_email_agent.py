@@ -3,6 +3,7 @@ Tests for the email_agent plugin — lifecycle, classification, database, IPC,
 sender reputation, cross-identity consultation, and enhanced feedback.
 """
 
+import asyncio
 import email.utils
 import json
 import time
@@ -270,6 +271,81 @@ class TestEmailAgentTick:
 
         await plugin.tick()  # Should not raise
 
+    @pytest.mark.asyncio
+    async def test_tick_registers_imap_push_once(self, stal_plugin_context, mock_gmail_capability):
+        """The first inbox check asks GmailCapability for IDLE push, later ones don't."""
+        plugin = EmailAgentPlugin(stal_plugin_context)
+        await plugin.setup()
+
+        plugin._state.last_check = 0
+        await plugin.tick()
+        plugin._state.last_check = 0
+        await plugin.tick()
+
+        mock_gmail_capability.on_new_mail.assert_called_once_with(plugin._on_new_mail)
+
+    @pytest.mark.asyncio
+    async def test_imap_push_disabled_by_config(self, stal_plugin_context, mock_gmail_capability):
+        """imap_push: false keeps the plugin on plain interval polling."""
+        stal_plugin_context.identity.raw_config["email_agent"]["imap_push"] = False
+        plugin = EmailAgentPlugin(stal_plugin_context)
+        await plugin.setup()
+        plugin._state.last_check = 0
+
+        await plugin.tick()
+
+        mock_gmail_capability.on_new_mail.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_push_checks_inbox_within_interval(
+        self, stal_plugin_context, mock_gmail_capability
+    ):
+        """A push notification fetches immediately, ignoring the tick interval."""
+        plugin = EmailAgentPlugin(stal_plugin_context)
+        await plugin.setup()
+        plugin._state.last_check = time.time()  # Just checked
+
+        plugin._on_new_mail()
+        await plugin._push_task
+
+        mock_gmail_capability.fetch_unread.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_push_during_check_runs_one_more_check(
+        self, stal_plugin_context, mock_gmail_capability
+    ):
+        """Pushes arriving mid-check coalesce into a single follow-up check."""
+        plugin = EmailAgentPlugin(stal_plugin_context)
+        await plugin.setup()
+        calls = 0
+
+        async def fetch(**kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                plugin._on_new_mail()
+                plugin._on_new_mail()
+            return []
+
+        mock_gmail_capability.fetch_unread = AsyncMock(side_effect=fetch)
+
+        plugin._on_new_mail()
+        await plugin._push_task
+
+        assert calls == 2
+
+    @pytest.mark.asyncio
+    async def test_teardown_stops_imap_push(self, stal_plugin_context, mock_gmail_capability):
+        """teardown() unregisters the push callback."""
+        plugin = EmailAgentPlugin(stal_plugin_context)
+        await plugin.setup()
+        plugin._state.last_check = 0
+        await plugin.tick()
+
+        await plugin.teardown()
+
+        mock_gmail_capability.on_new_mail.assert_called_with(None)
+
 
 class TestEmailAgentActions:
     """Test action execution methods."""
@@ -1008,6 +1084,36 @@ class TestDeduplicationAndMarkRead:
 
         await db.close()
 
+    @pytest.mark.asyncio
+    async def test_filter_processed_database_method(self, tmp_path):
+        """filter_processed() returns the known subset of message IDs in one call."""
+        from overblick.core.database.base import DatabaseConfig
+        from overblick.core.database.sqlite_backend import SQLiteBackend
+
+        backend = SQLiteBackend(DatabaseConfig(sqlite_path=str(tmp_path / "filter.db")))
+        db = EmailAgentDB(backend)
+        await db.setup()
+
+        for message_id in ("<a@x>", "<c@x>"):
+            await db.record_email(
+                EmailRecord(
+                    gmail_message_id=message_id,
+                    email_from="test@example.com",
+                    email_subject="Test",
+                    classified_intent="ignore",
+                    confidence=0.9,
+                    reasoning="Test",
+                )
+            )
+
+        assert await db.filter_processed(["<a@x>", "<b@x>", "<c@x>", "<a@x>", ""]) == {
+            "<a@x>",
+            "<c@x>",
+        }
+        assert await db.filter_processed([]) == set()
+
+        await db.close()
+
 
 class TestResearchIntegration:
     """Test research capability integration."""
@@ -1981,7 +2087,7 @@ class TestGmailMessageHeaders:
 
 
 class TestGmailHeaderExtraction:
-    """Test that _imap_fetch_message extracts classification-relevant headers."""
+    """Test that _parse_message extracts classification-relevant headers."""
 
     @pytest.mark.asyncio
     async def test_fetch_extracts_list_unsubscribe(self):
@@ -2345,6 +2451,7 @@ class TestMaxEmailAgeFilter:
         mock_gmail_capability.fetch_unread.assert_called_once_with(
             max_results=10,
             since_days=expected_since_days,
+            skip=plugin._db.filter_processed,
         )
 
     @pytest.mark.asyncio
@@ -2366,6 +2473,7 @@ class TestMaxEmailAgeFilter:
         mock_gmail_capability.fetch_unread.assert_called_once_with(
             max_results=10,
             since_days=2,
+            skip=plugin._db.filter_processed,
         )
 
     @pytest.mark.asyncio
@@ -2387,6 +2495,7 @@ class TestMaxEmailAgeFilter:
         mock_gmail_capability.fetch_unread.assert_called_once_with(
             max_results=10,
             since_days=1,
+            skip=plugin._db.filter_processed,
         )
 
 
@@ -3078,3 +3187,134 @@ class TestReplyRateLimiting:
 
         result = await plugin._execute_action(email, classification)
         assert result == "reply_rate_limited_notify_fallback"
+
+
+class TestEmailPipeline:
+    """Staged batch processing in _process_emails()."""
+
+    @staticmethod
+    def _email(n: int, sender: str | None = None, **extra) -> dict:
+        return {
+            "sender": sender or f"person{n}@example{n}.com",
+            "subject": f"Subject {n}",
+            "body": f"Body {n}",
+            "snippet": f"Body {n}",
+            "message_id": f"pipe-{n}",
+            "thread_id": f"thread-{n}",
+            "headers": {},
+            **extra,
+        }
+
+    @staticmethod
+    def _notify(confidence: float = 0.95) -> EmailClassification:
+        return EmailClassification(intent=EmailIntent.NOTIFY, confidence=confidence, reasoning="x")
+
+    @pytest.mark.asyncio
+    async def test_classification_concurrency_is_bounded(self, stal_plugin_context):
+        """At most classify_concurrency LLM classifications run at once."""
+        stal_plugin_context.identity.raw_config["email_agent"]["classify_concurrency"] = 2
+        plugin = EmailAgentPlugin(stal_plugin_context)
+        await plugin.setup()
+        in_flight = peak = 0
+
+        async def classify(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return self._notify()
+
+        plugin._classifier.classify = classify
+        plugin._execute_action = AsyncMock(return_value="notification_sent")
+
+        await plugin._process_emails([self._email(n) for n in range(6)])
+
+        assert peak == 2
+        assert plugin._execute_action.await_count == 6
+
+    @pytest.mark.asyncio
+    async def test_actions_keep_order_per_sender(self, stal_plugin_context):
+        """A sender's emails are acted on in fetch order even if classified out of order."""
+        plugin = EmailAgentPlugin(stal_plugin_context)
+        await plugin.setup()
+        delays = {"Body 0": 0.05, "Body 1": 0.0, "Body 2": 0.0}
+
+        async def classify(sender, subject, body, **kwargs):
+            await asyncio.sleep(next(d for k, d in delays.items() if k in body))
+            return self._notify()
+
+        order = []
+
+        async def execute(email, classification, email_record_id=None):
+            order.append(email["message_id"])
+            return "notification_sent"
+
+        plugin._classifier.classify = classify
+        plugin._execute_action = execute
+
+        await plugin._process_emails(
+            [
+                self._email(0, sender="same@example.com"),
+                self._email(1, sender="same@example.com"),
+                self._email(2),
+            ]
+        )
+
+        assert order.index("pipe-0") < order.index("pipe-1")
+        assert sorted(order) == ["pipe-0", "pipe-1", "pipe-2"]
+
+    @pytest.mark.asyncio
+    async def test_prefilter_skips_llm_for_phishing(self, stal_plugin_context):
+        """Phishing patterns are caught before the classification stage."""
+        plugin = EmailAgentPlugin(stal_plugin_context)
+        await plugin.setup()
+        plugin._classifier.classify = AsyncMock(return_value=self._notify())
+        plugin._execute_action = AsyncMock(return_value="ignored")
+        phishing = self._email(
+            1,
+            subject="Urgent: verify your account",
+            body="Your account will be suspended. Click here to verify your password.",
+        )
+        assert plugin._classifier.prefilter(
+            phishing["sender"], phishing["subject"], phishing["body"]
+        )
+
+        await plugin._process_emails([phishing, self._email(2)])
+
+        assert plugin._classifier.classify.await_count == 1
+        records = {r.email_subject: r for r in await plugin._db.get_recent_emails(limit=5)}
+        assert records["Urgent: verify your account"].classified_intent == "ignore"
+
+    @pytest.mark.asyncio
+    async def test_failed_email_does_not_stop_batch(self, stal_plugin_context):
+        """An exception while classifying one email leaves the others untouched."""
+        plugin = EmailAgentPlugin(stal_plugin_context)
+        await plugin.setup()
+
+        async def classify(sender, subject, body, **kwargs):
+            if "Body 0" in body:
+                raise RuntimeError("LLM exploded")
+            return self._notify()
+
+        plugin._classifier.classify = classify
+        plugin._execute_action = AsyncMock(return_value="notification_sent")
+
+        await plugin._process_emails([self._email(0), self._email(1), self._email(2)])
+
+        assert plugin._execute_action.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_dedup_uses_one_query(self, stal_plugin_context):
+        """Processed and repeated message IDs are filtered before any LLM work."""
+        plugin = EmailAgentPlugin(stal_plugin_context)
+        await plugin.setup()
+        plugin._classifier.classify = AsyncMock(return_value=self._notify())
+        plugin._execute_action = AsyncMock(return_value="notification_sent")
+        await plugin._process_emails([self._email(0)])
+        plugin._classifier.classify.reset_mock()
+        plugin._db.has_been_processed = AsyncMock(side_effect=AssertionError("per-email query"))
+
+        await plugin._process_emails([self._email(0), self._email(1), self._email(1)])
+
+        assert plugin._classifier.classify.await_count == 1
@@ -76,3 +76,174 @@ class TestGitHubAPIClient:
         original = client._rate_limit_remaining
         client._update_rate_limit({})
         assert client._rate_limit_remaining == original
+
+
+class _FakeGitHub:
+    """Local HTTP stand-in: serves JSON with an ETag and honours If-None-Match."""
+
+    def __init__(self):
+        self.payload = [{"number": 1, "title": "First"}]
+        self.version = 1
+        self.requests: list[dict] = []
+        self.remaining = 4999
+
+    @property
+    def etag(self) -> str:
+        return f'"v{self.version}"'
+
+    async def handle(self, request):
+        from aiohttp import web
+
+        self.requests.append(
+            {
+                "path": request.path,
+                "query": dict(request.query),
+                "if_none_match": request.headers.get("If-None-Match"),
+            }
+        )
+        headers = {"ETag": self.etag, "X-RateLimit-Reset": "1700000000"}
+        if request.headers.get("If-None-Match") == self.etag:
+            headers["X-RateLimit-Remaining"] = str(self.remaining)
+            return web.Response(status=304, headers=headers)
+        self.remaining -= 1
+        headers["X-RateLimit-Remaining"] = str(self.remaining)
+        return web.json_response(self.payload, headers=headers)
+
+    async def handle_post(self, request):
+        from aiohttp import web
+
+        self.requests.append({"path": request.path, "method": "POST"})
+        return web.json_response({"id": 99}, status=201)
+
+
+@pytest.fixture
+async def fake_github():
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    fake = _FakeGitHub()
+    app = web.Application()
+    app.router.add_get("/repos/{owner}/{repo}/issues", fake.handle)
+    app.router.add_post("/repos/{owner}/{repo}/issues/{number}/comments", fake.handle_post)
+    server = TestServer(app)
+    await server.start_server()
+    fake.base_url = str(server.make_url("")).rstrip("/")
+    yield fake
+    await server.close()
+
+
+@pytest.fixture
+async def github_db(tmp_path):
+    from overblick.core.database.base import DatabaseConfig
+    from overblick.core.database.sqlite_backend import SQLiteBackend
+    from overblick.plugins.github.database import GitHubDB
+
+    db = GitHubDB(SQLiteBackend(DatabaseConfig(sqlite_path=str(tmp_path / "github.db"))))
+    await db.setup()
+    yield db
+    await db.close()
+
+
+class TestConditionalRequests:
+    """ETag revalidation against a local HTTP stand-in."""
+
+    @pytest.mark.asyncio
+    async def test_304_served_from_cache(self, fake_github):
+        """The second GET revalidates with If-None-Match and reuses the body."""
+        client = GitHubAPIClient(base_url=fake_github.base_url)
+        try:
+            first = await client.list_issues("o/r")
+            second = await client.list_issues("o/r")
+        finally:
+            await client.close()
+
+        assert first == second == fake_github.payload
+        assert [r["if_none_match"] for r in fake_github.requests] == [None, '"v1"']
+        stats = client.cache_stats()
+        assert stats["cache_hits"] == 1
+        assert stats["cache_misses"] == 1
+        assert stats["rate_limit_saved"] == 1
+        assert stats["rate_limit_remaining"] == 4998
+
+    @pytest.mark.asyncio
+    async def test_changed_resource_refetched(self, fake_github):
+        """A new ETag on the server replaces the cached body."""
+        client = GitHubAPIClient(base_url=fake_github.base_url)
+        try:
+            await client.list_issues("o/r")
+            fake_github.payload = [{"number": 2, "title": "Second"}]
+            fake_github.version = 2
+            changed = await client.list_issues("o/r")
+            again = await client.list_issues("o/r")
+        finally:
+            await client.close()
+
+        assert changed == again == [{"number": 2, "title": "Second"}]
+        assert client.cache_stats()["cache_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_params_are_part_of_the_key(self, fake_github):
+        """Different query parameters are cached separately."""
+        client = GitHubAPIClient(base_url=fake_github.base_url)
+        try:
+            await client.list_issues("o/r", state="open")
+            await client.list_issues("o/r", state="closed")
+        finally:
+            await client.close()
+
+        assert [r["if_none_match"] for r in fake_github.requests] == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_cached_body_not_shared_between_callers(self, fake_github):
+        """Mutating a returned result does not corrupt the cache."""
+        client = GitHubAPIClient(base_url=fake_github.base_url)
+        try:
+            first = await client.list_issues("o/r")
+            first[0]["title"] = "mutated"
+            second = await client.list_issues("o/r")
+        finally:
+            await client.close()
+
+        assert second[0]["title"] == "First"
+
+    @pytest.mark.asyncio
+    async def test_post_not_cached(self, fake_github):
+        """Only GETs are cached or revalidated."""
+        client = GitHubAPIClient(base_url=fake_github.base_url)
+        try:
+            assert await client.create_comment("o/r", 1, "hi") == {"id": 99}
+            assert await client.create_comment("o/r", 1, "hi") == {"id": 99}
+        finally:
+            await client.close()
+
+        assert client.cache_stats()["cached_entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_persists_across_clients(self, fake_github, github_db):
+        """A restarted client revalidates using the ETag stored in GitHubDB."""
+        first = GitHubAPIClient(base_url=fake_github.base_url, cache_store=github_db)
+        try:
+            await first.list_issues("o/r")
+        finally:
+            await first.close()
+
+        second = GitHubAPIClient(base_url=fake_github.base_url, cache_store=github_db)
+        try:
+            result = await second.list_issues("o/r")
+        finally:
+            await second.close()
+
+        assert result == fake_github.payload
+        assert fake_github.requests[-1]["if_none_match"] == '"v1"'
+        assert second.cache_stats()["cache_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_prune_http_cache(self, github_db):
+        """prune_http_cache keeps only the newest entries."""
+        for n in range(5):
+            await github_db.put_http_cache(f"GET /k{n}", f'"e{n}"', "", "[]")
+
+        await github_db.prune_http_cache(keep=2)
+
+        remaining = [n for n in range(5) if await github_db.get_http_cache(f"GET /k{n}")]
+        assert len(remaining) == 2
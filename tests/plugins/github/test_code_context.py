@@ -258,3 +258,71 @@ class TestCodeContextBuilder:
         assert context.repo == "moltbook/api"
         assert context.question == "What does main do?"
         assert len(context.files) >= 1
+
+
+class TestTreeSync:
+    """Diff-based tree ingest into the real GitHubDB."""
+
+    @pytest.mark.asyncio
+    async def test_refresh_writes_only_changes(self, code_context_db, mock_github_client):
+        builder = CodeContextBuilder(
+            client=mock_github_client, db=code_context_db, tree_refresh_minutes=0
+        )
+        await builder.refresh_tree("moltbook/api")
+
+        mock_github_client.get_file_tree.return_value = {
+            "sha": "def456",
+            "tree": [
+                {"path": "src/main.py", "type": "blob", "sha": "sha1", "size": 500},
+                {"path": "src/utils.py", "type": "blob", "sha": "sha2b", "size": 320},
+                {"path": "src/new.py", "type": "blob", "sha": "sha5", "size": 10},
+                {"path": "tests/test_main.py", "type": "blob", "sha": "sha4", "size": 400},
+            ],
+        }
+        synced = []
+        original = code_context_db.sync_tree
+
+        async def spy(repo, entries):
+            result = await original(repo, entries)
+            synced.append(result)
+            return result
+
+        code_context_db.sync_tree = spy
+        assert await builder.refresh_tree("moltbook/api") is True
+
+        # utils.py changed, new.py added, README.md removed
+        assert synced == [(2, 1)]
+        shas = await code_context_db.get_tree_shas("moltbook/api")
+        assert shas == {
+            "src/main.py": "sha1",
+            "src/utils.py": "sha2b",
+            "src/new.py": "sha5",
+            "tests/test_main.py": "sha4",
+        }
+
+    @pytest.mark.asyncio
+    async def test_sync_tree_bulk_ingest(self, code_context_db):
+        from overblick.plugins.github.models import FileTreeEntry
+
+        entries = [FileTreeEntry(path=f"f{n}.py", sha=f"s{n}", size=n) for n in range(2000)]
+
+        assert await code_context_db.sync_tree("o/r", entries) == (2000, 0)
+        assert await code_context_db.sync_tree("o/r", entries) == (0, 0)
+        assert len(await code_context_db.get_tree_paths("o/r")) == 2000
+
+    @pytest.mark.asyncio
+    async def test_upsert_pr_tracking_many(self, code_context_db):
+        rows = [
+            {"pr_number": 1, "title": "a", "ci_status": "pending"},
+            {"pr_number": 2, "title": "b", "ci_status": "success", "is_dependabot": True},
+        ]
+        assert await code_context_db.upsert_pr_tracking_many("o/r", rows) == 2
+
+        rows[0]["ci_status"] = "failure"
+        await code_context_db.upsert_pr_tracking_many("o/r", rows)
+
+        row = await code_context_db._db.fetch_one(
+            "SELECT ci_status FROM pr_tracking WHERE repo = ? AND pr_number = ?", ("o/r", 1)
+        )
+        assert row["ci_status"] == "failure"
+        assert await code_context_db.upsert_pr_tracking_many("o/r", []) == 0
@@ -2,6 +2,7 @@
 Tests for ObservationCollector — world state gathering.
 """
 
+import asyncio
 from datetime import UTC
 from unittest.mock import AsyncMock, MagicMock
 
@@ -73,6 +74,7 @@ class TestObservationCollector:
         db.get_tree_paths = AsyncMock(return_value=[])
         db.has_responded_to_issue = AsyncMock(return_value=False)
         db.upsert_pr_tracking = AsyncMock()
+        db.upsert_pr_tracking_many = AsyncMock()
         return db
 
     @pytest.mark.asyncio
@@ -202,3 +204,71 @@ class TestObservationCollector:
         assert "Repository: owner/repo" in text
         assert "PR #1" in text
         assert "Test PR" in text
+
+
+def _raw_pr(number: int) -> dict:
+    return {
+        "number": number,
+        "title": f"PR {number}",
+        "user": {"login": "dev"},
+        "state": "open",
+        "head": {"sha": f"sha{number}"},
+        "base": {"ref": "main"},
+        "labels": [],
+        "created_at": "2026-02-20T10:00:00Z",
+        "updated_at": "2026-02-20T10:00:00Z",
+    }
+
+
+class TestConcurrentPRSnapshots:
+    """PR snapshots run with bounded concurrency and are tracked in one batch."""
+
+    @pytest.fixture
+    def mock_db(self):
+        db = AsyncMock()
+        db.get_repo_summary = AsyncMock(return_value=None)
+        db.get_tree_paths = AsyncMock(return_value=[])
+        db.upsert_pr_tracking_many = AsyncMock()
+        return db
+
+    def _client(self, in_flight: list[int], peak: list[int]):
+        async def slow_check_runs(repo, ref):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            return {"check_runs": [{"name": "ci", "status": "completed", "conclusion": "success"}]}
+
+        client = AsyncMock()
+        client.list_pulls = AsyncMock(return_value=[_raw_pr(n) for n in range(1, 11)])
+        client.list_issues = AsyncMock(return_value=[])
+        client.get_check_runs = AsyncMock(side_effect=slow_check_runs)
+        client.list_pull_reviews = AsyncMock(return_value=[{"state": "APPROVED"}])
+        return client
+
+    @pytest.mark.asyncio
+    async def test_snapshots_bounded_and_ordered(self, mock_db):
+        in_flight, peak = [0], [0]
+        observer = ObservationCollector(
+            client=self._client(in_flight, peak), db=mock_db, pr_concurrency=3
+        )
+
+        obs = await observer.observe("owner/repo")
+
+        assert [pr.number for pr in obs.open_prs] == list(range(1, 11))
+        assert all(pr.ci_status == CIStatus.SUCCESS for pr in obs.open_prs)
+        assert all(pr.review_state == "approved" for pr in obs.open_prs)
+        assert 1 < peak[0] <= 3
+
+    @pytest.mark.asyncio
+    async def test_tracking_written_in_one_batch(self, mock_db):
+        observer = ObservationCollector(client=self._client([0], [0]), db=mock_db)
+
+        await observer.observe("owner/repo")
+
+        mock_db.upsert_pr_tracking_many.assert_awaited_once()
+        repo, rows = mock_db.upsert_pr_tracking_many.await_args.args
+        assert repo == "owner/repo"
+        assert [r["pr_number"] for r in rows] == list(range(1, 11))
+        assert rows[0]["ci_status"] == "success"
+        mock_db.upsert_pr_tracking.assert_not_awaited()
@@ -8,8 +8,8 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from overblick.core.llm.pipeline import PipelineResult
-from overblick.plugins.github.models import PluginState
-from overblick.plugins.github.plugin import GitHubAgentPlugin
+from overblick.plugins.github.models import IssueSnapshot, PluginState, PRSnapshot, RepoObservation
+from overblick.plugins.github.plugin import GitHubAgentPlugin, _MultiRepoObserver
 
 
 class TestGitHubAgentPluginSetup:
@@ -114,6 +114,7 @@ class TestGitHubAgentPluginTick:
         # Mock agent loop to verify no calls
         plugin._agent_loop = MagicMock()
         plugin._agent_loop.tick = AsyncMock()
+        plugin._agent_loop.wait_for_reflections = AsyncMock()
 
         await plugin.tick()
 
@@ -131,6 +132,7 @@ class TestGitHubAgentPluginTick:
 
         plugin._agent_loop = MagicMock()
         plugin._agent_loop.tick = AsyncMock()
+        plugin._agent_loop.wait_for_reflections = AsyncMock()
 
         await plugin.tick()
 
@@ -185,3 +187,34 @@ class TestGitHubAgentPluginTeardown:
 
         # Should be safe to call twice
         await plugin.teardown()
+
+
+class TestMultiRepoObserverFingerprint:
+    """Fingerprint used to skip planning when the repos are unchanged."""
+
+    @staticmethod
+    def _observation(observed_at: str, age: float, title: str = "Bump x") -> dict:
+        pr = PRSnapshot(number=1, title=title, author="dependabot[bot]", age_hours=age)
+        issue = IssueSnapshot(number=2, title="Crash", author="alice", age_hours=age)
+        return {
+            "owner/repo": RepoObservation(
+                repo="owner/repo",
+                observed_at=observed_at,
+                open_prs=[pr],
+                dependabot_prs=[pr],
+                open_issues=[issue],
+                unanswered_issues=[issue],
+            )
+        }
+
+    def test_ignores_observed_at_and_ages(self):
+        observer = _MultiRepoObserver(MagicMock(), ["owner/repo"])
+        earlier = observer.fingerprint(self._observation("2026-02-23T10:00:00Z", 1.0))
+        later = observer.fingerprint(self._observation("2026-02-23T10:10:00Z", 1.2))
+        assert earlier == later
+
+    def test_changes_with_content(self):
+        observer = _MultiRepoObserver(MagicMock(), ["owner/repo"])
+        before = observer.fingerprint(self._observation("t", 1.0))
+        after = observer.fingerprint(self._observation("t", 1.0, title="Bump y"))
+        assert before != after
@@ -447,8 +447,9 @@ class TestIRCPluginStorage:
         )
         irc_plugin._save_conversation(conv)
 
-        # Verify file exists
-        assert (data_dir / "conversations.json").exists()
+        # Verify journal files exist
+        assert (data_dir / "journal" / "index.jsonl").exists()
+        assert (data_dir / "journal" / "irc-save.jsonl").exists()
 
         # Load and verify
         loaded = irc_plugin._load_conversations()
@@ -484,6 +485,44 @@ class TestIRCPluginStorage:
         ids = [c.id for c in irc_plugin._conversations]
         assert "irc-new" in ids
 
+    def test_save_appends_only_new_turns(self, irc_plugin, mock_ctx):
+        """Each turn is one appended line; earlier turns are not rewritten."""
+        data_dir = mock_ctx.data_dir / "irc"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        irc_plugin._data_dir = data_dir
+
+        conv = IRCConversation(id="irc-grow", topic="Grow", participants=["anomal"])
+        turn_file = data_dir / "journal" / "irc-grow.jsonl"
+        snapshots = []
+        for n in range(3):
+            turn = IRCTurn(identity="anomal", content=f"Turn {n}", turn_number=n)
+            conv = conv.model_copy(update={"turns": [*conv.turns, turn]})
+            irc_plugin._save_conversation(conv)
+            snapshots.append(turn_file.read_bytes())
+
+        assert len(turn_file.read_text().splitlines()) == 3
+        # Each save only extends the file
+        assert snapshots[2].startswith(snapshots[1])
+        assert snapshots[1].startswith(snapshots[0])
+
+    def test_legacy_conversations_imported(self, irc_plugin, mock_ctx):
+        data_dir = mock_ctx.data_dir / "irc"
+        data_dir.mkdir(parents=True, exist_ok=True)
+        irc_plugin._data_dir = data_dir
+        legacy = IRCConversation(
+            id="irc-legacy",
+            topic="Old format",
+            turns=[IRCTurn(identity="anomal", content="Hello")],
+        )
+        (data_dir / "conversations.json").write_text(json.dumps([legacy.model_dump(mode="json")]))
+
+        loaded = irc_plugin._load_conversations()
+
+        assert [c.id for c in loaded] == ["irc-legacy"]
+        assert loaded[0].turns[0].content == "Hello"
+        assert not (data_dir / "conversations.json").exists()
+        assert (data_dir / "conversations.json.migrated").exists()
+
     def test_load_handles_missing_file(self, irc_plugin, mock_ctx):
         data_dir = mock_ctx.data_dir / "irc"
         data_dir.mkdir(parents=True, exist_ok=True)
@@ -0,0 +1,98 @@
+"""Tests for the append-only IRC conversation journal."""
+
+import json
+
+from overblick.plugins.irc.journal import ConversationJournal
+
+
+def _conv(conv_id: str, turns: int = 0, updated_at: float = 1000.0, state: str = "active") -> dict:
+    return {
+        "id": conv_id,
+        "topic": f"Topic {conv_id}",
+        "participants": ["anomal", "cherry"],
+        "state": state,
+        "updated_at": updated_at,
+        "turns": [
+            {"identity": "anomal", "content": f"turn {n}", "turn_number": n} for n in range(turns)
+        ],
+    }
+
+
+class TestConversationJournal:
+    def test_record_appends_only_new_turns(self, tmp_path):
+        journal = ConversationJournal(tmp_path)
+
+        assert journal.record(_conv("c1", turns=2)) == 2
+        assert journal.record(_conv("c1", turns=3)) == 1
+        assert journal.record(_conv("c1", turns=3, state="completed")) == 0
+
+        lines = (tmp_path / "c1.jsonl").read_text().splitlines()
+        assert [json.loads(line)["content"] for line in lines] == ["turn 0", "turn 1", "turn 2"]
+        header = journal.header("c1")
+        assert header["state"] == "completed"
+        assert header["turn_count"] == 3
+        assert "turns" not in header
+
+    def test_reader_sees_writer_appends(self, tmp_path):
+        writer = ConversationJournal(tmp_path)
+        reader = ConversationJournal(tmp_path)
+        writer.record(_conv("c1", turns=1))
+
+        assert [t["content"] for t in reader.turns("c1")] == ["turn 0"]
+
+        writer.record(_conv("c1", turns=3, updated_at=2000.0))
+
+        assert [t["content"] for t in reader.turns("c1")] == ["turn 0", "turn 1", "turn 2"]
+        assert reader.header("c1")["updated_at"] == 2000.0
+
+    def test_conversations_paged_by_recency(self, tmp_path):
+        journal = ConversationJournal(tmp_path)
+        for n in range(5):
+            journal.record(_conv(f"c{n}", updated_at=float(n)))
+
+        assert [c["id"] for c in journal.conversations(limit=2)] == ["c4", "c3"]
+        assert [c["id"] for c in journal.conversations(limit=2, offset=2)] == ["c2", "c1"]
+        assert journal.count() == 5
+
+    def test_tail_reads_last_turns(self, tmp_path):
+        ConversationJournal(tmp_path).record(_conv("c1", turns=500))
+
+        tail = ConversationJournal(tmp_path).turns("c1", tail=3)
+
+        assert [t["turn_number"] for t in tail] == [497, 498, 499]
+
+    def test_torn_last_line_ignored(self, tmp_path):
+        journal = ConversationJournal(tmp_path)
+        journal.record(_conv("c1", turns=2))
+        with open(tmp_path / "c1.jsonl", "a") as f:
+            f.write('{"identity": "anomal", "cont')
+
+        reader = ConversationJournal(tmp_path)
+        assert len(reader.turns("c1")) == 2
+        assert len(reader.turns("c1", tail=5)) == 2
+
+    def test_index_compacts(self, tmp_path):
+        journal = ConversationJournal(tmp_path)
+        for n in range(200):
+            journal.record(_conv("c1", turns=n, updated_at=float(n)))
+
+        index_lines = (tmp_path / "index.jsonl").read_text().splitlines()
+        assert len(index_lines) <= 64
+        assert ConversationJournal(tmp_path).header("c1")["turn_count"] == 199
+
+    def test_evicts_oldest_beyond_limit(self, tmp_path):
+        journal = ConversationJournal(tmp_path, max_conversations=3)
+        reader = ConversationJournal(tmp_path)
+        for n in range(5):
+            journal.record(_conv(f"c{n}", turns=1, updated_at=float(n)))
+
+        assert {c["id"] for c in reader.conversations()} == {"c2", "c3", "c4"}
+        assert not (tmp_path / "c0.jsonl").exists()
+        assert reader.conversation("c0") is None
+
+    def test_missing_directory_is_empty(self, tmp_path):
+        journal = ConversationJournal(tmp_path / "nope")
+
+        assert not journal.exists()
+        assert journal.conversations() == []
+        assert journal.turns("c1") == []
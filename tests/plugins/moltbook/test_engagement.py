@@ -46,7 +46,7 @@ class TestUpvoteOwnPostComments:
         post = _make_post_with_comments([comment])
 
         ctx.engagement_db.get_my_post_ids = AsyncMock(return_value=["post-001"])
-        ctx.engagement_db.is_reply_processed = AsyncMock(return_value=False)
+        ctx.engagement_db.filter_unprocessed = AsyncMock(side_effect=lambda ids: list(ids))
         ctx.engagement_db.mark_reply_processed = AsyncMock()
         ctx.engagement_db.queue_reply_action = AsyncMock()
         client.get_post = AsyncMock(return_value=post)
@@ -73,7 +73,7 @@ class TestUpvoteOwnPostComments:
         post = _make_post_with_comments([comment])
 
         ctx.engagement_db.get_my_post_ids = AsyncMock(return_value=["post-001"])
-        ctx.engagement_db.is_reply_processed = AsyncMock(return_value=False)
+        ctx.engagement_db.filter_unprocessed = AsyncMock(side_effect=lambda ids: list(ids))
         ctx.engagement_db.queue_reply_action = AsyncMock()
         client.get_post = AsyncMock(return_value=post)
         client.upvote_comment = AsyncMock(return_value=True)
@@ -98,7 +98,7 @@ class TestUpvoteOwnPostComments:
         post = _make_post_with_comments([comment])
 
         ctx.engagement_db.get_my_post_ids = AsyncMock(return_value=["post-001"])
-        ctx.engagement_db.is_reply_processed = AsyncMock(return_value=False)
+        ctx.engagement_db.filter_unprocessed = AsyncMock(side_effect=lambda ids: list(ids))
         ctx.engagement_db.mark_reply_processed = AsyncMock()
         client.get_post = AsyncMock(return_value=post)
         client.upvote_comment = AsyncMock()
@@ -127,7 +127,7 @@ class TestUpvoteOwnPostComments:
         post = _make_post_with_comments([comment])
 
         ctx.engagement_db.get_my_post_ids = AsyncMock(return_value=["post-001"])
-        ctx.engagement_db.is_reply_processed = AsyncMock(return_value=False)
+        ctx.engagement_db.filter_unprocessed = AsyncMock(side_effect=lambda ids: list(ids))
         ctx.engagement_db.mark_reply_processed = AsyncMock()
         client.get_post = AsyncMock(return_value=post)
         client.upvote_comment = AsyncMock(return_value=True)
@@ -149,7 +149,7 @@ class TestUpvoteOwnPostComments:
         post = _make_post_with_comments([comment])
 
         ctx.engagement_db.get_my_post_ids = AsyncMock(return_value=["post-001"])
-        ctx.engagement_db.is_reply_processed = AsyncMock(return_value=False)
+        ctx.engagement_db.filter_unprocessed = AsyncMock(side_effect=lambda ids: list(ids))
         ctx.engagement_db.mark_reply_processed = AsyncMock()
         ctx.engagement_db.queue_reply_action = AsyncMock()
         client.get_post = AsyncMock(return_value=post)
@@ -163,3 +163,135 @@ class TestUpvoteOwnPostComments:
             ctx.engagement_db.mark_reply_processed.called
             or ctx.engagement_db.queue_reply_action.called
         )
+
+
+class TestReplyScanBatching:
+    """Reply scans fetch posts concurrently and filter comments in bulk."""
+
+    @pytest.mark.asyncio
+    async def test_posts_fetched_concurrently(self, setup_cherry_plugin):
+        """All own posts are in flight at once, not fetched one by one."""
+        import asyncio
+
+        plugin, ctx, client = setup_cherry_plugin
+        in_flight = 0
+        peak = 0
+
+        async def get_post(post_id, include_comments=True):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _make_post_with_comments([])
+
+        ctx.engagement_db.get_my_post_ids = AsyncMock(return_value=["p1", "p2", "p3"])
+        client.get_post = AsyncMock(side_effect=get_post)
+
+        await plugin._check_own_post_replies()
+
+        assert client.get_post.call_count == 3
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_one_filter_query_per_post(self, setup_cherry_plugin):
+        """Comments are checked with one filter_unprocessed call per post."""
+        plugin, ctx, client = setup_cherry_plugin
+
+        post = _make_post_with_comments(
+            [
+                _make_comment("c-old", "Seen this one already."),
+                _make_comment("c-new", "A perfectly fine comment."),
+            ]
+        )
+        ctx.engagement_db.get_my_post_ids = AsyncMock(return_value=["post-001"])
+        ctx.engagement_db.filter_unprocessed = AsyncMock(return_value=["c-new"])
+        ctx.engagement_db.is_reply_processed = AsyncMock(return_value=False)
+        client.get_post = AsyncMock(return_value=post)
+        client.upvote_comment = AsyncMock(return_value=True)
+
+        await plugin._check_own_post_replies()
+
+        ctx.engagement_db.filter_unprocessed.assert_awaited_once_with(["c-old", "c-new"])
+        ctx.engagement_db.is_reply_processed.assert_not_called()
+        client.upvote_comment.assert_called_once_with("post-001", "c-new")
+
+    @pytest.mark.asyncio
+    async def test_fetch_error_does_not_block_other_posts(self, setup_cherry_plugin):
+        plugin, ctx, client = setup_cherry_plugin
+
+        async def get_post(post_id, include_comments=True):
+            if post_id == "p-err":
+                raise MoltbookError("Not found")
+            return _make_post_with_comments([_make_comment("c-1", "Nice.")])
+
+        ctx.engagement_db.get_my_post_ids = AsyncMock(return_value=["p-err", "post-001"])
+        client.get_post = AsyncMock(side_effect=get_post)
+        client.upvote_comment = AsyncMock(return_value=True)
+
+        await plugin._check_own_post_replies()
+
+        client.upvote_comment.assert_called_once_with("post-001", "c-1")
+
+    @pytest.mark.asyncio
+    async def test_comment_replies_filtered_to_replies_to_us(self, setup_cherry_plugin):
+        """Only others' replies to our comments reach filter_unprocessed."""
+        plugin, ctx, client = setup_cherry_plugin
+        agent_name = ctx.identity.raw_config.get("agent_name", ctx.identity.name)
+
+        comments = [
+            Comment(
+                id="r-1",
+                post_id="p1",
+                agent_id="a",
+                agent_name="Other",
+                content="Reply to you",
+                parent_id="mine",
+            ),
+            Comment(
+                id="r-2",
+                post_id="p1",
+                agent_id="a",
+                agent_name="Other",
+                content="Unrelated",
+                parent_id="someone-else",
+            ),
+            Comment(
+                id="r-3",
+                post_id="p1",
+                agent_id="me",
+                agent_name=agent_name,
+                content="Our own follow-up",
+                parent_id="mine",
+            ),
+        ]
+        ctx.engagement_db.get_my_comment_post_ids = AsyncMock(return_value=["p1", "p2"])
+        ctx.engagement_db.get_my_comment_ids_for_post = AsyncMock(
+            side_effect=lambda post_id: ["mine"] if post_id == "p1" else []
+        )
+        client.get_post = AsyncMock(return_value=_make_post_with_comments(comments))
+        client.upvote_comment = AsyncMock(return_value=True)
+
+        await plugin._check_own_comment_replies()
+
+        # p2 has none of our comments, so it is never fetched
+        client.get_post.assert_called_once_with("p1", include_comments=True)
+        ctx.engagement_db.filter_unprocessed.assert_awaited_once_with(["r-1"])
+
+    @pytest.mark.asyncio
+    async def test_scanned_comments_skip_db_on_next_scan(self, setup_cherry_plugin):
+        """Comments recorded by one scan are answered by the seen index next time."""
+        plugin, ctx, client = setup_cherry_plugin
+        assert plugin._seen_index is not None
+
+        post = _make_post_with_comments([_make_comment("c-1", "Nice.")])
+        ctx.engagement_db.get_my_post_ids = AsyncMock(return_value=["post-001"])
+        client.get_post = AsyncMock(return_value=post)
+        client.upvote_comment = AsyncMock(return_value=True)
+
+        await plugin._check_own_post_replies()
+        assert ctx.engagement_db.filter_unprocessed.await_count == 1
+
+        await plugin._check_own_post_replies()
+        assert ctx.engagement_db.filter_unprocessed.await_count == 1
+        client.upvote_comment.assert_called_once()
@@ -2,6 +2,7 @@
 
 from overblick.plugins.moltbook.feed_processor import FeedProcessor
 from overblick.plugins.moltbook.models import Post
+from overblick.plugins.moltbook.seen_index import SeenIndex
 
 
 def _make_post(post_id: str, title: str = "Test") -> Post:
@@ -76,3 +77,20 @@ class TestFeedProcessor:
         for i in range(5):
             fp.mark_seen(f"p{i}")
         assert fp.seen_count <= 3
+
+
+class TestFeedProcessorPersistence:
+    def test_seen_posts_survive_restart(self, tmp_path):
+        index = SeenIndex(tmp_path)
+        FeedProcessor(seen_index=index).filter_new_posts([_make_post("p1"), _make_post("p2")])
+        index.close()
+
+        fp = FeedProcessor(seen_index=SeenIndex(tmp_path))
+        new = fp.filter_new_posts([_make_post("p1"), _make_post("p3")])
+        assert [p.id for p in new] == ["p3"]
+
+    def test_index_remembers_ids_evicted_from_memory(self, tmp_path):
+        fp = FeedProcessor(max_seen=3, seen_index=SeenIndex(tmp_path))
+        fp.filter_new_posts([_make_post(f"p{i}") for i in range(5)])
+        assert fp.seen_count <= 3
+        assert fp.is_seen("p0")
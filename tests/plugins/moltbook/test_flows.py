@@ -555,7 +555,7 @@ class TestMoltCaptchaInFeed:
         )
 
         ctx.engagement_db.get_my_post_ids = AsyncMock(return_value=["my-post"])
-        ctx.engagement_db.is_reply_processed = AsyncMock(return_value=False)
+        ctx.engagement_db.filter_unprocessed = AsyncMock(side_effect=lambda ids: list(ids))
         client.get_post = AsyncMock(return_value=my_post)
         client.get_posts = AsyncMock(return_value=[])
 
@@ -920,7 +920,7 @@ class TestOwnPostReplyChecking:
         )
 
         ctx.engagement_db.get_my_post_ids = AsyncMock(return_value=["my-p"])
-        ctx.engagement_db.is_reply_processed = AsyncMock(return_value=False)
+        ctx.engagement_db.filter_unprocessed = AsyncMock(side_effect=lambda ids: list(ids))
         client.get_post = AsyncMock(return_value=my_post)
         client.get_posts = AsyncMock(return_value=[])
 
@@ -954,7 +954,7 @@ class TestOwnPostReplyChecking:
         )
 
         ctx.engagement_db.get_my_post_ids = AsyncMock(return_value=["my-p"])
-        ctx.engagement_db.is_reply_processed = AsyncMock(return_value=True)
+        ctx.engagement_db.filter_unprocessed = AsyncMock(return_value=[])
         client.get_post = AsyncMock(return_value=my_post)
         client.get_posts = AsyncMock(return_value=[])
 
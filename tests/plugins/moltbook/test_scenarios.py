@@ -49,10 +49,11 @@ async def test_anomal_full_engagement_cycle(setup_anomal_plugin):
     )
 
     # Ensure engagement is triggered
-    plugin._decision_engine.evaluate_post = MagicMock(
-        return_value=EngagementDecision(
-            should_engage=True, score=100.0, action="comment", reason="test"
-        )
+    plugin._decision_engine.evaluate_posts = MagicMock(
+        side_effect=lambda posts: [
+            EngagementDecision(should_engage=True, score=100.0, action="comment", reason="test")
+        ]
+        * len(posts)
     )
 
     # Mock comment return
@@ -104,10 +105,11 @@ async def test_cherry_full_engagement_cycle(setup_cherry_plugin):
     )
 
     # Ensure engagement is triggered
-    plugin._decision_engine.evaluate_post = MagicMock(
-        return_value=EngagementDecision(
-            should_engage=True, score=100.0, action="comment", reason="test"
-        )
+    plugin._decision_engine.evaluate_posts = MagicMock(
+        side_effect=lambda posts: [
+            EngagementDecision(should_engage=True, score=100.0, action="comment", reason="test")
+        ]
+        * len(posts)
     )
 
     # Mock comment return
@@ -149,10 +151,11 @@ async def test_max_comments_per_cycle(setup_anomal_plugin):
     ctx.llm_pipeline.chat = AsyncMock(return_value=PipelineResult(content="Engaging comment"))
 
     # Ensure engagement is triggered for all
-    plugin._decision_engine.evaluate_post = MagicMock(
-        return_value=EngagementDecision(
-            should_engage=True, score=100.0, action="comment", reason="test"
-        )
+    plugin._decision_engine.evaluate_posts = MagicMock(
+        side_effect=lambda posts: [
+            EngagementDecision(should_engage=True, score=100.0, action="comment", reason="test")
+        ]
+        * len(posts)
     )
 
     # Mock comment return
@@ -290,10 +293,11 @@ async def test_challenge_during_comment(setup_anomal_plugin):
     plugin._challenge_handler.solve = AsyncMock(return_value={"success": True})
 
     # Ensure engagement is triggered
-    plugin._decision_engine.evaluate_post = MagicMock(
-        return_value=EngagementDecision(
-            should_engage=True, score=100.0, action="comment", reason="test"
-        )
+    plugin._decision_engine.evaluate_posts = MagicMock(
+        side_effect=lambda posts: [
+            EngagementDecision(should_engage=True, score=100.0, action="comment", reason="test")
+        ]
+        * len(posts)
     )
 
     await plugin.tick()
@@ -353,10 +357,11 @@ async def test_dream_context_in_comments(setup_anomal_plugin):
     ctx.llm_pipeline._chat_with_overrides = AsyncMock(return_value=pipeline_result)
 
     # Ensure engagement is triggered
-    plugin._decision_engine.evaluate_post = MagicMock(
-        return_value=EngagementDecision(
-            should_engage=True, score=100.0, action="comment", reason="test"
-        )
+    plugin._decision_engine.evaluate_posts = MagicMock(
+        side_effect=lambda posts: [
+            EngagementDecision(should_engage=True, score=100.0, action="comment", reason="test")
+        ]
+        * len(posts)
     )
 
     # Mock comment return
@@ -406,10 +411,11 @@ async def test_therapy_session(setup_anomal_plugin):
     ctx.llm_pipeline.chat = AsyncMock(return_value=PipelineResult(content="I'm here to listen."))
 
     # Ensure engagement is triggered
-    plugin._decision_engine.evaluate_post = MagicMock(
-        return_value=EngagementDecision(
-            should_engage=True, score=100.0, action="comment", reason="test"
-        )
+    plugin._decision_engine.evaluate_posts = MagicMock(
+        side_effect=lambda posts: [
+            EngagementDecision(should_engage=True, score=100.0, action="comment", reason="test")
+        ]
+        * len(posts)
     )
 
     # Mock comment return
@@ -608,10 +614,11 @@ async def test_output_safety_modifies_response(setup_anomal_plugin):
     ctx.llm_pipeline._chat_with_overrides = AsyncMock(return_value=pipeline_result)
 
     # Ensure engagement is triggered
-    plugin._decision_engine.evaluate_post = MagicMock(
-        return_value=EngagementDecision(
-            should_engage=True, score=100.0, action="comment", reason="test"
-        )
+    plugin._decision_engine.evaluate_posts = MagicMock(
+        side_effect=lambda posts: [
+            EngagementDecision(should_engage=True, score=100.0, action="comment", reason="test")
+        ]
+        * len(posts)
     )
 
     # Mock comment return
@@ -659,10 +666,11 @@ async def test_preflight_blocks_comment(setup_anomal_plugin):
     ctx.llm_pipeline._chat_with_overrides = AsyncMock(return_value=pipeline_result)
 
     # Ensure engagement is triggered
-    plugin._decision_engine.evaluate_post = MagicMock(
-        return_value=EngagementDecision(
-            should_engage=True, score=100.0, action="comment", reason="test"
-        )
+    plugin._decision_engine.evaluate_posts = MagicMock(
+        side_effect=lambda posts: [
+            EngagementDecision(should_engage=True, score=100.0, action="comment", reason="test")
+        ]
+        * len(posts)
     )
 
     await plugin.tick()
@@ -671,6 +679,32 @@ async def test_preflight_blocks_comment(setup_anomal_plugin):
     client.create_comment.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_feed_page_decided_in_one_batch(setup_anomal_plugin):
+    """The tick acts on evaluate_posts() decisions, one per post, in order."""
+    plugin, _, client = setup_anomal_plugin
+    plugin._reset_state()
+
+    posts = [
+        make_post(id="post-skip", title="Skip", content="Nothing here."),
+        make_post(id="post-up", title="Up", content="Somewhat interesting."),
+    ]
+    client.get_posts = AsyncMock(return_value=posts)
+    plugin._decision_engine.evaluate_posts = MagicMock(
+        return_value=[
+            EngagementDecision(should_engage=False, score=0.0, action="skip", reason="test"),
+            EngagementDecision(should_engage=False, score=15.0, action="upvote", reason="test"),
+        ]
+    )
+    plugin._decision_engine.evaluate_post = MagicMock(side_effect=AssertionError("per-post"))
+
+    await plugin.tick()
+
+    plugin._decision_engine.evaluate_posts.assert_called_once_with(posts)
+    client.upvote_post.assert_called_once_with("post-up")
+    client.create_comment.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # 19. Upvote for moderate score
 # ---------------------------------------------------------------------------
@@ -691,10 +725,10 @@ async def test_upvote_for_moderate_score(setup_anomal_plugin):
     client.get_posts = AsyncMock(return_value=[post])
 
     # Mock DecisionEngine to return a score below threshold but positive (triggers upvote)
-    plugin._decision_engine.evaluate_post = MagicMock(
-        return_value=EngagementDecision(
-            should_engage=False, score=15.0, action="upvote", reason="test"
-        )
+    plugin._decision_engine.evaluate_posts = MagicMock(
+        return_value=[
+            EngagementDecision(should_engage=False, score=15.0, action="upvote", reason="test")
+        ]
     )
 
     await plugin.tick()
@@ -0,0 +1,131 @@
+"""Tests for the persistent seen-ID index."""
+
+import os
+import sys
+import time
+
+import pytest
+
+from overblick.plugins.moltbook import seen_index
+from overblick.plugins.moltbook.seen_index import SeenIndex
+
+
+class TestSeenIndex:
+    def test_add_and_contains(self, tmp_path):
+        index = SeenIndex(tmp_path)
+        assert "p1" not in index
+        assert index.add("p1") is True
+        assert index.add("p1") is False
+        assert "p1" in index
+        assert "p2" not in index
+        assert len(index) == 1
+
+    def test_persists_across_reopen(self, tmp_path):
+        index = SeenIndex(tmp_path, name="feed")
+        for i in range(100):
+            index.add(f"post:{i}")
+        index.close()
+
+        reopened = SeenIndex(tmp_path, name="feed")
+        try:
+            assert len(reopened) == 100
+            assert all(f"post:{i}" in reopened for i in range(100))
+            assert "post:100" not in reopened
+        finally:
+            reopened.close()
+
+    def test_survives_without_close(self, tmp_path):
+        """Writes land in the shared mapping — no close/flush needed."""
+        index = SeenIndex(tmp_path)
+        index.add("crash-safe")
+        assert "crash-safe" in SeenIndex(tmp_path)
+
+    def test_rotation_keeps_previous_generation(self, tmp_path):
+        index = SeenIndex(tmp_path, generation_capacity=16)
+        per_generation = int(16 * seen_index.MAX_LOAD) + 1
+        first = [f"a{i}" for i in range(per_generation)]
+        second = [f"b{i}" for i in range(per_generation)]
+        for item in first + second:
+            index.add(item)
+
+        # One rotation: everything is still remembered
+        assert all(item in index for item in first + second)
+        assert (tmp_path / "seen.prev.idx").exists()
+
+        # A second rotation drops the oldest generation
+        for i in range(per_generation):
+            index.add(f"c{i}")
+        assert "a0" not in index
+        assert "c0" in index
+
+    def test_no_duplicates_across_generations(self, tmp_path):
+        index = SeenIndex(tmp_path, generation_capacity=16)
+        items = [f"x{i}" for i in range(int(16 * seen_index.MAX_LOAD))]
+        for item in items:
+            index.add(item)
+        count = len(index)
+        assert index.add(items[0]) is False
+        assert len(index) == count
+
+    def test_corrupt_file_starts_fresh(self, tmp_path):
+        (tmp_path / "seen.cur.idx").write_bytes(b"garbage")
+        index = SeenIndex(tmp_path)
+        assert len(index) == 0
+        index.add("p1")
+        assert "p1" in index
+
+    def test_works_without_pread_pwrite(self, tmp_path, monkeypatch):
+        """Windows has no os.pread/os.pwrite."""
+        monkeypatch.delattr(os, "pread", raising=False)
+        monkeypatch.delattr(os, "pwrite", raising=False)
+        index = SeenIndex(tmp_path)
+        index.add("p1")
+        index.close()
+        assert "p1" in SeenIndex(tmp_path)
+
+
+def test_memory_per_id_vs_set(tmp_path):
+    """Bytes per ID vs a Python set of the same IDs."""
+    n = 100_000
+    ids = [f"post-{i:08d}-0a1b2c3d" for i in range(n)]
+
+    index = SeenIndex(tmp_path, generation_capacity=1 << 18)
+    for item in ids:
+        index.add(item)
+    index.close()
+
+    reopened = SeenIndex(tmp_path, generation_capacity=1 << 18)
+    try:
+        index_bytes_per_million = reopened.memory_bytes * 1_000_000 // n
+        assert all(item in reopened for item in ids[:: n // 100])
+    finally:
+        reopened.close()
+
+    set_bytes = sys.getsizeof(set(ids)) + sum(sys.getsizeof(i) for i in ids)
+    set_bytes_per_million = set_bytes * 1_000_000 // n
+
+    # The table is sized for 1<<18 slots regardless of n: far smaller than the set
+    assert index_bytes_per_million * 2 < set_bytes_per_million, (
+        index_bytes_per_million,
+        set_bytes_per_million,
+    )
+
+
+@pytest.mark.benchmark
+def test_benchmark_reopen_time(tmp_path):
+    """Reopening maps the files instead of reloading every ID."""
+    n = 100_000
+    index = SeenIndex(tmp_path, generation_capacity=1 << 18)
+    for i in range(n):
+        index.add(f"post-{i:08d}-0a1b2c3d")
+    index.close()
+
+    start = time.perf_counter()
+    reopened = SeenIndex(tmp_path, generation_capacity=1 << 18)
+    load_seconds = time.perf_counter() - start
+    try:
+        assert len(reopened) == n
+    finally:
+        reopened.close()
+
+    assert load_seconds < 0.05, load_seconds
@@ -0,0 +1,187 @@
+"""
+Tests for the Polymarket market scan: numeric pre-screen, concurrent LLM
+estimates and the per-market estimate cache.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import ClassVar
+from unittest.mock import Mock
+
+import pytest
+
+from overblick.core.plugin_base import PluginContext
+from overblick.plugins.polymarket_monitor.models import (
+    MarketCategory,
+    MarketOutcome,
+    MarketStatus,
+    PolymarketMarket,
+)
+from overblick.plugins.polymarket_monitor.plugin import PolymarketMonitorPlugin
+from overblick.plugins.polymarket_monitor.screening import HAS_NUMPY, screen_markets
+
+
+def _market(market_id: str, yes: float, no: float | None = None, volume: float = 50_000.0):
+    now = datetime.now()
+    return PolymarketMarket(
+        id=market_id,
+        slug=market_id,
+        question=f"Will {market_id} happen?",
+        category=MarketCategory.OTHER,
+        status=MarketStatus.OPEN,
+        created_time=now - timedelta(days=10),
+        end_time=now + timedelta(days=20),
+        outcomes=[
+            MarketOutcome(name="Yes", ticker="YES", price=yes, last_updated=now),
+            MarketOutcome(
+                name="No", ticker="NO", price=1 - yes if no is None else no, last_updated=now
+            ),
+        ],
+        volume_24h=volume,
+        implied_probability=yes,
+    )
+
+
+class _FakeLLM:
+    """Answers every estimate with a fixed percentage, tracking concurrency."""
+
+    def __init__(self, answer: str = "70", delay: float = 0.01):
+        self.answer = answer
+        self.delay = delay
+        self.calls: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def chat(self, messages):
+        self.calls.append(messages[-1]["content"].split("\n", 1)[0])
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return SimpleNamespace(blocked=False, content=self.answer)
+
+
+@pytest.fixture
+def llm():
+    return _FakeLLM()
+
+
+@pytest.fixture
+async def plugin(tmp_path, llm):
+    ctx = Mock(spec=PluginContext)
+    ctx.identity_name = "polytrader"
+    ctx.data_dir = tmp_path
+    ctx.identity = Mock()
+    ctx.identity.raw_config = {
+        "polymarket_monitor": {"simulation_mode": False, "llm_concurrency": 3}
+    }
+    ctx.audit_log = None
+    ctx.llm_pipeline = llm
+    p = PolymarketMonitorPlugin(ctx)
+    await p.setup()
+    p._client = Mock()
+    return p
+
+
+def _serve(plugin, markets):
+    async def fetch():
+        return markets
+
+    plugin._fetch_markets = fetch
+
+
+class TestScreenMarkets:
+    MARKETS: ClassVar[list[PolymarketMarket]] = [
+        _market("ok", 0.40),
+        _market("thin", 0.40, volume=10.0),
+        _market("wide", 0.40, no=0.80),
+        _market("certain", 0.995),
+        _market("longshot", 0.004),
+        _market("edge", 0.01),
+    ]
+
+    @pytest.mark.parametrize(
+        "use_numpy",
+        [False, pytest.param(True, marks=pytest.mark.skipif(not HAS_NUMPY, reason="numpy"))],
+    )
+    def test_filters(self, use_numpy):
+        kept = screen_markets(
+            self.MARKETS, min_volume=1000, max_spread=0.1, min_price=0.01, use_numpy=use_numpy
+        )
+        assert [m.id for m in kept] == ["ok", "edge"]
+
+    def test_non_binary_markets_are_dropped(self):
+        market = _market("multi", 0.4)
+        market.outcomes.append(market.outcomes[0].model_copy(update={"ticker": "MAYBE"}))
+
+        assert screen_markets([market], min_volume=0, max_spread=1, min_price=0) == []
+
+    def test_empty(self):
+        assert screen_markets([], min_volume=0, max_spread=1, min_price=0) == []
+
+
+class TestMarketScan:
+    async def test_llm_only_for_screened_markets(self, plugin, llm):
+        _serve(plugin, [_market("a", 0.40), _market("thin", 0.40, volume=10.0)])
+
+        await plugin._perform_market_scan()
+
+        assert llm.calls == ["Market: Will a happen?"]
+
+    async def test_estimates_run_concurrently_with_cap(self, plugin, llm):
+        markets = [_market(f"m{i}", 0.40, volume=50_000 + i) for i in range(10)]
+        _serve(plugin, markets)
+
+        await plugin._perform_market_scan()
+
+        assert len(llm.calls) == 10
+        assert llm.max_in_flight == 3
+        # Opportunities are recorded in monitored order, not completion order
+        assert [o.market_id for o in plugin._recent_opportunities] == plugin._monitored_markets
+        assert all(o.our_probability == pytest.approx(0.70) for o in plugin._recent_opportunities)
+
+    async def test_estimate_reused_until_price_moves(self, plugin, llm):
+        _serve(plugin, [_market("a", 0.40), _market("b", 0.50)])
+        await plugin._perform_market_scan()
+        assert len(llm.calls) == 2
+
+        # Small move: both estimates reused
+        _serve(plugin, [_market("a", 0.41), _market("b", 0.49)])
+        await plugin._perform_market_scan()
+        assert len(llm.calls) == 2
+
+        # "a" moved past the threshold from where it was estimated
+        _serve(plugin, [_market("a", 0.45), _market("b", 0.49)])
+        await plugin._perform_market_scan()
+        assert llm.calls[2:] == ["Market: Will a happen?"]
+
+    async def test_stale_estimate_is_refreshed(self, plugin, llm):
+        market = _market("a", 0.40)
+        await plugin._estimate_probability(market)
+        price, probability, _ = plugin._estimates["a"]
+        plugin._estimates["a"] = (price, probability, 0.0)
+
+        await plugin._estimate_probability(market)
+
+        assert len(llm.calls) == 2
+
+    async def test_unparseable_answer_is_not_cached(self, plugin, llm):
+        llm.answer = "probably"
+        market = _market("a", 0.40)
+
+        assert await plugin._estimate_probability(market) == pytest.approx(0.40)
+        assert "a" not in plugin._estimates
+        await plugin._estimate_probability(market)
+        assert len(llm.calls) == 2
+
+    async def test_estimates_survive_restart(self, plugin, llm):
+        _serve(plugin, [_market("a", 0.40)])
+        await plugin._perform_market_scan()
+
+        restarted = PolymarketMonitorPlugin(plugin.ctx)
+        await restarted.setup()
+
+        assert restarted._cached_estimate(_market("a", 0.40)) == pytest.approx(0.70)
@@ -0,0 +1,114 @@
+"""Tests for the Stage record/replay cassette."""
+
+import json
+from unittest.mock import AsyncMock
+
+import pytest
+
+from overblick.core.llm.pipeline import PipelineResult, PipelineStage
+from overblick.plugins.stage.cassette import CassetteMiss, CassettePipeline, request_key
+
+MESSAGES = [
+    {"role": "system", "content": "You are Cherry."},
+    {"role": "user", "content": "Tell me about love"},
+]
+
+
+def _pipeline(content: str = "Love is attachment.") -> AsyncMock:
+    pipeline = AsyncMock()
+    pipeline.chat = AsyncMock(return_value=PipelineResult(content=content, duration_ms=812.0))
+    return pipeline
+
+
+class TestRequestKey:
+    def test_stable_and_sensitive_to_prompt(self):
+        assert request_key(MESSAGES, 0.7, 2000) == request_key(list(MESSAGES), 0.7, 2000)
+        assert request_key(MESSAGES, 0.7, 2000) != request_key(MESSAGES, 0.2, 2000)
+        other = [*MESSAGES[:1], {"role": "user", "content": "Tell me about loss"}]
+        assert request_key(MESSAGES, 0.7, 2000) != request_key(other, 0.7, 2000)
+
+
+class TestCassettePipeline:
+    @pytest.mark.asyncio
+    async def test_record_then_replay_offline(self, tmp_path):
+        path = tmp_path / "cassette.jsonl"
+        recorder = CassettePipeline(path, pipeline=_pipeline(), mode="record")
+        recorded = await recorder.chat(
+            messages=MESSAGES,
+            temperature=0.7,
+            max_tokens=2000,
+            audit_action="stage_scenario_step",
+            audit_details={"step": 0},
+        )
+        assert recorded.content == "Love is attachment."
+
+        player = CassettePipeline(path, mode="replay")
+        replayed = await player.chat(
+            messages=MESSAGES,
+            temperature=0.7,
+            max_tokens=2000,
+            audit_action="stage_scenario_step",
+            audit_details={"step": 3},  # Audit metadata is not part of the key
+        )
+        assert replayed.content == "Love is attachment."
+        assert player.stats() == {"mode": "replay", "entries": 1, "hits": 1, "recorded": 0}
+
+        line = json.loads(path.read_text())
+        assert line["prompt"] == "Tell me about love"
+        assert "duration_ms" not in line["result"]
+
+    @pytest.mark.asyncio
+    async def test_replay_miss_raises(self, tmp_path):
+        player = CassettePipeline(tmp_path / "empty.jsonl", mode="replay")
+        with pytest.raises(CassetteMiss):
+            await player.chat(messages=MESSAGES)
+
+    @pytest.mark.asyncio
+    async def test_auto_records_once(self, tmp_path):
+        pipeline = _pipeline()
+        cassette = CassettePipeline(tmp_path / "c.jsonl", pipeline=pipeline, mode="auto")
+
+        await cassette.chat(messages=MESSAGES, temperature=0.7)
+        await cassette.chat(messages=MESSAGES, temperature=0.7)
+
+        assert pipeline.chat.await_count == 1
+        assert cassette.stats()["hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_rerecorded_key_last_line_wins(self, tmp_path):
+        path = tmp_path / "c.jsonl"
+        await CassettePipeline(path, pipeline=_pipeline("old"), mode="record").chat(MESSAGES)
+        await CassettePipeline(path, pipeline=_pipeline("new"), mode="record").chat(MESSAGES)
+
+        result = await CassettePipeline(path, mode="replay").chat(MESSAGES)
+        assert result.content == "new"
+
+    @pytest.mark.asyncio
+    async def test_blocked_response_not_recorded(self, tmp_path):
+        pipeline = AsyncMock()
+        pipeline.chat = AsyncMock(
+            return_value=PipelineResult(
+                blocked=True,
+                block_reason="Rate limit",
+                block_stage=PipelineStage.RATE_LIMIT,
+            )
+        )
+        cassette = CassettePipeline(tmp_path / "c.jsonl", pipeline=pipeline, mode="auto")
+
+        result = await cassette.chat(messages=MESSAGES)
+
+        assert result.blocked
+        assert cassette.stats()["entries"] == 0
+        assert not (tmp_path / "c.jsonl").exists()
+
+    def test_bad_lines_skipped(self, tmp_path):
+        path = tmp_path / "c.jsonl"
+        key = request_key(MESSAGES)
+        path.write_text("not json\n" + json.dumps({"key": key, "result": {"content": "ok"}}) + "\n")
+        assert CassettePipeline(path, mode="replay").stats()["entries"] == 1
+
+    def test_invalid_configuration(self, tmp_path):
+        with pytest.raises(ValueError):
+            CassettePipeline(tmp_path / "c.jsonl", pipeline=_pipeline(), mode="rewind")
+        with pytest.raises(ValueError):
+            CassettePipeline(tmp_path / "c.jsonl", mode="record")
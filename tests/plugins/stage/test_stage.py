@@ -1,5 +1,6 @@
 """Tests for StagePlugin — behavioral scenario engine."""
 
+import asyncio
 import json
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -260,3 +261,167 @@ class TestTeardown:
 
         state_file = stage_context.data_dir / "stage_state.json"
         assert state_file.exists()
+
+
+def _write_scenarios(directory: Path, count: int) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        (directory / f"scenario_{i:02d}.yaml").write_text(f"""
+name: "scenario {i}"
+identity: test
+steps:
+  - input: "Question {i}, part one"
+    constraints:
+      - type: keyword_present
+        keywords: [love]
+  - input: "Question {i}, part two"
+    constraints:
+      - type: min_length
+        value: 5
+""")
+
+
+@pytest.fixture
+def patched_identity(stage_context):
+    """Identity loading and prompt building without identity files."""
+    mock_identity = MagicMock()
+    mock_identity.llm = stage_context.identity.llm
+    with (
+        patch("overblick.identities.load_identity", return_value=mock_identity),
+        patch("overblick.identities.build_system_prompt", return_value="System prompt"),
+    ):
+        yield
+
+
+def _slow_pipeline(delay: float, active: list[int] | None = None) -> AsyncMock:
+    """Pipeline whose chat() takes ``delay`` seconds; tracks peak concurrency."""
+
+    async def chat(**kwargs):
+        if active is not None:
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+        await asyncio.sleep(delay)
+        if active is not None:
+            active[0] -= 1
+        return PipelineResult(content="Love and connection matter most to me.")
+
+    pipeline = AsyncMock()
+    pipeline.chat = AsyncMock(side_effect=chat)
+    return pipeline
+
+
+class TestRunAllScenarios:
+    """Concurrent scenario runner."""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_and_order_kept(
+        self, stage_context, patched_identity, tmp_path
+    ):
+        active = [0, 0]  # current, peak
+        stage_context.llm_pipeline = _slow_pipeline(0.01, active)
+        _write_scenarios(tmp_path / "scenarios", 6)
+        plugin = StagePlugin(stage_context)
+        await plugin.setup()
+
+        results = await plugin.run_all_scenarios(tmp_path / "scenarios", max_concurrent=2)
+
+        assert active[1] == 2
+        assert [r.scenario_name for r in results] == [f"scenario {i}" for i in range(6)]
+        assert all(r.passed for r in results)
+        assert len(plugin.get_results()) == 6
+
+    @pytest.mark.asyncio
+    async def test_run_summary_reported(self, stage_context, patched_identity, tmp_path):
+        _write_scenarios(tmp_path / "scenarios", 3)
+        plugin = StagePlugin(stage_context)
+        await plugin.setup()
+
+        await plugin.run_all_scenarios(tmp_path / "scenarios")
+
+        summary = plugin.get_last_run()
+        assert summary.scenarios == 3
+        assert summary.passed == 3
+        assert summary.max_concurrent == 4
+        assert summary.wall_ms > 0
+        stage_context.event_bus.emit.assert_awaited_once()
+        assert stage_context.event_bus.emit.call_args.kwargs["speedup"] == summary.speedup
+
+        plugin2 = StagePlugin(stage_context)
+        await plugin2.setup()
+        assert plugin2.get_last_run() == summary
+
+    @pytest.mark.asyncio
+    async def test_config_sets_concurrency(self, stage_context, patched_identity, tmp_path):
+        stage_context.identity.raw_config["stage"]["max_concurrent_scenarios"] = 1
+        active = [0, 0]
+        stage_context.llm_pipeline = _slow_pipeline(0.01, active)
+        _write_scenarios(tmp_path / "scenarios", 3)
+        plugin = StagePlugin(stage_context)
+        await plugin.setup()
+
+        await plugin.run_all_scenarios(tmp_path / "scenarios")
+
+        assert active[1] == 1
+        assert plugin.get_last_run().max_concurrent == 1
+
+    @pytest.mark.asyncio
+    async def test_replay_runs_offline(self, stage_context, patched_identity, tmp_path):
+        _write_scenarios(tmp_path / "scenarios", 4)
+        cassette = tmp_path / "cassette.jsonl"
+        stage_config = stage_context.identity.raw_config["stage"]
+        stage_config.update(cassette=str(cassette), cassette_mode="record")
+        recorder = StagePlugin(stage_context)
+        await recorder.setup()
+        recorded = await recorder.run_all_scenarios(tmp_path / "scenarios")
+        assert stage_context.llm_pipeline.chat.await_count == 8
+
+        stage_context.llm_pipeline = None
+        stage_config["cassette_mode"] = "replay"
+        player = StagePlugin(stage_context)
+        await player.setup()
+        replayed = await player.run_all_scenarios(tmp_path / "scenarios")
+
+        assert [r.step_results for r in replayed] == [r.step_results for r in recorded]
+        assert player.get_last_run().cassette["hits"] == 8
+
+    @pytest.mark.asyncio
+    async def test_replay_miss_fails_step(self, stage_context, patched_identity, tmp_path):
+        _write_scenarios(tmp_path / "scenarios", 1)
+        stage_context.identity.raw_config["stage"].update(
+            cassette=str(tmp_path / "empty.jsonl"), cassette_mode="replay"
+        )
+        plugin = StagePlugin(stage_context)
+        await plugin.setup()
+
+        (result,) = await plugin.run_all_scenarios(tmp_path / "scenarios")
+
+        assert not result.passed
+        assert "No recorded response" in result.step_results[0].error
+        stage_context.llm_pipeline.chat.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_invalid_cassette_mode(self, stage_context):
+        stage_context.identity.raw_config["stage"]["cassette_mode"] = "rewind"
+        with pytest.raises(RuntimeError, match="Unknown cassette mode"):
+            await StagePlugin(stage_context).setup()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_run_overlaps_llm_calls(stage_context, patched_identity, tmp_path):
+    """12 two-step scenarios: same LLM calls, up to max_concurrent in flight."""
+    serial_active, concurrent_active = [0, 0], [0, 0]
+    _write_scenarios(tmp_path / "scenarios", 12)
+    plugin = StagePlugin(stage_context)
+    await plugin.setup()
+
+    stage_context.llm_pipeline = _slow_pipeline(0.005, serial_active)
+    serial = await plugin.run_all_scenarios(tmp_path / "scenarios", max_concurrent=1)
+    serial_calls = stage_context.llm_pipeline.chat.await_count
+
+    stage_context.llm_pipeline = _slow_pipeline(0.005, concurrent_active)
+    concurrent = await plugin.run_all_scenarios(tmp_path / "scenarios", max_concurrent=6)
+
+    assert serial_calls == stage_context.llm_pipeline.chat.await_count == 24
+    assert serial_active[1] == 1
+    assert concurrent_active[1] == 6
+    assert [r.step_results for r in concurrent] == [r.step_results for r in serial]
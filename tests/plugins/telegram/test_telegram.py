@@ -12,6 +12,7 @@ Tests cover:
 - Boundary marker injection prevention
 """
 
+import asyncio
 import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -21,6 +22,7 @@ from overblick.core.llm.pipeline import PipelineResult, PipelineStage
 from overblick.plugins.telegram.plugin import (
     COMMANDS,
     ConversationContext,
+    TelegramAPIError,
     TelegramMessage,
     TelegramPlugin,
     UserRateLimit,
@@ -531,3 +533,200 @@ class TestNotificationFormatting:
         assert limiter.is_allowed()
         limiter.record()
         assert not limiter.is_allowed()  # 3rd message in same second — blocked
+
+
+class TestLongPollListener:
+    """Background long polling, per-chat ordering and LLM backpressure."""
+
+    @staticmethod
+    def _feed(plugin, batches: list[list[dict]]):
+        """Make _poll_updates return each batch once, then block like an idle long poll."""
+        calls = []
+
+        async def poll(timeout=1):
+            calls.append(timeout)
+            if batches:
+                return batches.pop(0)
+            await asyncio.sleep(3600)
+            return []
+
+        plugin._poll_updates = poll
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_tick_starts_listener_once(self, telegram_plugin):
+        calls = self._feed(telegram_plugin, [[make_update("hi")]])
+        with patch.object(telegram_plugin, "_send_message", new_callable=AsyncMock) as mock_send:
+            await telegram_plugin.tick()
+            task = telegram_plugin._polling_task
+            await telegram_plugin.tick()
+            assert telegram_plugin._polling_task is task
+
+            for _ in range(20):
+                if mock_send.await_count:
+                    break
+                await asyncio.sleep(0.01)
+
+        mock_send.assert_awaited_once()
+        assert calls[0] == 30
+        assert telegram_plugin.get_status()["long_poll"] is True
+
+    @pytest.mark.asyncio
+    async def test_same_chat_in_order_other_chats_concurrent(self, telegram_plugin):
+        release = asyncio.Event()
+        started: list[str] = []
+
+        async def slow_chat(messages, **kwargs):
+            started.append(messages[-1]["content"])
+            await release.wait()
+            return PipelineResult(content="ok")
+
+        telegram_plugin.ctx.llm_pipeline.chat = AsyncMock(side_effect=slow_chat)
+        sent: list[tuple[int, int]] = []
+
+        async def send(chat_id, text, reply_to=None):
+            sent.append((chat_id, reply_to))
+            return True
+
+        telegram_plugin._send_message = send
+        for n, chat_id in enumerate([1, 1, 2, 3], start=1):
+            telegram_plugin._dispatch(make_update(f"m{n}", chat_id=chat_id, message_id=n))
+        await asyncio.sleep(0.01)
+
+        # Chats 1, 2, 3 each have one call in flight; chat 1's second waits
+        assert len(started) == 3
+        assert not any("m2" in text for text in started)
+
+        release.set()
+        await telegram_plugin._drain_chats()
+
+        assert [r for c, r in sent if c == 1] == [1, 2]
+        assert sorted(c for c, _ in sent) == [1, 1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_llm_calls_bounded(self, telegram_plugin):
+        telegram_plugin._llm_slots = asyncio.Semaphore(2)
+        in_flight, peak = [0], [0]
+
+        async def chat(messages, **kwargs):
+            in_flight[0] += 1
+            peak[0] = max(peak[0], in_flight[0])
+            await asyncio.sleep(0.01)
+            in_flight[0] -= 1
+            return PipelineResult(content="ok")
+
+        telegram_plugin.ctx.llm_pipeline.chat = AsyncMock(side_effect=chat)
+        with patch.object(telegram_plugin, "_send_message", new_callable=AsyncMock):
+            for chat_id in range(6):
+                telegram_plugin._dispatch(make_update("hi", chat_id=chat_id, user_id=chat_id))
+            await telegram_plugin._drain_chats()
+
+        assert peak[0] == 2
+        assert telegram_plugin.ctx.llm_pipeline.chat.await_count == 6
+
+    @pytest.mark.asyncio
+    async def test_poll_failure_retries(self, telegram_plugin, monkeypatch):
+        import overblick.plugins.telegram.plugin as tg
+
+        monkeypatch.setattr(tg, "POLL_RETRY_DELAY", 0.01)
+        attempts = []
+
+        async def flaky(timeout=1):
+            attempts.append(timeout)
+            if len(attempts) == 1:
+                raise ConnectionError("reset")
+            await asyncio.sleep(3600)
+            return []
+
+        telegram_plugin._poll_updates = flaky
+        await telegram_plugin.tick()
+        await asyncio.sleep(0.05)
+
+        assert len(attempts) == 2
+        assert telegram_plugin._errors == 1
+
+    @staticmethod
+    def _fake_session(responses: list[tuple[int, dict]]):
+        """Session whose getUpdates replies are served in order, then idle."""
+        requests = []
+        idle = asyncio.sleep  # bound now, so tests may patch asyncio.sleep
+
+        class Response:
+            def __init__(self, status, body):
+                self.status = status
+                self._body = body
+
+            async def json(self, content_type=None):
+                return self._body
+
+        class Request:
+            async def __aenter__(self):
+                requests.append(time.monotonic())
+                if responses:
+                    return Response(*responses.pop(0))
+                await idle(3600)
+
+            async def __aexit__(self, *exc):
+                return False
+
+        session = MagicMock()
+        session.get = MagicMock(side_effect=lambda *a, **kw: Request())
+        return session, requests
+
+    @pytest.mark.asyncio
+    async def test_api_error_backs_off(self, telegram_plugin, monkeypatch):
+        import overblick.plugins.telegram.plugin as tg
+
+        monkeypatch.setattr(tg, "POLL_RETRY_DELAY", 0.01)
+        conflict = {"ok": False, "error_code": 409, "description": "Conflict: terminated"}
+        flood = {"ok": False, "error_code": 429, "parameters": {"retry_after": 0.05}}
+        session, requests = self._fake_session([(409, conflict), (409, conflict), (429, flood)])
+        await telegram_plugin._session.close()
+        telegram_plugin._session = session
+        sleeps: list[float] = []
+        real_sleep = asyncio.sleep
+
+        async def recording_sleep(delay):
+            sleeps.append(delay)
+            await real_sleep(0)
+
+        monkeypatch.setattr(tg.asyncio, "sleep", recording_sleep)
+        await telegram_plugin.tick()
+        for _ in range(20):
+            if len(requests) >= 4:
+                break
+            await real_sleep(0.01)
+
+        # Each failure sleeps before re-polling: doubling, then retry_after
+        assert sleeps[:3] == [0.01, 0.02, 0.05]
+        assert len(requests) == 4
+        assert telegram_plugin._errors == 3
+
+    @pytest.mark.asyncio
+    async def test_poll_without_session_raises(self, telegram_plugin):
+        await telegram_plugin._session.close()
+        telegram_plugin._session = None
+        with pytest.raises(TelegramAPIError):
+            await telegram_plugin._poll_updates()
+
+    @pytest.mark.asyncio
+    async def test_teardown_stops_listener(self, telegram_plugin):
+        self._feed(telegram_plugin, [])
+        await telegram_plugin.tick()
+        task = telegram_plugin._polling_task
+
+        await telegram_plugin.teardown()
+
+        assert task.cancelled()
+        assert telegram_plugin._polling_task is None
+
+    @pytest.mark.asyncio
+    async def test_tick_mode_handles_updates_before_returning(self, telegram_plugin):
+        telegram_plugin._long_poll = False
+        calls = self._feed(telegram_plugin, [[make_update("a", chat_id=1), make_update("b")]])
+        with patch.object(telegram_plugin, "_send_message", new_callable=AsyncMock) as mock_send:
+            await telegram_plugin.tick()
+
+        assert calls == [1]
+        assert mock_send.await_count == 2
+        assert telegram_plugin._polling_task is None
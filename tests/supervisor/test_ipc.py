@@ -377,6 +377,203 @@ class TestIPCClientServer:
             await srv.stop()
 
 
+class TestIPCSession:
+    """Persistent multiplexed sessions and server push."""
+
+    @pytest_asyncio.fixture
+    async def server(self, ipc_dir):
+        token = generate_ipc_token()
+        srv = IPCServer(name="test", socket_dir=ipc_dir, auth_token=token)
+        srv.token = token
+
+        async def echo(msg: IPCMessage):
+            await asyncio.sleep(msg.payload.get("delay", 0))
+            return IPCMessage(msg_type="echo", payload=msg.payload, sender=msg.sender)
+
+        srv.on("echo", echo)
+        await srv.start()
+        yield srv
+        await srv.stop()
+
+    def _client(self, ipc_dir, server, **kwargs):
+        return IPCClient(
+            target="test",
+            socket_dir=ipc_dir,
+            auth_token=server.token,
+            identity="anomal",
+            persistent=True,
+            **kwargs,
+        )
+
+    @pytest.mark.asyncio
+    async def test_requests_share_one_connection(self, ipc_dir, server):
+        client = self._client(ipc_dir, server)
+        opened = []
+        original = client._open_connection
+
+        async def counting_open(timeout):
+            opened.append(timeout)
+            return await original(timeout)
+
+        client._open_connection = counting_open
+        try:
+            for i in range(5):
+                response = await client.send(IPCMessage(msg_type="echo", payload={"i": i}))
+                assert response.payload == {"i": i}
+            assert len(opened) == 1
+            assert server.has_session("anomal")
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_are_multiplexed(self, ipc_dir, server):
+        client = self._client(ipc_dir, server)
+        try:
+            await client.connect()
+            # Slower requests first: replies arrive out of order and must
+            # still be matched to their callers by request_id
+            responses = await asyncio.gather(
+                *(
+                    client.send(
+                        IPCMessage(msg_type="echo", payload={"i": i, "delay": 0.05 - i / 100})
+                    )
+                    for i in range(5)
+                )
+            )
+            assert [r.payload["i"] for r in responses] == list(range(5))
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_session_authenticates_once_and_pins_sender(self, ipc_dir, server):
+        seen = []
+
+        async def record(msg: IPCMessage):
+            seen.append((msg.sender, msg.auth_token))
+            return None
+
+        server.on("record", record)
+        client = self._client(ipc_dir, server)
+        try:
+            response = await client.send(IPCMessage(msg_type="record", sender="spoofed"))
+            assert response is None
+            assert seen == [("anomal", "")]
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_bad_token_falls_back_to_one_shot(self, ipc_dir, server):
+        client = IPCClient(
+            target="test",
+            socket_dir=ipc_dir,
+            auth_token="wrong",
+            identity="anomal",
+            persistent=True,
+        )
+        assert await client.connect(timeout=1.0) is False
+        assert not server.has_session("anomal")
+        assert await client.send(IPCMessage(msg_type="echo"), timeout=1.0) is None
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_unknown_type_resolves_without_timeout(self, ipc_dir, server):
+        client = self._client(ipc_dir, server)
+        try:
+            response = await asyncio.wait_for(
+                client.send(IPCMessage(msg_type="nope"), timeout=5.0), timeout=1.0
+            )
+            assert response is None
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_server_push_reaches_client(self, ipc_dir, server):
+        client = self._client(ipc_dir, server)
+        handled = []
+        client.on_push("notice", handled.append)
+        try:
+            await client.connect()
+            assert await server.push(
+                "anomal",
+                IPCMessage(
+                    msg_type="routed_messages",
+                    payload={"messages": [{"message_id": "route-000001"}], "count": 1},
+                ),
+            )
+            assert await server.push("anomal", IPCMessage(msg_type="notice"))
+
+            messages = await client.wait_routed_messages(timeout=1.0)
+            assert [m["message_id"] for m in messages] == ["route-000001"]
+            assert client.take_routed_messages() == []
+            await asyncio.sleep(0.05)
+            assert [m.msg_type for m in handled] == ["notice"]
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_push_without_session_returns_false(self, server):
+        assert await server.push("nobody", IPCMessage(msg_type="notice")) is False
+
+    @pytest.mark.asyncio
+    async def test_session_open_callback(self, ipc_dir, server):
+        opened = asyncio.Event()
+        agents = []
+
+        async def on_open(agent):
+            agents.append(agent)
+            opened.set()
+
+        server.on_session_open(on_open)
+        client = self._client(ipc_dir, server)
+        try:
+            await client.connect()
+            await asyncio.wait_for(opened.wait(), timeout=1.0)
+            assert agents == ["anomal"]
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_client_reconnects_after_drop(self, ipc_dir, server):
+        client = self._client(ipc_dir, server)
+        client._RECONNECT_INITIAL_DELAY = 0.01
+        try:
+            await client.connect()
+            server._sessions["anomal"].close()
+            for _ in range(100):
+                await asyncio.sleep(0.02)
+                if client.connected and server.has_session("anomal"):
+                    break
+            assert client.connected
+            response = await client.send(IPCMessage(msg_type="echo", payload={"ok": True}))
+            assert response.payload == {"ok": True}
+        finally:
+            await client.close()
+
+    @pytest.mark.asyncio
+    async def test_close_ends_session(self, ipc_dir, server):
+        client = self._client(ipc_dir, server)
+        await client.connect()
+        assert server.session_count == 1
+        await client.close()
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if server.session_count == 0:
+                break
+        assert server.session_count == 0
+        assert not client.connected
+
+    @pytest.mark.asyncio
+    async def test_one_shot_clients_still_work_alongside_sessions(self, ipc_dir, server):
+        session_client = self._client(ipc_dir, server)
+        one_shot = IPCClient(target="test", socket_dir=ipc_dir, auth_token=server.token)
+        try:
+            await session_client.connect()
+            response = await one_shot.send(IPCMessage(msg_type="echo", payload={"x": 1}))
+            assert response.payload == {"x": 1}
+        finally:
+            await session_client.close()
+
+
 class TestIPCRateLimiter:
     """Tests for IPC connection rate limiting (Pass 1, fix 1.3)."""
 
@@ -271,6 +271,35 @@ class TestQueueManagement:
         assert router.get_pending_count() == 0
 
 
+class TestPushHooks:
+    """on_pending notification and requeue for push delivery."""
+
+    def test_on_pending_called_for_queued_messages(self):
+        notified = []
+        router = MessageRouter(on_pending=notified.append)
+        router.register_agent("target", accepted_types={"ok"})
+        router.route("source", "target", "ok")
+        router.route("source", "target", "refused")
+        router.route("source", "unknown", "ok")
+        assert notified == ["target"]
+
+    def test_requeue_restores_order_and_status(self):
+        router = MessageRouter()
+        router.register_agent("target")
+        first = router.route("source", "target", "a")
+        second = router.route("source", "target", "b")
+        collected = router.collect("target")
+        router.route("source", "target", "c")
+
+        router.requeue(collected)
+
+        assert first.status == RouteStatus.PENDING
+        assert first.delivered_at is None
+        assert router.get_stats()["delivered"] == 0
+        assert [m.message_type for m in router.collect("target")] == ["a", "b", "c"]
+        assert second.status == RouteStatus.DELIVERED
+
+
 # ---------------------------------------------------------------------------
 # Statistics tests
 # ---------------------------------------------------------------------------
@@ -18,7 +18,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 
 from overblick.core.plugin_base import PluginContext
-from overblick.supervisor.ipc import IPCMessage
+from overblick.supervisor.ipc import IPCClient, IPCMessage
 from overblick.supervisor.process import ProcessState
 from overblick.supervisor.routing import MessageRouter, RouteStatus
 from overblick.supervisor.supervisor import Supervisor
@@ -595,3 +595,92 @@ class TestEndToEndRouting:
         routing = status["routing"]
         assert routing["total_routed"] == 3
         assert routing["pending"] == 3
+
+
+class TestPushDelivery:
+    """Routed messages are pushed over persistent IPC sessions."""
+
+    @pytest.mark.asyncio
+    async def test_routed_message_pushed_to_session(self, short_tmp):
+        sup = Supervisor(identities=[], socket_dir=short_tmp, base_dir=short_tmp)
+        sup.message_router.register_agent("vakt")
+        sup.message_router.register_agent("smed")
+        await sup.start()
+        smed = IPCClient(
+            target="supervisor",
+            socket_dir=short_tmp,
+            auth_token=sup._auth_token,
+            identity="smed",
+            persistent=True,
+        )
+        vakt = IPCClient(target="supervisor", socket_dir=short_tmp, auth_token=sup._auth_token)
+        try:
+            assert await smed.connect()
+            response = await vakt.send(
+                IPCMessage(
+                    msg_type="route_message",
+                    sender="vakt",
+                    payload={"target": "smed", "message_type": "bug_report", "data": {"n": 1}},
+                )
+            )
+            assert response.payload["success"] is True
+
+            messages = await smed.wait_routed_messages(timeout=2.0)
+            assert [m["message_type"] for m in messages] == ["bug_report"]
+            assert sup.message_router.get_pending_count("smed") == 0
+        finally:
+            await smed.close()
+            await sup.stop()
+
+    @pytest.mark.asyncio
+    async def test_pending_messages_pushed_when_session_opens(self, short_tmp):
+        sup = Supervisor(identities=[], socket_dir=short_tmp, base_dir=short_tmp)
+        sup.message_router.register_agent("smed")
+        sup.message_router.route("vakt", "smed", "queued_while_offline")
+        await sup.start()
+        smed = IPCClient(
+            target="supervisor",
+            socket_dir=short_tmp,
+            auth_token=sup._auth_token,
+            identity="smed",
+            persistent=True,
+        )
+        try:
+            await smed.connect()
+            messages = await smed.wait_routed_messages(timeout=2.0)
+            assert [m["message_type"] for m in messages] == ["queued_while_offline"]
+        finally:
+            await smed.close()
+            await sup.stop()
+
+    @pytest.mark.asyncio
+    async def test_failed_push_requeues(self, short_tmp):
+        sup = Supervisor(identities=[], socket_dir=short_tmp, base_dir=short_tmp)
+        sup.message_router.register_agent("smed")
+        sup.message_router.route("vakt", "smed", "retry_me")
+        sup._ipc.has_session = MagicMock(return_value=True)
+        sup._ipc.push = AsyncMock(return_value=False)
+
+        await sup._push_routed_messages("smed")
+
+        assert sup.message_router.get_pending_count("smed") == 1
+
+    @pytest.mark.asyncio
+    async def test_collect_messages_uses_pushed_inbox(self, tmp_path):
+        client = IPCClient(identity="vakt", persistent=True)
+        client._routed_inbox = [{"message_id": "route-000001"}]
+        client._writer = MagicMock()
+        client._writer.is_closing.return_value = False
+        client.send = AsyncMock()
+
+        ctx = PluginContext(
+            identity_name="vakt",
+            data_dir=tmp_path / "data" / "vakt",
+            log_dir=tmp_path / "logs" / "vakt",
+            ipc_client=client,
+        )
+
+        messages = await ctx.collect_messages()
+
+        assert messages == [{"message_id": "route-000001"}]
+        client.send.assert_not_called()
@@ -6,10 +6,13 @@ Standalone version for Whallet - copied from ethereum_ng.
 """
 
 import asyncio
+import json
 import logging
+import os
 import random
 import time
 from collections import OrderedDict
+from pathlib import Path
 from typing import Dict, List, Optional
 
 import aiohttp
@@ -28,24 +31,72 @@ class MetadataCache:
     - liquidity_usd, price_usd, volume_24h, pair_address, etc.
 
     Uses 24-hour TTL to ensure freshness while reducing RPC calls.
+    When given a path, entries are loaded from and saved to a JSON file
+    so they survive restarts (save() writes only if something changed).
     """
 
     # Only these fields are safe to cache (immutable after deployment)
     CACHEABLE_FIELDS = {"name", "symbol", "decimals", "total_supply", "address", "source"}
 
-    def __init__(self, ttl_hours: int = 24, max_size: int = 50000):
+    def __init__(self, ttl_hours: int = 24, max_size: int = 50000, path: str | Path | None = None):
         """
         Initialize metadata cache.
 
         Args:
             ttl_hours: Time-to-live in hours (default: 24h)
             max_size: Maximum cache entries (default: 50k = ~10MB)
+            path: JSON file to persist entries in (default: memory only)
         """
         self.cache = OrderedDict()  # LRU cache
         self.ttl = ttl_hours * 3600  # Convert to seconds
         self.max_size = max_size
         self.hits = 0
         self.misses = 0
+        self.path = Path(path) if path else None
+        self._dirty = False
+
+        if self.path:
+            self.load()
+
+    def load(self) -> None:
+        """Load fresh entries from the cache file (oldest first, so LRU order holds)."""
+        if not self.path:
+            return
+
+        try:
+            entries = json.loads(self.path.read_text()).get("entries", {})
+            now = time.time()
+            loaded = sorted(
+                (
+                    (key, {"data": dict(entry["data"]), "timestamp": float(entry["timestamp"])})
+                    for key, entry in entries.items()
+                ),
+                key=lambda item: item[1]["timestamp"],
+            )
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError, KeyError, TypeError, AttributeError) as e:
+            logger.warning(f"Ignoring unreadable metadata cache {self.path}: {e}")
+            return
+
+        for key, entry in loaded[-self.max_size :]:
+            if now - entry["timestamp"] < self.ttl:
+                self.cache[key] = entry
+        logger.debug(f"📂 Loaded {len(self.cache)} cached token metadata entries")
+
+    def save(self) -> None:
+        """Atomically write the cache file if entries changed since the last save."""
+        if not self.path or not self._dirty:
+            return
+
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp_path.write_text(json.dumps({"entries": self.cache}))
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        except OSError as e:
+            logger.warning(f"Failed to save metadata cache {self.path}: {e}")
 
     def get(self, address: str) -> dict | None:
         """
@@ -105,6 +156,7 @@ class MetadataCache:
 
             self.cache[key] = {"data": cached_data, "timestamp": time.time()}
             self.cache.move_to_end(key)  # Mark as recently used
+            self._dirty = True
             logger.debug(f"💾 Cached metadata for {address[:10]}...")
 
     def get_stats(self) -> dict:
@@ -128,14 +180,33 @@ class InfuraRPCClient:
     Handles token metadata fetching, contract calls, and transaction processing.
 
     Standalone version for Whallet - does not depend on ethereum_ng.
+
+    Independent calls (e.g. the four ERC-20 metadata reads per token) are
+    sent as JSON-RPC batch arrays, many calls per throttled POST.
     """
 
-    def __init__(self, infura_api_key: str):
+    # Standard ERC-20 method signatures, in the order results are parsed
+    ERC20_METADATA_SIGS = (
+        "0x06fdde03",  # name()
+        "0x95d89b41",  # symbol()
+        "0x313ce567",  # decimals()
+        "0x18160ddd",  # totalSupply()
+    )
+
+    def __init__(
+        self,
+        infura_api_key: str,
+        metadata_cache_path: str | Path | None = None,
+        max_batch_size: int = 100,
+    ):
         """
         Initialize Infura RPC client.
 
         Args:
             infura_api_key: Infura API key for Ethereum mainnet access
+            metadata_cache_path: JSON file to persist token metadata in
+                (default: in-memory cache only)
+            max_batch_size: Maximum JSON-RPC calls per batch POST
         """
         self.infura_api_key = infura_api_key
         self.rpc_url = f"https://mainnet.infura.io/v3/{infura_api_key}"
@@ -145,23 +216,74 @@ class InfuraRPCClient:
         self._last_call_ts = 0.0
         self._max_retries = 5
         self._base_backoff = 0.6  # seconds, tuned for Infura reliability
-        self.metadata_cache = MetadataCache()  # 24h cache for immutable metadata
+        self._max_batch_size = max(1, max_batch_size)
+        # 24h cache for immutable metadata
+        self.metadata_cache = MetadataCache(path=metadata_cache_path)
 
     async def __aenter__(self):
         self.session = aiohttp.ClientSession()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        await self.close()
 
     async def _make_rpc_call(self, method: str, params: list) -> dict | None:
         """Make a JSON-RPC call to Ethereum node."""
+        payload = {"jsonrpc": "2.0", "method": method, "params": params, "id": 1}
+        data = await self._post_rpc(payload, method)
+        return data.get("result") if isinstance(data, dict) else None
+
+    async def _make_batch_rpc_call(
+        self, calls: list[tuple[str, list]], max_concurrent: int = 1
+    ) -> list:
+        """
+        Make many JSON-RPC calls as batch arrays, up to max_batch_size per POST.
+
+        Each POST goes through the same throttle as a single call. Responses
+        are matched back to calls by ``id`` (servers may reorder them).
+
+        Args:
+            calls: (method, params) pairs
+            max_concurrent: Maximum batch POSTs in flight
+
+        Returns:
+            Results in call order; None for calls that errored or got no answer
+        """
+        results: list = [None] * len(calls)
+        if not calls:
+            return results
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrent))
+
+        async def send_chunk(start: int) -> None:
+            chunk = calls[start : start + self._max_batch_size]
+            payload = [
+                {"jsonrpc": "2.0", "method": method, "params": params, "id": start + offset}
+                for offset, (method, params) in enumerate(chunk)
+            ]
+            async with semaphore:
+                data = await self._post_rpc(payload, f"batch of {len(chunk)}")
+
+            # A batch that fails as a whole comes back as one error object
+            if not isinstance(data, list):
+                return
+            for item in data:
+                if not isinstance(item, dict):
+                    continue
+                call_id = item.get("id")
+                if isinstance(call_id, int) and start <= call_id < start + len(chunk):
+                    results[call_id] = item.get("result")
+
+        await asyncio.gather(
+            *(send_chunk(start) for start in range(0, len(calls), self._max_batch_size))
+        )
+        return results
+
+    async def _post_rpc(self, payload: dict | list, description: str) -> dict | list | None:
+        """POST a JSON-RPC payload (single or batch) with throttling and 429 backoff."""
         if not self.session:
             self.session = aiohttp.ClientSession()
 
-        payload = {"jsonrpc": "2.0", "method": method, "params": params, "id": 1}
-
         for attempt in range(self._max_retries):
             backoff = self._base_backoff * (2**attempt)
             jitter = random.uniform(0.0, 0.3)
@@ -175,8 +297,7 @@ class InfuraRPCClient:
                     timeout=aiohttp.ClientTimeout(total=10),
                 ) as response:
                     if response.status == 200:
-                        data = await response.json()
-                        return data.get("result")
+                        return await response.json()
 
                     if response.status == 429:
                         # Rate limited - use exponential backoff
@@ -195,11 +316,12 @@ class InfuraRPCClient:
                 raise
             except Exception as e:
                 logger.error(
-                    f"RPC call failed (attempt {attempt + 1}/{self._max_retries}) for {method}: {e}"
+                    f"RPC call failed (attempt {attempt + 1}/{self._max_retries}) "
+                    f"for {description}: {e}"
                 )
                 await asyncio.sleep(backoff + jitter)
 
-        logger.error(f"RPC call gave up after {self._max_retries} retries for method {method}")
+        logger.error(f"RPC call gave up after {self._max_retries} retries for {description}")
         return None
 
     async def _throttle(self):
@@ -257,6 +379,8 @@ class InfuraRPCClient:
         """
         Get ERC-20 token information by calling standard methods.
         Returns name, symbol, decimals, and total supply.
+
+        The four reads go out as one batch POST.
         """
         # Check cache first (24h TTL for immutable metadata)
         cached_metadata = self.metadata_cache.get(contract_address)
@@ -264,83 +388,28 @@ class InfuraRPCClient:
             logger.debug(f"🎯 Cache HIT for {contract_address[:10]}... - returning cached metadata")
             return cached_metadata
 
-        token_info = {
-            "address": contract_address,
-            "name": None,
-            "symbol": None,
-            "decimals": None,
-            "total_supply": None,
-            "source": "ethereum_rpc",
-        }
-
         try:
-            # Standard ERC-20 method signatures
-            name_sig = "0x06fdde03"  # name()
-            symbol_sig = "0x95d89b41"  # symbol()
-            decimals_sig = "0x313ce567"  # decimals()
-            total_supply_sig = "0x18160ddd"  # totalSupply()
-
-            # Make concurrent calls for efficiency
-            tasks = [
-                self.call_contract(contract_address, name_sig),
-                self.call_contract(contract_address, symbol_sig),
-                self.call_contract(contract_address, decimals_sig),
-                self.call_contract(contract_address, total_supply_sig),
-            ]
-
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Parse name
-            if results[0] and not isinstance(results[0], Exception):
-                token_info["name"] = self._decode_string(results[0])
-
-            # Parse symbol
-            if results[1] and not isinstance(results[1], Exception):
-                token_info["symbol"] = self._decode_string(results[1])
-
-            # Parse decimals
-            if results[2] and not isinstance(results[2], Exception):
-                try:
-                    token_info["decimals"] = int(results[2], 16)
-                except (ValueError, TypeError):
-                    pass
-
-            # Parse total supply
-            if results[3] and not isinstance(results[3], Exception):
-                try:
-                    token_info["total_supply"] = str(int(results[3], 16))
-                except (ValueError, TypeError):
-                    pass
-
-            # Validate this is a proper ERC-20 token (must have decimals)
-            if (token_info["name"] or token_info["symbol"]) and token_info["decimals"] is not None:
-                logger.info(
-                    f"✅ Retrieved ERC-20 token info for {contract_address}: {token_info['name']} ({token_info['symbol']}) - {token_info['decimals']} decimals"
-                )
-                # Cache successful metadata (only immutable fields)
-                self.metadata_cache.set(contract_address, token_info)
-                return token_info
-            else:
-                logger.debug(
-                    f"❌ Not a valid ERC-20 token {contract_address} (missing decimals or metadata)"
-                )
-                token_info["source"] = "not_erc20"
-                return token_info
-
+            results = await self._make_batch_rpc_call(self._erc20_metadata_calls(contract_address))
         except Exception as e:
             logger.error(f"Error getting token info for {contract_address}: {e}")
-            token_info["source"] = "error"
-            return token_info
+            return self._empty_token_info(contract_address, "error")
+
+        return self._parse_erc20_token_info(contract_address, results)
 
     async def batch_get_erc20_metadata(
         self, contract_addresses: list[str], max_concurrent: int = 10
     ) -> list[dict]:
         """
-        Batch fetch ERC-20 metadata for multiple tokens concurrently.
+        Batch fetch ERC-20 metadata for multiple tokens.
+
+        Cached tokens are answered locally; the metadata reads for all other
+        tokens are packed into JSON-RPC batch arrays (max_batch_size calls
+        per POST), so N tokens cost about 4N / max_batch_size throttled
+        round trips instead of 4N.
 
         Args:
             contract_addresses: List of token contract addresses
-            max_concurrent: Maximum concurrent requests (default: 10)
+            max_concurrent: Maximum batch POSTs in flight (default: 10)
 
         Returns:
             List of token metadata dicts (same order as input)
@@ -350,53 +419,99 @@ class InfuraRPCClient:
 
         logger.info(f"📦 Batch fetching metadata for {len(contract_addresses)} tokens")
 
-        # Create tasks with semaphore to limit concurrency
-        semaphore = asyncio.Semaphore(max_concurrent)
-
-        async def fetch_with_semaphore(address: str) -> dict:
-            async with semaphore:
-                try:
-                    return await self.get_erc20_token_info(address)
-                except Exception as e:
-                    logger.error(f"Error fetching metadata for {address}: {e}")
-                    return {
-                        "address": address,
-                        "name": None,
-                        "symbol": None,
-                        "decimals": None,
-                        "total_supply": None,
-                        "source": "error",
-                    }
+        metadata_list: list[dict | None] = [None] * len(contract_addresses)
+        misses = []
+        for i, address in enumerate(contract_addresses):
+            cached_metadata = self.metadata_cache.get(address)
+            if cached_metadata:
+                metadata_list[i] = cached_metadata
+            else:
+                misses.append(i)
 
-        # Fetch all concurrently
-        tasks = [fetch_with_semaphore(addr) for addr in contract_addresses]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        # Filter out exceptions and convert to list
-        metadata_list = []
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Exception fetching {contract_addresses[i]}: {result}")
-                metadata_list.append(
-                    {
-                        "address": contract_addresses[i],
-                        "name": None,
-                        "symbol": None,
-                        "decimals": None,
-                        "total_supply": None,
-                        "source": "exception",
-                    }
+        calls = [call for i in misses for call in self._erc20_metadata_calls(contract_addresses[i])]
+        per_token = len(self.ERC20_METADATA_SIGS)
+        try:
+            results = await self._make_batch_rpc_call(calls, max_concurrent=max_concurrent)
+        except Exception as e:
+            logger.error(f"Exception in batch metadata fetch: {e}")
+            for i in misses:
+                metadata_list[i] = self._empty_token_info(contract_addresses[i], "exception")
+        else:
+            for n, i in enumerate(misses):
+                metadata_list[i] = self._parse_erc20_token_info(
+                    contract_addresses[i], results[n * per_token : (n + 1) * per_token]
                 )
-            else:
-                metadata_list.append(result)
+
+        self.metadata_cache.save()
 
         successful = sum(1 for m in metadata_list if m.get("source") == "ethereum_rpc")
         logger.info(
-            f"✅ Batch metadata fetch complete: {successful}/{len(contract_addresses)} successful"
+            f"✅ Batch metadata fetch complete: {successful}/{len(contract_addresses)} successful "
+            f"({len(contract_addresses) - len(misses)} cached)"
         )
 
         return metadata_list
 
+    def _erc20_metadata_calls(self, contract_address: str) -> list[tuple[str, list]]:
+        """eth_call (method, params) pairs for name/symbol/decimals/totalSupply."""
+        return [
+            ("eth_call", [{"to": contract_address, "data": sig}, "latest"])
+            for sig in self.ERC20_METADATA_SIGS
+        ]
+
+    @staticmethod
+    def _empty_token_info(contract_address: str, source: str) -> dict:
+        return {
+            "address": contract_address,
+            "name": None,
+            "symbol": None,
+            "decimals": None,
+            "total_supply": None,
+            "source": source,
+        }
+
+    def _parse_erc20_token_info(self, contract_address: str, results: list) -> dict:
+        """Decode name/symbol/decimals/totalSupply results and cache valid tokens."""
+        token_info = self._empty_token_info(contract_address, "ethereum_rpc")
+        name, symbol, decimals, total_supply = results
+
+        # Parse name
+        if name:
+            token_info["name"] = self._decode_string(name)
+
+        # Parse symbol
+        if symbol:
+            token_info["symbol"] = self._decode_string(symbol)
+
+        # Parse decimals
+        if decimals:
+            try:
+                token_info["decimals"] = int(decimals, 16)
+            except (ValueError, TypeError):
+                pass
+
+        # Parse total supply
+        if total_supply:
+            try:
+                token_info["total_supply"] = str(int(total_supply, 16))
+            except (ValueError, TypeError):
+                pass
+
+        # Validate this is a proper ERC-20 token (must have decimals)
+        if (token_info["name"] or token_info["symbol"]) and token_info["decimals"] is not None:
+            logger.info(
+                f"✅ Retrieved ERC-20 token info for {contract_address}: {token_info['name']} ({token_info['symbol']}) - {token_info['decimals']} decimals"
+            )
+            # Cache successful metadata (only immutable fields)
+            self.metadata_cache.set(contract_address, token_info)
+            return token_info
+
+        logger.debug(
+            f"❌ Not a valid ERC-20 token {contract_address} (missing decimals or metadata)"
+        )
+        token_info["source"] = "not_erc20"
+        return token_info
+
     def _decode_string(self, hex_data: str) -> str | None:
         """
         Decode hex-encoded string from contract call.
@@ -483,6 +598,7 @@ class InfuraRPCClient:
         return result if result else []
 
     async def close(self):
-        """Close the HTTP session."""
+        """Close the HTTP session and persist the metadata cache."""
+        self.metadata_cache.save()
         if self.session:
             await self.session.close()
@@ -0,0 +1,269 @@
+"""
+Unit tests for InfuraRPCClient JSON-RPC batching and the persistent MetadataCache.
+
+Tests cover:
+1. Batch arrays: many calls per POST, results demultiplexed by id
+2. ERC-20 metadata fetched with one POST per max_batch_size calls
+3. MetadataCache persistence across client restarts
+4. Throughput (tokens/second) vs one call per POST, against a local mock RPC
+"""
+
+import json
+import random
+import time
+from contextlib import asynccontextmanager
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from whallet.infura_rpc_client import InfuraRPCClient, MetadataCache
+
+NAME_SIG, SYMBOL_SIG, DECIMALS_SIG, SUPPLY_SIG = InfuraRPCClient.ERC20_METADATA_SIGS
+
+
+def _abi_string(value: str) -> str:
+    data = value.encode().hex()
+    padded = data + "0" * (-len(data) % 64)
+    return "0x" + f"{32:064x}" + f"{len(value):064x}" + padded
+
+
+def _token(address: str) -> str:
+    return "T" + address[-4:]
+
+
+class _MockRPC:
+    """Local JSON-RPC stand-in answering ERC-20 reads; shuffles batch replies."""
+
+    def __init__(self):
+        self.posts: list[int] = []  # calls per POST
+        self.fail_ids: set[int] = set()
+
+    def answer(self, call: dict) -> dict:
+        if call["id"] in self.fail_ids:
+            return {"jsonrpc": "2.0", "id": call["id"], "error": {"code": 3, "message": "revert"}}
+        tx, _ = call["params"]
+        symbol = _token(tx["to"])
+        result = {
+            NAME_SIG: _abi_string(f"{symbol} Token"),
+            SYMBOL_SIG: _abi_string(symbol),
+            DECIMALS_SIG: hex(18),
+            SUPPLY_SIG: hex(10**24),
+        }[tx["data"]]
+        return {"jsonrpc": "2.0", "id": call["id"], "result": result}
+
+    async def handle(self, request):
+        payload = await request.json()
+        if isinstance(payload, list):
+            self.posts.append(len(payload))
+            replies = [self.answer(call) for call in payload]
+            random.shuffle(replies)
+            return web.json_response(replies)
+        self.posts.append(1)
+        return web.json_response(self.answer(payload))
+
+
+@asynccontextmanager
+async def _client(rpc: _MockRPC, min_interval: float = 0.0, **kwargs):
+    app = web.Application()
+    app.router.add_post("/", rpc.handle)
+    server = TestServer(app)
+    await server.start_server()
+    client = InfuraRPCClient("test-key", **kwargs)
+    client.rpc_url = str(server.make_url("/"))
+    client._min_interval = min_interval
+    try:
+        yield client
+    finally:
+        await client.close()
+        await server.close()
+
+
+def _addresses(n: int) -> list[str]:
+    return [f"0x{i:040x}" for i in range(1, n + 1)]
+
+
+class TestBatchRPC:
+    """JSON-RPC batch arrays against the mock RPC."""
+
+    @pytest.mark.asyncio
+    async def test_results_demultiplexed_by_id(self):
+        rpc = _MockRPC()
+        calls = [("eth_call", [{"to": a, "data": SYMBOL_SIG}, "latest"]) for a in _addresses(20)]
+
+        async with _client(rpc) as client:
+            results = await client._make_batch_rpc_call(calls)
+
+        assert rpc.posts == [20]
+        assert [client._decode_string(r) for r in results] == [_token(a) for a in _addresses(20)]
+
+    @pytest.mark.asyncio
+    async def test_split_into_max_batch_size_posts(self):
+        rpc = _MockRPC()
+        calls = [("eth_call", [{"to": a, "data": DECIMALS_SIG}, "latest"]) for a in _addresses(25)]
+
+        async with _client(rpc, max_batch_size=10) as client:
+            results = await client._make_batch_rpc_call(calls, max_concurrent=3)
+
+        assert sorted(rpc.posts) == [5, 10, 10]
+        assert results == [hex(18)] * 25
+
+    @pytest.mark.asyncio
+    async def test_errored_call_yields_none(self):
+        rpc = _MockRPC()
+        rpc.fail_ids = {1}
+        calls = [("eth_call", [{"to": a, "data": DECIMALS_SIG}, "latest"]) for a in _addresses(3)]
+
+        async with _client(rpc) as client:
+            results = await client._make_batch_rpc_call(calls)
+
+        assert results == [hex(18), None, hex(18)]
+
+    @pytest.mark.asyncio
+    async def test_single_call_still_plain_request(self):
+        rpc = _MockRPC()
+        async with _client(rpc) as client:
+            result = await client.call_contract(_addresses(1)[0], DECIMALS_SIG)
+
+        assert result == hex(18)
+        assert rpc.posts == [1]
+
+
+class TestERC20Metadata:
+    """ERC-20 metadata over batched RPC."""
+
+    @pytest.mark.asyncio
+    async def test_token_info_in_one_post(self):
+        rpc = _MockRPC()
+        address = _addresses(1)[0]
+
+        async with _client(rpc) as client:
+            info = await client.get_erc20_token_info(address)
+
+        assert rpc.posts == [4]
+        assert info["symbol"] == _token(address)
+        assert info["name"] == f"{_token(address)} Token"
+        assert info["decimals"] == 18
+        assert info["total_supply"] == str(10**24)
+        assert info["source"] == "ethereum_rpc"
+
+    @pytest.mark.asyncio
+    async def test_batch_metadata_preserves_order_and_skips_cached(self):
+        rpc = _MockRPC()
+        addresses = _addresses(30)
+
+        async with _client(rpc, max_batch_size=100) as client:
+            await client.get_erc20_token_info(addresses[0])
+            rpc.posts.clear()
+            metadata = await client.batch_get_erc20_metadata(addresses)
+
+        # 29 uncached tokens x 4 reads = 116 calls -> two POSTs
+        assert sorted(rpc.posts) == [16, 100]
+        assert [m["symbol"] for m in metadata] == [_token(a) for a in addresses]
+
+    @pytest.mark.asyncio
+    async def test_non_erc20_not_cached(self):
+        rpc = _MockRPC()
+        rpc.fail_ids = {0, 1, 2, 3}
+        address = _addresses(1)[0]
+
+        async with _client(rpc) as client:
+            info = await client.get_erc20_token_info(address)
+
+            assert info["source"] == "not_erc20"
+            assert client.metadata_cache.get(address) is None
+
+
+class TestMetadataCachePersistence:
+    """MetadataCache on disk."""
+
+    @pytest.mark.asyncio
+    async def test_metadata_survives_restart(self, tmp_path):
+        path = tmp_path / "token_metadata.json"
+        addresses = _addresses(5)
+
+        rpc = _MockRPC()
+        async with _client(rpc, metadata_cache_path=path) as client:
+            await client.batch_get_erc20_metadata(addresses)
+        assert path.exists()
+
+        rpc = _MockRPC()
+        async with _client(rpc, metadata_cache_path=path) as client:
+            metadata = await client.batch_get_erc20_metadata(addresses)
+
+        assert rpc.posts == []
+        assert [m["symbol"] for m in metadata] == [_token(a) for a in addresses]
+
+    def test_expired_entries_dropped_on_load(self, tmp_path):
+        path = tmp_path / "token_metadata.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "entries": {
+                        "0xold": {"data": {"symbol": "OLD"}, "timestamp": 0},
+                        "0xnew": {"data": {"symbol": "NEW"}, "timestamp": time.time()},
+                    }
+                }
+            )
+        )
+
+        cache = MetadataCache(path=path)
+
+        assert cache.get("0xOLD") is None
+        assert cache.get("0xNEW") == {"symbol": "NEW"}
+
+    def test_corrupt_file_starts_empty(self, tmp_path):
+        path = tmp_path / "token_metadata.json"
+        path.write_text("{not json")
+
+        cache = MetadataCache(path=path)
+        assert cache.get_stats()["size"] == 0
+
+        cache.set("0xabc", {"symbol": "ABC", "decimals": 6})
+        cache.save()
+        assert MetadataCache(path=path).get("0xabc") == {"symbol": "ABC", "decimals": 6}
+
+    def test_save_skipped_when_unchanged(self, tmp_path):
+        path = tmp_path / "token_metadata.json"
+        MetadataCache(path=path).save()
+        assert not path.exists()
+
+
+@pytest.mark.asyncio
+async def test_batching_cuts_throttled_posts():
+    """Same tokens, same results: 40 throttled POSTs one call at a time vs one batch."""
+    n = 10
+
+    rpc = _MockRPC()
+    async with _client(rpc, max_batch_size=1) as client:
+        unbatched = await client.batch_get_erc20_metadata(_addresses(n))
+    assert len(rpc.posts) == 4 * n
+
+    rpc = _MockRPC()
+    async with _client(rpc) as client:
+        batched = await client.batch_get_erc20_metadata(_addresses(n))
+    assert len(rpc.posts) == 1
+    assert batched == unbatched
+
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_benchmark_tokens_per_second():
+    """Benchmark: tokens/second under the same throttle, batched vs one call per POST."""
+    interval = 0.02
+    n = 10
+
+    rpc = _MockRPC()
+    async with _client(rpc, min_interval=interval, max_batch_size=1) as client:
+        start = time.perf_counter()
+        await client.batch_get_erc20_metadata(_addresses(n))
+        unbatched_rate = n / (time.perf_counter() - start)
+
+    rpc = _MockRPC()
+    async with _client(rpc, min_interval=interval) as client:
+        start = time.perf_counter()
+        await client.batch_get_erc20_metadata(_addresses(n))
+        batched_rate = n / (time.perf_counter() - start)
+
+    # 40 throttled POSTs vs one
+    assert batched_rate > 10 * unbatched_rate, (batched_rate, unbatched_rate)